@@ -0,0 +1,118 @@
+"""압축 파일 탐색 벤치마크 (멤버 수가 많은 zip / tar.gz)
+
+하위 디렉토리 여러 개에 멤버가 나뉜 압축 파일을 만들고 위젯으로 다음 시간을 잰다.
+
+- 처음 열기: 압축 파일로 이동해 로딩이 끝날 때까지 (멤버 목록을 읽어 인덱스를 만듦)
+- 하위 디렉토리: 압축 파일 안 하위 디렉토리로 이동 (인덱스 재사용, 처음 여는 목록)
+- 다시 방문: 목록 캐시를 비운 뒤 같은 하위 디렉토리로 이동 (인덱스만 재사용)
+- 비교: 압축 파일 전체를 임시 디렉토리에 풀기 (압축 해제 후 탐색하는 방식)
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_archives.py [멤버 수] [하위 디렉토리 수]
+"""
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtWidgets import QApplication
+
+from file_explorer import ArchiveBackend, FileExplorerWidget
+from file_explorer.listing_cache import ListingCache
+
+
+def make_archives(root: str, members: int, subdirs: int) -> list[str]:
+    """같은 멤버(작은 텍스트 파일)를 담은 zip과 tar.gz를 만든다."""
+    names = [f"dir_{i % subdirs:03d}/file_{i:07d}.txt" for i in range(members)]
+    data = b"x" * 100
+    zip_path = os.path.join(root, "members.zip")
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name in names:
+            archive.writestr(name, data)
+
+    source = os.path.join(root, "source.dat")
+    with open(source, "wb") as f:
+        f.write(data)
+    tar_path = os.path.join(root, "members.tar.gz")
+    with tarfile.open(tar_path, "w:gz") as archive:
+        info = archive.gettarinfo(source)
+        for name in names:
+            info.name = name
+            with open(source, "rb") as f:
+                archive.addfile(info, f)
+    os.remove(source)
+    return [zip_path, tar_path]
+
+
+def wait_for(app: QApplication, condition, timeout: float = 600.0) -> float:
+    """condition이 참이 될 때까지 이벤트를 처리하고 걸린 시간(ms)을 반환한다."""
+    start = time.perf_counter()
+    while not condition():
+        app.processEvents()
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    members = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    subdirs = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        archives = make_archives(root, members, subdirs)
+
+        print("=" * 64)
+        print(f"압축 파일 탐색 벤치마크 (멤버 {members:,}개, 하위 디렉토리 {subdirs}개)")
+        print("=" * 64)
+
+        for archive in archives:
+            name = os.path.basename(archive)
+            print(f"{name} ({os.path.getsize(archive) / (1024 * 1024):.1f} MB)")
+            cache = ListingCache()
+            widget = FileExplorerWidget(root, live_refresh=False, listing_cache=cache, backend=ArchiveBackend())
+            widget.resize(1000, 600)
+            widget.show()
+            model = widget.model
+            wait_for(app, lambda: not model._loading)
+
+            start = time.perf_counter()
+            widget.navigate_to(archive)
+            wait_for(app, lambda: not model._loading)
+            print(f"  {'처음 열기 (인덱스 생성)':<28} {(time.perf_counter() - start) * 1000:>10.1f} ms"
+                  f"  ({model.rowCount() - 1}행)")
+
+            target = os.path.join(archive, "dir_000")
+            expected = (members + subdirs - 1) // subdirs + 1
+            start = time.perf_counter()
+            widget.navigate_to(target)
+            wait_for(app, lambda: not model._loading)
+            assert model.rowCount() == expected, (model.rowCount(), expected)
+            print(f"  {'하위 디렉토리':<28} {(time.perf_counter() - start) * 1000:>10.1f} ms"
+                  f"  ({model.rowCount() - 1:,}행)")
+
+            widget.navigate_to(root)
+            wait_for(app, lambda: not model._loading)
+            cache.clear()
+            start = time.perf_counter()
+            widget.navigate_to(target)
+            wait_for(app, lambda: not model._loading)
+            assert model.rowCount() == expected
+            print(f"  {'다시 방문 (목록 캐시 없음)':<28} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+            widget.close()
+            widget.deleteLater()
+            app.processEvents()
+
+            extract_dir = os.path.join(root, "extracted")
+            start = time.perf_counter()
+            shutil.unpack_archive(archive, extract_dir)
+            print(f"  {'비교: 전체 압축 해제':<28} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+            shutil.rmtree(extract_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""디렉토리 재귀 크기 벤치마크 (du 실행 vs 백그라운드 계산 + 캐시)
+
+하위 디렉토리 여러 개에 파일 트리를 만들고 다음 시간을 잰다.
+
+- du: 하위 디렉토리마다 `du -s`를 실행해 끝날 때까지 기다리는 시간 (GUI 스레드가 멈춤)
+- 첫 표시: 탐색기를 연 뒤 화면에 보이는 첫 디렉토리의 크기가 표시될 때까지
+- 전체: 모든 하위 디렉토리 크기가 채워질 때까지 (그동안 GUI 스레드는 응답)
+- 재방문: 하위 디렉토리에 들어갔다가 돌아왔을 때 전체 크기가 다시 채워질 때까지
+  ((장치, inode, mtime) 캐시로 디렉토리마다 stat만 수행)
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_dir_sizes.py [하위 디렉토리 수] [디렉토리당 파일 수] [스레드 수]
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtWidgets import QApplication
+
+from file_explorer import FileExplorerWidget
+from file_explorer.dir_sizes import DirSizeCache
+from file_explorer.listing_cache import ListingCache
+
+DEPTH_DIRS = 10  # 하위 디렉토리 하나 안의 디렉토리 수
+
+
+def make_tree(root: str, subdirs: int, files: int):
+    """하위 디렉토리 subdirs개, 각 디렉토리 아래 DEPTH_DIRS개 디렉토리에 파일을 만든다."""
+    for i in range(subdirs):
+        for j in range(DEPTH_DIRS):
+            directory = os.path.join(root, f"project_{i:03d}", f"part_{j}")
+            os.makedirs(directory)
+            for k in range(files // DEPTH_DIRS):
+                with open(os.path.join(directory, f"file_{k}.bin"), "wb") as f:
+                    f.write(b"x" * (k % 4096))
+
+
+def wait_for(app: QApplication, condition, timeout: float = 600.0) -> float:
+    """condition이 참이 될 때까지 이벤트를 처리하고 걸린 시간(ms)을 반환한다."""
+    start = time.perf_counter()
+    while not condition():
+        app.processEvents()
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    subdirs = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, subdirs, files)
+        names = sorted(os.listdir(root))
+
+        print("=" * 64)
+        print(f"디렉토리 재귀 크기 벤치마크 (하위 디렉토리 {subdirs}개 x 파일 {files:,}개, 스레드 {workers}개)")
+        print("=" * 64)
+
+        if shutil.which("du"):
+            start = time.perf_counter()
+            for name in names:
+                subprocess.run(["du", "-s", os.path.join(root, name)], capture_output=True, check=True)
+            print(f"{'du -s (GUI 스레드 대기)':<32} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+        start = time.perf_counter()
+        widget = FileExplorerWidget(root, live_refresh=False, listing_cache=ListingCache(),
+                                    dir_size_workers=workers)
+        widget.model._dir_sizes.cache = DirSizeCache()  # 다른 실행의 결과를 쓰지 않도록
+        widget.resize(1000, 600)
+        widget.show()
+        model = widget.model
+        proxy = widget.proxy_model
+
+        def first_visible() -> str:
+            """화면 맨 위 디렉토리 (.. 다음 행) 이름."""
+            return model._items.names[proxy.mapToSource(proxy.index(1, 0)).row()]
+
+        wait_for(app, lambda: not model._loading and model.rowCount() > 1)
+        wait_for(app, lambda: first_visible() in model._dir_totals)
+        print(f"{'첫 표시 (보이는 첫 디렉토리)':<32} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+        wait_for(app, lambda: len(model._dir_totals) == subdirs)
+        print(f"{'전체':<32} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+        widget.navigate_to(os.path.join(root, names[0]))
+        wait_for(app, lambda: not model._loading and len(model._dir_totals) == DEPTH_DIRS)
+        start = time.perf_counter()
+        widget.navigate_to(root)
+        wait_for(app, lambda: len(model._dir_totals) == subdirs)
+        print(f"{'재방문 (캐시)':<32} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""디스크 인덱스 벤치마크: 큰 디렉토리 목록 저장/복원 시간
+
+디스크를 스캔하지 않고 합성 목록을 임시 인덱스 파일에 저장한 뒤 다시 읽는다.
+Qt 없이 실행된다.
+
+    python benchmarks/bench_disk_index.py [항목 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from file_explorer.disk_index import DiskIndex
+from file_explorer.entry_store import EntryStore
+
+
+def synthetic_store(count: int) -> EntryStore:
+    """데이터셋 샤드 디렉토리와 비슷한 합성 목록."""
+    rng = random.Random(0)
+    now = time.time()
+    store = EntryStore("/data/shards")
+    store.append_parent()
+    for i in range(count):
+        store.append(f"part-{i:07d}-{rng.getrandbits(32):08x}.parquet", False, True,
+                     rng.randrange(10 ** 9), now - rng.random() * 86400 * 365)
+    return store
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    store = synthetic_store(count)
+
+    print("=" * 60)
+    print(f"디스크 인덱스 벤치마크 ({count:,} 항목)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as root:
+        index = DiskIndex(os.path.join(root, "index.sqlite3"), min_entries=0)
+
+        start = time.perf_counter()
+        index.put(store.base_path, store, (1, 1))
+        print(f"  저장       {(time.perf_counter() - start) * 1000:8.1f} ms  ({index.total_bytes / 1e6:.1f} MB)")
+        index.close()
+
+        # 새 프로세스처럼 다시 열어서 읽기
+        index = DiskIndex(os.path.join(root, "index.sqlite3"), min_entries=0)
+        start = time.perf_counter()
+        restored, signature = index.get(store.base_path)
+        print(f"  복원       {(time.perf_counter() - start) * 1000:8.1f} ms  ({len(restored):,} 항목)")
+        assert restored.names == store.names and restored.sizes == store.sizes
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""항목 저장소 메모리 벤치마크: dict 목록 vs 컬럼 지향 EntryStore
+
+Qt 없이 실행된다.
+
+    python benchmarks/bench_entry_store.py [항목 수 ...]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'file_explorer'))
+
+from entry_store import EntryStore
+
+BASE_PATH = "/data/build/artifacts"
+
+
+def synthetic_entries(count: int):
+    """스캔 결과와 비슷한 (이름, is_dir, is_file, size, mtime) 튜플을 만든다."""
+    now = time.time()
+    for i in range(count):
+        is_dir = i % 20 == 0
+        yield (
+            f"object_{i:07d}.o" if not is_dir else f"dir_{i:07d}",
+            is_dir,
+            not is_dir,
+            None if is_dir else i * 37 % 1_000_000,
+            now - i,
+        )
+
+
+def build_dicts(count: int) -> list:
+    """기존 방식: 항목마다 dict 하나."""
+    items = []
+    for name, is_dir, is_file, size, modified in synthetic_entries(count):
+        items.append({
+            "name": name,
+            "path": os.path.join(BASE_PATH, name),
+            "is_dir": is_dir,
+            "is_file": is_file,
+            "size": size,
+            "modified": modified,
+        })
+    return items
+
+
+def build_store(count: int) -> EntryStore:
+    """컬럼 지향 저장소."""
+    store = EntryStore(BASE_PATH)
+    for name, is_dir, is_file, size, modified in synthetic_entries(count):
+        store.append(name, is_dir, is_file, size, modified)
+    return store
+
+
+def measure(builder, count: int):
+    """빌더가 만든 결과가 유지하는 메모리(바이트)와 빌드 시간을 측정한다."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = builder(count)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return current, peak, elapsed
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 500_000]
+
+    print("=" * 70)
+    print("항목 저장소 메모리 벤치마크")
+    print("=" * 70)
+    print(f"{'항목 수':>10} {'방식':>12} {'유지 메모리':>14} {'최대 메모리':>14} {'빌드 시간':>10}")
+    print("-" * 70)
+
+    for count in counts:
+        results = {}
+        for label, builder in (("dict 목록", build_dicts), ("EntryStore", build_store)):
+            current, peak, elapsed = measure(builder, count)
+            results[label] = current
+            print(f"{count:>10,} {label:>12} {current / 1e6:>11.1f} MB {peak / 1e6:>11.1f} MB {elapsed:>9.2f}s")
+
+        ratio = results["dict 목록"] / max(results["EntryStore"], 1)
+        print(f"{'':>10} {'절감':>12} {ratio:>12.1f}x")
+        print("-" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""행을 나눠 보이기(canFetchMore/fetchMore) 벤치마크 (수백만 항목 디렉토리)
+
+MemoryBackend의 합성 디렉토리를 위젯으로 열고, 스캔한 항목을 모두 행으로 보이는 기본
+방식과 앞쪽 fetch_rows개만 행으로 보이고 스크롤할 때 더 보이는 방식을 비교한다.
+방식마다 최대 RSS를 따로 재기 위해 각각 별도 프로세스에서 실행한다.
+
+- 첫 행까지 시간, 로딩 완료까지 시간, 로딩 중 GUI 최대 멈춤 (10ms 타이머 사이 최대 간격)
+- 로딩 후 모델 행 수 / 전체 항목 수, 최대 RSS
+- 끝까지 스크롤 (기본 방식은 맨 아래로 이동, 나눠 보이기는 fetchMore 한 번 더)
+- 크기순 정렬, 빠른 필터 시간과 그 뒤의 모델 행 수, 최대 RSS
+  (나눠 보이기는 모델 밖 전체 목록에 적용하고 앞쪽만 행으로 보이므로 행 수가 그대로)
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_fetch_more.py [항목 수] [fetch_rows]
+"""
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+TICK_MS = 10
+TIMEOUT = 3600  # 대기 한도(초)
+
+
+def peak_rss_mb() -> float | None:
+    """이 프로세스의 최대 RSS (MB). 측정할 수 없으면 None."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return (peak if sys.platform == "darwin" else peak * 1024) / (1024 * 1024)
+
+
+def run(count: int, fetch_rows: int):
+    """한 방식으로 디렉토리를 열고 결과를 출력한다 (하위 프로세스에서 실행)."""
+    from PyQt6.QtCore import Qt, QTimer
+    from PyQt6.QtWidgets import QApplication
+
+    from file_explorer import FileExplorerWidget, MemoryBackend
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    backend = MemoryBackend()
+    backend.make_dir("/empty")
+    backend.add_synthetic("/data", count, dirs=count // 1000)
+    baseline_rss = peak_rss_mb()
+
+    def pump_until(condition) -> float:
+        start = time.perf_counter()
+        while not condition():
+            if time.perf_counter() - start > TIMEOUT:
+                raise TimeoutError("측정 대기 시간 초과")
+            app.processEvents()
+        return time.perf_counter() - start
+
+    widget = FileExplorerWidget("/empty", backend=backend, fetch_rows=fetch_rows)
+    widget.resize(1000, 800)
+    widget.show()
+    model, view = widget.model, widget.table_view
+    pump_until(lambda: not model._loading)
+
+    gaps = []
+    last_tick = None
+
+    def tick():
+        nonlocal last_tick
+        now = time.perf_counter()
+        if last_tick is not None:
+            gaps.append(now - last_tick)
+        last_tick = now
+
+    timer = QTimer()
+    timer.setInterval(TICK_MS)
+    timer.timeout.connect(tick)
+    timer.start()
+
+    first_row = []
+    start = time.perf_counter()
+
+    def on_rows(*args):
+        if not first_row and model.rowCount() > 1:
+            first_row.append(time.perf_counter() - start)
+
+    model.rowsInserted.connect(on_rows)
+    widget.navigate_to("/data")
+    pump_until(lambda: not model._loading)
+    loaded = time.perf_counter() - start
+    timer.stop()
+
+    label = "전부 행으로" if fetch_rows <= 0 else f"fetch_rows={fetch_rows}"
+    print(f"{label}")
+    print(f"  {'첫 행':<24} {first_row[0] * 1000 if first_row else 0:>10.1f} ms")
+    print(f"  {'로딩 완료':<24} {loaded * 1000:>10.1f} ms")
+    print(f"  {'로딩 중 GUI 최대 멈춤':<24} {max(gaps, default=0) * 1000:>10.1f} ms")
+    print(f"  {'모델 행 / 전체 항목':<24} {model.rowCount():>10,} / {model.total_rows():,}")
+    if baseline_rss is not None:
+        print(f"  {'최대 RSS (백엔드 제외)':<24} {peak_rss_mb() - baseline_rss:>10.1f} MB")
+
+    start = time.perf_counter()
+    if fetch_rows <= 0:
+        view.scrollToBottom()
+    else:
+        model.fetchMore()
+        view.scrollToBottom()
+    app.processEvents()
+    print(f"  {'끝까지 스크롤':<24} {(time.perf_counter() - start) * 1000:>10.1f} ms"
+          f"  (모델 행 {model.rowCount():,})")
+
+    start = time.perf_counter()
+    view.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+    app.processEvents()
+    print(f"  {'크기순 정렬':<24} {(time.perf_counter() - start) * 1000:>10.1f} ms"
+          f"  (모델 행 {model.rowCount():,})")
+
+    start = time.perf_counter()
+    widget.set_quick_filter("file_1")
+    app.processEvents()
+    print(f"  {'빠른 필터':<24} {(time.perf_counter() - start) * 1000:>10.1f} ms"
+          f"  (모델 행 {model.rowCount():,} / 일치 {widget.proxy_model.rowCount() if fetch_rows <= 0 else model.total_rows():,})")
+    if baseline_rss is not None:
+        print(f"  {'최대 RSS (정렬/필터 후)':<24} {peak_rss_mb() - baseline_rss:>10.1f} MB")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--run":
+        run(int(sys.argv[2]), int(sys.argv[3]))
+        return
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    fetch_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    print("=" * 64)
+    print(f"행 나눠 보이기 벤치마크 ({count:,} 파일 + {count // 1000:,} 디렉토리)")
+    print("=" * 64)
+    sys.stdout.flush()
+    for rows in (0, fetch_rows):
+        subprocess.run([sys.executable, __file__, "--run", str(count), str(rows)], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""대량 파일 작업 벤치마크 (작은 파일 수만~수십만 개 복사/이동/삭제)
+
+작은 파일 N개를 만들고, 위젯이 원본 디렉토리를 보여 주는 동안(실시간 갱신 켬) 다음 작업을
+백그라운드에서 실행하며 시간을 잰다.
+
+- 복사 (다른 디렉토리로), 비교: shutil.copy2로 한 스레드에서 차례로 복사
+- 이동 (같은 파일 시스템: rename)
+- 삭제
+
+작업마다 GUI 스레드가 멈춘 최대 시간(10ms 타이머 사이 최대 간격)과
+진행 상황 시그널 수(파일마다가 아니라 묶어서 알림)를 함께 출력한다.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_file_operations.py [파일 수] [작업 스레드 수]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+from file_explorer import FileExplorerWidget
+
+TICK_MS = 10
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        source = os.path.join(root, "source")
+        os.makedirs(source)
+        data = b"x" * 1024
+        for i in range(count):
+            with open(os.path.join(source, f"file_{i:07d}.txt"), "wb") as f:
+                f.write(data)
+
+        print("=" * 64)
+        print(f"대량 파일 작업 벤치마크 (1KB 파일 {count:,}개, 작업 스레드 {workers})")
+        print("=" * 64)
+
+        widget = FileExplorerWidget(source, operation_workers=workers)
+        widget.resize(1000, 600)
+        widget.show()
+        model = widget.model
+        while model._loading:
+            app.processEvents()
+
+        gaps = []
+        last_tick = None
+
+        def tick():
+            nonlocal last_tick
+            now = time.perf_counter()
+            if last_tick is not None:
+                gaps.append(now - last_tick)
+            last_tick = now
+
+        timer = QTimer()
+        timer.setInterval(TICK_MS)
+        timer.timeout.connect(tick)
+        timer.start()
+
+        def run(label: str, start_operation, expected_rows: int):
+            """작업을 시작하고 끝날 때까지 이벤트를 처리하며 결과를 출력한다."""
+            nonlocal last_tick
+            results = []
+            signals = []
+            widget.operationProgress.connect(signals.append)
+            widget.operationFinished.connect(results.append)
+            gaps.clear()
+            last_tick = None
+            start = time.perf_counter()
+            start_operation()
+            while not results:
+                app.processEvents()
+            elapsed = time.perf_counter() - start
+            # 실시간 갱신이 목록에 반영될 때까지
+            while model._loading or model.rowCount() != expected_rows:
+                app.processEvents()
+            settled = time.perf_counter() - start
+            widget.operationProgress.disconnect(signals.append)
+            widget.operationFinished.disconnect(results.append)
+            result = results[0]
+            print(f"{label:<22} {elapsed * 1000:>10.1f} ms  (목록 반영까지 {settled * 1000:.1f} ms,"
+                  f" 항목 {result.files_done:,}, 오류 {len(result.errors)})")
+            print(f"{'  GUI 최대 멈춤':<22} {max(gaps, default=0) * 1000:>10.1f} ms"
+                  f"  (진행 시그널 {len(signals)}번)")
+
+        copied = os.path.join(root, "copied")
+        os.makedirs(copied)
+        widget.navigate_to(copied)
+        while model._loading:
+            app.processEvents()
+        paths = [os.path.join(source, name) for name in sorted(os.listdir(source))]
+        run("복사", lambda: widget.copy_files(copied, paths), count + 1)
+
+        baseline = os.path.join(root, "baseline")
+        os.makedirs(baseline)
+        start = time.perf_counter()
+        for path in paths:
+            shutil.copy2(path, baseline)
+        print(f"{'비교: shutil.copy2':<22} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+        shutil.rmtree(baseline)
+
+        moved = os.path.join(root, "moved")
+        os.makedirs(moved)
+        widget.navigate_to(copied)
+        while model._loading:
+            app.processEvents()
+        run("이동 (rename)", lambda: widget.move_files(moved, [os.path.join(copied, name) for name in
+                                                              os.listdir(copied)]), 1)
+
+        widget.navigate_to(source)
+        while model._loading:
+            app.processEvents()
+        widget.table_view.selectAll()
+        run("삭제 (전체 선택)", lambda: widget.delete_files(), 1)
+        timer.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""표시 문자열 포맷팅 벤치마크: 스캔 중 즉시 포맷팅 vs 화면에 보일 때 지연 포맷팅
+
+Qt 없이 실행된다. 임시 디렉토리에 파일을 만들어 스캔 처리량을 비교하고,
+strftime과 DisplayFormatter의 수정일시 포맷 처리량을 비교한다.
+
+    python benchmarks/bench_formatting.py [파일 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'file_explorer'))
+
+from entry_store import EntryStore
+from formatting import DisplayFormatter, format_modified, format_size
+
+VISIBLE_ROWS = 64  # 첫 화면에 보이는 정도의 행 수
+
+
+def make_tree(root: str, count: int):
+    """빈 파일 count개를 만들고 수정시간을 흩뜨린다."""
+    rng = random.Random(0)
+    now = time.time()
+    for i in range(count):
+        path = os.path.join(root, f"file_{i:07d}.dat")
+        with open(path, "wb"):
+            pass
+        modified = now - rng.random() * 5 * 365 * 86400
+        os.utime(path, (modified, modified))
+
+
+def scan(path: str, eager: bool):
+    """로더와 같은 방식으로 스캔한다. eager면 항목마다 표시 문자열도 만든다."""
+    store = EntryStore(path)
+    display = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            stat_info = entry.stat(follow_symlinks=False)
+            store.append(entry.name, entry.is_dir(follow_symlinks=False),
+                         entry.is_file(follow_symlinks=False),
+                         stat_info.st_size, stat_info.st_mtime)
+            if eager:
+                display.append((format_size(stat_info.st_size), format_modified(stat_info.st_mtime)))
+    if not eager:
+        # 첫 화면에 보이는 행만 포맷팅
+        formatter = DisplayFormatter()
+        for row in range(min(VISIBLE_ROWS, len(store))):
+            display.append((format_size(store.size(row)), formatter.format_modified(store.modified(row))))
+    return store, display
+
+
+def best_of(func, repeat: int = 3) -> float:
+    """가장 빠른 실행 시간(초)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+    print("=" * 60)
+    print(f"표시 문자열 포맷팅 벤치마크 ({count:,} 파일)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, count)
+        eager = best_of(lambda: scan(root, eager=True))
+        lazy = best_of(lambda: scan(root, eager=False))
+        print(f"  스캔 + 즉시 포맷팅     {eager * 1000:8.1f} ms  ({count / eager:>12,.0f} 항목/s)")
+        print(f"  스캔 + 보이는 행만     {lazy * 1000:8.1f} ms  ({count / lazy:>12,.0f} 항목/s)")
+        print(f"  {'개선':20} {eager / lazy:8.2f}x")
+
+    print("-" * 60)
+    rng = random.Random(1)
+    now = time.time()
+    # 실제 디렉토리처럼 수정시간이 몰려 있는 분포
+    timestamps = [now - rng.expovariate(1 / (30 * 86400)) for _ in range(count * 4)]
+    strftime_time = best_of(lambda: [format_modified(ts) for ts in timestamps])
+    formatter_time = best_of(lambda: DisplayFormatter().format_modified_batch(timestamps))
+    print(f"  strftime               {strftime_time * 1000:8.1f} ms  ({len(timestamps):,} 시각)")
+    print(f"  DisplayFormatter       {formatter_time * 1000:8.1f} ms")
+    print(f"  {'개선':20} {strftime_time / formatter_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
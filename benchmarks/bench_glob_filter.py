@@ -0,0 +1,87 @@
+"""glob 패턴 전환 벤치마크 (디스크 재스캔 vs 로드된 목록에 필터 적용)
+
+로그 디렉토리처럼 파일이 많은 디렉토리를 만들고, 주소 바에 `*.log`와 `*.gz`를 번갈아
+입력할 때 걸리는 시간을 잰다.
+
+- 재스캔: FileTableModel.load(경로, 패턴)으로 디렉토리를 다시 스캔 (이전 방식)
+- 필터: 위젯이 로드된 전체 목록에 GlobFilter를 적용 (패턴 전환/해제 모두)
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_glob_filter.py [파일 수] [반복 횟수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtWidgets import QApplication
+
+from file_explorer import FileExplorerWidget
+from file_explorer.listing_cache import ListingCache
+
+PATTERNS = ["*.log", "*.gz", "app-001*.log", "*.log.[0-9]"]
+SUFFIXES = [".log", ".gz", ".log.1", ".log.2"]
+
+
+def make_tree(root: str, count: int):
+    """파일 count개짜리 로그 디렉토리를 만든다."""
+    for i in range(count):
+        with open(os.path.join(root, f"app-{i:07d}{SUFFIXES[i % len(SUFFIXES)]}"), "wb"):
+            pass
+
+
+def wait_loaded(app: QApplication, widget: FileExplorerWidget):
+    while widget.model._loading:
+        app.processEvents()
+
+
+def median(values: list) -> float:
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, count)
+        widget = FileExplorerWidget(root, live_refresh=False, listing_cache=ListingCache())
+        wait_loaded(app, widget)
+
+        print("=" * 64)
+        print(f"glob 패턴 전환 벤치마크 ({count:,} 파일, {repeat}회 중앙값)")
+        print("=" * 64)
+        print(f"{'패턴':<16} {'재스캔':>12} {'필터':>12} {'행 수':>10}")
+
+        for pattern in PATTERNS:
+            rescans = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                widget.model.load(root, pattern)
+                wait_loaded(app, widget)
+                rescans.append((time.perf_counter() - start) * 1000)
+            # 전체 목록으로 되돌린 뒤 (캐시 적중) 필터 방식 측정
+            widget.navigate_to(root)
+            wait_loaded(app, widget)
+
+            filters = []
+            for _ in range(repeat):
+                widget._on_path_changed(root)  # 패턴 해제
+                start = time.perf_counter()
+                widget._on_path_changed(os.path.join(root, pattern))
+                filters.append((time.perf_counter() - start) * 1000)
+            rows = widget.proxy_model.rowCount()
+            print(f"{pattern:<16} {median(rescans):>10.1f}ms {median(filters):>10.2f}ms {rows:>10,}")
+
+        # 패턴 해제 (전체 목록 복원)
+        start = time.perf_counter()
+        widget._on_path_changed(root)
+        print(f"{'패턴 해제':<16} {'':>12} {(time.perf_counter() - start) * 1000:>10.2f}ms "
+              f"{widget.proxy_model.rowCount():>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""메모리 백엔드 대규모 벤치마크 (디스크 없이 수백만~천만 항목)
+
+MemoryBackend에 합성 항목을 만들고 위젯(모델/프록시/뷰)을 offscreen Qt에서 띄워
+다음을 측정하고 결과가 맞는지 확인한다.
+
+- 첫 행까지 시간, 로딩 완료까지 시간, 최대 RSS
+- 헤더 클릭 정렬 시간 (크기 오름/내림, 이름)
+- 스크롤 프레임 시간 (한 페이지씩 내리며 viewport를 다시 그림)
+- glob 필터(`file_00*`)와 이름 빠른 필터(`abc`) 적용 시간
+
+stat 지연(ms)을 주면 항목마다 그만큼 기다린다 (병렬 stat 스레드 수와 함께 사용).
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_memory_backend.py [항목 수] [stat 지연 ms] [stat 스레드 수]
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_memory_backend.py 10000000
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from file_explorer import FileExplorerWidget, MemoryBackend
+
+SCROLL_FRAMES = 50
+TIMEOUT = 3600  # 대기 한도(초)
+
+
+def peak_rss_mb() -> float | None:
+    """이 프로세스의 최대 RSS (MB). 측정할 수 없으면 None."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return (peak if sys.platform == "darwin" else peak * 1024) / (1024 * 1024)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    stat_latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 0.0) / 1000
+    stat_workers = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    backend = MemoryBackend(stat_latency=stat_latency)
+    backend.make_dir("/empty")
+    backend.add_synthetic("/data", count, dirs=count // 1000)
+
+    def pump_until(condition) -> float:
+        start = time.perf_counter()
+        while not condition():
+            if time.perf_counter() - start > TIMEOUT:
+                raise TimeoutError("측정 대기 시간 초과")
+            app.processEvents()
+        return time.perf_counter() - start
+
+    print("=" * 64)
+    print(f"메모리 백엔드 벤치마크 ({count:,} 파일 + {count // 1000:,} 디렉토리,"
+          f" stat 지연 {stat_latency * 1000:.2f} ms, stat 스레드 {stat_workers})")
+    print("=" * 64)
+
+    widget = FileExplorerWidget("/empty", backend=backend, stat_workers=stat_workers)
+    widget.resize(1000, 800)
+    widget.show()
+    model, proxy, view = widget.model, widget.proxy_model, widget.table_view
+    pump_until(lambda: not model._loading)
+
+    first_row = []
+    start = time.perf_counter()
+
+    def on_rows(*args):
+        if not first_row and model.rowCount() > 1:
+            first_row.append(time.perf_counter() - start)
+
+    model.rowsInserted.connect(on_rows)
+    widget.navigate_to("/data")
+    pump_until(lambda: first_row or not model._loading)
+    pump_until(lambda: not model._loading)
+    complete = time.perf_counter() - start
+    model.rowsInserted.disconnect(on_rows)
+    print(f"{'첫 행':<24} {(first_row[0] if first_row else complete) * 1000:>10.1f} ms")
+    print(f"{'로딩 완료':<24} {complete * 1000:>10.1f} ms")
+
+    expected = count + count // 1000 + 1
+    assert model.rowCount() == expected, (model.rowCount(), expected)
+
+    for label, column, order in (("크기 오름차순 정렬", 1, Qt.SortOrder.AscendingOrder),
+                                 ("크기 내림차순 정렬", 1, Qt.SortOrder.DescendingOrder),
+                                 ("이름 정렬", 0, Qt.SortOrder.AscendingOrder)):
+        sort_start = time.perf_counter()
+        view.sortByColumn(column, order)
+        print(f"{label:<24} {(time.perf_counter() - sort_start) * 1000:>10.1f} ms")
+
+    scrollbar = view.verticalScrollBar()
+    scrollbar.setValue(0)
+    app.processEvents()
+    frames = []
+    for _ in range(SCROLL_FRAMES):
+        scrollbar.setValue(scrollbar.value() + scrollbar.pageStep())
+        frame_start = time.perf_counter()
+        view.viewport().repaint()
+        frames.append((time.perf_counter() - frame_start) * 1000)
+    frames.sort()
+    print(f"{'스크롤 프레임 중앙값':<24} {frames[len(frames) // 2]:>10.2f} ms")
+    print(f"{'스크롤 프레임 최대':<24} {frames[-1]:>10.2f} ms")
+
+    # 이름 정렬 결과 확인 (.. 다음 디렉토리, 파일 순, 각각 이름 순)
+    names = [model._items.names[proxy.mapToSource(proxy.index(row, 0)).row()] for row in range(1, 2001)]
+    assert names == sorted(names, key=lambda name: (not name.startswith("dir_"), name.casefold()))
+
+    glob_start = time.perf_counter()
+    widget._on_path_changed("/data/file_00*")
+    pump_until(lambda: not model._loading)
+    print(f"{'glob 필터 (file_00*)':<24} {(time.perf_counter() - glob_start) * 1000:>10.1f} ms"
+          f"  ({proxy.rowCount():,}행)")
+
+    widget.navigate_to("/data")
+    pump_until(lambda: not model._loading)
+    filter_start = time.perf_counter()
+    widget.set_quick_filter("abc")
+    print(f"{'빠른 필터 (abc)':<24} {(time.perf_counter() - filter_start) * 1000:>10.1f} ms"
+          f"  ({proxy.rowCount():,}행)")
+
+    rss = peak_rss_mb()
+    if rss is not None:
+        print(f"{'최대 RSS':<24} {rss:>10.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
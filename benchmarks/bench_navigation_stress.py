@@ -0,0 +1,136 @@
+"""빠른 연속 이동 스트레스 벤치마크 (취소가 GUI 스레드를 막지 않는지)
+
+하위 디렉토리 여러 개를 만들고 초당 수백 번 navigate_to()를 호출한다.
+디렉토리 하나는 멈춘 NFS처럼 스캔이 취소 플래그를 보지 못하고 HANG_SECONDS 동안
+멈추게 한다 (scandir 호출 안에서 멈춘 상황).
+
+- navigate_to() 시간 (평균/p99/최대): 취소가 스캔 스레드를 기다리지 않으므로
+  멈춘 디렉토리를 떠날 때도 작아야 함 (--blocking이면 이전처럼 취소 후 스캔이 끝날 때까지 기다림)
+- 타이머 사이 최대 간격: 이동 사이에 청크 병합과 화면 그리기에 쓴 시간
+- 최대 스레드 수: 로더 풀 스레드 (멈춘 스캔이 끝나지 않은 동안 그 수만큼 더 생김)
+- 마지막 디렉토리의 행 수가 맞는지 (지난 로딩의 늦은 결과가 섞이지 않음)
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_navigation_stress.py [이동 횟수] [초당 이동] [디렉토리당 파일 수] [--blocking]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+import file_explorer.scan_scheduler
+from file_explorer import FileExplorerWidget, LoaderPool
+from file_explorer.listing_cache import ListingCache
+from file_explorer.loader import DirectoryLoader
+
+HANG_SECONDS = 3.0  # 멈춘 디렉토리의 스캔이 멈춰 있는 시간
+HUNG_NAME = "hung"
+TICK_MS = 10  # 이동 타이머 간격
+
+
+class HangingLoader(DirectoryLoader):
+    """이름이 HUNG_NAME인 디렉토리의 스캔을 취소와 상관없이 HANG_SECONDS 동안 멈춘다."""
+
+    def run(self):
+        if os.path.basename(self.path) == HUNG_NAME:
+            time.sleep(HANG_SECONDS)
+            if self._cancelled:
+                return
+        super().run()
+
+
+class BlockingLoader(HangingLoader):
+    """이전 동작: 취소하면 스캔 스레드가 끝날 때까지 기다린다."""
+
+    def cancel(self):
+        super().cancel()
+        self.wait()
+
+
+def main():
+    blocking = "--blocking" in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--blocking"]
+    count = int(args[0]) if len(args) > 0 else 2000
+    rate = int(args[1]) if len(args) > 1 else 500
+    files = int(args[2]) if len(args) > 2 else 2000
+    app = QApplication.instance() or QApplication(sys.argv)
+    file_explorer.scan_scheduler.DirectoryLoader = BlockingLoader if blocking else HangingLoader
+
+    with tempfile.TemporaryDirectory() as root:
+        names = [f"dir_{i:02d}" for i in range(8)] + [HUNG_NAME]
+        for name in names:
+            os.makedirs(os.path.join(root, name))
+            for k in range(files):
+                open(os.path.join(root, name, f"file_{k:05d}.txt"), "w").close()
+
+        print("=" * 64)
+        print(f"연속 이동 스트레스 ({count:,}번, 초당 {rate}번, 디렉토리당 파일 {files:,}개"
+              f"{', 취소 시 대기' if blocking else ''})")
+        print("=" * 64)
+
+        pool = LoaderPool()
+        # 캐시를 끄고 매번 스캔하게 한다
+        widget = FileExplorerWidget(root, live_refresh=False, listing_cache=ListingCache(max_entries=0),
+                                    loader_pool=pool)
+        widget.resize(1000, 600)
+        widget.show()
+        model = widget.model
+
+        # 이벤트 루프 안에서 TICK_MS마다 여러 번 이동한다 (화면 그리기는 Qt가 모아서 처리)
+        burst = max(1, rate * TICK_MS // 1000)
+        durations = []
+        gaps = []  # 타이머 호출 사이 간격 (GUI 스레드가 멈춘 시간 포함)
+        peak_threads = 0
+        timer = QTimer()
+        timer.setInterval(TICK_MS)
+        last_tick = None
+
+        def step():
+            nonlocal peak_threads, last_tick
+            now = time.perf_counter()
+            if last_tick is not None:
+                gaps.append(now - last_tick)
+            for _ in range(burst):
+                name = names[len(durations) % len(names)]
+                began = time.perf_counter()
+                widget.navigate_to(os.path.join(root, name))
+                durations.append(time.perf_counter() - began)
+                if len(durations) == count:
+                    timer.stop()
+                    loop.quit()
+                    break
+            peak_threads = max(peak_threads, pool.thread_count())
+            last_tick = time.perf_counter()
+
+        loop = QEventLoop()
+        timer.timeout.connect(step)
+        start = time.perf_counter()
+        timer.start()
+        loop.exec()
+        elapsed = time.perf_counter() - start
+
+        last = names[(count - 1) % len(names)]
+        settle = time.perf_counter()
+        while model._loading:
+            app.processEvents()
+        settle = time.perf_counter() - settle
+
+        durations.sort()
+        print(f"{'실제 초당 이동':<28} {count / elapsed:>10.0f}")
+        print(f"{'navigate_to() 평균':<28} {sum(durations) / count * 1000:>10.2f} ms")
+        print(f"{'navigate_to() p99':<28} {durations[int(count * 0.99)] * 1000:>10.2f} ms")
+        print(f"{'navigate_to() 최대':<28} {durations[-1] * 1000:>10.2f} ms")
+        print(f"{'타이머 사이 최대 간격':<28} {max(gaps) * 1000:>10.2f} ms")
+        print(f"{'최대 로더 스레드 수':<28} {peak_threads:>10}")
+        print(f"{'마지막 로딩 완료까지':<28} {settle * 1000:>10.1f} ms")
+        expected = files + 1
+        print(f"{'마지막 디렉토리 행 수':<28} {model.rowCount():>10} ({'정상' if model.rowCount() == expected else '오류'},"
+              f" {last})")
+
+
+if __name__ == "__main__":
+    main()
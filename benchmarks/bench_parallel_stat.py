@@ -0,0 +1,76 @@
+"""병렬 stat 파이프라인 벤치마크 (지연 주입 파일 시스템)
+
+stat 한 번마다 네트워크 왕복처럼 지연을 넣는 로더로 임시 디렉토리를 스캔해
+순차 stat과 스레드 풀 크기별 병렬 stat의 첫 행/전체 이름/전체 메타데이터
+도착 시간을 비교한다. 로더는 이벤트 루프 없이 현재 스레드에서 실행한다.
+
+    python benchmarks/bench_parallel_stat.py [파일 수] [stat 지연(ms)]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from file_explorer.loader import DirectoryLoader
+
+
+class LatencyLoader(DirectoryLoader):
+    """stat마다 latency초 지연되는 파일 시스템을 흉내 내는 로더"""
+
+    latency = 0.002
+
+    def _stat_entry(self, entry):
+        time.sleep(self.latency)
+        return super()._stat_entry(entry)
+
+
+def run(path: str, stat_workers: int) -> dict:
+    """로더를 동기 실행하고 단계별 도착 시간(초)을 잰다."""
+    loader = LatencyLoader(path, stat_workers=stat_workers)
+    timings = {"names": 0, "stats": 0}
+    start = time.perf_counter()
+
+    def on_chunk(chunk):
+        loader.chunk_consumed()
+        timings.setdefault("first_row", time.perf_counter() - start)
+        timings["names"] += len(chunk)
+        timings["all_names"] = time.perf_counter() - start
+
+    def on_stats(stats):
+        timings["stats"] += len(stats)
+
+    loader.chunk_ready.connect(on_chunk)
+    loader.stats_ready.connect(on_stats)
+    loader.run()
+    timings["total"] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    LatencyLoader.latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 2.0) / 1000
+
+    print("=" * 72)
+    print(f"병렬 stat 벤치마크 ({count:,} 파일, stat 지연 {LatencyLoader.latency * 1000:.1f} ms)")
+    print("=" * 72)
+    print(f"{'stat 스레드':>12} {'첫 행':>10} {'전체 이름':>10} {'전체 완료':>10} {'순차 대비':>10}")
+    print("-" * 72)
+
+    with tempfile.TemporaryDirectory() as root:
+        for i in range(count):
+            with open(os.path.join(root, f"file_{i:06d}.dat"), "wb"):
+                pass
+
+        baseline = None
+        for workers in (0, 4, 16, 64):
+            timings = run(root, workers)
+            baseline = baseline or timings["total"]
+            label = "순차" if workers == 0 else str(workers)
+            print(f"{label:>12} {timings['first_row'] * 1000:>8.1f}ms {timings['all_names'] * 1000:>8.1f}ms "
+                  f"{timings['total'] * 1000:>8.1f}ms {baseline / timings['total']:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
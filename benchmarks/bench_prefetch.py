@@ -0,0 +1,106 @@
+"""미리 스캔 벤치마크 (처음 여는 디렉토리 vs 미리 스캔된 디렉토리)
+
+하위 디렉토리 여러 개에 파일을 만들고 다음 시간을 잰다.
+
+- 미리 스캔 없음: 하위 디렉토리로 이동해 로딩이 끝날 때까지
+- 미리 스캔됨: 하위 디렉토리를 선택해 두고 (미리 스캔이 끝날 때까지 기다림)
+  이동했을 때 모든 행이 표시될 때까지
+- 전경 로딩: 미리 스캔이 진행 중일 때 다른 디렉토리로 이동해 로딩이 끝날 때까지
+  (미리 스캔은 바로 멈추므로 미리 스캔 없음과 비슷해야 함)
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_prefetch.py [하위 디렉토리 수] [디렉토리당 파일 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtWidgets import QApplication
+
+from file_explorer import FileExplorerWidget
+from file_explorer.listing_cache import ListingCache
+
+
+def make_tree(root: str, subdirs: int, files: int):
+    """하위 디렉토리 subdirs개에 빈 파일 files개씩 만든다."""
+    for i in range(subdirs):
+        directory = os.path.join(root, f"dir_{i:02d}")
+        os.makedirs(directory)
+        for k in range(files):
+            open(os.path.join(directory, f"file_{k:06d}.txt"), "w").close()
+
+
+def wait_for(app: QApplication, condition, timeout: float = 600.0) -> float:
+    """condition이 참이 될 때까지 이벤트를 처리하고 걸린 시간(ms)을 반환한다."""
+    start = time.perf_counter()
+    while not condition():
+        app.processEvents()
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError
+    return (time.perf_counter() - start) * 1000
+
+
+def select_name(widget: FileExplorerWidget, name: str):
+    """이름이 name인 행을 현재 행으로 만든다."""
+    proxy = widget.proxy_model
+    for row in range(proxy.rowCount()):
+        index = proxy.index(row, 0)
+        if widget.model._items.names[proxy.mapToSource(index).row()] == name:
+            widget.table_view.setCurrentIndex(index)
+            return
+
+
+def main():
+    subdirs = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, subdirs, files)
+        names = sorted(os.listdir(root))
+
+        print("=" * 64)
+        print(f"미리 스캔 벤치마크 (하위 디렉토리 {subdirs}개 x 파일 {files:,}개)")
+        print("=" * 64)
+
+        for prefetch_bytes in (0, 256 * 1024 * 1024):
+            cache = ListingCache()
+            widget = FileExplorerWidget(root, live_refresh=False, listing_cache=cache,
+                                        prefetch_bytes=prefetch_bytes)
+            widget.resize(1000, 600)
+            widget.show()
+            model = widget.model
+            wait_for(app, lambda: not model._loading)
+            label = "미리 스캔됨" if prefetch_bytes else "미리 스캔 없음"
+
+            target = os.path.join(root, names[0])
+            select_name(widget, names[0])
+            if prefetch_bytes:
+                wait_for(app, lambda: target in cache)
+            start = time.perf_counter()
+            widget.navigate_to(target)
+            wait_for(app, lambda: not model._loading and model.rowCount() == files + 1)
+            print(f"{label + ' 이동':<32} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+            if prefetch_bytes:
+                # 미리 스캔이 진행 중일 때 전경 로딩
+                widget.navigate_to(root)
+                wait_for(app, lambda: not model._loading)
+                model.prefetch(os.path.join(root, name) for name in names[2:])
+                time.sleep(0.05)
+            else:
+                widget.navigate_to(root)
+                wait_for(app, lambda: not model._loading)
+            start = time.perf_counter()
+            widget.navigate_to(os.path.join(root, names[1]))
+            wait_for(app, lambda: not model._loading)
+            print(f"{'전경 로딩 (' + label + ')':<32} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+            widget.close()
+            widget.deleteLater()
+            app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""이름 빠른 필터 벤치마크 (키 입력마다 set_filter 시간)
+
+디스크를 건드리지 않고 합성 항목으로 모델을 채운 뒤, 필터 입력에 검색어를 한 글자씩
+입력하고 지울 때 키 입력마다 걸리는 시간을 잰다. 위젯의 set_quick_filter(직전 결과 안에서
+다시 찾고, 백스페이스 때 이전 결과 재사용)와 매번 전체 행을 찾는 경우(전체)를 비교한다.
+한 프레임(16.7 ms) 안이 목표다.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_quick_filter.py [행 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from file_explorer import FileExplorerWidget
+from file_explorer.entry_store import EntryStore
+from file_explorer.file_model import FileTableModel
+from file_explorer.name_filter import QuickFilter
+
+WORDS = ["report", "data", "image", "backup", "config", "log", "frame", "archive", "sample", "test"]
+EXTENSIONS = [".txt", ".csv", ".png", ".jpg", ".gz", ".log", ".json", ".parquet", ".py", ""]
+QUERIES = ["report_1", "frm.png"]
+
+
+def fill_model(model: FileTableModel, count: int):
+    """모델을 합성 항목으로 채운다 (로딩 완료 상태와 같은 기본 정렬 순서)."""
+    rng = random.Random(0)
+    store = EntryStore("/bench")
+    store.append_parent()
+    for i in range(count):
+        is_dir = i % 50 == 0
+        name = f"{rng.choice(WORDS)}_{rng.randrange(10 ** 6)}{'' if is_dir else rng.choice(EXTENSIONS)}"
+        store.append(name, is_dir, not is_dir, None if is_dir else rng.randrange(10 ** 9), rng.random() * 1e9)
+    model.beginResetModel()
+    model._items = store.select(sorted(range(len(store)), key=store.sort_key))
+    model.endResetModel()
+
+
+def type_query(widget: FileExplorerWidget, query: str, fuzzy: bool, incremental: bool) -> list:
+    """query를 한 글자씩 입력한 뒤 다시 지우며 키 입력별 (검색어, ms, 행 수)를 반환한다."""
+    steps = [query[:n] for n in range(1, len(query) + 1)] + [query[:n] for n in range(len(query) - 1, -1, -1)]
+    proxy = widget.proxy_model
+    results = []
+    for text in steps:
+        start = time.perf_counter()
+        if incremental:
+            widget.set_quick_filter(text, fuzzy)
+        else:
+            proxy.set_filter("quick", QuickFilter(text, fuzzy) if text else None)
+        results.append((text, (time.perf_counter() - start) * 1000, proxy.rowCount()))
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    empty = tempfile.TemporaryDirectory()
+    widget = FileExplorerWidget(empty.name, live_refresh=False)
+    model, proxy = widget.model, widget.proxy_model
+    while model._loading:
+        app.processEvents()
+    fill_model(model, count)
+
+    print("=" * 64)
+    print(f"이름 빠른 필터 벤치마크 ({count:,} 항목)")
+    print("=" * 64)
+
+    start = time.perf_counter()
+    model.name_index()
+    print(f"{'이름 인덱스 생성 (포커스 시)':<36} {(time.perf_counter() - start) * 1000:>8.1f} ms")
+
+    for column in (-1, FileTableModel.COLUMN_NAME):
+        proxy.sort(column, Qt.SortOrder.AscendingOrder)
+        label = "원본 순서" if column < 0 else "이름순 정렬"
+        for query, fuzzy in [(QUERIES[0], False), (QUERIES[1], True)]:
+            print("-" * 64)
+            print(f"{label}, 검색어 '{query}'{' (퍼지)' if fuzzy else ''}")
+            print(f"{'검색어':<12} {'위젯':>10} {'전체':>10} {'행 수':>10}")
+            widget._quick_filters.clear()  # 이전 검색어 결과를 재사용하지 않도록
+            incremental = type_query(widget, query, fuzzy, incremental=True)
+            full = type_query(widget, query, fuzzy, incremental=False)
+            for (text, ms, rows), (_, full_ms, _) in zip(incremental, full):
+                print(f"{repr(text):<12} {ms:>8.2f}ms {full_ms:>8.2f}ms {rows:>10,}")
+            worst = max(ms for _, ms, _ in incremental)
+            print(f"최대 키 입력 시간: {worst:.2f} ms")
+    empty.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Qt 없는 스캔 코어 / 명령줄 도구 벤치마크 (find, ls -f 비교)
+
+하위 디렉토리 여러 개에 작은 파일을 나눠 만든 트리와 파일이 많은 평면 디렉토리에서
+`python -m file_explorer.scan`과 find / ls -f의 시간을 잰다 (출력은 /dev/null로 버림).
+명령마다 REPEAT번 실행해 가장 짧은 시간을 쓴다 (디렉토리 캐시가 찬 상태 기준).
+프로세스 시작 비용 없이 코어 제너레이터(walk)만 돌린 시간도 함께 출력한다.
+
+    python benchmarks/bench_scan_cli.py [파일 수] [하위 디렉토리 수]
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from file_explorer.scan import walk
+
+REPEAT = 3
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def make_tree(root: str, files: int, subdirs: int) -> tuple[str, str]:
+    """하위 디렉토리에 나눈 트리와 같은 수의 파일이 있는 평면 디렉토리를 만든다."""
+    tree = os.path.join(root, "tree")
+    flat = os.path.join(root, "flat")
+    for i in range(subdirs):
+        os.makedirs(os.path.join(tree, f"dir_{i:04d}"))
+    os.makedirs(flat)
+    for i in range(files):
+        name = f"file_{i:07d}.{'py' if i % 10 == 0 else 'txt'}"
+        open(os.path.join(tree, f"dir_{i % subdirs:04d}", name), "w").close()
+        open(os.path.join(flat, name), "w").close()
+    return tree, flat
+
+
+def best_time(command: list) -> float:
+    """명령을 REPEAT번 실행한 가장 짧은 시간(ms)."""
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, check=True, cwd=ROOT)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def best_walk_time(*args, **kwargs) -> tuple[float, int]:
+    """walk()를 REPEAT번 돌린 가장 짧은 시간(ms)과 항목 수."""
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        count = sum(len(batch) for batch in walk(*args, **kwargs))
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, count
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    subdirs = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    scan = [sys.executable, "-m", "file_explorer.scan"]
+
+    with tempfile.TemporaryDirectory() as root:
+        tree, flat = make_tree(root, files, subdirs)
+        print("=" * 64)
+        print(f"스캔 명령줄 벤치마크 (파일 {files:,}개, 트리는 하위 디렉토리 {subdirs}개)")
+        print("=" * 64)
+
+        cases = [
+            ("트리 전체 (이름만)", [
+                ("find", ["find", tree]),
+                ("scan -r --no-stat", scan + [tree, "-r", "--no-stat"]),
+            ]),
+            ("트리 전체 (크기/수정시간)", [
+                ("find -printf", ["find", tree, "-printf", "%P\t%y\t%s\t%T@\n"]),
+                ("scan -r (NDJSON)", scan + [tree, "-r"]),
+                ("scan -r -f csv", scan + [tree, "-r", "-f", "csv"]),
+            ]),
+            ("트리 glob (*.py)", [
+                ("find -name", ["find", tree, "-name", "*.py", "-printf", "%P\t%y\t%s\t%T@\n"]),
+                ("scan -r -g '*.py'", scan + [tree, "-r", "-g", "*.py"]),
+            ]),
+            ("평면 디렉토리", [
+                ("ls -f", ["ls", "-f", flat]),
+                ("scan --no-stat", scan + [flat, "--no-stat"]),
+                ("scan (NDJSON)", scan + [flat]),
+            ]),
+        ]
+        for title, commands in cases:
+            print(title)
+            for label, command in commands:
+                if shutil.which(command[0]) is None:
+                    print(f"  {label:<26} {'(없음)':>10}")
+                    continue
+                print(f"  {label:<26} {best_time(command):>10.1f} ms")
+
+        print("코어 제너레이터 (walk, 출력 없음)")
+        for label, args, kwargs in (
+            ("트리 전체", (tree,), {"recursive": True}),
+            ("트리 전체 (stat 생략)", (tree,), {"recursive": True, "stat": False}),
+            ("평면 디렉토리", (flat,), {}),
+        ):
+            elapsed, count = best_walk_time(*args, **kwargs)
+            print(f"  {label:<26} {elapsed:>10.1f} ms  ({count:,}개, {count / elapsed * 1000:,.0f}개/초)")
+
+
+if __name__ == "__main__":
+    main()
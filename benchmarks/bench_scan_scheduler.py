@@ -0,0 +1,130 @@
+"""창끼리 공유하는 스캔 스케줄러 벤치마크 (공유 vs 창마다 따로)
+
+메모리 백엔드에 큰 디렉토리를 만들고 다음을 잰다.
+
+- 두 창에서 같은 디렉토리: 한 창이 로딩을 시작한 직후 다른 창에서도 같은 디렉토리를 열어
+  두 창 모두 로딩이 끝날 때까지의 시간과 실제 스캔 횟수
+- 숨은 탭 vs 포커스 창: 숨은 탭이 큰 디렉토리를 로딩하는 중에 포커스가 있는 창에서 다른
+  디렉토리를 열어 포커스 창의 로딩이 끝날 때까지의 시간 (숨은 탭이 끝난 시간도 함께)
+
+"따로"는 창마다 자기 스케줄러와 로더 풀을 쓰는 이전 방식이다.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_scan_scheduler.py [디렉토리당 항목 수]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtWidgets import QApplication
+
+from file_explorer import FileExplorerWidget, LoaderPool, MemoryBackend
+from file_explorer import loader as loader_module
+from file_explorer.listing_cache import ListingCache
+from file_explorer.scan_scheduler import ScanScheduler
+
+scan_count = 0
+
+
+def count_runs():
+    """DirectoryLoader.run 호출 수를 센다."""
+    run = loader_module.DirectoryLoader.run
+
+    def counting_run(self):
+        global scan_count
+        scan_count += 1
+        return run(self)
+
+    loader_module.DirectoryLoader.run = counting_run
+
+
+def wait_for(app: QApplication, condition, timeout: float = 600.0) -> float:
+    """condition이 참이 될 때까지 이벤트를 처리하고 걸린 시간(ms)을 반환한다."""
+    start = time.perf_counter()
+    while not condition():
+        app.processEvents()
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError
+    return (time.perf_counter() - start) * 1000
+
+
+def make_panes(backend: MemoryBackend, shared: bool, count: int = 2) -> list:
+    """빈 디렉토리를 연 창 count개 (shared면 한 스케줄러, 아니면 창마다 스케줄러와 풀)."""
+    scheduler = ScanScheduler(LoaderPool())
+    panes = []
+    for _ in range(count):
+        if not shared:
+            scheduler = ScanScheduler(LoaderPool())
+        panes.append(FileExplorerWidget("/empty", backend=backend, live_refresh=False,
+                                        listing_cache=ListingCache(), scan_scheduler=scheduler))
+    return panes
+
+
+def close_panes(app: QApplication, panes: list):
+    for pane in panes:
+        pane.close()
+        pane.deleteLater()
+    app.processEvents()
+
+
+def same_directory(app: QApplication, backend: MemoryBackend, shared: bool, entries: int):
+    global scan_count
+    panes = make_panes(backend, shared)
+    wait_for(app, lambda: not any(pane.model._loading for pane in panes))
+    scan_count = 0
+    start = time.perf_counter()
+    panes[0].navigate_to("/big")
+    wait_for(app, lambda: panes[0].model.total_rows() > 1000)
+    panes[1].navigate_to("/big")
+    wait_for(app, lambda: not any(pane.model._loading for pane in panes))
+    elapsed = (time.perf_counter() - start) * 1000
+    assert all(pane.model.total_rows() == entries + entries // 1000 + 1 for pane in panes)
+    close_panes(app, panes)
+    return elapsed, scan_count
+
+
+def hidden_tab(app: QApplication, backend: MemoryBackend, shared: bool):
+    hidden, front = make_panes(backend, shared)
+    front.resize(1000, 600)
+    front.show()
+    front.table_view.setFocus()
+    wait_for(app, lambda: not hidden.model._loading and not front.model._loading)
+    done = {}  # 창 -> 로딩이 끝난 시각
+    for name, pane in (("hidden", hidden), ("front", front)):
+        pane.model.totalRowsChanged.connect(
+            lambda total, loading, name=name: loading or done.setdefault(name, time.perf_counter()))
+    hidden.navigate_to("/big")
+    wait_for(app, lambda: hidden.model.total_rows() > 1000)
+    start = time.perf_counter()
+    front.navigate_to("/other")
+    wait_for(app, lambda: "hidden" in done and "front" in done)
+    close_panes(app, [hidden, front])
+    return (done["front"] - start) * 1000, (done["hidden"] - start) * 1000
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    app = QApplication.instance() or QApplication(sys.argv)
+    count_runs()
+
+    backend = MemoryBackend()
+    backend.add_synthetic("/big", entries, dirs=entries // 1000)
+    backend.add_synthetic("/other", entries, dirs=entries // 1000)
+    backend.make_dir("/empty")
+
+    print("=" * 64)
+    print(f"스캔 스케줄러 벤치마크 (디렉토리당 항목 {entries:,}개, 메모리 백엔드)")
+    print("=" * 64)
+    print("두 창에서 같은 디렉토리")
+    for shared in (False, True):
+        elapsed, scans = same_directory(app, backend, shared, entries)
+        print(f"  {'공유' if shared else '따로':<8} 두 창 완료 {elapsed:>10.1f} ms  스캔 {scans}번")
+    print("숨은 탭 로딩 중 포커스 창에서 이동")
+    for shared in (False, True):
+        front, hidden = hidden_tab(app, backend, shared)
+        print(f"  {'공유' if shared else '따로':<8} 포커스 창 {front:>10.1f} ms  숨은 탭 {hidden:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""헤더 클릭 정렬 벤치마크 (ExplorerSortProxyModel.sort)
+
+디스크를 건드리지 않고 합성 항목으로 모델을 채운 뒤 컬럼별 정렬 시간을 잰다.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_sort.py [행 수]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+import file_explorer_single
+from file_explorer.entry_store import EntryStore
+from file_explorer.file_model import FileTableModel, load_numpy
+from file_explorer.sort_proxy import ExplorerSortProxyModel
+
+
+def fill_package_model(model: FileTableModel, count: int):
+    """패키지 모델을 합성 항목으로 채운다 (로딩 완료 상태와 같은 기본 정렬 순서)."""
+    rng = random.Random(0)
+    store = EntryStore("/bench")
+    store.append_parent()
+    for i in range(count):
+        is_dir = i % 50 == 0
+        store.append(f"Entry_{rng.random():.12f}", is_dir, not is_dir,
+                     None if is_dir else rng.randrange(10 ** 9), rng.random() * 1e9)
+    model.beginResetModel()
+    model._items = store.select(sorted(range(len(store)), key=store.sort_key))
+    model.endResetModel()
+
+
+def fill_single_model(model, count: int):
+    """단일 파일 버전 모델을 합성 항목으로 채운다 (스캔 순서 그대로)."""
+    rng = random.Random(0)
+    store = file_explorer_single.EntryStore("/bench")
+    store.append_parent()
+    for i in range(count):
+        is_dir = i % 50 == 0
+        size = None if is_dir else rng.randrange(10 ** 9)
+        store.append(f"Entry_{rng.random():.12f}", is_dir, size, rng.random() * 1e9)
+    model.beginResetModel()
+    model._items = store
+    model.endResetModel()
+
+
+def bench(label: str, model, proxy):
+    """컬럼/방향별 정렬 시간을 출력한다."""
+    columns = [
+        (FileTableModel.COLUMN_NAME, "이름"),
+        (FileTableModel.COLUMN_SIZE, "크기"),
+        (FileTableModel.COLUMN_MODIFIED, "수정일시"),
+    ]
+    for column, column_name in columns:
+        for order in (Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder):
+            start = time.perf_counter()
+            proxy.sort(column, order)
+            elapsed = (time.perf_counter() - start) * 1000
+            direction = "오름차순" if order == Qt.SortOrder.AscendingOrder else "내림차순"
+            print(f"  {label:10} {column_name:6} {direction:6} {elapsed:8.1f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    app = QApplication(sys.argv)
+
+    print("=" * 60)
+    print(f"헤더 정렬 벤치마크 ({count:,} 행, NumPy {'사용' if load_numpy() is not None else '없음'})")
+    print("=" * 60)
+
+    model = FileTableModel()
+    proxy = ExplorerSortProxyModel()
+    proxy.setSourceModel(model)
+    fill_package_model(model, count)
+    bench("패키지", model, proxy)
+
+    print("-" * 60)
+    single_model = file_explorer_single.FileTableModel()
+    single_proxy = file_explorer_single.ExplorerSortProxyModel()
+    single_proxy.setSourceModel(single_model)
+    fill_single_model(single_model, count)
+    bench("단일 파일", single_model, single_proxy)
+
+
+if __name__ == "__main__":
+    main()
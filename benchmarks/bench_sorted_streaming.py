@@ -0,0 +1,88 @@
+"""정렬 순서 스트리밍 벤치마크 (로딩 중 선택/스크롤 유지, 로딩 끝 초기화 없음)
+
+무작위 이름 파일이 많은 디렉토리를 열고 로딩 중에 행 하나를 선택하고 스크롤한 뒤
+로딩이 끝날 때까지 다음을 잰다.
+
+- 전체 로딩 시간과 청크 병합 한 번에 GUI 스레드가 멈춘 최대 시간
+- 청크 병합에 쓴 알림 종류별 횟수 (행 추가 / 레이아웃 변경 / 초기화)
+- 로딩이 끝난 뒤에도 선택한 항목과 스크롤 위치가 그대로인지
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_sorted_streaming.py [파일 수]
+"""
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtCore import QItemSelectionModel
+from PyQt6.QtWidgets import QApplication
+
+from file_explorer import FileExplorerWidget
+from file_explorer.listing_cache import ListingCache
+
+SELECT_ROW = 1000  # 로딩 중 선택할 행
+SCROLL_ROW = 900  # 로딩 중 스크롤할 위치
+
+
+def make_tree(root: str, count: int):
+    """무작위 이름(스캔 순서와 정렬 순서가 다름)의 파일 count개를 만든다."""
+    rng = random.Random(0)
+    letters = string.ascii_letters + string.digits
+    for i in range(count):
+        name = "".join(rng.choice(letters) for _ in range(rng.randrange(6, 16)))
+        with open(os.path.join(root, f"{name}_{i}.dat"), "wb"):
+            pass
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, count)
+        widget = FileExplorerWidget(root, live_refresh=False, listing_cache=ListingCache())
+        widget.resize(1000, 600)
+        widget.show()
+        model, proxy, view = widget.model, widget.proxy_model, widget.table_view
+
+        counts = {"행 추가": 0, "레이아웃 변경": 0, "초기화": 0}
+        model.rowsInserted.connect(lambda *args: counts.__setitem__("행 추가", counts["행 추가"] + 1))
+        model.layoutChanged.connect(lambda *args: counts.__setitem__("레이아웃 변경", counts["레이아웃 변경"] + 1))
+        model.modelReset.connect(lambda: counts.__setitem__("초기화", counts["초기화"] + 1))
+
+        start = time.perf_counter()
+        longest = 0.0
+        selected = None
+        while model._loading:
+            step = time.perf_counter()
+            app.processEvents()
+            longest = max(longest, time.perf_counter() - step)
+            if selected is None and proxy.rowCount() > SELECT_ROW:
+                index = proxy.index(SELECT_ROW, 0)
+                view.selectionModel().setCurrentIndex(
+                    index, QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows)
+                selected = model._items.names[proxy.mapToSource(index).row()]
+                view.verticalScrollBar().setValue(SCROLL_ROW)
+        elapsed = (time.perf_counter() - start) * 1000
+        app.processEvents()
+
+        current = view.selectionModel().currentIndex()
+        current_name = model._items.names[proxy.mapToSource(current).row()] if current.isValid() else None
+
+        print("=" * 64)
+        print(f"정렬 순서 스트리밍 벤치마크 ({count:,} 파일)")
+        print("=" * 64)
+        print(f"{'전체 로딩':<28} {elapsed:>10.1f} ms")
+        print(f"{'이벤트 처리 최대 멈춤':<28} {longest * 1000:>10.1f} ms")
+        for label, value in counts.items():
+            print(f"{label + ' 알림':<28} {value:>10,}")
+        print(f"{'선택 유지':<28} {str(current_name == selected):>10} ({selected})")
+        print(f"{'스크롤 위치 (행)':<28} {view.verticalScrollBar().value():>10,} (로딩 중 {SCROLL_ROW:,})")
+
+
+if __name__ == "__main__":
+    main()
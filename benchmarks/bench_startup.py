@@ -0,0 +1,165 @@
+"""시작 시간 벤치마크: import 시간, 모델 생성 시간, 탭 여러 개의 첫 표시 시간
+
+- import: 새 인터프리터에서 `import file_explorer`(지연 import)와 위젯 스택 전체를
+  즉시 불러오는 경우(이전 방식: 모든 하위 모듈 + NumPy)를 비교한다.
+- 모델 생성: FileTableModel 생성 시간 (아이콘 지연 로드 / 생성 시 기본 아이콘 로드).
+- 탭: 파일이 있는 디렉토리를 가리키는 탐색기 여러 개를 QTabWidget에 넣고 창을 띄워
+  첫 탭의 로딩이 끝날 때까지 시간을 잰다 (load_when_shown 켬/끔).
+
+측정마다 하위 프로세스에서 실행하고 중앙값을 보고한다.
+
+    python benchmarks/bench_startup.py [탭 수] [디렉토리당 파일 수] [반복 횟수]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+IMPORT_LAZY = "import file_explorer"
+IMPORT_WIDGET = "from file_explorer import FileExplorerWidget"
+IMPORT_EAGER = (
+    "import numpy, file_explorer.explorer_widget, file_explorer.disk_index, file_explorer.search; "
+    "import sqlite3, json, concurrent.futures, ctypes.util"
+)
+
+
+def measure_import(statement: str) -> float:
+    """새 인터프리터에서 statement 실행 시간(ms)."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def run_model_case(eager_icons: bool) -> float:
+    """하위 프로세스: FileTableModel 하나 생성 시간(ms)."""
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+    from file_explorer.file_model import FileTableModel
+    from file_explorer.icon_cache import IconCache
+    FileTableModel(icon_cache=IconCache())  # 클래스/Qt 초기화 비용 제외
+
+    start = time.perf_counter()
+    icon_cache = IconCache()
+    FileTableModel(icon_cache=icon_cache)
+    if eager_icons:
+        # 이전 방식: 생성 시 아이콘 제공자와 기본 아이콘 로드
+        icon_cache.placeholder()
+    return (time.perf_counter() - start) * 1000
+
+
+def run_tabs_case(root: str, tabs: int, load_when_shown: bool) -> dict:
+    """하위 프로세스: 탭 여러 개를 만들고 첫 탭이 로드될 때까지 시간(ms)."""
+    start = time.perf_counter()
+    from PyQt6.QtWidgets import QApplication, QTabWidget
+    app = QApplication.instance() or QApplication(sys.argv)
+    from file_explorer import FileExplorerWidget
+    from file_explorer.listing_cache import ListingCache
+
+    window = QTabWidget()
+    explorers = []
+    for i in range(tabs):
+        explorer = FileExplorerWidget(os.path.join(root, f"tab_{i}"), listing_cache=ListingCache(),
+                                      live_refresh=False, load_when_shown=load_when_shown)
+        window.addTab(explorer, f"tab {i}")
+        explorers.append(explorer)
+    constructed = time.perf_counter()
+
+    window.resize(1000, 800)
+    window.show()
+    first = explorers[0].model
+    while first._loading or first.rowCount() == 0:
+        app.processEvents()
+    shown = time.perf_counter()
+
+    # 백그라운드에서 돌던 숨은 탭 로더가 끝날 때까지 (결과에는 포함하지 않음)
+    while any(explorer.model._loading for explorer in explorers):
+        app.processEvents()
+
+    return {
+        "construct_ms": (constructed - start) * 1000,
+        "first_tab_ready_ms": (shown - start) * 1000,
+        "scanned_tabs": sum(1 for explorer in explorers if explorer.model.rowCount() > 0),
+    }
+
+
+def run_case(args: list) -> str:
+    """하위 프로세스 진입점: 결과를 한 줄로 출력할 문자열."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, ROOT)
+    kind = args[0]
+    if kind == "model":
+        return json.dumps(run_model_case(args[1] == "eager"))
+    return json.dumps(run_tabs_case(args[1], int(args[2]), args[3] == "lazy"))
+
+
+def spawn(*args) -> object:
+    """이 스크립트를 하위 프로세스로 실행하고 결과를 반환한다."""
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    completed = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", *map(str, args)],
+                               capture_output=True, text=True, env=env, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def median(values: list) -> float:
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--case":
+        print(run_case(sys.argv[2:]))
+        return
+
+    tabs = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    print("=" * 64)
+    print(f"시작 시간 벤치마크 (탭 {tabs}개, 탭당 {files:,} 파일, {repeat}회 중앙값)")
+    print("=" * 64)
+
+    lazy = median([measure_import(IMPORT_LAZY) for _ in range(repeat)])
+    widget = median([measure_import(IMPORT_WIDGET) for _ in range(repeat)])
+    eager = median([measure_import(IMPORT_EAGER) for _ in range(repeat)])
+    print(f"{'import file_explorer (지연)':<36} {lazy:>8.1f} ms")
+    print(f"{'FileExplorerWidget 접근':<36} {widget:>8.1f} ms")
+    print(f"{'위젯 스택 + NumPy 즉시 import':<36} {eager:>8.1f} ms   ({eager / widget:.1f}x)")
+
+    lazy = median([spawn("model", "lazy") for _ in range(repeat)])
+    eager = median([spawn("model", "eager") for _ in range(repeat)])
+    print(f"{'FileTableModel 생성 (아이콘 지연)':<36} {lazy:>8.2f} ms")
+    print(f"{'FileTableModel 생성 (기본 아이콘 로드)':<36} {eager:>8.2f} ms   ({eager / lazy:.1f}x)")
+
+    with tempfile.TemporaryDirectory() as root:
+        for i in range(tabs):
+            directory = os.path.join(root, f"tab_{i}")
+            os.makedirs(directory)
+            for j in range(files):
+                with open(os.path.join(directory, f"file_{j:06d}.dat"), "wb"):
+                    pass
+
+        print("-" * 64)
+        print(f"{'탭':<22} {'생성':>10} {'첫 탭 준비':>12} {'스캔한 탭':>10}")
+        results = {}
+        for mode in ("eager", "lazy"):
+            runs = [spawn("tabs", root, tabs, mode) for _ in range(repeat)]
+            results[mode] = {key: median([run[key] for run in runs]) for key in runs[0]}
+            label = "load_when_shown=True" if mode == "lazy" else "load_when_shown=False"
+            result = results[mode]
+            print(f"{label:<22} {result['construct_ms']:>8.1f}ms {result['first_tab_ready_ms']:>10.1f}ms "
+                  f"{result['scanned_tabs']:>10}")
+        speedup = results["eager"]["first_tab_ready_ms"] / results["lazy"]["first_tab_ready_ms"]
+        print(f"첫 탭 준비 시간 개선: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""로딩/정렬/스크롤 벤치마크 모음 (JSON 출력)
+
+임시 디렉토리에 합성 트리(평면/중첩, 여러 확장자)를 만들고 패키지 버전과
+단일 파일 버전 위젯을 offscreen Qt에서 띄워 다음을 측정한다.
+
+- 첫 행까지 시간, 로딩 완료까지 시간, 최대 RSS
+- 헤더 클릭 정렬 시간 (컬럼/방향별)
+- glob 필터(`*.py`) 적용 시간
+- 스크롤 프레임 시간 (한 페이지씩 내리며 viewport를 다시 그림)
+- 재귀 검색(`**/*.py`) 시간 (중첩 트리, 패키지 버전만)
+
+최대 RSS를 케이스별로 따로 재기 위해 각 (버전, 트리) 조합은 하위 프로세스에서 실행한다.
+
+    python benchmarks/bench_suite.py [--sizes 10000,100000,1000000] [--layouts flat,nested]
+                                     [--versions package,single] [--output results.json]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+EXTENSIONS = [".py", ".txt", ".json", ".csv", ".parquet", ".log", ".md", ".png", ".so", ".tar.gz", ""]
+NESTED_FANOUT = 1000  # 중첩 트리에서 디렉토리 하나당 파일 수
+TIMEOUT = 600  # 대기 한도(초)
+SCROLL_FRAMES = 50
+
+
+# ----------------------------------------------------------------------
+# 합성 트리
+# ----------------------------------------------------------------------
+
+def make_tree(root: str, count: int, layout: str) -> str:
+    """count개 파일의 합성 트리를 만들고 경로를 반환한다 (이미 있으면 재사용)."""
+    path = os.path.join(root, f"{layout}_{count}")
+    if os.path.isdir(path):
+        return path
+    building = path + ".tmp"
+    shutil.rmtree(building, ignore_errors=True)
+    os.makedirs(building)
+
+    now = time.time()
+    for i in range(count):
+        if layout == "nested":
+            directory = os.path.join(building, f"d{i // NESTED_FANOUT // 10:03d}", f"s{i // NESTED_FANOUT:05d}")
+            if i % NESTED_FANOUT == 0:
+                os.makedirs(directory, exist_ok=True)
+        else:
+            directory = building
+            if i % 500 == 0:
+                os.makedirs(os.path.join(building, f"dir_{i:07d}"))
+        file_path = os.path.join(directory, f"file_{i:07d}{EXTENSIONS[i % len(EXTENSIONS)]}")
+        with open(file_path, "wb") as f:
+            f.write(b"x" * (i % 4096))
+        modified = now - (i * 7919) % (365 * 86400)
+        os.utime(file_path, (modified, modified))
+
+    os.rename(building, path)
+    return path
+
+
+# ----------------------------------------------------------------------
+# 하위 프로세스: 케이스 하나 측정
+# ----------------------------------------------------------------------
+
+class Adapter:
+    """두 버전 위젯의 차이를 감춘다."""
+
+    def __init__(self, version: str):
+        sys.path.insert(0, ROOT)
+        from PyQt6.QtCore import Qt
+        self.Qt = Qt
+        self.version = version
+        if version == "package":
+            from file_explorer import FileExplorerWidget
+            from file_explorer.listing_cache import ListingCache
+            self._make = lambda path: FileExplorerWidget(path, listing_cache=ListingCache(), live_refresh=False)
+        else:
+            import file_explorer_single
+            self._make = lambda path: file_explorer_single.FileExplorerWidget(path)
+
+    def create(self, path: str):
+        return self._make(path)
+
+    def is_loading(self, widget) -> bool:
+        model = widget.model
+        if self.version == "package":
+            return model._loading
+        return model._loader is not None
+
+    def supports_recursive_search(self) -> bool:
+        return self.version == "package"
+
+
+def peak_rss_bytes() -> int | None:
+    """이 프로세스의 최대 RSS (바이트). 측정할 수 없으면 None."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_case(version: str, path: str, layout: str) -> dict:
+    """위젯 하나를 띄워 모든 지표를 측정한다."""
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+    adapter = Adapter(version)
+    Qt = adapter.Qt
+
+    def pump_until(condition, timeout=TIMEOUT) -> float:
+        start = time.perf_counter()
+        while not condition():
+            if time.perf_counter() - start > timeout:
+                raise TimeoutError("측정 대기 시간 초과")
+            app.processEvents()
+        return time.perf_counter() - start
+
+    empty = tempfile.mkdtemp()
+    widget = adapter.create(empty)
+    widget.resize(1000, 800)
+    widget.show()
+    pump_until(lambda: not adapter.is_loading(widget))
+
+    result = {}
+    model, proxy, view = widget.model, widget.proxy_model, widget.table_view
+
+    # 로딩: 첫 행 / 완료
+    first_row = []
+    start = time.perf_counter()
+
+    def on_rows(*args):
+        # .. 항목만 있는 상태는 제외
+        if not first_row and model.rowCount() > 1:
+            first_row.append(time.perf_counter() - start)
+
+    model.rowsInserted.connect(on_rows)
+    widget.navigate_to(path)
+    pump_until(lambda: first_row or not adapter.is_loading(widget))
+    result["time_to_first_row_ms"] = (first_row[0] if first_row else time.perf_counter() - start) * 1000
+    pump_until(lambda: not adapter.is_loading(widget))
+    result["time_to_complete_ms"] = (time.perf_counter() - start) * 1000
+    model.rowsInserted.disconnect(on_rows)
+    result["rows"] = model.rowCount()
+
+    # 헤더 정렬
+    sort = {}
+    for column, name in ((0, "name"), (1, "size"), (3, "modified")):
+        for order, direction in ((Qt.SortOrder.AscendingOrder, "asc"), (Qt.SortOrder.DescendingOrder, "desc")):
+            sort_start = time.perf_counter()
+            view.sortByColumn(column, order)
+            sort[f"{name}_{direction}"] = (time.perf_counter() - sort_start) * 1000
+    view.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+    result["sort_ms"] = sort
+
+    # 스크롤 프레임
+    scrollbar = view.verticalScrollBar()
+    scrollbar.setValue(0)
+    app.processEvents()
+    frames = []
+    for _ in range(SCROLL_FRAMES):
+        scrollbar.setValue(scrollbar.value() + scrollbar.pageStep())
+        frame_start = time.perf_counter()
+        view.viewport().repaint()
+        frames.append((time.perf_counter() - frame_start) * 1000)
+    frames.sort()
+    result["scroll_frame_ms"] = {
+        "median": frames[len(frames) // 2],
+        "p95": frames[int(len(frames) * 0.95)],
+        "max": frames[-1],
+    }
+
+    # glob 필터
+    glob_start = time.perf_counter()
+    widget._on_path_changed(os.path.join(path, "*.py"))
+    pump_until(lambda: not adapter.is_loading(widget))
+    result["glob_filter_ms"] = (time.perf_counter() - glob_start) * 1000
+    result["glob_rows"] = proxy.rowCount()
+
+    # 재귀 검색
+    if layout == "nested" and adapter.supports_recursive_search():
+        search_start = time.perf_counter()
+        widget._on_path_changed(os.path.join(path, "**", "*.py"))
+        pump_until(lambda: not adapter.is_loading(widget))
+        result["recursive_search_ms"] = (time.perf_counter() - search_start) * 1000
+        result["recursive_search_rows"] = proxy.rowCount()
+    else:
+        result["recursive_search_ms"] = None
+
+    widget.close()
+    shutil.rmtree(empty, ignore_errors=True)
+    result["peak_rss_bytes"] = peak_rss_bytes()
+    return result
+
+
+# ----------------------------------------------------------------------
+# 상위 프로세스
+# ----------------------------------------------------------------------
+
+def environment() -> dict:
+    """결과를 비교할 때 필요한 실행 환경 정보."""
+    info = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        from PyQt6.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
+        info["qt"] = QT_VERSION_STR
+        info["pyqt"] = PYQT_VERSION_STR
+    except ImportError:
+        pass
+    try:
+        import numpy
+        info["numpy"] = numpy.__version__
+    except ImportError:
+        info["numpy"] = None
+    try:
+        info["git_revision"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        info["git_revision"] = None
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000", help="쉼표로 구분한 파일 수 (예: 10000,100000,1000000)")
+    parser.add_argument("--layouts", default="flat,nested", help="flat, nested")
+    parser.add_argument("--versions", default="package,single", help="package, single")
+    parser.add_argument("--tree-dir", help="합성 트리를 만들/재사용할 디렉토리 (기본: 임시 디렉토리)")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본: 표준 출력)")
+    parser.add_argument("--case", nargs=3, metavar=("VERSION", "PATH", "LAYOUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        print(json.dumps(run_case(*args.case)))
+        return
+
+    tree_dir = args.tree_dir or tempfile.mkdtemp(prefix="explorer-bench-")
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    results = []
+    try:
+        for layout in args.layouts.split(","):
+            for count in (int(size) for size in args.sizes.split(",")):
+                print(f"트리 생성: {layout} {count:,}", file=sys.stderr)
+                path = make_tree(tree_dir, count, layout)
+                for version in args.versions.split(","):
+                    print(f"  측정: {version}", file=sys.stderr)
+                    completed = subprocess.run(
+                        [sys.executable, os.path.abspath(__file__), "--case", version, path, layout],
+                        capture_output=True, text=True, env=env,
+                    )
+                    case = {"version": version, "layout": layout, "files": count}
+                    if completed.returncode == 0:
+                        case.update(json.loads(completed.stdout.strip().splitlines()[-1]))
+                    else:
+                        case["error"] = completed.stderr.strip().splitlines()[-1:] or ["실패"]
+                    results.append(case)
+    finally:
+        if not args.tree_dir:
+            shutil.rmtree(tree_dir, ignore_errors=True)
+
+    report = json.dumps({"environment": environment(), "results": results}, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""pytest 공용 fixture"""
+import sys
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def app():
+    # 테스트 모듈이 끝날 때마다 QApplication을 버리면 프로세스 전역 객체(아이콘 캐시 등)도 지워지므로
+    # 프로세스에서 하나만 만들어 끝까지 유지한다
+    return QApplication.instance() or QApplication(sys.argv)
@@ -1,9 +1,9 @@
-"""PyQt6 파일 탐색기 위젯"""
+"""PyQt6 파일 탐색기 위젯
 
-from .explorer_widget import FileExplorerWidget
-from .file_model import FileTableModel
-from .navigation_bar import NavigationBar
-from .loader import DirectoryLoader
+공개 클래스는 처음 접근할 때 해당 모듈을 불러온다 (패키지 import 시 위젯 스택 전체를
+불러오지 않음).
+"""
+import importlib
 
 __version__ = "1.0.0"
 __all__ = [
@@ -11,4 +11,53 @@ __all__ = [
     "FileTableModel",
     "NavigationBar",
     "DirectoryLoader",
+    "BatchPolicy",
+    "LoaderPool",
+    "ScanScheduler",
+    "DiskIndex",
+    "Instrumentation",
+    "IconCache",
+    "QuickFilter",
+    "GlobFilter",
+    "DirSizeCache",
+    "FileSystemBackend",
+    "LocalBackend",
+    "MemoryBackend",
+    "ArchiveBackend",
+    "FileOperation",
 ]
+
+# 공개 이름 -> 정의된 하위 모듈
+_EXPORTS = {
+    "FileExplorerWidget": ".explorer_widget",
+    "FileTableModel": ".file_model",
+    "NavigationBar": ".navigation_bar",
+    "DirectoryLoader": ".loader",
+    "BatchPolicy": ".loader",
+    "LoaderPool": ".loader",
+    "ScanScheduler": ".scan_scheduler",
+    "DiskIndex": ".disk_index",
+    "Instrumentation": ".instrumentation",
+    "IconCache": ".icon_cache",
+    "QuickFilter": ".name_filter",
+    "GlobFilter": ".name_filter",
+    "DirSizeCache": ".dir_sizes",
+    "FileSystemBackend": ".backends",
+    "LocalBackend": ".backends",
+    "MemoryBackend": ".backends",
+    "ArchiveBackend": ".archives",
+    "FileOperation": ".file_operations",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # 다음 접근부터는 모듈 속성으로 바로 찾음
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,566 @@
+"""압축 파일(zip, tar) 탐색 백엔드
+
+로컬 디스크의 압축 파일을 디렉토리처럼 열 수 있게 한다. 압축 파일마다 멤버 목록을 한 번만
+읽어 디렉토리 트리 인덱스를 만들고 (zip은 중앙 디렉토리만, tar는 헤더만 읽음) 압축 파일의
+서명이 바뀌지 않는 동안 재사용한다. 멤버 내용은 open()으로 필요할 때만 읽는다.
+Qt를 쓰지 않는다 (감시자만 처음 만들 때 불러옴).
+"""
+import io
+import itertools
+import os
+import stat as stat_module
+import threading
+from collections import OrderedDict
+from .backends import LocalBackend, VirtualEntry, VirtualListing, VirtualStat
+
+# 디렉토리로 여는 압축 파일 확장자 -> 형식 (tar의 압축 방식은 파일 앞부분으로 판단)
+ARCHIVE_SUFFIXES = {
+    ".zip": "zip",
+    ".tar": "tar",
+    ".tar.gz": "tar", ".tgz": "tar",
+    ".tar.bz2": "tar", ".tbz2": "tar",
+    ".tar.xz": "tar", ".txz": "tar",
+    ".tar.zst": "tar", ".tzst": "tar",
+}
+
+_TAR_BLOCK = 512
+_READ_SIZE = 1024 * 1024  # tar 헤더를 찾을 때 한 번에 읽는 크기
+_TAR_DATA_TYPES = b"07\x00"  # 일반 파일 형식
+_TAR_NO_DATA_TYPES = b"123456"  # 헤더 뒤에 내용이 없는 형식 (링크, 장치, 디렉토리, FIFO)
+_TAR_SYMLINK = ord("2")
+
+
+def archive_format(path: str) -> str | None:
+    """이름으로 판단한 압축 파일 형식 ("zip", "tar"). 압축 파일이 아니면 None."""
+    name = os.path.basename(path).lower()
+    for suffix, kind in ARCHIVE_SUFFIXES.items():
+        if name.endswith(suffix) and len(name) > len(suffix):
+            return kind
+    return None
+
+
+def _open_tar_stream(path: str):
+    """tar 파일의 (압축을 푼) 이진 스트림을 연다. 압축 방식은 파일 앞부분으로 판단한다.
+
+    압축된 tar는 앞으로만 효율적으로 이동할 수 있다 (뒤로 가면 처음부터 다시 풂).
+    """
+    with open(path, "rb") as f:
+        magic = f.read(6)
+    if magic.startswith(b"\x1f\x8b"):
+        import gzip
+        return gzip.open(path, "rb")
+    if magic.startswith(b"BZh"):
+        import bz2
+        return bz2.open(path, "rb")
+    if magic.startswith(b"\xfd7zXZ\x00"):
+        import lzma
+        return lzma.open(path, "rb")
+    if magic.startswith(b"\x28\xb5\x2f\xfd"):
+        try:
+            import zstandard  # 선택 의존성: zstd로 압축한 tar를 열 때만 필요
+        except ImportError:
+            raise OSError(f"zstandard 패키지가 없어 열 수 없습니다: {path}") from None
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return open(path, "rb")
+
+
+class _NeedsTarfile(Exception):
+    """빠른 헤더 읽기가 지원하지 않는 멤버 (GNU sparse 등): tarfile로 다시 읽는다."""
+
+
+def _tar_number(field: bytes) -> int:
+    """tar 헤더의 숫자 필드 (8진수 문자열 또는 base-256)."""
+    if field[:1] in (b"\x80", b"\xff"):
+        import tarfile
+        return tarfile.nti(field)
+    field = field.strip(b" \x00")
+    return int(field, 8) if field else 0
+
+
+def _tar_headers(stream, path: str):
+    """tar 스트림의 헤더만 읽어 (이름, 디렉토리 여부, 심볼릭 링크 여부, 크기, 수정시간, 헤더 오프셋)을 만든다.
+
+    멤버 내용은 읽지 않고 건너뛴다 (압축하지 않은 tar는 seek). GNU 긴 이름/링크 대상과 pax 확장
+    헤더의 path/linkpath/size/mtime을 반영하며, 헤더 오프셋은 확장 헤더가 있으면 첫 확장 헤더의
+    오프셋이다. 심볼릭 링크의 크기는 lstat처럼 링크 대상 경로의 바이트 수다.
+    """
+    buffer = b""
+    buffer_start = 0  # buffer 첫 바이트의 스트림 오프셋
+    position = 0  # 다음 헤더의 스트림 오프셋
+    member_start = None  # 확장 헤더로 시작한 멤버의 첫 헤더 오프셋
+    overrides = {}  # 다음 헤더에 적용할 확장 헤더 값 (path, linkpath, size, mtime)
+
+    def read(offset: int, size: int) -> bytes:
+        """스트림 offset부터 size바이트 (끝이면 더 짧음)."""
+        nonlocal buffer, buffer_start
+        end = offset + size
+        if end > buffer_start + len(buffer):
+            if offset >= buffer_start + len(buffer):
+                if offset > buffer_start + len(buffer):
+                    stream.seek(offset)
+                buffer = b""
+            else:
+                buffer = buffer[offset - buffer_start:]
+            buffer_start = offset
+            parts = [buffer]
+            available = len(buffer)
+            while available < size:
+                data = stream.read(max(_READ_SIZE, size - available))
+                if not data:
+                    break
+                parts.append(data)
+                available += len(data)
+            buffer = b"".join(parts)
+        return buffer[offset - buffer_start:end - buffer_start]
+
+    while True:
+        header = read(position, _TAR_BLOCK)
+        if len(header) < _TAR_BLOCK or not header.strip(b"\x00"):
+            # 끝 (0으로 채운 블록 또는 스트림 끝)
+            return
+        checksum = header[148:156].strip(b" \x00")
+        if not checksum or int(checksum, 8) != sum(header[:148]) + 256 + sum(header[156:]):
+            raise OSError(f"tar 헤더가 손상되었습니다: {path} (오프셋 {position})")
+        kind = header[156]
+        size = _tar_number(header[124:136])
+        data_start = position + _TAR_BLOCK
+        next_position = data_start + -(-size // _TAR_BLOCK) * _TAR_BLOCK
+        if member_start is None:
+            member_start = position
+
+        if kind in b"LK":
+            # GNU 긴 이름/링크 대상: 내용이 다음 헤더의 이름
+            value = read(data_start, size).split(b"\x00", 1)[0].decode("utf-8", "surrogateescape")
+            overrides["path" if kind == ord("L") else "linkpath"] = value
+            position = next_position
+            continue
+        if kind in b"xg":
+            if kind == ord("x"):
+                overrides.update(_pax_records(read(data_start, size)))
+            position = next_position
+            continue
+        if kind == ord("S") or "GNU.sparse.map" in overrides or "GNU.sparse.size" in overrides:
+            raise _NeedsTarfile
+
+        name = overrides.get("path")
+        if name is None:
+            name = header[:100].split(b"\x00", 1)[0]
+            if header[257:265] == b"ustar\x0000":
+                prefix = header[345:500].split(b"\x00", 1)[0]
+                if prefix:
+                    name = prefix + b"/" + name
+            name = name.decode("utf-8", "surrogateescape")
+        if "size" in overrides:
+            size = int(overrides["size"])
+            next_position = data_start + -(-size // _TAR_BLOCK) * _TAR_BLOCK
+        mtime = float(overrides["mtime"]) if "mtime" in overrides else _tar_number(header[136:148])
+        is_file = kind in _TAR_DATA_TYPES
+        is_dir = kind == ord("5") or (is_file and name.endswith("/"))
+        is_link = kind == _TAR_SYMLINK
+        if is_link:
+            target = overrides.get("linkpath")
+            member_size = (len(target.encode("utf-8", "surrogateescape")) if target is not None
+                           else len(header[157:257].split(b"\x00", 1)[0]))
+        else:
+            member_size = size if is_file and not is_dir else 0
+        yield name, is_dir, is_link, member_size, mtime, member_start
+        # 링크/장치/디렉토리는 내용이 없고, 모르는 형식은 tarfile처럼 내용을 건너뜀
+        position = data_start if kind in _TAR_NO_DATA_TYPES else next_position
+        member_start = None
+        overrides = {}
+
+
+def _pax_records(data: bytes) -> dict:
+    """pax 확장 헤더의 "길이 키=값\\n" 레코드 중 필요한 값."""
+    records = {}
+    offset = 0
+    while offset < len(data):
+        space = data.find(b" ", offset)
+        if space < 0:
+            break
+        try:
+            length = int(data[offset:space])
+        except ValueError:
+            break
+        if length <= 0:
+            break
+        key, _, value = data[space + 1:offset + length - 1].partition(b"=")
+        key = key.decode("utf-8", "replace")
+        if key in ("path", "linkpath", "size", "mtime") or key.startswith("GNU.sparse."):
+            records[key] = value.decode("utf-8", "surrogateescape")
+        offset += length
+    return records
+
+
+class ArchiveIndex:
+    """압축 파일 하나의 디렉토리 트리 인덱스
+
+    directories는 압축 파일 안 디렉토리 경로("" = 최상위, "a/b")에서
+    {이름: (디렉토리 여부, 크기, 수정시간, inode, 멤버, 심볼릭 링크 여부)} 딕셔너리로 가는 매핑이다.
+    멤버 목록에 디렉토리 항목이 없어도 파일 경로의 상위 디렉토리를 만든다.
+    멤버는 zip이면 ZipInfo, tar이면 헤더 오프셋이다. 심볼릭 링크 멤버는 따라가지 않는다.
+    """
+
+    _serials = itertools.count(1)  # 인덱스마다 다른 inode 범위를 쓰기 위한 번호
+
+    def __init__(self, path: str, kind: str, mtime: float):
+        self.path = path
+        self.kind = kind
+        self.mtime = mtime  # 압축 파일 수정시간 (멤버에 없는 상위 디렉토리에 사용)
+        self.directories = {"": {}}
+        self.members = 0  # 멤버 수
+        self._zip = None  # 열어 둔 ZipFile (멤버 읽기용)
+        self._ino = next(self._serials) << 32
+
+    @classmethod
+    def build(cls, path: str, kind: str, mtime: float) -> "ArchiveIndex":
+        """압축 파일의 멤버 목록을 읽어 인덱스를 만든다. 읽을 수 없으면 OSError."""
+        index = cls(path, kind, mtime)
+        if kind == "zip":
+            index._build_zip()
+        else:
+            index._build_tar()
+        return index
+
+    def _build_zip(self):
+        """zip: 중앙 디렉토리만 읽는다 (멤버 압축은 풀지 않음)."""
+        import time
+        import zipfile
+        try:
+            archive = zipfile.ZipFile(self.path)
+        except zipfile.BadZipFile as e:
+            raise OSError(f"zip 파일을 읽을 수 없습니다: {self.path} ({e})") from None
+        try:
+            for info in archive.infolist():
+                try:
+                    mtime = time.mktime(info.date_time + (0, 0, -1))
+                except (OverflowError, ValueError):
+                    mtime = self.mtime
+                is_dir = info.is_dir()
+                # 유닉스에서 만든 zip은 외부 속성 상위 16비트에 st_mode를 담는다
+                is_link = not is_dir and stat_module.S_ISLNK(info.external_attr >> 16)
+                self._add(info.filename, is_dir, info.file_size, mtime, info, is_link)
+        except BaseException:
+            archive.close()
+            raise
+        self._zip = archive
+
+    def _build_tar(self):
+        """tar: 헤더만 읽어 멤버마다 헤더 오프셋을 기록한다.
+
+        압축하지 않은 tar는 멤버 내용을 건너뛰며 읽고, 압축된 tar는 한 번 끝까지 풀어 읽는다.
+        """
+        with _open_tar_stream(self.path) as stream:
+            try:
+                for name, is_dir, is_link, size, mtime, offset in _tar_headers(stream, self.path):
+                    self._add(name, is_dir, size, mtime, offset, is_link)
+                return
+            except _NeedsTarfile:
+                pass
+            except (EOFError, ValueError) as e:
+                raise OSError(f"tar 파일을 읽을 수 없습니다: {self.path} ({e})") from None
+
+        # 빠른 헤더 읽기가 지원하지 않는 멤버가 있으면 tarfile로 처음부터 다시 읽는다
+        import tarfile
+        self.directories = {"": {}}
+        self.members = 0
+        with _open_tar_stream(self.path) as stream:
+            try:
+                with tarfile.open(fileobj=stream, mode="r|") as archive:
+                    for info in archive:
+                        archive.members.clear()  # 멤버 정보는 인덱스에만 보관
+                        if info.issym():
+                            size = len(info.linkname.encode("utf-8", "surrogateescape"))
+                        else:
+                            size = info.size if info.isfile() else 0
+                        self._add(info.name, info.isdir(), size, info.mtime, info.offset, info.issym())
+            except (tarfile.TarError, EOFError) as e:
+                raise OSError(f"tar 파일을 읽을 수 없습니다: {self.path} ({e})") from None
+
+    def _add(self, name: str, is_dir: bool, size: int, mtime: float, member, is_link: bool = False):
+        """멤버 하나를 트리에 넣는다 (상위 디렉토리도 만듦)."""
+        parts = [part for part in name.replace("\\", "/").split("/") if part and part != "."]
+        if not parts or ".." in parts:
+            # 최상위 자신이나 압축 파일 밖을 가리키는 멤버는 보이지 않음
+            return
+        directories = self.directories
+        directory = ""
+        for part in parts[:-1]:
+            children = directories[directory]
+            child = part if not directory else f"{directory}/{part}"
+            if child not in directories:
+                directories[child] = {}
+                if part not in children:
+                    children[part] = (True, 0, self.mtime, self._new_ino(), None, False)
+            directory = child
+        children = directories[directory]
+        leaf = parts[-1]
+        path = leaf if not directory else f"{directory}/{leaf}"
+        old = children.get(leaf)
+        ino = old[3] if old is not None else self._new_ino()
+        if is_dir:
+            directories.setdefault(path, {})
+            children[leaf] = (True, 0, mtime, ino, member, False)
+        elif path not in directories:
+            # 같은 이름의 디렉토리가 이미 있으면 (잘못된 압축 파일) 디렉토리를 유지
+            children[leaf] = (False, size, mtime, ino, member, is_link)
+            self.members += 1
+
+    def _new_ino(self) -> int:
+        self._ino += 1
+        return self._ino
+
+    def lookup(self, inner: str) -> tuple | None:
+        """압축 파일 안 경로의 (디렉토리 여부, 크기, 수정시간, inode, 멤버, 심볼릭 링크 여부). 없으면 None."""
+        directory, _, name = inner.rpartition("/")
+        children = self.directories.get(directory)
+        if children is None:
+            return None
+        return children.get(name)
+
+    def open(self, inner: str):
+        """멤버 내용을 읽는 이진 파일 객체를 연다 (압축된 tar는 멤버 앞까지 풀어야 함)."""
+        found = self.lookup(inner)
+        if found is None:
+            raise FileNotFoundError(os.path.join(self.path, inner))
+        is_dir, _, _, _, member, is_link = found
+        if is_dir:
+            raise IsADirectoryError(os.path.join(self.path, inner))
+        if is_link:
+            raise OSError(f"심볼릭 링크 멤버는 열 수 없습니다: {os.path.join(self.path, inner)}")
+        if self.kind == "zip":
+            return self._zip.open(member)
+
+        # 헤더 오프셋으로 이동해 그 멤버부터 tarfile 스트림 모드로 읽는다
+        import tarfile
+        stream = _open_tar_stream(self.path)
+        try:
+            stream.seek(member)
+            archive = tarfile.open(fileobj=stream, mode="r|")
+            member_file = archive.extractfile(archive.next())
+            if member_file is None:
+                raise OSError(f"일반 파일이 아닌 멤버입니다: {os.path.join(self.path, inner)}")
+        except tarfile.TarError as e:
+            stream.close()
+            raise OSError(f"tar 파일을 읽을 수 없습니다: {self.path} ({e})") from None
+        except BaseException:
+            stream.close()
+            raise
+        return io.BufferedReader(_MemberStream(member_file, stream))
+
+    def close(self):
+        """열어 둔 zip 파일을 닫는다 (이미 연 멤버는 계속 읽을 수 있음)."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+
+class _MemberStream(io.RawIOBase):
+    """tar 멤버 읽기 스트림 (닫으면 압축 파일 스트림도 닫음)"""
+
+    def __init__(self, member_file, stream):
+        self._member_file = member_file
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._member_file.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._member_file.close()
+            self._stream.close()
+        super().close()
+
+
+class ArchiveBackend(LocalBackend):
+    """로컬 디스크 + 압축 파일을 디렉토리처럼 여는 백엔드
+
+    실제 경로는 LocalBackend와 똑같이 처리하고, 실제로 없는 경로만 상위 경로에서 압축 파일을
+    찾아 인덱스에서 답한다 (압축 파일 안의 압축 파일은 열지 않음). 압축 파일 자체는 목록에서
+    파일로 보이지만 is_dir()은 참이다. 압축 파일 안 경로의 서명은 압축 파일의 서명이라
+    압축 파일이 바뀌면 목록 캐시와 인덱스가 함께 무효화된다.
+    인덱스는 압축 파일 max_archives개까지 LRU로 보관한다.
+    """
+
+    def __init__(self, max_archives: int = 16):
+        self.max_archives = max_archives  # 인덱스를 보관할 최대 압축 파일 수
+        self._lock = threading.Lock()
+        self._indexes = OrderedDict()  # 압축 파일 경로 -> (압축 파일 stat 키, ArchiveIndex)
+        self._build_locks = {}  # 압축 파일 경로 -> 인덱스 생성 잠금 (같은 파일을 동시에 두 번 읽지 않음)
+
+    # FileSystemBackend
+
+    def list(self, path: str):
+        try:
+            return super().list(path)
+        except (FileNotFoundError, NotADirectoryError):
+            found = self._resolve(path)
+            if found is None:
+                raise
+        index, inner = found
+        children = index.directories.get(inner)
+        if children is None:
+            if index.lookup(inner) is not None:
+                raise NotADirectoryError(path) from None
+            raise FileNotFoundError(path) from None
+        entries = list(children.items())
+        return VirtualListing(VirtualEntry(path, name, is_dir, size, mtime, ino, is_symlink=is_link)
+                              for name, (is_dir, size, mtime, ino, _, is_link) in entries)
+
+    def stat(self, path: str):
+        try:
+            return super().stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            found = self._resolve(path)
+            if found is None:
+                raise
+        index, inner = found
+        entry = index.lookup(inner)
+        if entry is None:
+            raise FileNotFoundError(path)
+        is_dir, size, mtime, ino, _, is_link = entry
+        return VirtualStat(is_dir, size, mtime, ino, is_symlink=is_link)
+
+    def is_dir(self, path: str) -> bool:
+        if super().is_dir(path):
+            return True
+        path = os.path.abspath(path)
+        if archive_format(path) is not None:
+            # 압축 파일 자체: 인덱스를 만들지 않고 일반 파일인지만 확인
+            try:
+                return stat_module.S_ISREG(os.stat(path).st_mode)
+            except OSError:
+                pass
+        try:
+            found = self._resolve(path)
+        except OSError:
+            return False
+        if found is None:
+            return False
+        index, inner = found
+        return inner in index.directories
+
+    def signature(self, path: str) -> tuple | None:
+        signature = super().signature(path)
+        if signature is None:
+            archive = self.split(path)
+            if archive is not None:
+                signature = super().signature(archive[0])
+        return signature
+
+    def watch(self, parent=None):
+        from .watcher import ArchiveWatcher  # Qt가 필요한 감시자는 처음 쓸 때 불러옴
+        return ArchiveWatcher(self, parent=parent)
+
+    # 압축 파일
+
+    def split(self, path: str) -> tuple[str, str] | None:
+        """path를 (압축 파일 경로, 압축 파일 안 경로)로 나눈다. 압축 파일 안이 아니면 None.
+
+        압축 파일 자체는 안 경로가 ""이다. 압축 파일을 읽지 않고 경로와 파일 종류만 확인한다.
+        """
+        path = os.path.abspath(path)
+        inner = []
+        candidate = path
+        while True:
+            if archive_format(candidate) is not None:
+                try:
+                    if stat_module.S_ISREG(os.stat(candidate).st_mode):
+                        return candidate, "/".join(reversed(inner))
+                except OSError:
+                    pass
+            head, tail = os.path.split(candidate)
+            if not tail or head == candidate:
+                return None
+            inner.append(tail)
+            candidate = head
+
+    def open(self, path: str):
+        """파일 내용을 읽는 이진 파일 객체를 연다 (압축 파일 멤버는 필요한 부분만 읽음)."""
+        try:
+            return super().open(path)
+        except (FileNotFoundError, NotADirectoryError):
+            found = self._resolve(path)
+            if found is None:
+                raise
+        index, inner = found
+        return index.open(inner)
+
+    def index(self, archive: str) -> ArchiveIndex:
+        """압축 파일의 인덱스 (처음이거나 압축 파일이 바뀌었으면 새로 만듦). 읽을 수 없으면 OSError."""
+        archive = os.path.abspath(archive)
+        kind = archive_format(archive)
+        if kind is None:
+            raise OSError(f"지원하지 않는 압축 파일 형식입니다: {archive}")
+        stat_info = os.stat(archive)
+        key = (stat_info.st_dev, stat_info.st_ino, stat_info.st_size, stat_info.st_mtime_ns)
+        with self._lock:
+            index = self._cached_index(archive, key)
+            if index is not None:
+                return index
+            build_lock = self._build_locks.setdefault(archive, threading.Lock())
+
+        with build_lock:
+            with self._lock:
+                # 기다리는 동안 다른 스레드가 만들었으면 그대로 사용
+                index = self._cached_index(archive, key)
+                if index is not None:
+                    return index
+            index = ArchiveIndex.build(archive, kind, stat_info.st_mtime)
+            with self._lock:
+                old = self._indexes.pop(archive, None)
+                self._indexes[archive] = (key, index)
+                evicted = [old[1]] if old is not None else []
+                while len(self._indexes) > self.max_archives:
+                    evicted_path, (_, evicted_index) = self._indexes.popitem(last=False)
+                    self._build_locks.pop(evicted_path, None)
+                    evicted.append(evicted_index)
+        for evicted_index in evicted:
+            evicted_index.close()
+        return index
+
+    def clear(self):
+        """보관한 인덱스를 모두 버린다."""
+        with self._lock:
+            indexes = [index for _, index in self._indexes.values()]
+            self._indexes.clear()
+        for index in indexes:
+            index.close()
+
+    def __contains__(self, archive: str) -> bool:
+        """압축 파일의 인덱스를 보관하고 있는지 여부."""
+        with self._lock:
+            return os.path.abspath(archive) in self._indexes
+
+    # 내부
+
+    def _cached_index(self, archive: str, key: tuple) -> ArchiveIndex | None:
+        """보관한 인덱스가 key와 같은 압축 파일이면 반환한다 (잠금을 잡은 상태에서 호출)."""
+        cached = self._indexes.get(archive)
+        if cached is None or cached[0] != key:
+            return None
+        self._indexes.move_to_end(archive)
+        return cached[1]
+
+    def _resolve(self, path: str) -> tuple[ArchiveIndex, str] | None:
+        """압축 파일 안 경로의 (인덱스, 안 경로). 압축 파일 안이 아니면 None."""
+        archive = self.split(path)
+        if archive is None:
+            return None
+        return self.index(archive[0]), archive[1]
+
+
+_archive_backend = None
+
+
+def archive_backend() -> ArchiveBackend:
+    """프로세스 전역 압축 파일 탐색 백엔드 (위젯/모델의 기본 백엔드)."""
+    global _archive_backend
+    if _archive_backend is None:
+        _archive_backend = ArchiveBackend()
+    return _archive_backend
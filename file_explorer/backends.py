@@ -0,0 +1,379 @@
+"""파일 시스템 백엔드 (로컬 디스크, 메모리)
+
+로더/검색/미리 스캔/디렉토리 크기 계산과 위젯은 파일 시스템에 이 인터페이스로만 접근한다.
+Qt를 쓰지 않는다 (감시자만 처음 만들 때 불러옴).
+"""
+import os
+import stat as stat_module
+import threading
+import time
+from .listing_cache import directory_signature
+
+
+class FileSystemBackend:
+    """탐색기가 쓰는 파일 시스템 인터페이스
+
+    list()는 os.scandir처럼 항목(name, is_dir(), is_file(), stat())을 돌려주는
+    컨텍스트 관리자를, stat()은 심볼릭 링크를 따라가지 않는 stat 결과(st_mode, st_size,
+    st_mtime, st_mtime_ns, st_ctime_ns, st_dev, st_ino)를 반환하고, 없으면 OSError를 낸다.
+    모든 메서드는 워커 스레드에서 동시에 불릴 수 있다. watch()는 감시자(QObject,
+    watch(path)/stop()/close()와 changes_ready 시그널)를 만들며, 감시할 수 없으면 None.
+    """
+
+    def list(self, path: str):
+        """디렉토리 항목 반복자 (컨텍스트 관리자)."""
+        raise NotImplementedError
+
+    def stat(self, path: str):
+        """항목의 stat 결과 (심볼릭 링크를 따라가지 않음)."""
+        raise NotImplementedError
+
+    def is_dir(self, path: str) -> bool:
+        """path가 디렉토리인지 여부."""
+        try:
+            return stat_module.S_ISDIR(self.stat(path).st_mode)
+        except OSError:
+            return False
+
+    def abspath(self, path: str) -> str:
+        """정규화한 절대 경로."""
+        return os.path.normpath(os.path.join(os.sep, path))
+
+    def signature(self, path: str) -> tuple | None:
+        """디렉토리 변경 여부 판단에 쓰는 (mtime, ctime) 서명. 읽을 수 없으면 None."""
+        try:
+            stat_info = self.stat(path)
+        except OSError:
+            return None
+        return (stat_info.st_mtime_ns, stat_info.st_ctime_ns)
+
+    def watch(self, parent=None):
+        """디렉토리 변경 감시자를 만든다. 지원하지 않으면 None."""
+        return None
+
+
+class LocalBackend(FileSystemBackend):
+    """로컬 디스크 (os.scandir / os.stat, inotify 감시)"""
+
+    def list(self, path: str):
+        return os.scandir(path)
+
+    def stat(self, path: str):
+        return os.stat(path, follow_symlinks=False)
+
+    def is_dir(self, path: str) -> bool:
+        return os.path.isdir(path)
+
+    def abspath(self, path: str) -> str:
+        return os.path.abspath(path)
+
+    def signature(self, path: str) -> tuple | None:
+        return directory_signature(path)
+
+    def open(self, path: str):
+        """파일 내용을 읽는 이진 파일 객체를 연다."""
+        return open(path, "rb")
+
+    def watch(self, parent=None):
+        from .watcher import DirectoryWatcher  # Qt가 필요한 감시자는 처음 쓸 때 불러옴
+        return DirectoryWatcher(parent=parent)
+
+
+_local_backend = None
+
+
+def local_backend() -> LocalBackend:
+    """프로세스 전역 로컬 디스크 백엔드."""
+    global _local_backend
+    if _local_backend is None:
+        _local_backend = LocalBackend()
+    return _local_backend
+
+
+class VirtualStat:
+    """디스크에 없는 항목(메모리 백엔드, 압축 파일 멤버)의 stat 결과"""
+
+    __slots__ = ("st_mode", "st_size", "st_mtime", "st_mtime_ns", "st_ctime_ns", "st_dev", "st_ino")
+
+    def __init__(self, is_dir: bool, size: int, mtime: float, ino: int, ctime_ns: int = None,
+                 is_symlink: bool = False):
+        if is_symlink:
+            self.st_mode = stat_module.S_IFLNK | 0o777
+        else:
+            self.st_mode = (stat_module.S_IFDIR | 0o755) if is_dir else (stat_module.S_IFREG | 0o644)
+        self.st_size = size
+        self.st_mtime = mtime
+        self.st_mtime_ns = int(mtime * 1_000_000_000)
+        self.st_ctime_ns = self.st_mtime_ns if ctime_ns is None else ctime_ns
+        self.st_dev = -1  # 로컬 디스크와 겹치지 않는 장치 번호
+        self.st_ino = ino
+
+
+class VirtualEntry:
+    """디스크에 없는 디렉토리 항목 (os.DirEntry와 같은 메서드, stat()마다 latency초 지연)"""
+
+    __slots__ = ("name", "path", "_is_dir", "_size", "_mtime", "_ino", "_latency", "_is_symlink")
+
+    def __init__(self, directory: str, name: str, is_dir: bool, size: int, mtime: float, ino: int,
+                 latency: float = 0.0, is_symlink: bool = False):
+        self.name = name
+        self.path = os.path.join(directory, name)
+        self._is_dir = is_dir
+        self._size = size
+        self._mtime = mtime
+        self._ino = ino
+        self._latency = latency
+        self._is_symlink = is_symlink  # 심볼릭 링크 (대상은 따라가지 않으므로 파일도 디렉토리도 아님)
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return self._is_dir
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return not self._is_dir and not self._is_symlink
+
+    def is_symlink(self) -> bool:
+        return self._is_symlink
+
+    def stat(self, follow_symlinks: bool = True) -> VirtualStat:
+        if self._latency:
+            time.sleep(self._latency)
+        return VirtualStat(self._is_dir, self._size, self._mtime, self._ino, is_symlink=self._is_symlink)
+
+
+class VirtualListing:
+    """디스크에 없는 디렉토리의 list() 결과 (os.scandir처럼 with 문과 for 문에 쓴다)"""
+
+    def __init__(self, entries):
+        self._entries = entries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __iter__(self):
+        return self._entries
+
+    def close(self):
+        self._entries.close()
+
+
+class _MemoryDirectory:
+    """메모리 백엔드의 디렉토리 하나: 직접 추가한 항목과 합성 항목"""
+
+    __slots__ = ("entries", "synthetic_files", "synthetic_dirs", "synthetic_names", "mtime", "ino")
+
+    def __init__(self, mtime: float, ino: int):
+        self.entries = {}  # 이름 -> (디렉토리 여부, 크기, 수정시간, inode)
+        self.synthetic_files = 0  # 합성 파일 수
+        self.synthetic_dirs = 0  # 합성 (빈) 하위 디렉토리 수
+        self.synthetic_names = ("file_", ".dat")  # 합성 파일 이름 (접두어, 접미어)
+        self.mtime = mtime
+        self.ino = ino
+
+
+class MemoryBackend(FileSystemBackend):
+    """메모리에만 있는 파일 시스템 (벤치마크/회귀 테스트용)
+
+    make_dir()/add_file()/remove()로 항목을 만들거나, add_synthetic()으로 항목을 저장하지
+    않고 번호에서 이름/크기/수정시간을 계산하는 합성 항목 수백만 개를 만든다. 합성 이름은
+    번호를 섞어 만들어 스캔 순서가 정렬 순서와 다르다. list_latency(디렉토리를 열 때)와
+    stat_latency(stat마다)로 네트워크 파일 시스템 같은 지연을 넣을 수 있다.
+    항목을 바꾸면 해당 디렉토리의 mtime이 바뀌고 감시자에게 변경 이름을 알린다.
+    """
+
+    # 합성 항목 이름을 섞는 곱수 (2^32와 서로소라 번호 -> 이름이 일대일)
+    SYNTHETIC_MULTIPLIER = 2654435761
+    SYNTHETIC_INVERSE = pow(SYNTHETIC_MULTIPLIER, -1, 1 << 32)
+    # 합성 항목 수정시간 기준 (2020-01-01 UTC)
+    SYNTHETIC_EPOCH = 1577836800.0
+
+    def __init__(self, list_latency: float = 0.0, stat_latency: float = 0.0):
+        self.list_latency = list_latency  # list() 호출마다 넣는 지연 (초)
+        self.stat_latency = stat_latency  # stat()마다 넣는 지연 (초)
+        self._lock = threading.Lock()
+        self._next_ino = 2
+        self._directories = {os.sep: _MemoryDirectory(time.time(), 1)}  # 경로 -> 디렉토리
+        self._watchers = []  # 변경을 알릴 감시자
+
+    # 항목 만들기/바꾸기
+
+    def make_dir(self, path: str):
+        """디렉토리를 (상위 디렉토리까지) 만든다."""
+        path = self.abspath(path)
+        with self._lock:
+            self._make_dir(path)
+
+    def add_file(self, path: str, size: int = 0, mtime: float = None):
+        """파일을 만들거나 크기/수정시간을 바꾼다 (상위 디렉토리는 자동으로 만듦)."""
+        path = self.abspath(path)
+        directory, name = os.path.split(path)
+        with self._lock:
+            parent = self._make_dir(directory)
+            old = parent.entries.get(name)
+            if old is not None and old[0]:
+                raise IsADirectoryError(path)
+            ino = old[3] if old is not None else self._new_ino()
+            parent.entries[name] = (False, size, time.time() if mtime is None else mtime, ino)
+            parent.mtime = time.time()
+        self._notify(directory, name)
+
+    def remove(self, path: str):
+        """직접 추가한 파일이나 디렉토리(하위 항목 포함)를 지운다."""
+        path = self.abspath(path)
+        directory, name = os.path.split(path)
+        with self._lock:
+            parent = self._directories.get(directory)
+            if parent is None or name not in parent.entries:
+                raise FileNotFoundError(path)
+            del parent.entries[name]
+            parent.mtime = time.time()
+            prefix = os.path.join(path, "")
+            for key in [key for key in self._directories if key == path or key.startswith(prefix)]:
+                del self._directories[key]
+        self._notify(directory, name)
+
+    def add_synthetic(self, path: str, files: int, dirs: int = 0, prefix: str = "file_",
+                      suffix: str = ".dat"):
+        """path에 합성 파일 files개와 빈 하위 디렉토리 dirs개를 만든다 (항목은 저장하지 않음)."""
+        if files >= 1 << 32 or dirs >= 1 << 32:
+            raise ValueError("합성 항목은 디렉토리당 2^32개 미만이어야 합니다")
+        path = self.abspath(path)
+        with self._lock:
+            directory = self._make_dir(path)
+            directory.synthetic_files = files
+            directory.synthetic_dirs = dirs
+            directory.synthetic_names = (prefix, suffix)
+            directory.mtime = time.time()
+        self._notify(path, None)
+
+    # FileSystemBackend
+
+    def list(self, path: str):
+        path = self.abspath(path)
+        if self.list_latency:
+            time.sleep(self.list_latency)
+        with self._lock:
+            directory = self._directory(path)
+            if directory is None and self._lookup(path) is not None:
+                raise NotADirectoryError(path)
+            if directory is None:
+                raise FileNotFoundError(path)
+            explicit = list(directory.entries.items())
+        return VirtualListing(self._iter_entries(path, directory, explicit))
+
+    def stat(self, path: str) -> VirtualStat:
+        path = self.abspath(path)
+        if self.stat_latency:
+            time.sleep(self.stat_latency)
+        with self._lock:
+            directory = self._directory(path)
+            if directory is not None:
+                return VirtualStat(True, 4096, directory.mtime, directory.ino)
+            found = self._lookup(path)
+        if found is None:
+            raise FileNotFoundError(path)
+        is_dir, size, mtime, ino = found
+        return VirtualStat(is_dir, size, mtime, ino)
+
+    def is_dir(self, path: str) -> bool:
+        path = self.abspath(path)
+        with self._lock:
+            return self._directory(path) is not None
+
+    def watch(self, parent=None):
+        from .watcher import MemoryWatcher  # Qt가 필요한 감시자는 처음 쓸 때 불러옴
+        watcher = MemoryWatcher(self, parent=parent)
+        with self._lock:
+            self._watchers.append(watcher)
+        return watcher
+
+    def unwatch(self, watcher):
+        """감시자를 해제한다 (MemoryWatcher.close()가 호출)."""
+        with self._lock:
+            if watcher in self._watchers:
+                self._watchers.remove(watcher)
+
+    # 내부
+
+    def _new_ino(self) -> int:
+        ino = self._next_ino
+        self._next_ino += 1
+        return ino
+
+    def _make_dir(self, path: str) -> _MemoryDirectory:
+        """디렉토리를 만들어 반환한다 (잠금을 잡은 상태에서 호출)."""
+        directory = self._directories.get(path)
+        if directory is not None:
+            return directory
+        parent_path, name = os.path.split(path)
+        parent = self._make_dir(parent_path)
+        old = parent.entries.get(name)
+        if old is not None and not old[0]:
+            raise NotADirectoryError(path)
+        directory = _MemoryDirectory(time.time(), self._new_ino())
+        self._directories[path] = directory
+        parent.entries[name] = (True, 4096, directory.mtime, directory.ino)
+        parent.mtime = time.time()
+        return directory
+
+    def _directory(self, path: str) -> _MemoryDirectory | None:
+        """path 디렉토리. 합성 하위 디렉토리는 처음 찾을 때 (빈 디렉토리로) 만든다."""
+        directory = self._directories.get(path)
+        if directory is None:
+            found = self._lookup(path)
+            if found is not None and found[0]:
+                directory = _MemoryDirectory(found[2], found[3])
+                self._directories[path] = directory
+        return directory
+
+    def _lookup(self, path: str) -> tuple | None:
+        """상위 디렉토리에서 찾은 (디렉토리 여부, 크기, 수정시간, inode). 없으면 None."""
+        parent_path, name = os.path.split(path)
+        parent = self._directories.get(parent_path)
+        if parent is None or not name:
+            return None
+        found = parent.entries.get(name)
+        if found is not None:
+            return found
+        # 합성 항목: 이름에서 번호를 되살려 범위 안인지 확인
+        for is_dir, count, prefix, suffix in ((True, parent.synthetic_dirs, "dir_", ""),
+                                              (False, parent.synthetic_files, *parent.synthetic_names)):
+            if count and name.startswith(prefix) and name.endswith(suffix):
+                digits = name[len(prefix):len(name) - len(suffix)]
+                if len(digits) != 8:
+                    continue
+                try:
+                    index = int(digits, 16) * self.SYNTHETIC_INVERSE & 0xFFFFFFFF
+                except ValueError:
+                    continue
+                if index < count:
+                    return self._synthetic(is_dir, index, parent.ino)
+        return None
+
+    def _synthetic(self, is_dir: bool, index: int, parent_ino: int) -> tuple:
+        """합성 항목 번호의 (디렉토리 여부, 크기, 수정시간, inode)."""
+        size = 4096 if is_dir else index * 7919 % 10_000_000
+        mtime = self.SYNTHETIC_EPOCH + index * 37 % 100_000_000
+        return is_dir, size, mtime, (parent_ino << 33) | (is_dir << 32) | index
+
+    def _iter_entries(self, path: str, directory: _MemoryDirectory, explicit: list):
+        """합성 디렉토리, 합성 파일, 직접 추가한 항목 순서로 항목을 만든다."""
+        multiplier = self.SYNTHETIC_MULTIPLIER
+        for is_dir, count, name_prefix, name_suffix in ((True, directory.synthetic_dirs, "dir_", ""),
+                                                        (False, directory.synthetic_files,
+                                                         *directory.synthetic_names)):
+            for index in range(count):
+                name = f"{name_prefix}{index * multiplier & 0xFFFFFFFF:08x}{name_suffix}"
+                _, size, mtime, ino = self._synthetic(is_dir, index, directory.ino)
+                yield VirtualEntry(path, name, is_dir, size, mtime, ino, self.stat_latency)
+        for name, (is_dir, size, mtime, ino) in explicit:
+            yield VirtualEntry(path, name, is_dir, size, mtime, ino, self.stat_latency)
+
+    def _notify(self, directory: str, name: str | None):
+        """directory를 감시하는 감시자에게 변경을 알린다 (name이 None이면 전체 재확인)."""
+        with self._lock:
+            watchers = [watcher for watcher in self._watchers if watcher.path == directory]
+        for watcher in watchers:
+            watcher.notify(name)
@@ -0,0 +1,234 @@
+"""디렉토리 재귀 크기/파일 수 계산 (백그라운드 스레드 풀, (장치, inode, mtime) 캐시)"""
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from PyQt6.QtCore import QObject, pyqtSignal
+from .backends import FileSystemBackend, local_backend
+from .instrumentation import Instrumentation
+
+
+class DirSizeCache:
+    """디렉토리별 직속 항목 합계를 (장치, inode, mtime)을 키로 보관하는 LRU 캐시
+
+    값은 (직속 파일 바이트, 직속 파일 수, 하위 디렉토리 이름들)이다. 디렉토리의 mtime은
+    직속 항목이 추가/삭제/이름 변경될 때만 바뀌므로, 재귀 합계는 하위 디렉토리마다
+    stat 한 번으로 캐시 항목을 확인해 다시 더한다 (바뀐 디렉토리만 다시 스캔).
+    파일 내용만 바뀐 경우(크기 변경)는 디렉토리 mtime이 바뀌지 않아 감지하지 못한다.
+    여러 스레드에서 동시에 사용할 수 있다.
+    """
+
+    def __init__(self, max_entries: int = 200_000):
+        self.max_entries = max_entries  # 최대 디렉토리 수
+        self._entries = OrderedDict()  # (장치, inode, mtime_ns) -> (바이트, 파일 수, 하위 디렉토리 이름)
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> tuple | None:
+        """캐시된 (바이트, 파일 수, 하위 디렉토리 이름)을 반환한다. 없으면 None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: tuple):
+        """디렉토리의 직속 합계를 저장한다."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """캐시를 비운다."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared_cache = None
+
+
+def shared_dir_size_cache() -> DirSizeCache:
+    """프로세스 전역에서 공유하는 디렉토리 크기 캐시를 반환한다."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = DirSizeCache()
+    return _shared_cache
+
+
+class DirSizeCalculator(QObject):
+    """디렉토리의 재귀 크기와 파일 수를 정해진 수의 스레드에서 계산한다
+
+    request()로 넣은 디렉토리는 우선순위(작을수록 먼저) 순으로 처리하며,
+    prioritize()로 화면에 보이는 디렉토리를 앞으로 당길 수 있다. 결과는 모아서
+    RESULT_FLUSH_MS마다 sizes_ready로 보낸다. clear()는 대기 중인 요청을 버리고,
+    진행 중인 계산은 중단해 결과를 보내지 않는다. 요청이 없는 채로 IDLE_SECONDS가 지난
+    스레드는 끝나고, 다음 요청 때 다시 시작한다.
+    심볼릭 링크는 따라가지 않고, 하드 링크는 링크마다 센다.
+    """
+
+    sizes_ready = pyqtSignal(object)  # [(경로, 바이트, 파일 수)]
+
+    # 우선순위
+    PRIORITY_VISIBLE = 0  # 화면에 보이는 행
+    PRIORITY_NORMAL = 1
+
+    # 워커가 결과를 모아 보내는 최대 간격 (ms)
+    RESULT_FLUSH_MS = 100
+    # 요청이 없을 때 스레드가 끝나기까지 기다리는 시간 (초)
+    IDLE_SECONDS = 5.0
+
+    def __init__(self, workers: int = 4, cache: DirSizeCache = None,
+                 instrumentation: Instrumentation = None, backend: FileSystemBackend = None, parent=None):
+        super().__init__(parent)
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다")
+        self.workers = workers  # 계산 스레드 수
+        self.backend = backend if backend is not None else local_backend()  # 파일 시스템 백엔드
+        self.cache = cache if cache is not None else shared_dir_size_cache()
+        self.instrumentation = instrumentation
+        self._requests = queue.PriorityQueue()  # (우선순위, 순번, 세대, 경로)
+        self._queued = {}  # 경로 -> 대기 중인 우선순위 (GUI 스레드와 워커가 공유)
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._generation = 0  # clear()마다 증가 (이전 요청/계산 무효화)
+        self._threads = []  # 계산 스레드 (첫 요청 때 시작)
+
+    def request(self, paths, priority: int = PRIORITY_NORMAL):
+        """디렉토리들의 크기 계산을 요청한다 (이미 더 높은 우선순위로 대기 중이면 무시)."""
+        with self._lock:
+            generation = self._generation
+            for path in paths:
+                queued = self._queued.get(path)
+                if queued is not None and queued <= priority:
+                    continue
+                self._queued[path] = priority
+                self._requests.put((priority, next(self._counter), generation, path))
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._run, name="DirSizeCalculator", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+    def prioritize(self, paths):
+        """대기 중인 디렉토리들을 화면에 보이는 행 우선순위로 당긴다."""
+        with self._lock:
+            generation = self._generation
+            for path in paths:
+                queued = self._queued.get(path)
+                if queued is not None and queued > self.PRIORITY_VISIBLE:
+                    self._queued[path] = self.PRIORITY_VISIBLE
+                    self._requests.put((self.PRIORITY_VISIBLE, next(self._counter), generation, path))
+
+    def clear(self):
+        """대기 중인 요청을 버리고 진행 중인 계산을 중단한다."""
+        with self._lock:
+            self._generation += 1
+            self._queued.clear()
+
+    def pending(self) -> int:
+        """아직 계산하지 않은 디렉토리 수."""
+        return len(self._queued)
+
+    def _take(self, timeout: float) -> tuple | None:
+        """다음 요청 (경로, 세대). timeout 동안 요청이 없으면 None."""
+        while True:
+            try:
+                priority, _, generation, path = self._requests.get(timeout=timeout)
+            except queue.Empty:
+                return None
+            with self._lock:
+                # 다른 우선순위로 다시 넣은 요청이나 clear() 이전 요청은 건너뜀
+                if generation != self._generation or self._queued.get(path) != priority:
+                    continue
+                del self._queued[path]
+                return path, generation
+
+    def _run(self):
+        """워커 스레드: 요청을 꺼내 계산하고 결과를 모아 보낸다."""
+        results = []
+        flush_interval = self.RESULT_FLUSH_MS / 1000
+        deadline = None
+        while True:
+            # 모아 둔 결과가 있으면 보낼 시각까지만 기다림
+            timeout = self.IDLE_SECONDS if deadline is None else max(deadline - time.monotonic(), 0)
+            taken = self._take(timeout)
+            if taken is None and not results:
+                with self._lock:
+                    # 요청을 넣는 쪽도 같은 잠금 안에서 스레드 수를 확인하므로 요청을 놓치지 않음
+                    if self._requests.empty():
+                        self._threads.remove(threading.current_thread())
+                        return
+                continue
+            if taken is not None:
+                path, generation = taken
+                totals = self._measure(path, generation)
+                if totals is not None:
+                    results.append((path, *totals))
+                    if deadline is None:
+                        deadline = time.monotonic() + flush_interval
+            if results and (taken is None or time.monotonic() >= deadline):
+                try:
+                    self.sizes_ready.emit(results)
+                except RuntimeError:
+                    # 계산기(QObject)가 이미 삭제됨
+                    return
+                results = []
+                deadline = None
+
+    def _measure(self, path: str, generation: int) -> tuple | None:
+        """path 아래 전체의 (바이트, 파일 수). 중간에 clear()되면 None."""
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = instrumentation.now()
+        cache = self.cache
+        total_bytes = total_files = scanned = 0
+        stack = [path]
+        while stack:
+            if generation != self._generation:
+                return None
+            directory = stack.pop()
+            try:
+                stat_info = self.backend.stat(directory)
+            except OSError:
+                continue
+            key = (stat_info.st_dev, stat_info.st_ino, stat_info.st_mtime_ns)
+            cached = cache.get(key)
+            if cached is None:
+                cached = self._scan(directory)
+                if cached is None:
+                    continue
+                cache.put(key, cached)
+                scanned += 1
+            own_bytes, own_files, children = cached
+            total_bytes += own_bytes
+            total_files += own_files
+            stack.extend(os.path.join(directory, name) for name in children)
+        if instrumentation is not None:
+            instrumentation.record("dir_size.measure", "dir_size", start, path=path,
+                                   files=total_files, scanned_dirs=scanned)
+        return total_bytes, total_files
+
+    def _scan(self, directory: str) -> tuple | None:
+        """디렉토리의 직속 (파일 바이트, 파일 수, 하위 디렉토리 이름). 읽을 수 없으면 None."""
+        own_bytes = own_files = 0
+        children = []
+        try:
+            with self.backend.list(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            children.append(entry.name)
+                            continue
+                        own_bytes += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+                    own_files += 1
+        except OSError:
+            # 권한 없음 등
+            return None
+        return own_bytes, own_files, tuple(children)
@@ -0,0 +1,215 @@
+"""큰 디렉토리 목록의 디스크 인덱스 (SQLite, 사용자 캐시 디렉토리)"""
+import os
+import sqlite3
+import sys
+import time
+from array import array
+from .entry_store import EntryStore
+
+# 저장 형식이 바뀌면 올린다 (다른 버전의 인덱스는 비우고 다시 만든다)
+_SCHEMA_VERSION = 1
+
+
+def user_cache_dir() -> str:
+    """플랫폼별 사용자 캐시 디렉토리 아래의 이 패키지 디렉토리를 반환한다."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "pyqt-file-explorer")
+
+
+def _report(message: str, error: Exception):
+    """인덱스 오류를 stderr에 알린다.
+
+    다른 프로세스가 인덱스를 쓰고 있어 잠긴 경우는 이번 저장을 건너뛴 것(다음에 적중 실패)일 뿐이라 알리지 않는다.
+    """
+    if isinstance(error, sqlite3.OperationalError) and "locked" in str(error):
+        return
+    print(f"{message}: {error}", file=sys.stderr)
+
+
+class DiskIndex:
+    """디렉토리 목록을 프로세스 재시작 후에도 유지하는 디스크 인덱스
+
+    min_entries개 이상인 큰 디렉토리만 저장한다. 목록은 디렉토리 하나당
+    한 행에 컬럼별 BLOB(이름은 NUL 구분 UTF-8, 크기/수정시간/플래그는 배열 바이트)으로
+    저장해 수십만 항목도 한 번의 읽기로 복원한다. 각 목록은 스캔 시작 시점의
+    디렉토리 서명과 함께 저장되어 ListingCache와 같은 방식으로 재검증된다.
+    전체 바이트와 디렉토리 수 한도를 넘으면 가장 오래 사용하지 않은 목록부터 지운다.
+    인덱스는 캐시이므로 SQLite 오류는 적중 실패로 취급한다.
+    """
+
+    def __init__(self, path: str = None, max_bytes: int = 1024 * 1024 * 1024,
+                 max_directories: int = 256, min_entries: int = 5000):
+        self.path = path or os.path.join(user_cache_dir(), "index.sqlite3")  # 인덱스 파일
+        self.max_bytes = max_bytes  # 최대 전체 바이트
+        self.max_directories = max_directories  # 최대 디렉토리 수
+        self.min_entries = min_entries  # 저장할 최소 항목 수
+        self._connection = None
+        try:
+            self._connection = self._open()
+        except (OSError, sqlite3.Error) as e:
+            _report("디스크 인덱스를 열 수 없음", e)
+
+    def _open(self) -> sqlite3.Connection:
+        """인덱스 파일을 열고 스키마를 준비한다."""
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS listings")
+            connection.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS listings ("
+            " path TEXT PRIMARY KEY,"
+            " mtime_ns INTEGER NOT NULL,"
+            " ctime_ns INTEGER NOT NULL,"
+            " count INTEGER NOT NULL,"
+            " nbytes INTEGER NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " names BLOB NOT NULL,"
+            " sizes BLOB NOT NULL,"
+            " mtimes BLOB NOT NULL,"
+            " flags BLOB NOT NULL)"
+        )
+        connection.commit()
+        return connection
+
+    def get(self, path: str) -> tuple[EntryStore, tuple] | None:
+        """저장된 (목록, 서명)을 반환한다. 없으면 None."""
+        if self._connection is None:
+            return None
+        try:
+            row = self._connection.execute(
+                "SELECT mtime_ns, ctime_ns, count, names, sizes, mtimes, flags"
+                " FROM listings WHERE path = ?", (path,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE listings SET last_used = ? WHERE path = ?", (time.time(), path))
+            self._connection.commit()
+        except sqlite3.Error:
+            return None
+
+        mtime_ns, ctime_ns, count, names, sizes, mtimes, flags = row
+        store = EntryStore(path)
+        store.names = names.decode("utf-8", "surrogateescape").split("\0") if count else []
+        store.sizes.frombytes(sizes)
+        store.mtimes.frombytes(mtimes)
+        store.flags = bytearray(flags)
+        if not (len(store.names) == len(store.sizes) == len(store.mtimes) == len(store.flags) == count):
+            # 손상된 행
+            self.invalidate(path)
+            return None
+        return store, (mtime_ns, ctime_ns)
+
+    def put(self, path: str, store: EntryStore, signature: tuple | None):
+        """목록이 충분히 크면 저장한다."""
+        if self._connection is None or signature is None:
+            return
+        if len(store) < self.min_entries:
+            self.invalidate(path)
+            return
+
+        names = "\0".join(store.names).encode("utf-8", "surrogateescape")
+        sizes = store.sizes.tobytes()
+        mtimes = store.mtimes.tobytes()
+        flags = bytes(store.flags)
+        nbytes = len(names) + len(sizes) + len(mtimes) + len(flags)
+        if nbytes > self.max_bytes:
+            self.invalidate(path)
+            return
+
+        try:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO listings"
+                " (path, mtime_ns, ctime_ns, count, nbytes, last_used, names, sizes, mtimes, flags)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (path, signature[0], signature[1], len(store), nbytes, time.time(),
+                 names, sizes, mtimes, flags),
+            )
+            self._evict()
+            self._connection.commit()
+        except sqlite3.Error as e:
+            _report("디스크 인덱스 저장 오류", e)
+
+    def invalidate(self, path: str):
+        """경로의 목록을 제거한다."""
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute("DELETE FROM listings WHERE path = ?", (path,))
+            self._connection.commit()
+        except sqlite3.Error:
+            pass
+
+    def clear(self):
+        """인덱스를 비운다."""
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute("DELETE FROM listings")
+            self._connection.commit()
+            self._connection.execute("VACUUM")
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """인덱스 파일을 닫는다."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _evict(self):
+        """한도를 넘으면 가장 오래 사용하지 않은 목록부터 제거한다."""
+        count, total = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM listings"
+        ).fetchone()
+        if count <= self.max_directories and total <= self.max_bytes:
+            return
+
+        victims = []
+        for path, nbytes in self._connection.execute(
+            "SELECT path, nbytes FROM listings ORDER BY last_used"
+        ):
+            if count <= self.max_directories and total <= self.max_bytes:
+                break
+            victims.append((path,))
+            count -= 1
+            total -= nbytes
+        self._connection.executemany("DELETE FROM listings WHERE path = ?", victims)
+
+    def __contains__(self, path: str) -> bool:
+        if self._connection is None:
+            return False
+        try:
+            return self._connection.execute(
+                "SELECT 1 FROM listings WHERE path = ?", (path,)
+            ).fetchone() is not None
+        except sqlite3.Error:
+            return False
+
+    def __len__(self) -> int:
+        if self._connection is None:
+            return 0
+        try:
+            return self._connection.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    @property
+    def total_bytes(self) -> int:
+        """저장된 목록의 전체 바이트."""
+        if self._connection is None:
+            return 0
+        try:
+            return self._connection.execute("SELECT COALESCE(SUM(nbytes), 0) FROM listings").fetchone()[0]
+        except sqlite3.Error:
+            return 0
@@ -0,0 +1,222 @@
+"""컬럼 지향 디렉토리 항목 저장소"""
+import bisect
+import functools
+import os
+import sys
+from array import array
+
+# 플래그 비트
+FLAG_DIR = 0x01
+FLAG_FILE = 0x02
+FLAG_PARENT = 0x04  # 상위 디렉토리(..) 항목
+FLAG_LINK = 0x08  # 심볼릭 링크 (스캔 코어만 표시, 로더는 0)
+
+# 크기/수정시간을 알 수 없을 때의 값
+UNKNOWN = -1
+
+# select()가 NumPy로 배열을 고르는 최소 행 수 (적을 때는 NumPy를 불러오지 않음)
+NUMPY_SELECT_ROWS = 4096
+
+
+@functools.cache
+def load_numpy():
+    """NumPy를 처음 필요할 때 불러온다 (import 비용이 커서 모듈 로드 시 불러오지 않음).
+
+    NumPy는 선택 사항이며 없으면 None (순수 Python 경로 사용).
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def sort_key(name: str, flags: int) -> str:
+    """기본 정렬 키: .. → 디렉토리 → 파일 순, 같은 그룹은 이름(대소문자 무시)순.
+
+    그룹 번호 한 글자 뒤에 대소문자를 무시한 이름을 붙인 문자열이다 (튜플보다 비교가 빠름).
+    """
+    return ("0" if flags & FLAG_PARENT else "1" if flags & FLAG_DIR else "2") + name.casefold()
+
+
+def insert_runs(positions: list):
+    """끼워 넣을 위치 목록(오름차순)을 같은 위치끼리 (위치, 시작, 끝) 구간으로 묶는다."""
+    start = 0
+    while start < len(positions):
+        position = positions[start]
+        end = bisect.bisect_right(positions, position, start)
+        yield position, start, end
+        start = end
+
+
+class EntryStore:
+    """항목 하나당 dict 대신 컬럼별 배열로 항목을 저장하는 컨테이너
+
+    이름은 list, 크기/수정시간은 typed array, 플래그는 bytearray에 보관하고
+    전체 경로는 부모 디렉토리 + 이름으로 필요할 때 다시 만든다.
+    인덱싱/순회 시에는 기존 코드와 호환되는 dict를 즉석에서 만들어 반환한다.
+    """
+
+    __slots__ = ("base_path", "names", "sizes", "mtimes", "flags")
+
+    def __init__(self, base_path: str = ""):
+        self.base_path = base_path  # 항목들이 속한 디렉토리
+        self.names = []  # 이름
+        self.sizes = array("q")  # 크기 (UNKNOWN = 알 수 없음)
+        self.mtimes = array("d")  # 수정시간 (UNKNOWN = 알 수 없음)
+        self.flags = bytearray()  # FLAG_* 비트 조합
+
+    def append(self, name: str, is_dir: bool, is_file: bool,
+               size: int | None = None, modified: float | None = None):
+        """항목 하나를 추가한다."""
+        self.names.append(name)
+        self.sizes.append(UNKNOWN if size is None else size)
+        self.mtimes.append(UNKNOWN if modified is None else modified)
+        self.flags.append((FLAG_DIR if is_dir else 0) | (FLAG_FILE if is_file else 0))
+
+    def append_from(self, other: "EntryStore", row: int):
+        """다른 저장소의 항목 하나를 추가한다."""
+        self.names.append(other.names[row])
+        self.sizes.append(other.sizes[row])
+        self.mtimes.append(other.mtimes[row])
+        self.flags.append(other.flags[row])
+
+    def append_parent(self):
+        """상위 디렉토리(..) 항목을 추가한다."""
+        self.names.append("..")
+        self.sizes.append(UNKNOWN)
+        self.mtimes.append(UNKNOWN)
+        self.flags.append(FLAG_DIR | FLAG_PARENT)
+
+    def extend(self, other: "EntryStore"):
+        """다른 저장소의 항목을 뒤에 이어 붙인다."""
+        self.names.extend(other.names)
+        self.sizes.extend(other.sizes)
+        self.mtimes.extend(other.mtimes)
+        self.flags.extend(other.flags)
+
+    def copy(self) -> "EntryStore":
+        """항목을 복사한 새 저장소를 만든다."""
+        store = EntryStore(self.base_path)
+        store.extend(self)
+        return store
+
+    def select(self, rows) -> "EntryStore":
+        """지정한 행들만 주어진 순서대로 담은 새 저장소를 만든다.
+
+        행이 많고 NumPy가 있으면 크기/수정시간/플래그 배열은 NumPy로 한 번에 고른다.
+        """
+        rows = list(rows)
+        store = EntryStore(self.base_path)
+        store.names = list(map(self.names.__getitem__, rows))
+        numpy = load_numpy() if len(rows) >= NUMPY_SELECT_ROWS else None
+        if numpy is not None:
+            order = numpy.array(rows, dtype=numpy.int64)
+            store.sizes.frombytes(numpy.frombuffer(self.sizes, dtype=numpy.int64)[order].tobytes())
+            store.mtimes.frombytes(numpy.frombuffer(self.mtimes, dtype=numpy.float64)[order].tobytes())
+            store.flags = bytearray(numpy.frombuffer(self.flags, dtype=numpy.uint8)[order].tobytes())
+            return store
+        store.sizes = array("q", map(self.sizes.__getitem__, rows))
+        store.mtimes = array("d", map(self.mtimes.__getitem__, rows))
+        store.flags = bytearray(map(self.flags.__getitem__, rows))
+        return store
+
+    def insert(self, row: int, other: "EntryStore"):
+        """다른 저장소의 항목을 row 위치에 끼워 넣는다."""
+        self.names[row:row] = other.names
+        self.sizes[row:row] = other.sizes
+        self.mtimes[row:row] = other.mtimes
+        self.flags[row:row] = other.flags
+
+    def delete(self, first: int, last: int):
+        """first~last(포함) 행을 제거한다."""
+        del self.names[first:last + 1]
+        del self.sizes[first:last + 1]
+        del self.mtimes[first:last + 1]
+        del self.flags[first:last + 1]
+
+    def update_from(self, row: int, other: "EntryStore", other_row: int) -> bool:
+        """다른 저장소 항목의 메타데이터로 행을 갱신한다. 값이 바뀌었으면 True.
+
+        행을 옮기지 않으므로 정렬 그룹(디렉토리/파일)이 같은 항목끼리만 쓴다.
+        """
+        changed = False
+        if self.flags[row] != other.flags[other_row]:
+            self.flags[row] = other.flags[other_row]
+            changed = True
+        if self.sizes[row] != other.sizes[other_row]:
+            self.sizes[row] = other.sizes[other_row]
+            changed = True
+        if self.mtimes[row] != other.mtimes[other_row]:
+            self.mtimes[row] = other.mtimes[other_row]
+            changed = True
+        return changed
+
+    def clear(self):
+        """모든 항목을 제거한다."""
+        self.names = []
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.flags = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def is_dir(self, row: int) -> bool:
+        """디렉토리 여부."""
+        return bool(self.flags[row] & FLAG_DIR)
+
+    def is_parent(self, row: int) -> bool:
+        """상위 디렉토리(..) 항목 여부."""
+        return bool(self.flags[row] & FLAG_PARENT)
+
+    def size(self, row: int) -> int | None:
+        """크기 (알 수 없으면 None)."""
+        size = self.sizes[row]
+        return None if size == UNKNOWN else size
+
+    def modified(self, row: int) -> float | None:
+        """수정시간 (알 수 없으면 None)."""
+        modified = self.mtimes[row]
+        return None if modified == UNKNOWN else modified
+
+    def sort_key(self, row: int) -> str:
+        """기본 정렬 키 (sort_key 참고)."""
+        return sort_key(self.names[row], self.flags[row])
+
+    def path(self, row: int) -> str:
+        """항목의 전체 경로를 만든다."""
+        if self.flags[row] & FLAG_PARENT:
+            return os.path.dirname(self.base_path)
+        return os.path.join(self.base_path, self.names[row])
+
+    def item(self, row: int) -> dict:
+        """기존 dict 형식으로 항목을 만든다."""
+        flags = self.flags[row]
+        return {
+            "name": self.names[row],
+            "path": self.path(row),
+            "is_dir": bool(flags & FLAG_DIR),
+            "is_file": bool(flags & FLAG_FILE),
+            "size": self.size(row),
+            "modified": self.modified(row),
+        }
+
+    def __getitem__(self, row: int) -> dict:
+        if row < 0:
+            row += len(self.names)
+        if not 0 <= row < len(self.names):
+            raise IndexError("EntryStore index out of range")
+        return self.item(row)
+
+    def __iter__(self):
+        for row in range(len(self.names)):
+            yield self.item(row)
+
+    def nbytes(self) -> int:
+        """저장소가 차지하는 메모리를 대략 계산한다."""
+        total = sys.getsizeof(self.names)
+        total += sum(map(sys.getsizeof, self.names))
+        total += sys.getsizeof(self.sizes) + sys.getsizeof(self.mtimes)
+        total += sys.getsizeof(self.flags)
+        return total
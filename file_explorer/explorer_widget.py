@@ -1,25 +1,42 @@
 """파일 탐색기 메인 위젯"""
 import os
 from pathlib import Path
-from PyQt6.QtCore import Qt, QModelIndex, QSortFilterProxyModel, pyqtSignal
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableView, QHeaderView
+from typing import TYPE_CHECKING
+from PyQt6.QtCore import Qt, QModelIndex, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QTableView, QHeaderView
+from .archives import archive_backend, archive_format
+from .backends import FileSystemBackend
+from .file_operations import COPY, DELETE, MOVE, FileOperation
 from .file_model import FileTableModel
+from .icon_cache import IconCache
+from .instrumentation import Instrumentation, instrumentation_from_env
+from .listing_cache import ListingCache
+from .loader import BatchPolicy, LoaderPool, PRIORITY_FOCUSED, PRIORITY_HIDDEN, PRIORITY_VISIBLE
+from .name_filter import GlobFilter, QuickFilter
 from .navigation_bar import NavigationBar
+from .scan_scheduler import ScanScheduler
+from .search import is_recursive_pattern
+from .sort_proxy import ExplorerSortProxyModel
+
+if TYPE_CHECKING:
+    from .disk_index import DiskIndex
 
 
 def parse_path_with_pattern(input_path: str):
     """경로와 glob 패턴을 분리한다.
 
     예: "/home/user/*.py" -> ("/home/user", "*.py")
+    예: "/data/**/*.parquet" -> ("/data", "**/*.parquet")  (재귀 검색)
     예: "/home/user" -> ("/home/user", None)
     """
     # * 또는 ? 가 포함되어 있으면 glob 패턴으로 간주
     if '*' in input_path or '?' in input_path:
-        # 마지막 경로 구분자를 찾아서 디렉토리와 패턴 분리
-        last_sep_idx = input_path.rfind(os.sep)
-        if last_sep_idx != -1:
-            dir_path = input_path[:last_sep_idx]
-            pattern = input_path[last_sep_idx + 1:]
+        # 와일드카드가 처음 나오는 경로 단계 앞에서 디렉토리와 패턴 분리
+        wildcard_idx = min(i for i in (input_path.find('*'), input_path.find('?')) if i != -1)
+        sep_idx = input_path.rfind(os.sep, 0, wildcard_idx)
+        if sep_idx != -1:
+            dir_path = input_path[:sep_idx] or os.sep
+            pattern = input_path[sep_idx + 1:]
             return dir_path, pattern
         else:
             # 구분자가 없으면 현재 디렉토리에서 패턴 적용
@@ -33,14 +50,55 @@ class FileExplorerWidget(QWidget):
 
     # 파일 더블클릭 시 파일 경로를 전달하는 시그널
     fileDoubleClicked = pyqtSignal(str)
-
-    def __init__(self, initial_path: str = None, parent=None):
+    # 파일 작업(복사/이동/삭제) 진행 상황과 완료 (OperationProgress)
+    operationProgress = pyqtSignal(object)
+    operationFinished = pyqtSignal(object)
+
+    # 결과를 보관하는 최근 이름 필터 수 (백스페이스 시 재사용)
+    QUICK_FILTER_HISTORY = 16
+
+    # 선택/마우스가 이 시간(ms) 동안 머물면 미리 스캔 후보를 갱신
+    PREFETCH_DELAY_MS = 200
+
+    def __init__(self, initial_path: str = None, parent=None, listing_cache: ListingCache = None,
+                 live_refresh: bool = True, batch_policy: BatchPolicy = None, stat_workers: int = 0,
+                 disk_index: "DiskIndex" = None, instrumentation: Instrumentation = None,
+                 load_when_shown: bool = False, icon_cache: IconCache = None, dir_size_workers: int = 0,
+                 prefetch_bytes: int = 0, slow_mounts=(), loader_pool: LoaderPool = None,
+                 backend: FileSystemBackend = None, operation_workers: int = 4,
+                 fetch_rows: int = 0, scan_scheduler: ScanScheduler = None):
         super().__init__(parent)
-        self._current_path = initial_path or os.getcwd()
+        # 파일 시스템 백엔드 (지정하지 않으면 압축 파일도 디렉토리로 여는 로컬 디스크)
+        self._backend = backend if backend is not None else archive_backend()
+        self._current_path = initial_path or (os.getcwd() if backend is None else os.sep)
         self._back_stack = []
         self._forward_stack = []
+        self._listing_cache = listing_cache  # None이면 프로세스 전역 캐시 사용
+        self._live_refresh = live_refresh  # 현재 디렉토리 변경 시 자동 갱신
+        self._batch_policy = batch_policy  # 로딩 청크 크기/주기 (None이면 기본값)
+        self._stat_workers = stat_workers  # 병렬 stat 스레드 수 (네트워크 마운트용, 0이면 순차)
+        self._disk_index = disk_index  # 큰 디렉토리 목록의 디스크 인덱스 (None이면 사용 안 함)
+        self._icon_cache = icon_cache  # None이면 프로세스 전역 아이콘 캐시 사용
+        self._dir_size_workers = dir_size_workers  # 디렉토리 재귀 크기 계산 스레드 수 (0이면 계산 안 함)
+        self._prefetch_bytes = prefetch_bytes  # 미리 스캔한 목록의 메모리 예산 (0이면 미리 스캔 안 함)
+        self._slow_mounts = slow_mounts  # 미리 스캔하지 않을 느린 마운트 경로
+        self._loader_pool = loader_pool  # 로더 스레드 풀 (None이면 프로세스 전역 풀)
+        # 스캔 스케줄러 (None이면 프로세스 전역 스케줄러: 같은 디렉토리를 연 위젯끼리 스캔 공유)
+        self._scan_scheduler = scan_scheduler
+        self._operation_workers = operation_workers  # 파일 작업(복사/이동/삭제) 하나의 스레드 수
+        self._fetch_rows = fetch_rows  # 스크롤할 때마다 더 보일 행 수 (0이면 스캔한 항목을 모두 행으로)
+        self._hovered_path = None  # 마우스를 올린 디렉토리 (미리 스캔 후보)
+        # 성능 계측기 (지정하지 않으면 FILE_EXPLORER_TRACE 환경 변수로 켬, 꺼져 있으면 None)
+        self.instrumentation = instrumentation if instrumentation is not None else instrumentation_from_env()
+        # 숨겨진 동안(예: 선택되지 않은 탭)에는 스캔하지 않고 처음 보일 때 로드
+        self._load_when_shown = load_when_shown
+        self._deferred_load = None  # 보일 때 로드할 (경로, glob 패턴)
+        self._quick_filters = {}  # (검색어, 퍼지 여부) -> 최근 이름 필터 (오래된 순)
 
         self._setup_ui()
+        # 로딩 우선순위: 포커스가 있는 창 > 보이는 창 > 숨겨진 창 (선택되지 않은 탭 등)
+        QApplication.instance().focusChanged.connect(self._update_scan_priority)
+        self._update_scan_priority()
         self.navigate_to(self._current_path)
 
     def _setup_ui(self):
@@ -53,21 +111,29 @@ class FileExplorerWidget(QWidget):
         self.nav_bar.path_changed.connect(self._on_path_changed)
         self.nav_bar.back_requested.connect(self._on_back)
         self.nav_bar.forward_requested.connect(self._on_forward)
+        self.nav_bar.filter_changed.connect(self.set_quick_filter)
+        self.nav_bar.filter_focused.connect(self._on_filter_focused)
         layout.addWidget(self.nav_bar)
 
         # 파일 모델
-        self.model = FileTableModel()
+        self.model = FileTableModel(listing_cache=self._listing_cache, live_refresh=self._live_refresh,
+                                    batch_policy=self._batch_policy, stat_workers=self._stat_workers,
+                                    disk_index=self._disk_index, instrumentation=self.instrumentation,
+                                    icon_cache=self._icon_cache, dir_size_workers=self._dir_size_workers,
+                                    prefetch_bytes=self._prefetch_bytes, slow_mounts=self._slow_mounts,
+                                    loader_pool=self._loader_pool, backend=self._backend,
+                                    fetch_rows=self._fetch_rows, scan_scheduler=self._scan_scheduler)
 
         # 정렬 필터 프록시 모델
-        self.proxy_model = QSortFilterProxyModel()
+        # (모델이 계산한 정렬 순서를 매핑으로 적용, 삽입 시 자동 재정렬 없음)
+        self.proxy_model = ExplorerSortProxyModel(instrumentation=self.instrumentation)
         self.proxy_model.setSourceModel(self.model)
-        self.proxy_model.setDynamicSortFilter(False)  # 삽입 시 자동 재정렬 비활성화
 
         # 테이블 뷰
         self.table_view = QTableView()
         self.table_view.setModel(self.proxy_model)
         self.table_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
-        self.table_view.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table_view.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
         self.table_view.verticalHeader().setDefaultSectionSize(24)  # 행 높이 설정
         self.table_view.setSortingEnabled(True)  # 헤더 클릭으로 정렬 활성화
         self.table_view.doubleClicked.connect(self._on_double_clicked)
@@ -89,15 +155,76 @@ class FileExplorerWidget(QWidget):
         layout.addWidget(self.table_view)
         self.setLayout(layout)
 
+        if self._dir_size_workers > 0:
+            # 스크롤/정렬/행 추가 후 화면에 보이는 디렉토리의 크기를 먼저 계산
+            self._visible_timer = QTimer(self)
+            self._visible_timer.setSingleShot(True)
+            self._visible_timer.setInterval(50)
+            self._visible_timer.timeout.connect(self._prioritize_visible_dir_sizes)
+            for signal in (self.table_view.verticalScrollBar().valueChanged, self.proxy_model.layoutChanged,
+                           self.proxy_model.rowsInserted, self.proxy_model.modelReset):
+                signal.connect(lambda *args: self._visible_timer.start())
+
+        if self._prefetch_bytes > 0:
+            # 선택/마우스가 잠시 머문 디렉토리를 미리 스캔 후보 맨 앞에 둠
+            self._prefetch_timer = QTimer(self)
+            self._prefetch_timer.setSingleShot(True)
+            self._prefetch_timer.setInterval(self.PREFETCH_DELAY_MS)
+            self._prefetch_timer.timeout.connect(self._update_prefetch)
+            self.table_view.setMouseTracking(True)
+            self.table_view.entered.connect(self._on_entered)
+            self.table_view.selectionModel().currentChanged.connect(lambda *args: self._prefetch_timer.start())
+
+    def _on_entered(self, index: QModelIndex):
+        """마우스를 올린 행이 디렉토리면 미리 스캔 후보로 기억한다."""
+        path = self._directory_at(index)
+        if path is not None and path != self._hovered_path:
+            self._hovered_path = path
+            self._prefetch_timer.start()
+
+    def _directory_at(self, index: QModelIndex) -> str | None:
+        """프록시 인덱스 행이 디렉토리(.. 포함)면 그 경로."""
+        row = self.proxy_model.mapToSource(index).row()
+        items = self.model._items
+        if row < 0 or row >= len(items) or not items.is_dir(row):
+            return None
+        return items.path(row)
+
+    def _update_prefetch(self):
+        """미리 스캔 후보: 선택한/마우스를 올린 디렉토리, 상위 디렉토리, 최근 방문한 형제 디렉토리."""
+        candidates = []
+        for path in (self._directory_at(self.table_view.currentIndex()), self._hovered_path,
+                     os.path.dirname(self._current_path)):
+            if path:
+                candidates.append(path)
+        parent_dir = os.path.dirname(self._current_path)
+        for path in reversed(self._back_stack + self._forward_stack):
+            if os.path.dirname(path) == parent_dir:
+                candidates.append(path)
+        self.model.prefetch(candidates)
+
+    def _prioritize_visible_dir_sizes(self):
+        """화면에 보이는 행의 디렉토리 크기 계산을 앞으로 당긴다."""
+        view = self.table_view
+        first = view.rowAt(0)
+        if first < 0:
+            return
+        last = view.rowAt(view.viewport().height() - 1)
+        if last < 0:
+            last = self.proxy_model.rowCount() - 1
+        proxy = self.proxy_model
+        rows = [proxy.mapToSource(proxy.index(row, 0)).row() for row in range(first, last + 1)]
+        self.model.prioritize_dir_sizes(rows)
+
     def _on_path_changed(self, input_path: str):
         """사용자가 경로를 변경했을 때."""
         # 경로와 glob 패턴을 분리
         dir_path, glob_pattern = parse_path_with_pattern(input_path)
 
         # 절대 경로로 변환
-        dir_path = os.path.abspath(dir_path)
+        dir_path = self._backend.abspath(dir_path)
 
-        if os.path.isdir(dir_path):
+        if self._backend.is_dir(dir_path):
             if glob_pattern:
                 # glob 패턴이 있으면 경로와 패턴을 함께 전달
                 self._navigate_with_pattern(dir_path, glob_pattern)
@@ -105,6 +232,26 @@ class FileExplorerWidget(QWidget):
                 # 일반 경로 네비게이션
                 self.navigate_to(dir_path)
 
+    def _on_filter_focused(self):
+        """필터 입력에 포커스: 첫 글자 입력 전에 이름 인덱스를 만들어 둔다."""
+        self.model.name_index()
+
+    def set_quick_filter(self, text: str, fuzzy: bool = False):
+        """현재 목록을 이름으로 거른다 (빈 문자열이면 해제).
+
+        검색어가 길어지기만 하면 직전 필터의 결과 안에서만 다시 찾는다.
+        """
+        row_filter = None
+        if text:
+            # 지운 글자를 다시 입력하거나 백스페이스로 돌아가면 이전 결과를 재사용
+            row_filter = self._quick_filters.pop((text, fuzzy), None)
+            if row_filter is None:
+                row_filter = QuickFilter(text, fuzzy, previous=self.proxy_model.filter("quick"))
+            self._quick_filters[(text, fuzzy)] = row_filter
+            while len(self._quick_filters) > self.QUICK_FILTER_HISTORY:
+                del self._quick_filters[next(iter(self._quick_filters))]
+        self.proxy_model.set_filter("quick", row_filter)
+
     def _on_back(self):
         """뒤로가기."""
         if self._back_stack:
@@ -125,14 +272,14 @@ class FileExplorerWidget(QWidget):
         source_index = self.proxy_model.mapToSource(index)
         row = source_index.row()
 
-        if row >= len(self.model._items):
+        items = self.model._items
+        if row < 0 or row >= len(items):
             return
 
-        item = self.model._items[row]
-        path = item["path"]
+        path = items.path(row)
 
-        if item["is_dir"]:
-            # 디렉토리: 진입
+        if items.is_dir(row) or (archive_format(path) is not None and self._backend.is_dir(path)):
+            # 디렉토리 (또는 디렉토리로 열 수 있는 압축 파일): 진입
             self.navigate_to(path)
         else:
             # 파일: 시그널 발생
@@ -140,9 +287,9 @@ class FileExplorerWidget(QWidget):
 
     def navigate_to(self, path: str):
         """경로로 이동한다."""
-        path = os.path.abspath(path)
+        path = self._backend.abspath(path)
 
-        if not os.path.isdir(path):
+        if not self._backend.is_dir(path):
             return
 
         # 히스토리 처리
@@ -159,11 +306,7 @@ class FileExplorerWidget(QWidget):
         self.nav_bar.set_back_enabled(len(self._back_stack) > 0)
         self.nav_bar.set_forward_enabled(len(self._forward_stack) > 0)
 
-        # 모델 로드
-        self.model.load(path)
-
-        # 정렬 다시 설정
-        self.proxy_model.sort(-1, Qt.SortOrder.AscendingOrder)
+        self._load(path)
 
     def _navigate_with_pattern(self, dir_path: str, glob_pattern: str):
         """glob 패턴과 함께 네비게이션을 처리한다."""
@@ -173,8 +316,119 @@ class FileExplorerWidget(QWidget):
         self.nav_bar.set_back_enabled(False)
         self.nav_bar.set_forward_enabled(False)
 
-        # 모델 로드 (glob 패턴 포함)
-        self.model.load(dir_path, glob_pattern)
+        self._load(dir_path, glob_pattern)
 
-        # 정렬 다시 설정
-        self.proxy_model.sort(-1, Qt.SortOrder.AscendingOrder)
+    def _load(self, path: str, glob_pattern: str = None):
+        """모델에 목록을 로드한다 (load_when_shown이면 보일 때까지 미룸)."""
+        if self._load_when_shown and not self.isVisible():
+            self._deferred_load = (path, glob_pattern)
+            return
+        self._deferred_load = None
+
+        if self.instrumentation is not None:
+            start = self.instrumentation.now()
+
+        # 이름 필터는 디렉토리마다 새로 시작
+        self.nav_bar.clear_filter()
+        self._quick_filters.clear()
+        self.proxy_model.set_filter("quick", None)
+
+        # 한 디렉토리 안의 glob 패턴은 전체 목록을 로드하고 프록시 필터로 적용한다
+        # (재귀 검색만 로더가 패턴으로 스캔)
+        glob_filter = None
+        if glob_pattern and not is_recursive_pattern(glob_pattern):
+            glob_filter = GlobFilter(glob_pattern)
+            glob_pattern = None
+
+        # 재귀 검색 패턴(glob_pattern이 남아 있음)은 glob 필터가 켜져 있어도 새로 검색한다
+        switching = glob_filter is not None or self.proxy_model.filter("glob") is not None
+        if switching and not glob_pattern and self.model.shows_listing(path):
+            # 이미 로드된 목록에서 패턴만 바꾸거나 해제: 다시 스캔하지 않음
+            self.proxy_model.set_filter("glob", glob_filter)
+        else:
+            self.proxy_model.set_filter("glob", None)
+            # 모델 로드 (재귀 검색 패턴 포함)
+            self.model.load(path, glob_pattern)
+            if self.model.columnCount() > FileTableModel.COLUMN_PATH:
+                # 재귀 검색: 상대 경로 컬럼
+                self.table_view.setColumnWidth(FileTableModel.COLUMN_PATH, 250)
+            self.proxy_model.set_filter("glob", glob_filter)
+
+            # 정렬 다시 설정
+            self.proxy_model.sort(-1, Qt.SortOrder.AscendingOrder)
+
+            if self._prefetch_bytes > 0:
+                self._hovered_path = None
+                self._update_prefetch()
+
+        if self.instrumentation is not None:
+            # 첫 화면 표시 전까지 GUI 스레드를 점유한 시간 (로딩 전체는 model.load)
+            self.instrumentation.record("widget.navigate", "widget", start, path=path)
+
+    def selected_paths(self) -> list[str]:
+        """선택한 항목의 경로 (.. 행 제외, 화면 순서)."""
+        items = self.model._items
+        paths = []
+        for selection_range in self.table_view.selectionModel().selection():
+            for row in self.proxy_model.source_rows(selection_range.top(), selection_range.bottom()):
+                if not items.is_parent(row):
+                    paths.append(items.path(row))
+        return paths
+
+    def copy_files(self, destination: str, paths=None) -> FileOperation:
+        """항목(기본은 선택한 항목)을 destination 디렉토리로 백그라운드 복사한다."""
+        return self._start_operation(COPY, paths, destination)
+
+    def move_files(self, destination: str, paths=None) -> FileOperation:
+        """항목(기본은 선택한 항목)을 destination 디렉토리로 백그라운드 이동한다."""
+        return self._start_operation(MOVE, paths, destination)
+
+    def delete_files(self, paths=None) -> FileOperation:
+        """항목(기본은 선택한 항목)을 백그라운드에서 지운다 (휴지통을 거치지 않음)."""
+        return self._start_operation(DELETE, paths)
+
+    def _start_operation(self, kind: str, paths, destination: str = None) -> FileOperation:
+        """파일 작업을 만들어 시작한다. 진행 상황은 operationProgress/operationFinished로 알린다."""
+        operation = FileOperation(kind, self.selected_paths() if paths is None else paths, destination,
+                                  workers=self._operation_workers, parent=self)
+        operation.progress.connect(self.operationProgress)
+        operation.finished.connect(self._on_operation_finished)
+        operation.start()
+        return operation
+
+    def _on_operation_finished(self, result):
+        """파일 작업 완료: 실시간 갱신이 꺼져 있으면 현재 디렉토리를 다시 확인한다."""
+        operation = self.sender()
+        if not self._live_refresh:
+            self.model.refresh()
+        self.operationFinished.emit(result)
+        if isinstance(operation, FileOperation):
+            operation.deleteLater()
+
+    @property
+    def backend(self) -> FileSystemBackend:
+        """파일 시스템 백엔드 (fileDoubleClicked로 받은 압축 파일 멤버는 backend.open()으로 읽는다)."""
+        return self._backend
+
+    def _update_scan_priority(self, *args):
+        """보임/포커스 상태에 따라 모델의 로딩 우선순위를 정한다."""
+        if not self.isVisible():
+            priority = PRIORITY_HIDDEN
+        else:
+            focus = QApplication.focusWidget()
+            focused = focus is not None and (focus is self or self.isAncestorOf(focus))
+            priority = PRIORITY_FOCUSED if focused else PRIORITY_VISIBLE
+        if priority != self.model.scan_priority:
+            self.model.set_scan_priority(priority)
+
+    def showEvent(self, event):
+        """숨겨진 동안 미룬 로드를 처음 보일 때 실행한다."""
+        super().showEvent(event)
+        self._update_scan_priority()
+        if self._deferred_load is not None:
+            self._load(*self._deferred_load)
+
+    def hideEvent(self, event):
+        """숨겨지면 (예: 다른 탭 선택) 진행 중인 로딩의 우선순위를 낮춘다."""
+        super().hideEvent(event)
+        self._update_scan_priority()
@@ -1,15 +1,85 @@
 """파일 탐색기 테이블 모델"""
+import bisect
+import fnmatch
+import itertools
 import os
-from datetime import datetime
-from pathlib import Path
-from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QFileInfo
+import re
+import stat
+import time
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QFileIconProvider
-from .loader import DirectoryLoader
+from .archives import archive_backend
+from .backends import FileSystemBackend, LocalBackend
+from .dir_sizes import DirSizeCalculator
+from .entry_store import EntryStore, FLAG_DIR, FLAG_PARENT, UNKNOWN, insert_runs, load_numpy
+from .formatting import DisplayFormatter, format_size
+from .icon_cache import IconCache, icon_key, shared_icon_cache
+from .instrumentation import Instrumentation, instrumentation_from_env
+from .listing_buffer import ListingBuffer
+from .listing_cache import ListingCache, shared_listing_cache
+from .loader import BatchPolicy, LoaderPool, PRIORITY_VISIBLE, SortedChunk, StatBatch
+from .name_filter import NameBuffer, NameIndex
+from .prefetch import Prefetcher
+from .scan import is_recursive_pattern
+from .scan_scheduler import ScanScheduler, SharedScan, shared_scan_scheduler
+from .sort_proxy import intersect_rows, restrict_rows
+
+if TYPE_CHECKING:
+    from .disk_index import DiskIndex
+
+
+# 플래그 바이트 → 하위 디렉토리(.. 제외)면 1
+_SUBDIR_TABLE = bytes(1 if flags & FLAG_DIR and not flags & FLAG_PARENT else 0 for flags in range(256))
+
+# 플래그 바이트 → 정렬 그룹 (0: .., 1: 디렉토리, 2: 파일)
+_GROUP_TABLE = bytes(
+    0 if flags & FLAG_PARENT else 1 if flags & FLAG_DIR else 2 for flags in range(256)
+)
+
+
+def _native_order(items: EntryStore) -> tuple:
+    """기본 정렬 순서인 항목을 (.. 행, 디렉토리 행, 파일 행) 연속 구간(range)으로 나눈다."""
+    groups = items.flags.translate(_GROUP_TABLE)
+    parent_end = groups.count(0)
+    directory_end = parent_end + groups.count(1)
+    return range(parent_end), range(parent_end, directory_end), range(directory_end, len(groups))
+
+
+def _row_ranges(rows: list):
+    """정렬된 행 번호 목록을 연속 구간 (first, last)로 묶는다 (내림차순 입력 기준)."""
+    first = last = None
+    for row in rows:
+        if last is not None and row == first - 1:
+            first = row
+            continue
+        if last is not None:
+            yield first, last
+        first = last = row
+    if last is not None:
+        yield first, last
 
 
 class FileTableModel(QAbstractTableModel):
-    """파일/디렉토리 목록을 표시하는 커스텀 테이블 모델"""
+    """파일/디렉토리 목록을 표시하는 커스텀 테이블 모델
+
+    fetch_rows > 0이면 스캔한 항목은 모델 밖에 두고 (로딩 중에는 정렬 키 없는 정렬된 구간들,
+    ListingBuffer / 로딩이 끝나면 기본 정렬 순서의 EntryStore 하나) 모델 행(_items)으로는
+    보일 순서의 앞쪽 fetch_rows개만 복사해 보인다. 나머지는 뷰가 끝까지 스크롤할 때
+    canFetchMore/fetchMore로 fetch_rows개씩 더 보인다. 다른 컬럼 정렬과 이름 필터는 프록시가
+    set_view()로 넘기면 모델이 전체 항목에 적용해 그 순서의 앞쪽만 보이므로, 뷰/프록시가
+    행마다 관리하는 정보는 보이는 행 수에만 비례한다. 전체 항목 수와 로딩 여부는
+    totalRowsChanged로 따로 알린다.
+
+    스캔은 스캔 스케줄러(ScanScheduler)에 요청한다. 다른 모델이 같은 디렉토리를 스캔 중이면
+    그 스캔에 합류해 지금까지의 결과부터 반영하고, 로더 풀에서의 순서는 scan_priority
+    (set_scan_priority(), 위젯이 보임/포커스에 따라 정함)를 따른다.
+    """
+
+    # 전체 항목 수(아직 보이지 않는 행 포함), 로딩 중 여부
+    totalRowsChanged = pyqtSignal(int, bool)
 
     # 컬럼 정의
     COLUMN_NAME = 0
@@ -17,197 +87,1272 @@ class FileTableModel(QAbstractTableModel):
     COLUMN_TYPE = 2
     COLUMN_MODIFIED = 3
     COLUMN_COUNT = 4
+    COLUMN_PATH = 4  # 재귀 검색 중에만 표시되는 상대 경로 컬럼
+
+    # 표시 문자열을 한 번에 포맷팅/캐시하는 단위 (행 수, 블록 수)
+    DISPLAY_BLOCK_ROWS = 64
+    DISPLAY_CACHE_BLOCKS = 256
+
+    # 로딩 중 받은 청크는 현재 행 수의 MERGE_FRACTION만큼 모이거나 MERGE_INTERVAL_MS가
+    # 지나면 병합하고, 추가된 행이 MERGE_INSERT_RUNS개보다 많은 구간에 흩어져 있으면
+    # 구간별 행 추가 알림 대신 레이아웃 변경 알림 한 번으로 반영한다. 시간 간격은 직전 병합에
+    # 걸린 시간의 MERGE_COST_RATIO배 이상으로 늘려 병합이 GUI 스레드를 차지하는 비율을 제한한다
+    # (병합 비용은 전체 행 수에 비례하므로 고정 간격이면 큰 목록에서 로딩 시간이 제곱으로 늘어남)
+    MERGE_FRACTION = 0.25
+    MERGE_INTERVAL_MS = 500
+    MERGE_COST_RATIO = 4
+    MERGE_INSERT_RUNS = 8
+
+    # 한 번에 알려진 변경 이름이 이보다 많으면 (대량 복사/이동/삭제 중) 이름마다 GUI 스레드에서
+    # lstat하지 않고 백그라운드에서 다시 스캔해 달라진 행만 반영한다. 변경이 계속되면 다음 재스캔은
+    # 직전 재스캔 결과 반영에 걸린 시간의 MERGE_COST_RATIO배가 지난 뒤에 시작한다
+    MAX_NAMED_CHANGES = 256
+
+    # 항목이 (로딩 중에도) 유지하는 기본 정렬 (프록시는 이 정렬을 매핑 없이 통과시킨다)
+    native_sort = (COLUMN_NAME, Qt.SortOrder.AscendingOrder)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, listing_cache: ListingCache = None, live_refresh: bool = False,
+                 batch_policy: BatchPolicy = None, stat_workers: int = 0, disk_index: "DiskIndex" = None,
+                 instrumentation: Instrumentation = None, icon_cache: IconCache = None,
+                 dir_size_workers: int = 0, prefetch_bytes: int = 0, slow_mounts=(),
+                 loader_pool: LoaderPool = None, backend: FileSystemBackend = None, fetch_rows: int = 0,
+                 scan_scheduler: ScanScheduler = None):
         super().__init__(parent)
-        self._items = []  # 항목 데이터
+        self._items = EntryStore()  # 모델 행 데이터 (컬럼 지향 저장소, fetch_rows > 0이면 보이는 행만)
+        self.fetch_rows = fetch_rows  # 처음/fetchMore마다 보이는 행 수 (0이면 전부 보임)
+        self._window = None  # 보일 앞쪽 항목 수 (처음 fetch_rows, fetchMore마다 증가, None이면 전부)
+        self._listing = None  # fetch_rows > 0일 때 보이지 않는 항목까지 담은 전체 목록 (기본 정렬 순서)
+        self._buffer = None  # fetch_rows > 0일 때 로딩 중 받은 항목 (ListingBuffer)
+        self._view_sort = None  # fetch_rows > 0일 때 적용할 (컬럼, 방향) 정렬 (None이면 기본 정렬)
+        self._view_filters = {}  # fetch_rows > 0일 때 적용할 행 필터 (이름 -> 필터)
+        self._view_rows = None  # 정렬/필터를 적용한 _listing 행 순서 (None이면 _listing 순서 그대로)
         self._current_path = ""  # 현재 경로
-        self._loader = None  # 현재 실행 중인 로더
-        self._icon_cache = {}  # 확장자별 아이콘 캐시
-        self._file_icon_provider = QFileIconProvider()
-
-        # 기본 아이콘 미리 로드
-        self._init_default_icons()
-
-    def _init_default_icons(self):
-        """기본 아이콘을 초기화한다."""
-        try:
-            dir_info = QFileInfo("/")
-            self._icon_cache["__dir__"] = self._file_icon_provider.icon(dir_info)
-
-            # 파일 아이콘은 시스템 기본 파일 아이콘 사용
-            file_info = QFileInfo(__file__)
-            self._icon_cache["__file__"] = self._file_icon_provider.icon(file_info)
-        except Exception:
-            # 아이콘 로드 실패 시 빈 아이콘 사용
-            self._icon_cache["__dir__"] = QIcon()
-            self._icon_cache["__file__"] = QIcon()
+        self._glob_pattern = None  # 현재 glob 필터 패턴
+        self._glob_matcher = None  # 컴파일된 glob 필터
+        self._recursive = False  # 재귀 glob 검색 결과 표시 중 (이름은 상대 경로)
+        self.search_workers = 4  # 재귀 검색 디렉토리 스캔 스레드 수
+        self._loader = None  # 현재 구독 중인 스캔 (SharedScan)
+        # 스캔 스케줄러 (지정하지 않으면 프로세스 전역 스케줄러, loader_pool만 지정하면 그 풀을 쓰는 스케줄러)
+        if scan_scheduler is None:
+            scan_scheduler = shared_scan_scheduler() if loader_pool is None else ScanScheduler(loader_pool)
+        self._scheduler = scan_scheduler
+        self.scan_priority = PRIORITY_VISIBLE  # 로더 풀 우선순위 (PRIORITY_*)
+        self.batch_policy = batch_policy or BatchPolicy()  # 로더 청크 전송 정책
+        self.stat_workers = stat_workers  # 병렬 stat 스레드 수 (0이면 순차 stat)
+        self._load_keys = None  # 로딩 중 쌓고 있는 목록의 행별 정렬 키 (청크 병합 위치 계산용)
+        self._load_buffer = []  # 아직 목록에 병합하지 않은 정렬된 청크
+        self._load_buffered = 0  # _load_buffer의 행 수
+        self._load_merged = 0.0  # 마지막 청크 병합이 끝난 시각 (time.monotonic)
+        self._load_merge_seconds = 0.0  # 마지막 청크 병합에 걸린 시간
+        self._loading = False  # 로더 실행 중 여부
+        self._pending = None  # 재검증/새로고침 중 새로 스캔한 목록 (완료 시 비교 반영)
+        # 파일 시스템 백엔드 (지정하지 않으면 압축 파일도 디렉토리로 여는 로컬 디스크)
+        self._backend = backend if backend is not None else archive_backend()
+        # 디렉토리 목록 캐시 (지정하지 않으면 로컬 디스크는 프로세스 전역 캐시 공유,
+        # 다른 백엔드는 경로가 겹칠 수 있으므로 모델마다 따로)
+        if listing_cache is None:
+            listing_cache = shared_listing_cache() if isinstance(self._backend, LocalBackend) else ListingCache()
+        self._listing_cache = listing_cache
+        self._disk_index = disk_index  # 큰 디렉토리 목록의 디스크 인덱스 (None이면 사용 안 함)
+        # 성능 계측기 (지정하지 않으면 FILE_EXPLORER_TRACE 환경 변수로 켬, 꺼져 있으면 None)
+        self.instrumentation = instrumentation if instrumentation is not None else instrumentation_from_env()
+        self._load_started = None  # 계측 중 load() 호출 시각
+        self._dirty_signature = None  # 실시간 갱신 후 캐시에 아직 반영하지 않은 목록의 서명
+        self._watcher = None  # 디렉토리 변경 감시자
+        self._deferred_changes = set()  # 로딩 중 미뤄 둔 변경 (None이면 전체 재확인)
+        self._refresh_finished = 0.0  # 마지막 재스캔 결과 반영이 끝난 시각 (time.monotonic)
+        self._refresh_seconds = 0.0  # 마지막 재스캔 결과 반영에 걸린 시간
+        self._refresh_timer = QTimer(self)  # 연달아 오는 재스캔 요청을 미룸
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._sort_keys = None  # 정렬 키 캐시 (.. 행, 디렉토리 행, 파일 행)
+        self._name_index = None  # 빠른 필터용 이름 인덱스 (처음 필터할 때 생성)
+        self._name_buffer = None  # glob 필터용 이름 바이트 버퍼 (처음 필터할 때 생성)
+        self._dir_sizes = None  # 디렉토리 재귀 크기 계산기 (dir_size_workers > 0일 때)
+        self._dir_totals = {}  # 하위 디렉토리 이름 -> (재귀 바이트, 파일 수)
+        self._prefetcher = None  # 다음 디렉토리 미리 스캔 (prefetch_bytes > 0일 때)
+
+        self._formatter = DisplayFormatter()  # 수정일시 포맷터 (날짜 접두어 재사용)
+        self._display_blocks = OrderedDict()  # 블록 번호 -> (크기 문자열들, 수정일시 문자열들)
+
+        # 항목이 바뀌면 정렬 키/표시 문자열 캐시 무효화 (모델 밖 목록의 캐시는 _invalidate_listing)
+        for signal in (self.modelReset, self.rowsInserted, self.rowsRemoved, self.layoutChanged):
+            signal.connect(self._invalidate_sort_keys)
+        for signal in (self.modelReset, self.layoutChanged):
+            signal.connect(lambda *args: self._invalidate_display())
+            signal.connect(lambda *args: self._invalidate_row_names())
+        for signal in (self.rowsInserted, self.rowsRemoved):
+            signal.connect(lambda parent, first, last: self._invalidate_display(first))
+        self.rowsInserted.connect(self._on_rows_inserted_names)
+        self.rowsRemoved.connect(self._on_rows_removed_names)
+        self.dataChanged.connect(self._on_data_changed)
+
+        # 확장자별 아이콘 캐시 (지정하지 않으면 프로세스 전역 캐시 공유)
+        self._icon_cache = icon_cache if icon_cache is not None else shared_icon_cache()
+        self._waiting_icons = set()  # 자리 표시 아이콘을 보여 준 키 (준비되면 다시 그림)
+        self._icon_cache.icons_ready.connect(self._on_icons_ready)
+
+        # 디렉토리 재귀 크기: 행이 들어오는 대로 요청하고 결과를 크기 컬럼에 채움
+        if dir_size_workers > 0:
+            self._dir_sizes = DirSizeCalculator(dir_size_workers, instrumentation=self.instrumentation,
+                                                backend=self._backend, parent=self)
+            self._dir_sizes.sizes_ready.connect(self._on_dir_sizes_ready)
+            self.modelReset.connect(self._request_dir_sizes)
+            self.rowsInserted.connect(self._on_rows_inserted_dir_sizes)
+
+        # 다음에 열 디렉토리 미리 스캔: 로딩 중에는 멈추고 끝나면 다시 시작
+        if prefetch_bytes > 0:
+            self._prefetcher = Prefetcher(self._listing_cache, prefetch_bytes, slow_mounts,
+                                          instrumentation=self.instrumentation, backend=self._backend,
+                                          scheduler=self._scheduler, parent=self)
+
+        self.set_live_refresh(live_refresh)
 
     def load(self, path: str, glob_pattern: str = None):
-        """경로의 항목을 로드한다."""
+        """경로의 항목을 로드한다.
+
+        glob 필터가 없고 캐시(메모리 또는 디스크 인덱스)에 목록이 있으면 즉시 표시한 뒤,
+        백그라운드에서 디렉토리 서명을 확인해 변경된 경우에만 다시 스캔한다.
+        """
+        if self.instrumentation is not None:
+            self._load_started = self.instrumentation.now()
+
+        # 실시간 갱신으로 바뀐 이전 목록은 버리기 전에 캐시에 넣어 둔다
+        if self._dirty_signature is not None and not self._glob_pattern:
+            self._listing_cache.put(self._current_path, self.entries(), self._dirty_signature)
+        self._dirty_signature = None
+
         self._current_path = path
+        self._glob_pattern = glob_pattern
+        self._refresh_timer.stop()
+        self._refresh_seconds = 0.0
+        if self._dir_sizes is not None:
+            # 이전 디렉토리의 대기 중인 계산은 버림 (끝난 하위 디렉토리 합계는 캐시에 남음)
+            self._dir_sizes.clear()
+            self._dir_totals = {}
+        self._glob_matcher = re.compile(fnmatch.translate(glob_pattern)).match if glob_pattern else None
 
-        # 이전 로더가 실행 중이면 취소
-        if self._loader is not None:
-            self._loader.cancel()
+        cached = None if glob_pattern else self._listing_cache.get(path)
+        if cached is None and not glob_pattern and self._disk_index is not None:
+            # 이전 실행에서 인덱스한 큰 디렉토리
+            cached = self._disk_index.get(path)
 
         # 모델 초기화
         self.beginResetModel()
-        self._items = []
+        self._recursive = is_recursive_pattern(glob_pattern)
+        self._window = self.fetch_rows if self.fetch_rows > 0 else None
+        self._buffer = None
+        self._listing = None
+        if cached is None:
+            self._items = self._new_store(path, glob_pattern)
+        elif self._window is None:
+            self._items = cached[0].copy()
+        else:
+            # 캐시된 목록은 모델 밖에 두고 보일 순서의 앞쪽만 행으로
+            self._listing = cached[0].copy()
+            self._invalidate_listing()
+            self._update_view()
+            self._items = self._window_rows(0, self._window)
         self.endResetModel()
+        self.totalRowsChanged.emit(self.total_rows(), True)
+
+        # 로딩 중 발생한 변경도 놓치지 않도록 스캔 전에 감시 시작
+        # (재귀 검색 결과는 하위 트리 전체에 걸치므로 감시하지 않음)
+        if self._watcher is not None:
+            if self._recursive:
+                self._watcher.stop()
+            else:
+                self._watcher.watch(path)
+
+        if cached is not None:
+            # 캐시 적중: 변경되었을 때만 새 목록과 비교해 반영
+            self._start_loader(self._new_store(path, glob_pattern), cached[1])
+        else:
+            self._start_loader(None, None)
+        if self._prefetcher is not None:
+            # 미리 스캔 중이던 디렉토리면 위에서 그 스캔에 합류했으므로 미리 스캔기는 빠져도 된다
+            self._prefetcher.claim(path)
+
+    def prefetch(self, paths):
+        """다음에 열 가능성이 큰 디렉토리들을 (가능성이 큰 순서로) 미리 스캔하게 한다."""
+        if self._prefetcher is not None:
+            self._prefetcher.set_candidates([path for path in paths if path != self._current_path])
+
+    def shows_listing(self, path: str) -> bool:
+        """path 디렉토리의 전체 목록(로더 glob 필터 없이)을 표시 중인지 여부."""
+        return self._current_path == path and not self._glob_pattern
+
+    def refresh(self):
+        """현재 디렉토리를 다시 스캔해 달라진 항목만 반영한다."""
+        if self._loading:
+            # 진행 중인 로딩이 끝난 뒤 전체 재확인
+            self._deferred_changes = None
+        elif self._current_path:
+            # 변경 뒤의 내용이 필요하므로 이미 읽기 시작한 다른 창의 스캔에는 합류하지 않는다
+            self._start_loader(self._new_store(self._current_path, self._glob_pattern), None, fresh=True)
+
+    def set_scan_priority(self, priority: int):
+        """로딩 우선순위를 바꾼다 (PRIORITY_*, 진행 중인 스캔에도 바로 반영)."""
+        self.scan_priority = priority
+        if self._loader is not None:
+            self._loader.set_priority(self, priority)
+
+    def _start_loader(self, pending: EntryStore | None, expected_signature: tuple | None, fresh: bool = False):
+        """스캔을 시작하거나 진행 중인 같은 스캔에 합류한다. pending이 있으면 결과를 모아 기존 목록과 비교한다."""
+        # 이전 스캔에서 빠진다 (구독자가 없으면 스캔은 취소되고, 멈추기를 기다리지 않음)
+        if self._loader is not None:
+            self._release_scan()
+
+        self._pending = pending
+        self._loading = True
+        if self._prefetcher is not None:
+            self._prefetcher.pause()
+        # 스캔 결과는 정렬 순서를 유지하며 쌓인다 (시작 목록은 비었거나 .. 항목뿐)
+        target = pending if pending is not None else self._items
+        self._load_keys = list(map(target.sort_key, range(len(target))))
+        # 행을 나눠 보이면 받은 항목은 모델 밖 버퍼에 쌓고 보이는 구간에 들어갈 항목만 행으로 병합
+        self._buffer = None if self._window is None else ListingBuffer(target)
+        self._load_buffer = []
+        self._load_buffered = 0
+        self._load_merged = time.monotonic()
+        self._load_merge_seconds = 0.0
+
+        # 스캔 요청 (같은 스캔이 진행 중이면 합류)
+        if self._recursive:
+            scan = self._scheduler.search(self, self._current_path, self._glob_pattern, self._backend,
+                                          self.search_workers, self.batch_policy, self.instrumentation,
+                                          self.scan_priority, fresh)
+        else:
+            scan = self._scheduler.scan_directory(self, self._current_path, self._glob_pattern,
+                                                  expected_signature, self._backend, self.stat_workers,
+                                                  self.batch_policy, self.instrumentation,
+                                                  self.scan_priority, fresh)
+        self._loader = scan
+        for signal, slot in self._scan_slots(scan):
+            signal.connect(slot)
 
-        # .. 항목을 미리 추가 (루트가 아닐 경우, glob 필터가 없을 때만)
+        if self._buffer is not None and pending is None and self._reordered():
+            # 정렬/필터 중 새로 로딩: 보이는 행은 받은 항목을 합친 목록에서 고른다
+            self._merge_listing()
+
+        # 다른 모델이 먼저 시작한 스캔이면 그쪽이 지금까지 받은 결과를 한 번에 반영한다
+        received = scan.received(self)
+        if received and self._buffer is not None:
+            for chunk in received:
+                self._buffer_chunk(chunk)
+            self._show_buffered()
+        elif received:
+            self._load_buffer.extend(received)
+            self._load_buffered += sum(map(len, received))
+            self._merge_load_buffer()
+
+    def scan_results(self, scan: SharedScan) -> list:
+        """구독 중인 scan에서 지금까지 받은 항목의 복사본 (늦게 합류한 구독자가 따라잡는 데 씀)."""
+        if not self._is_current(scan) or self._load_keys is None:
+            return []
+        if self._buffer is not None:
+            # 모델 밖 버퍼의 구간들 (.. 항목은 첫 구간의 맨 앞에만 있음)
+            chunks = []
+            for run in self._buffer.runs:
+                rows = range(1 if len(run) and run.is_parent(0) else 0, len(run))
+                chunks.append(SortedChunk.presorted(run.select(rows), list(map(run.sort_key, rows))))
+            return chunks
+        target = self._pending if self._pending is not None else self._items
+        # 스캔 전 목록은 비었거나 .. 항목뿐이라 그 뒤가 받은 항목이다 (stat 결과도 반영됨)
+        start = 1 if len(target) and target.is_parent(0) else 0
+        received = SortedChunk.presorted(target.select(range(start, len(target))), self._load_keys[start:])
+        return [received, *self._load_buffer]
+
+    def _scan_slots(self, scan: SharedScan) -> tuple:
+        """스캔 시그널과 이 모델의 슬롯 쌍."""
+        return ((scan.chunk_ready, self._on_chunk_ready), (scan.stats_ready, self._on_stats_ready),
+                (scan.finished, self._on_finished), (scan.unchanged, self._on_unchanged))
+
+    def _release_scan(self):
+        """구독 중인 스캔에서 빠진다 (시그널 연결을 끊으므로 이후 결과는 받지 않음)."""
+        scan = self._loader
+        self._loader = None
+        for signal, slot in self._scan_slots(scan):
+            signal.disconnect(slot)
+        scan.unsubscribe(self)
+
+    def _is_current(self, scan) -> bool:
+        """시그널을 보낸 스캔이 현재 구독 중인 스캔인지."""
+        return scan is not None and scan is self._loader
+
+    @staticmethod
+    def _new_store(path: str, glob_pattern: str = None) -> EntryStore:
+        """빈 목록을 만든다. 루트가 아니고 glob 필터가 없으면 .. 항목을 포함한다."""
+        store = EntryStore(path)
         parent_dir = os.path.dirname(path)
         if not glob_pattern and parent_dir and parent_dir != path:
-            parent_item = {
-                "name": "..",
-                "path": parent_dir,
-                "is_dir": True,
-                "is_file": False,
-                "size": None,
-                "modified": None,
-            }
-            self.beginInsertRows(QModelIndex(), 0, 0)
-            self._items.append(parent_item)
-            self.endInsertRows()
-
-        # 새로운 로더 생성
-        self._loader = DirectoryLoader(path, glob_pattern)
-        self._loader.chunk_ready.connect(self._on_chunk_ready)
-        self._loader.finished.connect(self._on_finished)
-        self._loader.start()
-
-    def _on_chunk_ready(self, chunk: list):
-        """청크 단위 결과를 받아 모델에 추가한다."""
-        # 이미 항목이 있는 경우 시작 위치 계산
-        start_row = len(self._items)
-        end_row = start_row + len(chunk) - 1
-
-        self.beginInsertRows(QModelIndex(), start_row, end_row)
-        self._items.extend(chunk)
-        self.endInsertRows()
+            store.append_parent()
+        return store
+
+    def _on_chunk_ready(self, chunk: SortedChunk):
+        """정렬된 청크를 받아 정렬 순서를 유지하며 모델에 끼워 넣는다."""
+        if not self._is_current(self.sender()):
+            return
+        if self._buffer is not None:
+            self._buffer_chunk(chunk)
+            self._show_buffered()
+            return
+
+        # 청크를 모아 두었다가 한 번에 병합한다 (병합 한 번의 비용이 전체 행 수에 비례하므로
+        # 행 수에 비례한 양이 모이거나 일정 시간이 지났을 때만 병합)
+        self._load_buffer.append(chunk)
+        self._load_buffered += len(chunk)
+        target = self._pending if self._pending is not None else self._items
+        if self._merge_due(len(target)):
+            merge_start = time.monotonic()
+            self._merge_load_buffer()
+            self._load_merge_seconds = time.monotonic() - merge_start
+            self._load_merged = time.monotonic()
+
+    def _merge_due(self, count: int) -> bool:
+        """모아 둔 청크를 병합할 때인지 (count는 병합할 목록의 행 수)."""
+        interval = max(self.MERGE_INTERVAL_MS / 1000, self._load_merge_seconds * self.MERGE_COST_RATIO)
+        return (self._load_buffered >= count * self.MERGE_FRACTION
+                or time.monotonic() - self._load_merged >= interval)
+
+    def _buffer_chunk(self, chunk: SortedChunk):
+        """청크를 모델 밖 버퍼에 쌓는다 (행을 나눠 보일 때).
+
+        보일 순서가 기본 정렬이면 청크에서 보이는 구간 안에 들어갈 앞부분만 행 병합 대기열에
+        넣는다 (보이는 마지막 행보다 앞서는 항목, 구간이 덜 찼으면 구간 크기까지).
+        """
+        self._buffer.add(chunk)
+        self._load_buffered += len(chunk)
+        if self._pending is not None:
+            return
+        if not self._streaming():
+            # 새 확장자의 아이콘을 화면에 그리기 전에 미리 해석 (기본 정렬이면 병합할 때)
+            self._icon_cache.prefetch(chunk)
+            return
+        end = min(len(chunk), self._window)
+        if len(self._load_keys) >= self._window:
+            # 키가 같으면 먼저 받은 행이 앞이므로 마지막 행과 키가 같은 항목은 들어오지 않는다
+            end = bisect.bisect_left(chunk.keys, self._load_keys[-1], 0, end)
+        if end:
+            self._load_buffer.append(SortedChunk.presorted(chunk.select(range(end)), chunk.keys[:end]))
+
+    def _show_buffered(self):
+        """버퍼에 쌓은 청크를 보이는 행에 반영한다 (행을 나눠 보일 때).
+
+        기본 정렬이면 보이는 구간에 들어갈 항목만 바로 병합하고 (비용이 보이는 행 수에 비례),
+        정렬/필터 중이면 병합 주기(_merge_due)마다 버퍼 전체를 합쳐 보일 순서를 다시 계산한다.
+        """
+        if self._pending is not None:
+            return
+        if self._streaming():
+            self._load_buffered = 0
+            if self._load_buffer:
+                self._merge_load_buffer()  # 전체 항목 수도 알림
+                return
+        elif self._merge_due(len(self._buffer) - self._load_buffered):
+            merge_start = time.monotonic()
+            self._merge_listing()
+            self._load_merge_seconds = time.monotonic() - merge_start
+            self._load_merged = time.monotonic()
+        else:
+            return
+        self.totalRowsChanged.emit(self.total_rows(), True)
+
+    def _merge_listing(self):
+        """버퍼에 쌓인 구간을 합쳐 전체 목록으로 만들고 보일 순서의 앞쪽을 다시 보인다."""
+        self._load_buffered = 0
+        self._listing = None  # 이전에 합친 목록은 버퍼의 첫 구간이므로 병합하면서 놓아 준다
+        self._listing = self._buffer.merged()
+        self._invalidate_listing()
+        self._update_window()
+
+    def _merge_load_buffer(self):
+        """모아 둔 정렬된 청크들을 정렬 순서를 유지하며 목록에 끼워 넣는다.
+
+        추가된 행이 MERGE_INSERT_RUNS개 이하 구간에 모이면 구간마다 행 추가 알림을 보내고,
+        더 흩어져 있으면 새 목록을 한 번에 만들고 레이아웃 변경 알림으로 영구 인덱스(선택 등)를
+        밀린 만큼 옮긴다. 어느 쪽이든 초기화하지 않으므로 뷰의 선택과 스크롤 위치가 유지된다.
+        """
+        chunks = self._load_buffer
+        self._load_buffer = []
+        self._load_buffered = 0
+        self._load_merged = time.monotonic()
+        if not chunks:
+            return
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = instrumentation.now()
+
+        pending = self._pending is not None
+        target = self._pending if pending else self._items
+        count = len(target)
+        added = EntryStore(target.base_path)
+        keys = list(self._load_keys)
+        for chunk in chunks:
+            added.extend(chunk)
+            keys += chunk.keys
+            if not pending:
+                # 새 확장자의 아이콘을 화면에 그리기 전에 미리 해석
+                self._icon_cache.prefetch(chunk)
+        # 기존 목록과 각 청크는 이미 정렬된 구간이라 정렬은 구간 병합만 한다 (키가 같으면 기존 행 먼저)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+
+        if pending:
+            self._pending = self._select(target, added, order)
+            self._load_keys = list(map(keys.__getitem__, order))
+            return
 
-    def _on_finished(self, all_items: list):
+        # 추가된 행의 최종 위치 → 기존 목록 기준으로 끼워 넣을 위치 (오름차순)
+        new_rows = [row for row, source in enumerate(order) if source >= count]
+        positions = [row - index for index, row in enumerate(new_rows)]
+        runs = list(itertools.islice(insert_runs(positions), self.MERGE_INSERT_RUNS + 1))
+        if len(runs) <= self.MERGE_INSERT_RUNS:
+            added = added.select([order[row] - count for row in new_rows])
+            added_keys = [keys[order[row]] for row in new_rows]
+            for position, first, end in reversed(runs):
+                self._load_keys[position:position] = added_keys[first:end]
+                self._insert_rows(position, added.select(range(first, end)))
+        else:
+            self.layoutAboutToBeChanged.emit()
+            old_persistent = self.persistentIndexList()
+            self._items = self._select(target, added, order)
+            self._load_keys = list(map(keys.__getitem__, order))
+            # 기존 행은 앞에 끼워 넣은 새 행 수만큼 밀린다 (보이는 구간 밖으로 밀리면 _sync_window에서 무효)
+            new_persistent = [self.index(index.row() + bisect.bisect_right(positions, index.row()), index.column())
+                              for index in old_persistent]
+            self.changePersistentIndexList(old_persistent, new_persistent)
+            self.layoutChanged.emit()
+        self._sync_window()
+        self.totalRowsChanged.emit(self.total_rows(), True)
+
+        if instrumentation is not None:
+            instrumentation.record("model.insert_rows", "model", start, rows=len(added),
+                                   layout=len(runs) > self.MERGE_INSERT_RUNS)
+
+    @staticmethod
+    def _select(items: EntryStore, added: EntryStore, order: list) -> EntryStore:
+        """items 뒤에 added를 이어 붙인 목록에서 order 순서대로 행을 고른 새 목록."""
+        combined = items.copy()
+        combined.extend(added)
+        return combined.select(order)
+
+    def _on_stats_ready(self, stats: StatBatch):
+        """병렬 stat 결과로 이미 표시된 행의 크기/수정시간을 채운다."""
+        if self._is_current(self.sender()):
+            self._apply_stats(stats)
+
+    def _apply_stats(self, stats: StatBatch):
+        """stat 결과를 목록과 아직 병합하지 않은 청크에 반영한다 (같은 결과를 다시 반영해도 같음)."""
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = instrumentation.now()
+
+        rows = []
+        if self._buffer is not None:
+            # 행을 나눠 보이면 모델 밖 버퍼에 반영하고, 보이는 행(버퍼 항목의 사본)은 이름으로 찾는다
+            self._buffer.apply_stats(stats)
+            items = self._items
+            lookup = {} if self._pending is not None else dict(zip(items.names, range(len(items))))
+            for name, size, modified in zip(stats.names, stats.sizes, stats.mtimes):
+                row = lookup.get(name)
+                if row is not None:
+                    items.sizes[row] = size
+                    items.mtimes[row] = modified
+                    rows.append(row)
+        else:
+            # 청크가 먼저 도착하므로 항목은 목록이나 아직 병합하지 않은 청크에 있다
+            target = self._pending if self._pending is not None else self._items
+            stores = [(target, self._load_keys), *((chunk, chunk.keys) for chunk in self._load_buffer)]
+            for name, key, size, modified in zip(stats.names, stats.keys, stats.sizes, stats.mtimes):
+                for store, keys in stores:
+                    # 대소문자만 다른 이름은 키가 같으므로 이름이 일치하는 행까지 찾는다
+                    row = bisect.bisect_left(keys, key)
+                    while row < len(keys) and keys[row] == key and store.names[row] != name:
+                        row += 1
+                    if row < len(keys) and store.names[row] == name:
+                        break
+                else:
+                    continue
+                store.sizes[row] = size
+                store.mtimes[row] = modified
+                if store is target:
+                    rows.append(row)
+
+        if self._pending is None and rows:
+            self.dataChanged.emit(
+                self.index(min(rows), self.COLUMN_SIZE),
+                self.index(max(rows), self.COLUMN_MODIFIED),
+                [Qt.ItemDataRole.DisplayRole],
+            )
+        if instrumentation is not None:
+            instrumentation.record("model.apply_stats", "model", start, entries=len(stats))
+
+    def _on_finished(self):
         """전체 로딩이 완료되었다."""
-        # 청크로 이미 추가된 항목이 없으면 전체를 한 번에 추가
-        if not self._items:
-            self.beginResetModel()
-            self._items = all_items
-            self.endResetModel()
-
-        # 정렬: .. → 디렉토리 → 파일
-        self._sort_items()
-
-    def _sort_items(self):
-        """항목을 정렬한다: .. → 디렉토리(이름순) → 파일(이름순)"""
-        parent_item = None
-        directories = []
-        files = []
-
-        for item in self._items:
-            if item["name"] == "..":
-                parent_item = item
-            elif item["is_dir"]:
-                directories.append(item)
+        scan = self.sender()
+        if not self._is_current(scan):
+            return
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = instrumentation.now()
+
+        # 항목은 이미 정렬 순서대로 쌓였으므로 남은 청크만 병합하고 초기화하지 않는다
+        self._merge_load_buffer()
+        refreshed = self._pending is not None
+        applied = time.monotonic()
+        if self._buffer is not None:
+            # 행을 나눠 보이면 버퍼를 합친 전체 목록을 모델 밖에 둔다. 기본 정렬로 받던 보이는 행은
+            # 이미 그 앞쪽이므로 그대로 두고, 새로고침이나 정렬/필터 중이었으면 보일 순서로 다시 보인다
+            streaming = self._streaming()
+            self._listing = None
+            self._listing = self._buffer.merged()
+            self._buffer = None
+            self._pending = None
+            self._invalidate_listing()
+            if not streaming:
+                self._update_window()
+        elif refreshed:
+            self._apply_listing(self._pending)
+            self._pending = None
+        if refreshed:
+            self._refresh_finished = time.monotonic()
+            self._refresh_seconds = self._refresh_finished - applied
+        if self._dir_sizes is not None and (not refreshed or self._window is not None):
+            self._request_dir_sizes()
+
+        if instrumentation is not None:
+            instrumentation.record("model.finish", "model", start, rows=len(self.entries()))
+
+        if not self._glob_pattern:
+            self._listing_cache.put(self._current_path, self.entries().copy(), scan.signature)
+            if self._disk_index is not None:
+                self._disk_index.put(self._current_path, self.entries(), scan.signature)
+            self._dirty_signature = None
+
+        self._finish_loading()
+
+    def _on_unchanged(self):
+        """캐시된 목록이 최신임이 확인되었다."""
+        if not self._is_current(self.sender()):
+            return
+        self._pending = None
+        self._buffer = None
+        self._finish_loading()
+
+    def _finish_loading(self):
+        """로딩 중 미뤄 둔 디렉토리 변경을 반영한다."""
+        self._loading = False
+        self._load_keys = None
+        self.totalRowsChanged.emit(self.total_rows(), False)
+        if self._prefetcher is not None:
+            self._prefetcher.resume()
+        if self.instrumentation is not None and self._load_started is not None:
+            self.instrumentation.record("model.load", "model", self._load_started,
+                                        path=self._current_path, pattern=self._glob_pattern,
+                                        rows=len(self.entries()))
+            self._load_started = None
+        deferred = self._deferred_changes
+        self._deferred_changes = set()
+        if deferred is None or deferred:
+            self._on_directory_changes(deferred)
+
+    def _on_directory_changes(self, names: set | None):
+        """감시자가 알린 변경을 반영한다. names가 None이면 전체를 다시 확인한다."""
+        if self._loading:
+            if (names is None or self._deferred_changes is None
+                    or len(self._deferred_changes) + len(names) > self.MAX_NAMED_CHANGES):
+                self._deferred_changes = None
             else:
-                files.append(item)
+                self._deferred_changes |= names
+            return
 
-        # 각각 이름순으로 정렬
-        directories.sort(key=lambda x: x["name"].lower())
-        files.sort(key=lambda x: x["name"].lower())
+        if names is None or len(names) > self.MAX_NAMED_CHANGES:
+            delay = self._refresh_finished + self._refresh_seconds * self.MERGE_COST_RATIO - time.monotonic()
+            if delay <= 0:
+                self.refresh()
+            elif not self._refresh_timer.isActive():
+                self._refresh_timer.start(int(delay * 1000) + 1)
+        else:
+            self._apply_named_changes(names)
 
-        # 재조립
-        self.beginResetModel()
-        self._items = []
-        if parent_item:
-            self._items.append(parent_item)
-        self._items.extend(directories)
-        self._items.extend(files)
-        self.endResetModel()
+    def _apply_named_changes(self, names: set):
+        """변경된 이름들만 lstat해서 추가/삭제/갱신을 반영한다."""
+        signature = self._backend.signature(self._current_path)
+        items = self.entries()
+        lookup = self._row_lookup(names)
+        changed = EntryStore(self._current_path)
+        changed_rows = []
+        removed_rows = []
+
+        for name in names:
+            row = lookup.get(name)
+            try:
+                stat_info = self._backend.stat(os.path.join(self._current_path, name))
+            except OSError:
+                if row is not None:
+                    removed_rows.append(row)
+                continue
 
-    def _get_icon(self, item: dict) -> QIcon:
-        """항목의 아이콘을 반환한다 (캐시 활용)."""
-        if item["is_dir"]:
-            return self._icon_cache.get("__dir__", QIcon())
+            if row is None and self._glob_matcher and not self._glob_matcher(name):
+                continue
 
-        # 확장자 기반 캐시 조회
-        ext = os.path.splitext(item["name"])[1].lower() if item["name"] != ".." else ""
+            changed.append(
+                name,
+                stat.S_ISDIR(stat_info.st_mode),
+                stat.S_ISREG(stat_info.st_mode),
+                stat_info.st_size,
+                stat_info.st_mtime,
+            )
+            changed_rows.append(row)
 
-        if not ext:
-            ext = "__file__"
+        updated_rows = []
+        inserted = EntryStore(self._current_path)
+        for index, row in enumerate(changed_rows):
+            if row is not None and items.is_dir(row) != changed.is_dir(index):
+                # 파일 <-> 디렉토리로 바뀌면 정렬 그룹이 달라지므로 지우고 제자리에 다시 넣는다
+                removed_rows.append(row)
+                row = None
+            if row is None:
+                inserted.append_from(changed, index)
+            elif items.update_from(row, changed, index):
+                updated_rows.append(row)
 
-        if ext not in self._icon_cache:
-            # 캐시에 없으면 QFileInfo로 로드
+        if self._apply_changes(updated_rows, removed_rows, inserted):
+            self._mark_dirty(signature)
+
+    def _apply_listing(self, listing: EntryStore):
+        """새로 스캔한 목록과 현재 목록을 비교해 달라진 행만 반영한다."""
+        items = self._items
+        lookup = dict(zip(items.names, range(len(items))))
+        updated_rows = []
+        inserted = EntryStore(items.base_path)
+
+        for row, name in enumerate(listing.names):
+            old_row = lookup.pop(name, None)
+            if old_row is not None and items.is_dir(old_row) != listing.is_dir(row):
+                # 종류가 바뀐 항목은 lookup에 남겨 삭제하고 새 항목으로 넣는다
+                lookup[name] = old_row
+                old_row = None
+            if old_row is None:
+                inserted.append_from(listing, row)
+            elif items.update_from(old_row, listing, row):
+                updated_rows.append(old_row)
+
+        self._apply_changes(updated_rows, list(lookup.values()), inserted)
+
+    def _row_lookup(self, names: set) -> dict:
+        """이름 → 행 번호(entries() 기준) 조회표를 만든다."""
+        item_names = self.entries().names
+        if len(names) > 64:
+            return dict(zip(item_names, range(len(item_names))))
+
+        lookup = {}
+        for name in names:
             try:
-                file_info = QFileInfo(item["path"])
-                self._icon_cache[ext] = self._file_icon_provider.icon(file_info)
-            except Exception:
-                self._icon_cache[ext] = self._icon_cache.get("__file__", QIcon())
+                lookup[name] = item_names.index(name)
+            except ValueError:
+                pass
+        return lookup
 
-        return self._icon_cache.get(ext, QIcon())
+    def _apply_changes(self, updated_rows: list, removed_rows: list, inserted: EntryStore) -> bool:
+        """갱신/삭제/추가를 최소한의 행 단위 알림으로 모델에 반영한다.
 
-    def _format_size(self, size: int | None) -> str:
-        """파일 크기를 사람이 읽기 쉬운 형태로 변환한다."""
-        if size is None:
-            return "—"
+        삭제/추가할 행이 MERGE_INSERT_RUNS개보다 많은 구간에 흩어져 있으면 (대량 복사/이동 등)
+        구간마다 알리지 않고 새 목록을 한 번에 만들어 레이아웃 변경 알림으로 반영한다.
+        행을 나눠 보이면 행 번호는 모델 밖 목록 기준이므로 _apply_listing_changes로 반영한다.
+        """
+        if self._listing is not None:
+            return self._apply_listing_changes(updated_rows, removed_rows, inserted)
+        items = self._items
+
+        if updated_rows:
+            top = self.index(min(updated_rows), 0)
+            bottom = self.index(max(updated_rows), self.COLUMN_COUNT - 1)
+            self.dataChanged.emit(top, bottom)
+
+        ranges = list(_row_ranges(sorted(removed_rows, reverse=True)))
+        if len(ranges) > self.MERGE_INSERT_RUNS:
+            removed = sorted(removed_rows)
+            removed_set = set(removed)
+            kept = [row for row in range(len(items)) if row not in removed_set]
+            self._replace_items(items.select(kept), lambda row: None if row in removed_set
+                                else row - bisect.bisect_left(removed, row))
+            items = self._items
+        else:
+            # 연속 구간 단위로 뒤에서부터 삭제
+            for first, last in ranges:
+                self._remove_rows(first, last)
+
+        if len(inserted):
+            # 정렬 위치를 찾아 같은 위치에 들어갈 항목끼리 묶어 뒤에서부터 삽입
+            inserted = inserted.select(sorted(range(len(inserted)), key=inserted.sort_key))
+            rows = range(len(items))
+            if len(inserted) * len(items).bit_length() > len(items):
+                # 많이 추가될 때는 기존 행의 정렬 키를 한 번만 만들어 둠
+                rows = [items.sort_key(row) for row in rows]
+                positions = [bisect.bisect_left(rows, inserted.sort_key(new_row))
+                             for new_row in range(len(inserted))]
+            else:
+                positions = [
+                    bisect.bisect_left(rows, inserted.sort_key(new_row), key=items.sort_key)
+                    for new_row in range(len(inserted))
+                ]
+            runs = list(itertools.islice(insert_runs(positions), self.MERGE_INSERT_RUNS + 1))
+            if len(runs) > self.MERGE_INSERT_RUNS:
+                count = len(items)
+                order = []
+                added = 0
+                for row in range(count):
+                    while added < len(positions) and positions[added] <= row:
+                        order.append(count + added)
+                        added += 1
+                    order.append(row)
+                order.extend(range(count + added, count + len(positions)))
+                self._replace_items(self._select(items, inserted, order),
+                                    lambda row: row + bisect.bisect_right(positions, row))
+            else:
+                for position, first, end in reversed(runs):
+                    self._insert_rows(position, inserted.select(range(first, end)))
+
+        changed = bool(updated_rows or removed_rows or len(inserted))
+        if changed:
+            self.totalRowsChanged.emit(self.total_rows(), self._loading)
+        return changed
+
+    def _apply_listing_changes(self, updated_rows: list, removed_rows: list, inserted: EntryStore) -> bool:
+        """갱신/삭제/추가를 모델 밖 목록에 알림 없이 반영하고 보이는 행을 다시 고른다 (행을 나눠 보일 때).
+
+        갱신은 호출 전에 목록에 이미 반영되어 있다.
+        """
+        if not (updated_rows or removed_rows or len(inserted)):
+            return False
+        listing = self._listing
+        for first, last in _row_ranges(sorted(removed_rows, reverse=True)):
+            listing.delete(first, last)
+        if len(inserted):
+            inserted = inserted.select(sorted(range(len(inserted)), key=inserted.sort_key))
+            positions = [bisect.bisect_left(range(len(listing)), inserted.sort_key(row), key=listing.sort_key)
+                         for row in range(len(inserted))]
+            for position, first, end in reversed(list(insert_runs(positions))):
+                listing.insert(position, inserted.select(range(first, end)))
+        self._invalidate_listing()
+        self._update_window()
+        self.totalRowsChanged.emit(self.total_rows(), self._loading)
+        return True
+
+    def _insert_rows(self, position: int, rows: EntryStore):
+        """position 행에 rows를 끼워 넣는다."""
+        self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+        self._items.insert(position, rows)
+        self.endInsertRows()
+
+    def _remove_rows(self, first: int, last: int):
+        """first~last 행을 지운다."""
+        self.beginRemoveRows(QModelIndex(), first, last)
+        self._items.delete(first, last)
+        self.endRemoveRows()
+
+    def _replace_items(self, items: EntryStore, new_row):
+        """항목을 새 목록으로 바꾸고 영구 인덱스(선택 등)를 옮긴다.
+
+        new_row(기존 행)은 새 행 번호를, 지워진 행이면 None을 반환한다.
+        """
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        self._items = items
+        new_persistent = []
+        for index in old_persistent:
+            row = new_row(index.row())
+            new_persistent.append(QModelIndex() if row is None else self.index(row, index.column()))
+        self.changePersistentIndexList(old_persistent, new_persistent)
+        self.layoutChanged.emit()
+
+    def _mark_dirty(self, signature: tuple | None):
+        """실시간 갱신으로 캐시와 달라졌음을 기록한다."""
+        if self._glob_pattern:
+            return
+        self._listing_cache.invalidate(self._current_path)
+        self._dirty_signature = signature
+
+    def set_live_refresh(self, enabled: bool):
+        """현재 디렉토리 변경 감시를 켜거나 끈다."""
+        if enabled and self._watcher is None:
+            self._watcher = self._backend.watch(parent=self)
+            if self._watcher is None:
+                # 변경을 감시할 수 없는 백엔드
+                return
+            self._watcher.changes_ready.connect(self._on_directory_changes)
+            if self._current_path and not self._recursive:
+                self._watcher.watch(self._current_path)
+        elif not enabled and self._watcher is not None:
+            self._watcher.close()
+            self._watcher.deleteLater()
+            self._watcher = None
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()):
+        """값이 바뀐 행의 캐시를 무효화한다 (아이콘만 바뀐 경우는 제외)."""
+        if list(roles) == [Qt.ItemDataRole.DecorationRole]:
+            return
+        if not top_left.column() == bottom_right.column() == self.COLUMN_SIZE:
+            # 크기만 바뀐 경우(디렉토리 재귀 크기)는 이름/종류가 그대로이므로 정렬 키 유지
+            self._invalidate_sort_keys()
+        self._invalidate_display(top_left.row())
+
+    def _invalidate_sort_keys(self, *args):
+        """항목이 바뀌었으므로 정렬 키 캐시를 버린다 (모델 밖 목록을 쓰면 보이는 행과 무관)."""
+        if self._listing is None:
+            self._sort_keys = None
+
+    def _invalidate_row_names(self):
+        """행이 바뀌었으므로 이름 인덱스/버퍼를 버린다 (모델 밖 목록을 쓰면 무관)."""
+        if self._listing is None:
+            self._invalidate_name_index()
+
+    def _on_rows_inserted_names(self, parent: QModelIndex, first: int, last: int):
+        """끼워 넣은 행만 이름 인덱스/버퍼에 색인해 넣는다 (모델 밖 목록을 쓰면 무관)."""
+        if self._listing is not None:
+            return
+        for index in (self._name_index, self._name_buffer):
+            if index is not None:
+                index.insert(first, last - first + 1, self._items)
+
+    def _on_rows_removed_names(self, parent: QModelIndex, first: int, last: int):
+        """지운 행을 이름 인덱스/버퍼에서도 지운다 (모델 밖 목록을 쓰면 무관)."""
+        if self._listing is not None:
+            return
+        for index in (self._name_index, self._name_buffer):
+            if index is not None:
+                index.remove(first, last)
+
+    def _invalidate_listing(self):
+        """모델 밖 목록이 바뀌었으므로 정렬 키와 이름 인덱스/버퍼를 버린다."""
+        self._sort_keys = None
+        self._invalidate_name_index()
+
+    def _invalidate_name_index(self, first_row: int = 0):
+        """first_row 행부터 이름 인덱스/버퍼를 버린다 (끝에 추가된 행은 다음 필터 때 색인)."""
+        if self._name_index is not None:
+            self._name_index.truncate(first_row)
+        if self._name_buffer is not None:
+            self._name_buffer.truncate(first_row)
+
+    def _on_rows_inserted_dir_sizes(self, parent: QModelIndex, first: int, last: int):
+        """추가된 하위 디렉토리의 크기를 요청한다.
+
+        처음 로딩 중에 스트리밍되는 행은 위치가 계속 바뀌므로, 로딩이 끝난 뒤
+        위쪽 행부터 한 번에 요청한다.
+        """
+        if self._loading and self._pending is None:
+            return
+        self._request_dir_sizes(first, last + 1)
+
+    def _request_dir_sizes(self, first: int = 0, end: int = None):
+        """first~end-1 행 중 하위 디렉토리의 재귀 크기 계산을 요청한다."""
+        items = self._items
+        if end is None:
+            end = self.rowCount()
+        subdirs = items.flags[first:end].translate(_SUBDIR_TABLE)
+        paths = []
+        row = subdirs.find(1)
+        while row != -1:
+            if items.names[first + row] not in self._dir_totals:
+                paths.append(items.path(first + row))
+            row = subdirs.find(1, row + 1)
+        if paths:
+            self._dir_sizes.request(paths)
+
+    def prioritize_dir_sizes(self, rows):
+        """화면에 보이는 행(원본 행 번호)의 디렉토리 크기를 먼저 계산하게 한다."""
+        if self._dir_sizes is None:
+            return
+        items = self._items
+        paths = [items.path(row) for row in rows
+                 if 0 <= row < len(items) and items.flags[row] & FLAG_DIR and not items.flags[row] & FLAG_PARENT
+                 and items.names[row] not in self._dir_totals]
+        if paths:
+            self._dir_sizes.prioritize(paths)
+
+    def _on_dir_sizes_ready(self, results: list):
+        """계산된 디렉토리 재귀 크기를 크기 컬럼에 반영한다."""
+        prefix = os.path.join(self._current_path, "")
+        totals = {path[len(prefix):]: (size, files) for path, size, files in results if path.startswith(prefix)}
+        # 다른 디렉토리(이동 전에 요청한 하위 디렉토리 등)의 결과는 버림
+        lookup = self._row_lookup(set(totals))
+        if not lookup:
+            return
+        for name in lookup:
+            self._dir_totals[name] = totals[name]
+        if self._listing is None:
+            rows = list(lookup.values())
+        else:
+            # 보이는 행은 모델 밖 목록의 일부를 복사한 것이므로 이름으로 찾는다
+            names = self._items.names
+            rows = [row for row in range(len(names)) if names[row] in lookup]
+        if not rows:
+            return
+        self.dataChanged.emit(self.index(min(rows), self.COLUMN_SIZE), self.index(max(rows), self.COLUMN_SIZE),
+                              [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole])
+
+    def _display_size(self, row: int) -> int | None:
+        """크기 컬럼에 표시할 크기 (디렉토리 재귀 크기 모드에서는 디렉토리 합계)."""
+        items = self._items
+        if self._dir_sizes is not None and items.flags[row] & FLAG_DIR:
+            totals = self._dir_totals.get(items.names[row])
+            return None if totals is None else totals[0]
+        return items.size(row)
+
+    def name_index(self) -> NameIndex:
+        """빠른 필터용 이름 인덱스 (아직 색인하지 않은 행까지 색인해 반환)."""
+        if self._name_index is None:
+            self._name_index = NameIndex()
+        self._name_index.sync(self.entries())
+        return self._name_index
+
+    def name_buffer(self) -> NameBuffer:
+        """glob 필터용 이름 바이트 버퍼 (아직 담지 않은 행까지 담아 반환, NumPy 필요)."""
+        if self._name_buffer is None:
+            self._name_buffer = NameBuffer()
+        self._name_buffer.sync(self.entries())
+        return self._name_buffer
 
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
+    def sort_permutation(self, column: int, order: Qt.SortOrder) -> list:
+        """컬럼 기준으로 정렬된 행 순서(entries() 행 번호 목록)를 계산한다.
 
-        return "—"
+        .. 항목과 디렉토리는 정렬 방향과 관계없이 항상 앞에 둔다.
+        이름순 행 순서를 캐시해 두고 크기/수정시간은 그 순서를 기준으로
+        키 배열 하나로 안정 정렬한다 (NumPy가 있으면 argsort 사용).
+        """
+        items = self.entries()
+        if self._sort_keys is None:
+            # 항목은 로딩 중에도 항상 기본 정렬 순서로 유지된다
+            self._sort_keys = _native_order(items)
+        parent_rows, directories, files = self._sort_keys
+        descending = order == Qt.SortOrder.DescendingOrder
+
+        if column == self.COLUMN_SIZE:
+            keys = items.sizes
+            if self._dir_sizes is not None:
+                # 디렉토리는 재귀 크기로 정렬 (아직 계산하지 않았으면 알 수 없음)
+                keys = array("q", keys)
+                names = items.names
+                for row in directories:
+                    totals = self._dir_totals.get(names[row])
+                    keys[row] = UNKNOWN if totals is None else totals[0]
+        elif column == self.COLUMN_MODIFIED:
+            keys = items.mtimes
+        elif column == self.COLUMN_NAME:
+            keys = None
+        else:
+            # 타입 컬럼은 디렉토리 우선 규칙만으로 정해지므로 이름순 유지
+            return [*parent_rows, *directories, *files]
+
+        numpy = load_numpy() if keys is not None else None
+        if numpy is not None:
+            values = numpy.frombuffer(keys, dtype=numpy.dtype(keys.typecode))
+            parts = [numpy.asarray(parent_rows, dtype=numpy.int64)]
+            for rows in (directories, files):
+                if isinstance(rows, range):
+                    rows = numpy.arange(rows.start, rows.stop, dtype=numpy.int64)
+                else:
+                    rows = numpy.asarray(rows, dtype=numpy.int64)
+                row_values = values[rows]
+                parts.append(rows[numpy.argsort(-row_values if descending else row_values, kind="stable")])
+            permutation = array("q")
+            permutation.frombytes(numpy.concatenate(parts).tobytes())
+            return permutation
+
+        permutation = list(parent_rows)
+        for rows in (directories, files):
+            if keys is None:
+                permutation.extend(reversed(rows) if descending else rows)
+            else:
+                permutation.extend(sorted(rows, key=keys.tolist().__getitem__, reverse=descending))
+        return permutation
+
+    def row_sort_key(self, column: int, order: Qt.SortOrder):
+        """sort_permutation(column, order)과 같은 순서를 주는 행별 키 함수 (entries() 행 번호를 받음).
+
+        프록시가 정렬된 매핑에 추가된 행을 이분 탐색으로 끼워 넣을 때 쓴다. 값이 같으면
+        sort_permutation처럼 행 번호(기본 정렬 순서)로 정해지므로 행마다 키가 다르다.
+        """
+        items = self.entries()
+        flags = items.flags
+        descending = order == Qt.SortOrder.DescendingOrder
+        if column == self.COLUMN_NAME:
+            sign = -1 if descending else 1
+            return lambda row: (_GROUP_TABLE[flags[row]], row if flags[row] & FLAG_PARENT else sign * row)
+        if column == self.COLUMN_SIZE:
+            values = items.sizes
+            if self._dir_sizes is not None:
+                names, totals = items.names, self._dir_totals
+
+                def value(row):
+                    if flags[row] & FLAG_DIR:
+                        total = totals.get(names[row])
+                        return UNKNOWN if total is None else total[0]
+                    return values[row]
+            else:
+                value = values.__getitem__
+        elif column == self.COLUMN_MODIFIED:
+            value = items.mtimes.__getitem__
+        else:
+            return lambda row: (_GROUP_TABLE[flags[row]], row)
+
+        def key(row):
+            group = _GROUP_TABLE[flags[row]]
+            if group == 0:
+                # .. 항목은 값과 관계없이 맨 앞
+                return 0, 0, row
+            return group, -value(row) if descending else value(row), row
+        return key
+
+    def _get_icon(self, row: int) -> QIcon:
+        """항목의 아이콘을 반환한다 (준비되지 않았으면 자리 표시 아이콘)."""
+        items = self._items
+        key = icon_key(items.names[row], items.is_dir(row))
+        icon = self._icon_cache.icon(key)
+        instrumentation = self.instrumentation
+        if icon is None:
+            self._icon_cache.request(key, items.path(row))
+            self._waiting_icons.add(key)
+            if instrumentation is not None:
+                instrumentation.count("icon.placeholder")
+            return self._icon_cache.placeholder()
+        if instrumentation is not None:
+            instrumentation.count("icon.cache_hit")
+        return icon
+
+    def _on_icons_ready(self, keys: set):
+        """자리 표시 아이콘으로 그린 키가 준비되면 이름 컬럼 아이콘을 다시 그린다."""
+        if not self._waiting_icons or self._waiting_icons.isdisjoint(keys):
+            return
+        self._waiting_icons -= keys
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, self.COLUMN_NAME),
+                                  self.index(self.rowCount() - 1, self.COLUMN_NAME),
+                                  [Qt.ItemDataRole.DecorationRole])
+
+    def _format_size(self, size: int | None) -> str:
+        """파일 크기를 사람이 읽기 쉬운 형태로 변환한다."""
+        return format_size(size)
 
     def _format_modified(self, timestamp: float | None) -> str:
         """수정 시간을 포맷팅한다."""
-        if timestamp is None:
-            return "—"
+        return self._formatter.format_modified(timestamp)
 
-        try:
-            dt = datetime.fromtimestamp(timestamp)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except Exception:
-            return "—"
+    def _display_strings(self, row: int) -> tuple[str, str]:
+        """행의 (크기, 수정일시) 표시 문자열을 반환한다.
+
+        화면에 그려지는 행이 속한 블록(DISPLAY_BLOCK_ROWS 행)만 한 번에
+        포맷팅하고, 최근 블록을 제한된 개수만큼 캐시한다.
+        """
+        block = row // self.DISPLAY_BLOCK_ROWS
+        start = block * self.DISPLAY_BLOCK_ROWS
+        cached = self._display_blocks.get(block)
+        if cached is None:
+            items = self._items
+            rows = range(start, min(start + self.DISPLAY_BLOCK_ROWS, len(items)))
+            cached = (
+                [format_size(self._display_size(r)) for r in rows],
+                self._formatter.format_modified_batch(map(items.modified, rows)),
+            )
+            self._display_blocks[block] = cached
+            if len(self._display_blocks) > self.DISPLAY_CACHE_BLOCKS:
+                self._display_blocks.popitem(last=False)
+        else:
+            self._display_blocks.move_to_end(block)
+        return cached[0][row - start], cached[1][row - start]
+
+    def _invalidate_display(self, first_row: int = 0):
+        """first_row 이후 행의 표시 문자열 캐시를 버린다."""
+        if first_row <= 0:
+            self._display_blocks.clear()
+            return
+        first_block = first_row // self.DISPLAY_BLOCK_ROWS
+        for block in [block for block in self._display_blocks if block >= first_block]:
+            del self._display_blocks[block]
 
     def rowCount(self, parent=QModelIndex()) -> int:
-        """행 개수."""
+        """행 개수 (행을 나눠 보이면 지금까지 보인 행 수)."""
+        if parent.isValid():
+            return 0
         return len(self._items)
 
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        """아직 보이지 않은 항목이 있는지 여부."""
+        return not parent.isValid() and self._window is not None and len(self._items) < self.total_rows()
+
+    def fetchMore(self, parent=QModelIndex()):
+        """다음 fetch_rows개 항목을 보이게 한다."""
+        if not parent.isValid() and self._window is not None:
+            self._window = len(self._items) + self.fetch_rows
+            self._sync_window()
+
+    def total_rows(self) -> int:
+        """보일 전체 항목 수 (아직 보이지 않은 행 포함, 필터 중이면 일치하는 항목 수)."""
+        if self._window is None:
+            return len(self._items)
+        if self._streaming():
+            return len(self._buffer)
+        if self._view_rows is not None:
+            return len(self._view_rows)
+        return len(self.entries())
+
+    def entries(self) -> EntryStore:
+        """전체 항목 목록 (행을 나눠 보이면 보이지 않는 항목까지 담은 모델 밖 목록)."""
+        return self._items if self._listing is None else self._listing
+
+    def is_loading(self) -> bool:
+        """현재 디렉토리를 스캔하는 중인지 여부."""
+        return self._loading
+
+    def set_view(self, sort: tuple | None, filters: dict) -> bool:
+        """정렬 (컬럼, 방향)과 행 필터를 모델 밖 전체 목록에 적용해 그 순서의 앞쪽을 보인다.
+
+        행을 나눠 보이지 않으면 (fetch_rows가 0) 적용하지 않고 False를 반환한다.
+        프록시는 True를 받으면 매핑 없이 원본 행을 그대로 통과시킨다.
+        """
+        if self.fetch_rows <= 0:
+            return False
+        self._view_sort = None if sort == self.native_sort else sort
+        self._view_filters = filters
+        if self._window is None:
+            # 아직 디렉토리를 열지 않음
+            return True
+        if self._buffer is not None and self._pending is None:
+            # 새로 로딩 중: 정렬/필터가 있으면 받은 항목을 합쳐 고르고, 없으면 버퍼 앞쪽을 보인다
+            if self._reordered():
+                self._merge_listing()
+            else:
+                self._listing = None
+                self._invalidate_listing()
+                self._update_window()
+        else:
+            self._update_window()
+        self.totalRowsChanged.emit(self.total_rows(), self._loading)
+        return True
+
+    def _reordered(self) -> bool:
+        """보일 순서가 기본 정렬 순서와 다른지 (다른 컬럼 정렬이나 필터 적용 중)."""
+        return self._view_sort is not None or bool(self._view_filters)
+
+    def _streaming(self) -> bool:
+        """새로 로딩 중인 항목을 기본 정렬 순서로 보이는 중인지 (보이는 행만 병합하면 됨)."""
+        return self._buffer is not None and self._pending is None and not self._reordered()
+
+    def _view_order(self):
+        """정렬/필터를 적용한 모델 밖 목록의 행 순서 (기본 정렬이고 필터가 없으면 None)."""
+        rows = None
+        for row_filter in self._view_filters.values():
+            matched = row_filter.rows(self)
+            rows = matched if rows is None else intersect_rows(rows, matched)
+        if self._view_sort is None:
+            return rows
+        permutation = self.sort_permutation(*self._view_sort)
+        return permutation if rows is None else restrict_rows(permutation, rows, len(self.entries()))
+
+    def _update_view(self):
+        """보일 순서(_view_rows)를 다시 계산한다."""
+        if self._listing is None or self._streaming():
+            self._view_rows = None
+        else:
+            self._view_rows = self._view_order()
+
+    def _window_rows(self, first: int, end: int) -> EntryStore:
+        """보일 순서에서 first~end-1번째 항목의 사본."""
+        if self._streaming():
+            return self._buffer.head(first, end)
+        items = self.entries()
+        if self._view_rows is None:
+            return items.select(range(first, min(end, len(items))))
+        return items.select(list(self._view_rows[first:end]))
+
+    def _update_window(self):
+        """보일 순서를 다시 계산하고 그 앞쪽 _window개로 보이는 행을 바꾼다.
+
+        이름이 같은 행은 영구 인덱스(선택 등)를 새 위치로 옮긴다.
+        """
+        self._update_view()
+        window = self._window_rows(0, self._window)
+        old_names = self._items.names
+        new_rows = dict(zip(window.names, range(len(window))))
+        self._replace_items(window, lambda row: new_rows.get(old_names[row]))
+        if self._streaming():
+            self._load_keys = list(map(window.sort_key, range(len(window))))
+        if self._dir_sizes is not None and not self._loading:
+            self._request_dir_sizes()
+
+    def _expose_rows(self, end: int):
+        """보이는 행을 보일 순서의 앞쪽 end개(전체 항목 수까지)로 늘린다."""
+        count = len(self._items)
+        rows = self._window_rows(count, end)
+        if not len(rows):
+            return
+        self.beginInsertRows(QModelIndex(), count, count + len(rows) - 1)
+        self._items.extend(rows)
+        if self._streaming():
+            self._load_keys += map(rows.sort_key, range(len(rows)))
+        self.endInsertRows()
+
+    def _sync_window(self):
+        """보이는 행 수를 다시 _window개(전체 항목 수까지)로 맞춘다.
+
+        보이는 구간 안에 끼워 넣은 행만큼 뒤쪽 행은 다시 보이지 않게 되고 (모델 밖 목록에는 남음),
+        보이는 행이 지워진 만큼 뒤쪽 항목이 보이게 된다.
+        """
+        if self._window is None:
+            return
+        count = len(self._items)
+        if count > self._window:
+            self.beginRemoveRows(QModelIndex(), self._window, count - 1)
+            self._items.delete(self._window, count - 1)
+            if self._streaming():
+                del self._load_keys[self._window:]
+            self.endRemoveRows()
+        elif count < self._window:
+            self._expose_rows(self._window)
+
     def columnCount(self, parent=QModelIndex()) -> int:
         """컬럼 개수."""
-        return self.COLUMN_COUNT
+        return self.COLUMN_COUNT + 1 if self._recursive else self.COLUMN_COUNT
 
     def data(self, index: QModelIndex, role: int):
         """셀 데이터를 반환한다."""
         if not index.isValid() or index.row() >= len(self._items):
             return None
 
-        item = self._items[index.row()]
+        items = self._items
+        row = index.row()
 
         if role == Qt.ItemDataRole.DisplayRole:
             col = index.column()
             if col == self.COLUMN_NAME:
-                return item["name"]
+                if self._recursive:
+                    return os.path.basename(items.names[row])
+                return items.names[row]
+            elif col == self.COLUMN_PATH and self._recursive:
+                return os.path.dirname(items.names[row]) or "."
+            # .. 항목은 크기/타입/수정일시 표시 안 함
+            if items.is_parent(row):
+                return ""
             elif col == self.COLUMN_SIZE:
-                # .. 항목은 크기 표시 안 함
-                if item["name"] == "..":
-                    return ""
-                return self._format_size(item["size"])
+                return self._display_strings(row)[0]
             elif col == self.COLUMN_TYPE:
-                # .. 항목은 타입 표시 안 함
-                if item["name"] == "..":
-                    return ""
-                return "디렉토리" if item["is_dir"] else "파일"
+                return "디렉토리" if items.is_dir(row) else "파일"
             elif col == self.COLUMN_MODIFIED:
-                # .. 항목은 수정일시 표시 안 함
-                if item["name"] == "..":
-                    return ""
-                return self._format_modified(item["modified"])
+                return self._display_strings(row)[1]
+
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            # 디렉토리 재귀 크기 모드: 크기 컬럼에 하위 파일 수
+            if index.column() == self.COLUMN_SIZE and self._dir_sizes is not None and items.is_dir(row):
+                totals = self._dir_totals.get(items.names[row])
+                if totals is not None:
+                    return f"파일 {totals[1]:,}개"
 
         elif role == Qt.ItemDataRole.DecorationRole:
             # 첫 번째 컬럼에만 아이콘 표시
             if index.column() == self.COLUMN_NAME:
-                return self._get_icon(item)
+                return self._get_icon(row)
 
         return None
 
@@ -223,5 +1368,7 @@ class FileTableModel(QAbstractTableModel):
                     return "타입"
                 elif section == self.COLUMN_MODIFIED:
                     return "수정일시"
+                elif section == self.COLUMN_PATH and self._recursive:
+                    return "경로"
 
         return None
@@ -0,0 +1,477 @@
+"""백그라운드 파일 작업 (여러 항목 복사/이동/삭제)
+
+작업 하나는 작업 풀(LoaderPool)의 스레드에서 항목 목록을 만들고, 파일 단위 작업은
+workers개 스레드에 묶음으로 나눠 실행한다. 진행 상황은 파일마다가 아니라
+PROGRESS_INTERVAL_MS마다 한 번 알린다.
+"""
+import errno
+import os
+import stat
+import threading
+import time
+from PyQt6.QtCore import QObject, pyqtSignal
+from .loader import LoaderPool
+
+COPY = "copy"
+MOVE = "move"
+DELETE = "delete"
+
+# copy_file_range/sendfile 호출 한 번에 복사하는 최대 바이트 (취소 확인 간격)
+COPY_CHUNK = 8 * 1024 * 1024
+# 커널 복사를 쓸 수 없을 때 다음 방식으로 넘어가는 오류
+_FALLBACK_ERRNOS = frozenset(
+    code for code in (getattr(errno, name, None) for name in ("EXDEV", "ENOSYS", "EINVAL", "EOPNOTSUPP",
+                                                              "ENOTSUP", "EBADF", "ETXTBSY"))
+    if code is not None
+)
+
+
+class OperationCancelled(Exception):
+    """작업이 취소되어 복사를 중단함"""
+
+
+def copy_file_data(src_fd: int, dst_fd: int, on_chunk=None, cancelled=None, size: int = None) -> int:
+    """src_fd의 현재 위치부터 끝까지 dst_fd로 복사하고 복사한 바이트 수를 반환한다.
+
+    데이터가 사용자 공간을 거치지 않도록 os.copy_file_range(같은 파일 시스템이면 reflink나
+    서버 측 복사가 될 수 있음)를 먼저 쓰고, 지원하지 않으면 os.sendfile, 그것도 안 되면
+    read/write로 복사한다. on_chunk(바이트 수)는 조각마다 호출되고, cancelled()가 참이면
+    OperationCancelled를 낸다.
+    커널 복사는 /proc, sysfs 같은 가상 파일에서 끝이 아닌데도 0을 반환하므로, 예상 크기(size,
+    원본의 st_size)만큼 복사하기 전에 0이 오면 다음 방식으로 이어서 복사한다.
+    """
+    methods = []
+    if hasattr(os, "copy_file_range"):
+        methods.append("copy_file_range")
+    if hasattr(os, "sendfile"):
+        methods.append("sendfile")
+    methods.append("read")
+    method = methods.pop(0)
+    copied = 0
+    while True:
+        if cancelled is not None and cancelled():
+            raise OperationCancelled
+        try:
+            if method == "copy_file_range":
+                count = os.copy_file_range(src_fd, dst_fd, COPY_CHUNK)
+            elif method == "sendfile":
+                count = os.sendfile(dst_fd, src_fd, None, COPY_CHUNK)
+            else:
+                data = os.read(src_fd, COPY_CHUNK)
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(dst_fd, view):]
+                count = len(data)
+        except OSError as e:
+            if e.errno in _FALLBACK_ERRNOS and methods:
+                # 이 파일 시스템 조합에서는 지원하지 않음: 같은 위치부터 다음 방식으로
+                method = methods.pop(0)
+                continue
+            raise
+        if count == 0:
+            if method != "read" and (size is None or copied < size or size == 0):
+                # 가상 파일이거나 크기보다 짧음: read가 0을 반환해야 끝으로 본다
+                method = methods.pop(0)
+                continue
+            return copied
+        copied += count
+        if on_chunk is not None:
+            on_chunk(count)
+
+
+def copy_file(src: str, dst: str, on_chunk=None, cancelled=None) -> int:
+    """파일 하나를 새 파일 dst로 복사하고 권한과 수정시간을 옮긴다 (dst가 있으면 FileExistsError).
+
+    취소되거나 실패하면 복사하던 dst를 지운다.
+    """
+    with open(src, "rb") as source:
+        source_stat = os.fstat(source.fileno())
+        with open(dst, "xb") as target:
+            try:
+                copied = copy_file_data(source.fileno(), target.fileno(), on_chunk, cancelled,
+                                        source_stat.st_size)
+            except BaseException:
+                target.close()
+                try:
+                    os.unlink(dst)
+                except OSError:
+                    pass
+                raise
+    os.chmod(dst, stat.S_IMODE(source_stat.st_mode))
+    os.utime(dst, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    return copied
+
+
+class OperationProgress:
+    """파일 작업 진행 상황 (시그널로 보내는 복사본)"""
+
+    __slots__ = ("kind", "files_done", "files_total", "bytes_done", "bytes_total", "current", "errors",
+                 "planning", "cancelled")
+
+    def __init__(self, kind: str):
+        self.kind = kind  # COPY, MOVE, DELETE
+        self.files_done = 0  # 끝낸 파일(항목) 수
+        self.files_total = 0  # 전체 파일(항목) 수 (목록을 만드는 중에는 늘어남)
+        self.bytes_done = 0  # 복사한 바이트
+        self.bytes_total = 0  # 복사할 전체 바이트
+        self.current = None  # 마지막으로 처리한 경로
+        self.errors = []  # (경로, 오류 메시지)
+        self.planning = True  # 아직 항목 목록을 만드는 중
+        self.cancelled = False  # 취소되어 끝남
+
+    def copy(self) -> "OperationProgress":
+        snapshot = OperationProgress(self.kind)
+        for name in self.__slots__:
+            setattr(snapshot, name, getattr(self, name))
+        snapshot.errors = list(self.errors)
+        return snapshot
+
+
+class _Plan:
+    """작업 목록: 만들 디렉토리, 파일 단위 작업, 끝나고 지울/정리할 디렉토리"""
+
+    __slots__ = ("make_dirs", "tasks", "remove_dirs", "dir_stats")
+
+    def __init__(self):
+        self.make_dirs = []  # 복사: 만들 디렉토리 (상위부터)
+        self.tasks = []  # (동작, 원본, 대상, 크기)
+        self.remove_dirs = []  # 삭제/다른 파일 시스템 이동: 지울 디렉토리 (하위부터)
+        self.dir_stats = []  # 복사: (대상 디렉토리, 원본 stat) 파일을 다 복사한 뒤 권한/수정시간 적용
+
+
+class FileOperation(QObject):
+    """여러 항목을 백그라운드에서 복사/이동/삭제하는 작업
+
+    start()하면 작업 풀의 스레드에서 run()을 실행한다. 복사는 디렉토리를 재귀적으로 복사하고
+    심볼릭 링크는 링크로 만든다. 이동은 같은 파일 시스템이면 항목마다 rename 한 번이고,
+    다른 파일 시스템이면 복사 후 원본을 지운다 (오류가 난 항목의 원본은 남김).
+    대상에 같은 이름이 있으면 그 항목은 오류로 기록하고 건너뛴다.
+    cancel()은 플래그만 세우며, 복사 중인 파일은 지우고 이미 끝낸 항목은 그대로 둔다.
+    작업 풀의 대기열에서 아직 시작하지 않은 작업을 취소하면 풀은 run()을 실행하지 않으므로,
+    cancel()이 바로 취소된 결과로 finished를 보낸다.
+    """
+
+    progress = pyqtSignal(object)  # OperationProgress (PROGRESS_INTERVAL_MS마다)
+    finished = pyqtSignal(object)  # OperationProgress (완료 또는 취소, 오류 목록 포함)
+
+    # 진행 상황을 알리는 최소 간격
+    PROGRESS_INTERVAL_MS = 100
+    # 작업 스레드에 한 번에 넘기는 파일 수
+    BATCH_FILES = 64
+
+    def __init__(self, kind: str, sources, destination: str = None, workers: int = 4, parent=None):
+        super().__init__(parent)
+        if kind not in (COPY, MOVE, DELETE):
+            raise ValueError(f"알 수 없는 작업입니다: {kind}")
+        if kind != DELETE and destination is None:
+            raise ValueError("복사/이동에는 대상 디렉토리가 필요합니다")
+        self.kind = kind
+        self.sources = list(sources)  # 작업할 항목
+        self.destination = os.path.abspath(destination) if destination is not None else None
+        self.workers = max(1, workers)  # 파일 단위 작업 스레드 수
+        self._state = OperationProgress(kind)
+        self._lock = threading.Lock()  # _state와 _cross_device 보호
+        self._cross_device = []  # 이동: 다른 파일 시스템이라 rename하지 못한 (원본, 대상)
+        self._next_report = 0.0  # 다음 진행 상황 알림 시각 (time.monotonic)
+        self._cancelled = False
+        self._started = False  # run()이 시작됨 (_lock으로 보호)
+        self._dropped = False  # 시작 전에 취소되어 cancel()이 finished를 보냄 (_lock으로 보호)
+        self._done = threading.Event()  # run()이 끝났거나 실행되지 않고 버려짐
+        self._done.set()
+
+    def start(self, pool: LoaderPool = None):
+        """작업 풀에서 실행한다 (pool이 None이면 프로세스 전역 작업 풀)."""
+        self._done.clear()
+        (pool if pool is not None else shared_operation_pool()).submit(self)
+
+    def cancel(self):
+        """작업 취소를 요청한다 (기다리지 않음, 아직 시작하지 않았으면 바로 finished를 보냄)."""
+        with self._lock:
+            self._cancelled = True
+            if self._started or self._dropped or self._done.is_set():
+                return
+            # 대기열에 있는 작업: 풀은 취소된 작업을 실행하지 않고 버린다
+            self._dropped = True
+            self._state.planning = False
+            self._state.cancelled = True
+            result = self._state.copy()
+        self._done.set()
+        self.finished.emit(result)
+
+    def wait(self, timeout: float = None) -> bool:
+        """작업이 끝날 때까지 기다린다. 시간 안에 끝나면 True."""
+        return self._done.wait(timeout)
+
+    def snapshot(self) -> OperationProgress:
+        """지금까지의 진행 상황."""
+        with self._lock:
+            return self._state.copy()
+
+    def run(self):
+        """항목 목록을 만들고 파일 단위 작업을 실행한다."""
+        with self._lock:
+            if self._dropped:
+                # 풀이 꺼낸 직후에 취소되어 이미 finished를 보냄
+                return
+            self._started = True
+        self._next_report = time.monotonic() + self.PROGRESS_INTERVAL_MS / 1000
+        try:
+            plan = self._plan()
+            with self._lock:
+                self._state.planning = False
+            if not self._cancelled:
+                self._execute(plan)
+        except Exception as e:
+            self._error(self.destination or "", e)
+        with self._lock:
+            self._state.cancelled = self._cancelled
+            result = self._state.copy()
+        self.finished.emit(result)
+
+    # 목록 만들기
+
+    def _plan(self) -> _Plan:
+        """작업할 항목을 모은다 (복사/삭제는 디렉토리 아래를 재귀적으로, 이동은 항목마다 rename)."""
+        plan = _Plan()
+        for source in self.sources:
+            if self._cancelled:
+                break
+            source = os.path.abspath(source)
+            try:
+                source_stat = os.lstat(source)
+            except OSError as e:
+                self._error(source, e)
+                continue
+            if self.kind == DELETE:
+                self._plan_delete(plan, source, source_stat)
+                continue
+
+            target = os.path.join(self.destination, os.path.basename(source))
+            if os.path.lexists(target):
+                if os.path.normpath(target) != source:
+                    self._error(source, FileExistsError(errno.EEXIST, "대상에 같은 이름이 있습니다", target))
+                else:
+                    self._error(source, OSError(errno.EINVAL, "원본과 대상이 같습니다", target))
+                continue
+            if stat.S_ISDIR(source_stat.st_mode) and (self.destination + os.sep).startswith(source + os.sep):
+                self._error(source, OSError(errno.EINVAL, "디렉토리를 자기 안으로 복사/이동할 수 없습니다"))
+                continue
+            if self.kind == MOVE:
+                self._add_task(plan, "rename", source, target, source_stat)
+            else:
+                self._plan_copy(plan, source, target, source_stat)
+            self._maybe_report(source)
+        return plan
+
+    def _plan_copy(self, plan: _Plan, source: str, target: str, source_stat):
+        """source 아래를 target으로 복사하는 작업을 모은다."""
+        if not stat.S_ISDIR(source_stat.st_mode):
+            self._add_task(plan, "copy", source, target, source_stat)
+            return
+        stack = [(source, target, source_stat)]
+        while stack:
+            if self._cancelled:
+                return
+            directory, target_directory, directory_stat = stack.pop()
+            plan.make_dirs.append(target_directory)
+            plan.dir_stats.append((target_directory, directory_stat))
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        entry_target = os.path.join(target_directory, entry.name)
+                        entry_stat = entry.stat(follow_symlinks=False)
+                        if stat.S_ISDIR(entry_stat.st_mode):
+                            stack.append((entry.path, entry_target, entry_stat))
+                        else:
+                            self._add_task(plan, "copy", entry.path, entry_target, entry_stat)
+            except OSError as e:
+                self._error(directory, e)
+            self._maybe_report(directory)
+
+    def _plan_delete(self, plan: _Plan, source: str, source_stat):
+        """source와 그 아래 항목을 지우는 작업을 모은다 (디렉토리는 하위부터 지움)."""
+        if not stat.S_ISDIR(source_stat.st_mode):
+            self._add_task(plan, "unlink", source, None, source_stat)
+            return
+        directories = []
+        stack = [source]
+        while stack:
+            if self._cancelled:
+                return
+            directory = stack.pop()
+            directories.append(directory)
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            self._add_task(plan, "unlink", entry.path, None, None)
+            except OSError as e:
+                self._error(directory, e)
+            self._maybe_report(directory)
+        plan.remove_dirs.extend(reversed(directories))
+
+    def _add_task(self, plan: _Plan, action: str, source: str, target: str | None, source_stat):
+        size = source_stat.st_size if action == "copy" and stat.S_ISREG(source_stat.st_mode) else 0
+        plan.tasks.append((action, source, target, size))
+        with self._lock:
+            self._state.files_total += 1
+            self._state.bytes_total += size
+
+    # 실행
+
+    def _execute(self, plan: _Plan):
+        """파일 단위 작업을 실행하고 디렉토리를 정리한다."""
+        self._copy_tree(plan)
+        if self.kind == MOVE:
+            # 다른 파일 시스템이라 rename하지 못한 항목: 복사한 뒤 원본을 지움
+            for source, target in self._cross_device:
+                if self._cancelled:
+                    break
+                self._move_across_devices(source, target)
+        if not self._cancelled:
+            for directory in plan.remove_dirs:
+                try:
+                    os.rmdir(directory)
+                except OSError as e:
+                    self._error(directory, e)
+
+    def _copy_tree(self, plan: _Plan):
+        """디렉토리를 만들고, 파일 단위 작업을 실행한 뒤 디렉토리 권한/수정시간을 옮긴다."""
+        for directory in plan.make_dirs:
+            try:
+                os.mkdir(directory)
+            except OSError as e:
+                self._error(directory, e)
+        self._run_tasks(plan.tasks)
+        for directory, directory_stat in reversed(plan.dir_stats):
+            try:
+                os.chmod(directory, stat.S_IMODE(directory_stat.st_mode))
+                os.utime(directory, ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns))
+            except OSError as e:
+                self._error(directory, e)
+
+    def _run_tasks(self, tasks: list):
+        """파일 단위 작업을 BATCH_FILES개씩 workers개 스레드에서 실행하고 진행 상황을 알린다."""
+        if not tasks:
+            return
+        from concurrent.futures import ThreadPoolExecutor, wait  # 작업이 있을 때만 필요
+        batches = [tasks[start:start + self.BATCH_FILES] for start in range(0, len(tasks), self.BATCH_FILES)]
+        interval = self.PROGRESS_INTERVAL_MS / 1000
+        with ThreadPoolExecutor(min(self.workers, len(batches))) as pool:
+            pending = {pool.submit(self._run_batch, batch) for batch in batches}
+            while pending:
+                _, pending = wait(pending, timeout=interval)
+                self._maybe_report(None)
+                if self._cancelled:
+                    for future in pending:
+                        future.cancel()
+        self._maybe_report(None)
+
+    def _run_batch(self, batch: list):
+        """작업 스레드: 파일 단위 작업 묶음을 실행한다."""
+        cancelled = lambda: self._cancelled
+        for action, source, target, size in batch:
+            if self._cancelled:
+                return
+            try:
+                if action == "copy":
+                    self._copy_entry(source, target, cancelled)
+                elif action == "unlink":
+                    os.unlink(source)
+                else:
+                    if os.path.lexists(target):
+                        # rename은 대상 파일을 덮어쓰므로 목록을 만든 뒤 생긴 항목도 확인
+                        raise FileExistsError(errno.EEXIST, "대상에 같은 이름이 있습니다", target)
+                    try:
+                        os.rename(source, target)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        with self._lock:
+                            self._cross_device.append((source, target))
+                        continue
+            except OperationCancelled:
+                return
+            except OSError as e:
+                self._error(source, e)
+                continue
+            with self._lock:
+                self._state.files_done += 1
+                self._state.current = source
+
+    def _copy_entry(self, source: str, target: str, cancelled):
+        """파일/심볼릭 링크/특수 파일 하나를 복사한다."""
+        source_stat = os.lstat(source)
+        if stat.S_ISLNK(source_stat.st_mode):
+            os.symlink(os.readlink(source), target)
+        elif stat.S_ISREG(source_stat.st_mode):
+            copy_file(source, target, self._add_bytes, cancelled)
+        else:
+            raise OSError(errno.EINVAL, "일반 파일이 아니어서 복사하지 않습니다", source)
+
+    def _move_across_devices(self, source: str, target: str):
+        """다른 파일 시스템으로 이동: 복사한 뒤 오류가 없으면 원본을 지운다."""
+        with self._lock:
+            self._state.files_total -= 1  # rename 한 번 대신 복사할 파일들을 셈
+            errors = len(self._state.errors)
+        try:
+            source_stat = os.lstat(source)
+        except OSError as e:
+            self._error(source, e)
+            return
+        plan = _Plan()
+        self._plan_copy(plan, source, target, source_stat)
+        self._copy_tree(plan)
+        with self._lock:
+            failed = len(self._state.errors) > errors
+        if failed or self._cancelled:
+            # 원본을 남겨 둠 (복사한 부분은 대상에 남음)
+            return
+
+        removal = _Plan()
+        self._plan_delete(removal, source, source_stat)
+        with self._lock:
+            self._state.files_total -= len(removal.tasks)  # 원본 삭제는 진행 상황에 세지 않음
+        for _, path, _, _ in removal.tasks:
+            try:
+                os.unlink(path)
+            except OSError as e:
+                self._error(path, e)
+        for directory in removal.remove_dirs:
+            try:
+                os.rmdir(directory)
+            except OSError as e:
+                self._error(directory, e)
+
+    def _add_bytes(self, count: int):
+        with self._lock:
+            self._state.bytes_done += count
+
+    def _error(self, path: str, error: Exception):
+        with self._lock:
+            self._state.errors.append((path, str(error)))
+
+    def _maybe_report(self, current: str | None):
+        """마지막 알림 뒤 PROGRESS_INTERVAL_MS가 지났으면 진행 상황을 알린다."""
+        now = time.monotonic()
+        if now < self._next_report:
+            return
+        self._next_report = now + self.PROGRESS_INTERVAL_MS / 1000
+        with self._lock:
+            if current is not None:
+                self._state.current = current
+            snapshot = self._state.copy()
+        self.progress.emit(snapshot)
+
+
+_shared_pool = None
+
+
+def shared_operation_pool() -> LoaderPool:
+    """프로세스 전역 파일 작업 풀 (디렉토리 로딩과 스레드를 나누지 않음)."""
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = LoaderPool(max_threads=2)
+    return _shared_pool
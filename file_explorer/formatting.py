@@ -0,0 +1,108 @@
+"""크기/수정일시 표시 문자열 포맷터"""
+import math
+import time
+from datetime import datetime
+
+# 한 구간(초). 표준 시간대 오프셋과 서머타임 전환은 대부분 15분 단위라 구간 안에서는
+# 현지 날짜/시가 바뀌지 않는다 (구간 안에서 오프셋이 바뀌면 _bucket_entry가 걸러 냄).
+_BUCKET_SECONDS = 900
+
+# 구간 안에서 UTC 오프셋이 바뀌는 구간의 캐시 값 (시작 분/초가 3600이라 항상 format_modified 사용)
+_SHIFTED_BUCKET = ("", 3600)
+
+# 시 안의 초(0~3599) -> "MM:SS"
+_MINUTE_SECOND = tuple(f"{minute:02d}:{second:02d}" for minute in range(60) for second in range(60))
+
+
+def format_size(size: int | None) -> str:
+    """파일 크기를 사람이 읽기 쉬운 형태로 변환한다."""
+    if size is None:
+        return "—"
+
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+
+    return "—"
+
+
+def format_modified(timestamp: float | None) -> str:
+    """수정 시간을 포맷팅한다."""
+    if timestamp is None:
+        return "—"
+
+    try:
+        dt = datetime.fromtimestamp(timestamp)
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except Exception:
+        return "—"
+
+
+class DisplayFormatter:
+    """수정일시 문자열을 strftime 없이 만드는 포맷터
+
+    15분 구간마다 localtime()을 한 번만 호출해 "YYYY-MM-DD HH:" 접두어와
+    구간 시작의 분/초를 캐시하고, 구간 안의 시각은 정수 연산으로 만든다.
+    날짜 접두어 문자열은 같은 날의 구간끼리 공유한다.
+    """
+
+    def __init__(self, max_buckets: int = 16384):
+        self.max_buckets = max_buckets  # 캐시할 최대 구간 수
+        self._buckets = {}  # 구간 번호 -> (시 접두어, 구간 시작 시점의 분*60+초)
+        self._day_prefixes = {}  # (년, 월, 일) -> "YYYY-MM-DD "
+
+    def format_modified(self, timestamp: float | None) -> str:
+        """수정 시간을 "YYYY-MM-DD HH:MM:SS" 형식으로 만든다."""
+        if timestamp is None:
+            return "—"
+
+        try:
+            seconds = math.floor(timestamp)
+        except (OverflowError, ValueError):
+            return "—"
+
+        bucket, within = divmod(seconds, _BUCKET_SECONDS)
+        entry = self._buckets.get(bucket)
+        if entry is None:
+            entry = self._bucket_entry(bucket)
+            if entry is None:
+                return format_modified(timestamp)
+
+        offset = entry[1] + within
+        if offset >= 3600:
+            # 정시에 맞지 않는 역사적 시간대 오프셋이라 구간 안에서 시가 바뀜
+            return format_modified(timestamp)
+        return entry[0] + _MINUTE_SECOND[offset]
+
+    def format_modified_batch(self, timestamps) -> list:
+        """여러 수정 시간을 한 번에 포맷팅한다."""
+        format_one = self.format_modified
+        return [format_one(timestamp) for timestamp in timestamps]
+
+    def _bucket_entry(self, bucket: int) -> tuple | None:
+        """구간의 시 접두어와 시작 분/초를 계산해 캐시한다."""
+        try:
+            local = time.localtime(bucket * _BUCKET_SECONDS)
+            last = time.localtime(bucket * _BUCKET_SECONDS + _BUCKET_SECONDS - 1)
+        except (OverflowError, OSError, ValueError):
+            return None
+
+        if len(self._buckets) >= self.max_buckets:
+            self._buckets.clear()
+            self._day_prefixes.clear()
+
+        if last.tm_gmtoff != local.tm_gmtoff:
+            # 15분 단위가 아닌 시각의 전환 (예: 1987~2011년 뉴펀들랜드는 00:01에 전환)
+            self._buckets[bucket] = _SHIFTED_BUCKET
+            return _SHIFTED_BUCKET
+
+        day = (local.tm_year, local.tm_mon, local.tm_mday)
+        day_prefix = self._day_prefixes.get(day)
+        if day_prefix is None:
+            day_prefix = f"{local.tm_year:04d}-{local.tm_mon:02d}-{local.tm_mday:02d} "
+            self._day_prefixes[day] = day_prefix
+
+        entry = (f"{day_prefix}{local.tm_hour:02d}:", local.tm_min * 60 + local.tm_sec)
+        self._buckets[bucket] = entry
+        return entry
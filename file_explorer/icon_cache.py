@@ -0,0 +1,174 @@
+"""프로세스 전역 아이콘 캐시 (MIME 종류별 공유, 백그라운드 해석)"""
+import os
+import queue
+import threading
+import time
+from collections import deque
+from PyQt6.QtCore import QObject, QFileInfo, QMimeDatabase, QTimer, pyqtSignal
+from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QFileIconProvider
+from .entry_store import EntryStore, FLAG_DIR
+from .instrumentation import Instrumentation, instrumentation_from_env
+
+DIR_KEY = "__dir__"  # 디렉토리 아이콘 키
+FILE_KEY = "__file__"  # 확장자 없는 파일 (기본 파일 아이콘) 키
+
+
+def icon_key(name: str, is_dir: bool) -> str:
+    """항목의 아이콘 캐시 키 (디렉토리, 확장자 없는 파일, 또는 소문자 확장자)."""
+    if is_dir:
+        return DIR_KEY
+    return os.path.splitext(name)[1].lower() or FILE_KEY
+
+
+class IconCache(QObject):
+    """확장자별 아이콘을 프로세스 전체에서 공유하는 캐시
+
+    처음 보는 확장자는 그 자리에서 해석하지 않는다. 호출자는 자리 표시 아이콘을 표시하고
+    request()/prefetch()로 요청하면 백그라운드 스레드에서 MIME 종류를 찾는다
+    (QMimeDatabase는 스레드 안전).
+    QIcon은 GUI 스레드에서만 만들 수 있으므로 해석 결과는 GUI 스레드로 넘겨
+    이벤트 루프 한 번에 RESOLVE_BUDGET_MS까지만 아이콘을 만들고 나머지는 다음 차례로 미룬다.
+    같은 MIME 종류의 확장자(.jpg/.jpeg 등)는 아이콘 하나를 공유한다.
+    준비된 키는 icons_ready로 알린다.
+    """
+
+    icons_ready = pyqtSignal(object)  # set[str]: 새로 준비된 키
+    # 워커 → GUI 스레드: [(키, MIME 이름, 테마 아이콘 이름, 일반 아이콘 이름, 예시 경로)]
+    _resolved = pyqtSignal(object)
+
+    # GUI 스레드에서 이벤트 루프 한 번에 아이콘을 만드는 최대 시간 (ms)
+    RESOLVE_BUDGET_MS = 8
+
+    def __init__(self, instrumentation: Instrumentation = None, parent=None):
+        super().__init__(parent)
+        self.instrumentation = instrumentation
+        self._icons = {}  # 키 -> QIcon
+        self._mime_icons = {}  # MIME 이름 -> QIcon
+        self._requested = set()  # 해석을 요청했지만 아직 준비되지 않은 키
+        self._provider = None  # 기본 아이콘/테마 없는 플랫폼용 아이콘 제공자 (첫 사용 때 생성)
+        self._placeholder = None
+        self._requests = queue.SimpleQueue()  # 워커 요청: (디렉토리, 이름 목록, 플래그)
+        self._worker = None  # MIME 해석 스레드 (첫 요청 때 시작)
+        self._unbuilt = deque()  # 해석됐지만 아직 아이콘을 만들지 않은 결과
+        self._resolved.connect(self._on_resolved)
+
+    def _ensure_defaults(self):
+        """아이콘 제공자를 만들고 디렉토리/기본 파일 아이콘을 로드한다."""
+        self._provider = QFileIconProvider()
+        try:
+            self._icons[DIR_KEY] = self._provider.icon(QFileIconProvider.IconType.Folder)
+            self._icons[FILE_KEY] = self._provider.icon(QFileIconProvider.IconType.File)
+        except Exception:
+            # 아이콘 로드 실패 시 빈 아이콘 사용
+            self._icons[DIR_KEY] = QIcon()
+            self._icons[FILE_KEY] = QIcon()
+        self._placeholder = self._icons[FILE_KEY]
+
+    def placeholder(self) -> QIcon:
+        """아이콘이 준비되기 전에 표시할 자리 표시 아이콘 (기본 파일 아이콘)."""
+        if self._provider is None:
+            self._ensure_defaults()
+        return self._placeholder
+
+    def icon(self, key: str) -> QIcon | None:
+        """키의 아이콘. 아직 준비되지 않았으면 None."""
+        if self._provider is None:
+            self._ensure_defaults()
+        return self._icons.get(key)
+
+    def request(self, key: str, path: str):
+        """path(이 키를 가진 파일)를 예시로 키의 아이콘 해석을 요청한다."""
+        if key not in self._icons and key not in self._requested:
+            self._requested.add(key)
+            self._submit((os.path.dirname(path), [os.path.basename(path)], None))
+
+    def prefetch(self, chunk: EntryStore):
+        """청크에 있는 확장자의 아이콘을 미리 해석한다 (키 계산도 워커에서 함)."""
+        if chunk:
+            self._submit((chunk.base_path, chunk.names, chunk.flags))
+
+    def _submit(self, request: tuple):
+        self._requests.put(request)
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="IconCache", daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        """워커 스레드: 요청된 이름들의 새 키를 찾아 MIME 종류를 해석한다."""
+        database = QMimeDatabase()
+        seen = {DIR_KEY, FILE_KEY}  # 이미 해석한 키 (워커 전용)
+        while True:
+            directory, names, flags = self._requests.get()
+            batch = []
+            for i, name in enumerate(names):
+                if flags is not None and flags[i] & FLAG_DIR:
+                    continue
+                key = icon_key(name, False)
+                if key in seen:
+                    continue
+                seen.add(key)
+                # 확장자만으로 결정 (파일 내용은 읽지 않음)
+                mime = database.mimeTypeForFile("x" + key, QMimeDatabase.MatchMode.MatchExtension)
+                batch.append((key, mime.name(), mime.iconName(), mime.genericIconName(),
+                              os.path.join(directory, name)))
+            if batch:
+                self._resolved.emit(batch)
+
+    def _on_resolved(self, batch: list):
+        """GUI 스레드: 해석 결과를 받아 아이콘을 만든다."""
+        idle = not self._unbuilt
+        self._unbuilt.extend(batch)
+        if idle:
+            self._build_icons()
+
+    def _build_icons(self):
+        """시간 예산 안에서 아이콘을 만들고 남은 것은 다음 이벤트 루프 차례로 미룬다."""
+        if self._provider is None:
+            self._ensure_defaults()
+        instrumentation = self.instrumentation
+        deadline = time.perf_counter() + self.RESOLVE_BUDGET_MS / 1000
+        ready = set()
+        while self._unbuilt and time.perf_counter() < deadline:
+            key, mime_name, icon_name, generic_icon_name, path = self._unbuilt.popleft()
+            icon = self._mime_icons.get(mime_name)
+            if icon is None:
+                if instrumentation is not None:
+                    start = instrumentation.now()
+                icon = QIcon.fromTheme(icon_name)
+                if icon.isNull():
+                    icon = QIcon.fromTheme(generic_icon_name)
+                if icon.isNull():
+                    # 아이콘 테마가 없는 플랫폼 (Windows/macOS 등)
+                    try:
+                        icon = self._provider.icon(QFileInfo(path))
+                    except Exception:
+                        icon = self._placeholder
+                self._mime_icons[mime_name] = icon
+                if instrumentation is not None:
+                    instrumentation.record("icon.resolve", "icon", start, extension=key, mime=mime_name)
+            self._icons[key] = icon
+            self._requested.discard(key)
+            ready.add(key)
+
+        if self._unbuilt:
+            QTimer.singleShot(0, self._build_icons)
+        if ready:
+            self.icons_ready.emit(ready)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._icons
+
+    def __len__(self) -> int:
+        return len(self._icons)
+
+
+_shared_cache = None
+
+
+def shared_icon_cache() -> IconCache:
+    """프로세스 전역에서 공유하는 아이콘 캐시를 반환한다."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = IconCache(instrumentation_from_env())
+    return _shared_cache
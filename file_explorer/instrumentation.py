@@ -0,0 +1,152 @@
+"""성능 계측 (로더/모델/위젯 구간 시간 기록, JSON/Chrome trace 내보내기)
+
+기본적으로 꺼져 있다. 위젯/모델에 Instrumentation 객체를 넘기거나
+환경 변수 FILE_EXPLORER_TRACE를 설정하면 켜진다.
+
+    FILE_EXPLORER_TRACE=1                  # 계측만 켬 (instrumentation.export_*로 직접 저장)
+    FILE_EXPLORER_TRACE=/tmp/trace.json    # 종료 시 Chrome trace 파일로 저장
+
+저장한 trace는 chrome://tracing 또는 https://ui.perfetto.dev 에서 열 수 있다.
+"""
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from PyQt6.QtCore import QObject, pyqtSignal
+
+TRACE_ENV = "FILE_EXPLORER_TRACE"
+
+
+class Instrumentation(QObject):
+    """구간 시간과 카운터를 기록하는 계측기
+
+    모든 메서드는 워커 스레드에서 호출해도 된다. 기록된 구간은
+    event_recorded로도 전달된다 (다른 스레드에서 기록된 구간은 수신 객체의
+    스레드로 전달됨). 메모리 사용을 묶기 위해 최근 max_events개만 보관한다.
+    """
+
+    event_recorded = pyqtSignal(object)  # 구간 dict (name, cat, ts_us, dur_us, tid, args)
+
+    def __init__(self, max_events: int = 100_000, parent=None):
+        super().__init__(parent)
+        self._events = deque(maxlen=max_events)
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()  # 타임스탬프 기준 시점
+
+    def now(self) -> float:
+        """구간 시작/끝 시각으로 쓰는 단조 시계 (초)."""
+        return time.perf_counter()
+
+    def record(self, name: str, category: str, start: float, end: float = None, **args):
+        """start~end(초, now() 기준) 구간을 기록한다."""
+        end = self.now() if end is None else end
+        event = {
+            "name": name,
+            "cat": category,
+            "ts_us": (start - self._origin) * 1e6,
+            "dur_us": max(0.0, end - start) * 1e6,
+            "tid": threading.get_ident(),
+            "thread": threading.current_thread().name,
+            "args": args,
+        }
+        with self._lock:
+            self._events.append(event)
+        self.event_recorded.emit(event)
+
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        """with 블록 실행 시간을 구간으로 기록한다."""
+        start = self.now()
+        try:
+            yield args
+        finally:
+            self.record(name, category, start, **args)
+
+    def count(self, name: str, value: int = 1):
+        """카운터를 증가시킨다 (아이콘 캐시 적중 등 너무 잦아 구간으로 기록하지 않는 값)."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def events(self) -> list:
+        """기록된 구간 목록의 복사본."""
+        with self._lock:
+            return list(self._events)
+
+    def counters(self) -> dict:
+        """카운터의 복사본."""
+        with self._lock:
+            return dict(self._counters)
+
+    def clear(self):
+        """기록을 비운다."""
+        with self._lock:
+            self._events.clear()
+            self._counters.clear()
+
+    def summary(self) -> dict:
+        """구간 이름별 횟수/합계/최대 시간(ms)."""
+        summary = {}
+        for event in self.events():
+            entry = summary.setdefault(event["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            duration = event["dur_us"] / 1000
+            entry["count"] += 1
+            entry["total_ms"] += duration
+            entry["max_ms"] = max(entry["max_ms"], duration)
+        return summary
+
+    def to_json(self) -> dict:
+        """요약, 카운터, 구간 목록을 담은 dict."""
+        return {"summary": self.summary(), "counters": self.counters(), "events": self.events()}
+
+    def to_chrome_trace(self) -> dict:
+        """Chrome trace 형식 (Trace Event Format) dict."""
+        pid = os.getpid()
+        trace_events = []
+        thread_names = {}
+        for event in self.events():
+            thread_names[event["tid"]] = event["thread"]
+            trace_events.append({
+                "name": event["name"],
+                "cat": event["cat"],
+                "ph": "X",
+                "ts": event["ts_us"],
+                "dur": event["dur_us"],
+                "pid": pid,
+                "tid": event["tid"],
+                "args": event["args"],
+            })
+        for tid, thread_name in thread_names.items():
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                                 "args": {"name": thread_name}})
+        return {"traceEvents": trace_events, "otherData": {"counters": self.counters()}}
+
+    def export_json(self, path: str):
+        """to_json() 결과를 파일로 저장한다."""
+        import json
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, ensure_ascii=False, indent=1)
+
+    def export_chrome_trace(self, path: str):
+        """Chrome trace 파일로 저장한다."""
+        import json
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+
+
+_env_instrumentation = None
+
+
+def instrumentation_from_env() -> Instrumentation | None:
+    """FILE_EXPLORER_TRACE가 설정되어 있으면 프로세스 전역 계측기를 반환한다."""
+    global _env_instrumentation
+    value = os.environ.get(TRACE_ENV, "")
+    if not value or value == "0":
+        return None
+    if _env_instrumentation is None:
+        _env_instrumentation = Instrumentation()
+        if value != "1":
+            atexit.register(_env_instrumentation.export_chrome_trace, value)
+    return _env_instrumentation
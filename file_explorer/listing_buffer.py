@@ -0,0 +1,78 @@
+"""행을 나눠 보이는 모델(fetch_rows)이 로딩 중 항목을 모델 밖에 쌓아 두는 버퍼"""
+import bisect
+import heapq
+import itertools
+from array import array
+from .entry_store import EntryStore, sort_key
+
+
+class ListingBuffer:
+    """기본 정렬 순서로 정렬된 구간(run) 여러 개로 이루어진 목록
+
+    로더가 보낸 정렬된 청크는 행별 정렬 키 없이 컬럼 배열만 복사해 구간으로 쌓는다.
+    합친 순서의 앞쪽 행(head)이나 전체 목록(merged)은 구간들을 k-way 병합해 만들며,
+    병합 키는 꺼내는 행마다 만들고 바로 버리므로 전체 행의 정렬 키를 한꺼번에 들고 있지 않다.
+    키가 같은 행은 먼저 추가된 구간의 행이 앞에 온다.
+    """
+
+    def __init__(self, store: EntryStore):
+        self.base_path = store.base_path
+        self.runs = [store.copy()] if len(store) else []  # 정렬된 구간 (추가된 순서)
+        self._count = len(store)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, chunk: EntryStore):
+        """정렬된 청크를 새 구간으로 추가한다 (SortedChunk의 정렬 키는 복사하지 않음)."""
+        if len(chunk):
+            self.runs.append(chunk.copy())
+            self._count += len(chunk)
+
+    def _merged_rows(self):
+        """모든 구간을 합친 순서대로 (정렬 키, 구간 번호, 행)을 만든다."""
+        return heapq.merge(*(zip(map(sort_key, run.names, run.flags), itertools.repeat(index), itertools.count())
+                             for index, run in enumerate(self.runs)))
+
+    def head(self, first: int, end: int) -> EntryStore:
+        """합친 순서에서 first~end-1번째 항목 (구간은 그대로 둠)."""
+        store = EntryStore(self.base_path)
+        runs = self.runs
+        for _, index, row in itertools.islice(self._merged_rows(), first, end):
+            store.append_from(runs[index], row)
+        return store
+
+    def merged(self) -> EntryStore:
+        """구간들을 하나로 병합해 전체 목록을 만든다 (이후 구간은 그 목록 하나)."""
+        if not self.runs:
+            self.runs = [EntryStore(self.base_path)]
+        elif len(self.runs) > 1:
+            # 구간을 이어 붙인 목록에서의 행 번호를 합친 순서대로 고른다
+            offsets = list(itertools.accumulate(map(len, self.runs[:-1]), initial=0))
+            order = array("q", (offsets[index] + row for _, index, row in self._merged_rows()))
+            runs, self.runs = self.runs, []
+            combined = EntryStore(self.base_path)
+            for index, run in enumerate(runs):
+                combined.extend(run)
+                runs[index] = None  # 이어 붙인 구간은 바로 놓아 준다
+            self.runs = [combined.select(order)]
+        return self.runs[0]
+
+    def apply_stats(self, stats) -> int:
+        """stat 결과(StatBatch)로 구간의 크기/수정시간을 채운다. 찾은 항목 수를 반환한다.
+
+        stat 결과는 해당 청크 직후에 오므로 최근 구간부터 찾는다.
+        """
+        found = 0
+        for name, key, size, modified in zip(stats.names, stats.keys, stats.sizes, stats.mtimes):
+            for run in reversed(self.runs):
+                # 대소문자만 다른 이름은 키가 같으므로 이름이 일치하는 행까지 찾는다
+                row = bisect.bisect_left(range(len(run)), key, key=run.sort_key)
+                while row < len(run) and run.names[row] != name and run.sort_key(row) == key:
+                    row += 1
+                if row < len(run) and run.names[row] == name:
+                    run.sizes[row] = size
+                    run.mtimes[row] = modified
+                    found += 1
+                    break
+        return found
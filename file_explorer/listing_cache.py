@@ -0,0 +1,93 @@
+"""디렉토리 목록 캐시 (뒤로/앞으로 이동 시 재스캔 방지)"""
+import os
+from collections import OrderedDict
+from .entry_store import EntryStore
+
+
+def directory_signature(path: str) -> tuple | None:
+    """디렉토리 변경 여부 판단에 쓰는 (mtime, ctime) 서명을 반환한다."""
+    try:
+        stat_info = os.stat(path)
+    except OSError:
+        return None
+    return (stat_info.st_mtime_ns, stat_info.st_ctime_ns)
+
+
+class ListingCache:
+    """절대 경로를 키로 디렉토리 목록을 보관하는 LRU 캐시
+
+    항목 개수와 전체 바이트 두 가지 한도를 모두 적용한다.
+    각 목록은 스캔 시작 시점의 디렉토리 서명과 함께 저장되어,
+    재방문 시 서명을 비교해 재스캔 여부를 결정할 수 있다.
+    """
+
+    def __init__(self, max_entries: int = 32, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries  # 최대 목록 개수
+        self.max_bytes = max_bytes  # 최대 전체 바이트
+        self._entries = OrderedDict()  # path -> (store, signature, nbytes)
+        self._total_bytes = 0
+
+    def get(self, path: str) -> tuple[EntryStore, tuple] | None:
+        """캐시된 (목록, 서명)을 반환한다. 없으면 None."""
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(path)
+        store, signature, _ = entry
+        return store, signature
+
+    def put(self, path: str, store: EntryStore, signature: tuple | None):
+        """목록을 캐시에 저장한다."""
+        self.invalidate(path)
+        if signature is None:
+            return
+
+        nbytes = store.nbytes()
+        if self.max_entries <= 0 or nbytes > self.max_bytes:
+            return
+
+        self._entries[path] = (store, signature, nbytes)
+        self._total_bytes += nbytes
+        self._evict()
+
+    def invalidate(self, path: str):
+        """경로의 캐시를 제거한다."""
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
+
+    def clear(self):
+        """캐시를 비운다."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def _evict(self):
+        """한도를 넘으면 가장 오래 사용하지 않은 목록부터 제거한다."""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            _, (_, _, nbytes) = self._entries.popitem(last=False)
+            self._total_bytes -= nbytes
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """캐시된 목록의 전체 바이트."""
+        return self._total_bytes
+
+
+_shared_cache = None
+
+
+def shared_listing_cache() -> ListingCache:
+    """프로세스 전역에서 공유하는 목록 캐시를 반환한다."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ListingCache()
+    return _shared_cache
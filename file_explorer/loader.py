@@ -1,80 +1,509 @@
-"""백그라운드 디렉토리 스캔 워커 (QThread)"""
+"""백그라운드 디렉토리 스캔 워커와 재사용 스레드 풀 (스캔 자체는 Qt와 무관한 scan 모듈)"""
 import os
-import fnmatch
-from pathlib import Path
-from PyQt6.QtCore import QThread, pyqtSignal
+import queue
+import threading
+import time
+from array import array
+from collections import deque
+from contextlib import closing
+from PyQt6.QtCore import QObject, pyqtSignal
+from .entry_store import EntryStore, FLAG_DIR, UNKNOWN, sort_key
+from .instrumentation import Instrumentation
+from .backends import FileSystemBackend, local_backend
+from .scan import entry_stat, iter_entries
 
+# 로더 풀 작업 우선순위 (작을수록 먼저): 포커스가 있는 창, 보이는 창, 숨겨진 창(선택되지 않은 탭), 미리 스캔
+PRIORITY_FOCUSED = 0
+PRIORITY_VISIBLE = 1
+PRIORITY_HIDDEN = 2
+PRIORITY_PREFETCH = 3
 
-class DirectoryLoader(QThread):
-    """백그라운드에서 디렉토리 항목을 스캔하는 QThread 워커"""
 
-    chunk_ready = pyqtSignal(list)  # 청크 단위 결과 전달
-    finished = pyqtSignal(list)  # 전체 완료
+class BatchPolicy:
+    """로더가 청크를 보내는 시점을 정하는 정책
 
-    def __init__(self, path: str, glob_pattern: str = None):
+    첫 청크는 first_batch개로 작게 보내 첫 행이 빨리 보이게 하고,
+    이후 청크 크기는 growth배씩 max_batch까지 늘린다. 크기를 채우지 못해도
+    flush_ms가 지나면 모인 항목을 보낸다. GUI 스레드가 아직 처리하지 않은
+    청크가 max_in_flight개면 워커는 처리될 때까지 기다린다(backpressure).
+    """
+
+    def __init__(self, first_batch: int = 64, max_batch: int = 4096, growth: float = 2.0,
+                 flush_ms: int = 100, max_in_flight: int = 2):
+        if first_batch < 1 or max_batch < first_batch:
+            raise ValueError("1 <= first_batch <= max_batch 이어야 합니다")
+        if growth < 1.0:
+            raise ValueError("growth는 1 이상이어야 합니다")
+        if flush_ms <= 0 or max_in_flight < 1:
+            raise ValueError("flush_ms와 max_in_flight는 양수여야 합니다")
+        self.first_batch = first_batch  # 첫 청크 크기
+        self.max_batch = max_batch  # 최대 청크 크기
+        self.growth = growth  # 청크 크기 증가 배율
+        self.flush_ms = flush_ms  # 최대 청크 보관 시간(ms)
+        self.max_in_flight = max_in_flight  # GUI 스레드가 처리하지 않은 최대 청크 수
+
+    def batch_sizes(self):
+        """청크 크기를 차례로 만든다."""
+        size = float(self.first_batch)
+        while True:
+            yield int(size)
+            size = min(size * self.growth, self.max_batch)
+
+
+class SortedChunk(EntryStore):
+    """기본 정렬 순서(sort_key)로 정렬한 청크와 행별 정렬 키
+
+    워커 스레드에서 정렬해 보내므로 GUI 스레드는 정렬된 목록에 끼워 넣을 위치만 찾는다.
+    """
+
+    __slots__ = ("keys",)
+
+    def __init__(self, chunk: EntryStore):
+        super().__init__(chunk.base_path)
+        keys = list(map(chunk.sort_key, range(len(chunk))))
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = [keys[row] for row in order]  # 행별 정렬 키 (오름차순)
+        selected = chunk.select(order)
+        self.names, self.sizes = selected.names, selected.sizes
+        self.mtimes, self.flags = selected.mtimes, selected.flags
+
+    @classmethod
+    def presorted(cls, store: EntryStore, keys: list) -> "SortedChunk":
+        """이미 정렬된 저장소와 행별 정렬 키로 청크를 만든다 (다시 정렬하지 않고 배열을 그대로 씀)."""
+        chunk = cls.__new__(cls)
+        chunk.base_path, chunk.keys = store.base_path, keys
+        chunk.names, chunk.sizes, chunk.mtimes, chunk.flags = store.names, store.sizes, store.mtimes, store.flags
+        return chunk
+
+
+class StatBatch:
+    """병렬 stat 결과 묶음
+
+    행은 정렬된 청크에 끼워 넣어져 위치가 바뀌므로 항목을 이름과 정렬 키로 가리킨다.
+    """
+
+    __slots__ = ("names", "keys", "sizes", "mtimes")
+
+    def __init__(self):
+        self.names = []
+        self.keys = []  # 항목별 sort_key
+        self.sizes = array("q")
+        self.mtimes = array("d")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class LoaderPool:
+    """로더를 실행하는 재사용 스레드 풀
+
+    스레드는 필요할 때 만들고 IDLE_SECONDS 동안 일이 없으면 끝난다. 취소되지 않은
+    로더를 실행 중이거나 쉬고 있는 스레드는 max_threads개를 넘지 않는다. 취소된 뒤에도
+    (멈춘 NFS의 scandir 등에서) 끝나지 않는 로더는 이 수에 세지 않으므로 새 로딩을
+    막지 않는다. 다만 그런 스레드가 max_abandoned개를 넘으면 더 만들지 않고 새 로더는
+    스레드가 빌 때까지 대기열에서 기다린다. 시작 전에 취소된 로더는 실행하지 않고 버린다.
+    스레드는 데몬 스레드라서 멈춘 스캔이 프로그램 종료를 막지 않는다.
+
+    대기열의 로더는 우선순위(priority 속성, PRIORITY_*, 없으면 PRIORITY_VISIBLE) 순서로,
+    같은 우선순위끼리는 들어온 순서로 실행한다. 실행 중인 로더는 청크를 보낼 때마다
+    wait_turn()으로 더 높은 우선순위의 로더가 실행 중이거나 기다리는 동안 멈춘다
+    (멈춘 로더는 max_threads에 세지 않으므로 높은 우선순위 로더는 바로 스레드를 얻는다).
+    """
+
+    # 일이 없을 때 스레드가 끝나기까지 기다리는 시간 (초)
+    IDLE_SECONDS = 10.0
+    # 양보해 멈춘 로더가 취소 여부를 확인하는 간격 (초)
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, max_threads: int = 4, max_abandoned: int = 16):
+        if max_threads < 1 or max_abandoned < 0:
+            raise ValueError("max_threads는 1 이상, max_abandoned는 0 이상이어야 합니다")
+        self.max_threads = max_threads  # 취소되지 않은 로더를 실행하거나 쉬는 최대 스레드 수
+        self.max_abandoned = max_abandoned  # 취소된 로더가 더 차지할 수 있는 최대 스레드 수
+        self._queue = []  # 실행을 기다리는 로더 (들어온 순서)
+        self._running = set()  # 실행 중인 로더
+        self._yielding = set()  # 실행 중이지만 높은 우선순위 로더에 양보해 멈춘 로더
+        self._threads = 0  # 살아 있는 스레드 수
+        self._idle = 0  # 일을 기다리는 스레드 수
+        self._condition = threading.Condition()
+
+    def submit(self, loader: "DirectoryLoader"):
+        """로더를 실행 대기열에 넣는다."""
+        with self._condition:
+            # 시작 전에 취소된 로더는 자리만 차지하므로 버린다
+            self._discard_cancelled()
+            self._queue.append(loader)
+            self._start_thread()
+            self._condition.notify_all()
+
+    def set_priority(self, loader, priority: int):
+        """대기 중이거나 실행 중인 로더의 우선순위를 바꾼다."""
+        with self._condition:
+            loader.priority = priority
+            self._condition.notify_all()
+
+    def wait_turn(self, loader) -> bool:
+        """실행 중인 로더가 더 높은 우선순위의 로더가 없을 때까지 멈춘다. 취소되면 False."""
+        with self._condition:
+            if not self._outranked(loader):
+                return not loader._cancelled
+            self._yielding.add(loader)
+            # 이 로더가 비운 자리에서 높은 우선순위 로더가 시작할 수 있게 한다
+            self._start_thread()
+            try:
+                while self._outranked(loader) and not loader._cancelled:
+                    self._condition.wait(self.POLL_INTERVAL)
+            finally:
+                self._yielding.discard(loader)
+            return not loader._cancelled
+
+    def is_queued(self, loader) -> bool:
+        """로더가 아직 시작하지 않고 대기열에 있는지 여부."""
+        with self._condition:
+            return loader in self._queue
+
+    def thread_count(self) -> int:
+        """살아 있는 스레드 수 (취소된 뒤 아직 끝나지 않은 로더의 스레드 포함)."""
+        return self._threads
+
+    def _outranked(self, loader) -> bool:
+        """더 높은 우선순위의 로더가 대기 중이거나 (멈추지 않고) 실행 중인지 (조건 변수를 잡은 상태에서 호출)."""
+        priority = _priority(loader)
+        for other in self._queue:
+            if _priority(other) < priority and not other._cancelled:
+                return True
+        for other in self._running:
+            if _priority(other) < priority and not other._cancelled and other not in self._yielding:
+                return True
+        return False
+
+    def _start_thread(self):
+        """대기열을 처리할 스레드가 모자라면 하나 만든다 (조건 변수를 잡은 상태에서 호출)."""
+        active = sum(1 for running in self._running if not running._cancelled and running not in self._yielding)
+        if (self._idle < len(self._queue) and active + self._idle < self.max_threads
+                and self._threads < self.max_threads + self.max_abandoned):
+            self._threads += 1
+            threading.Thread(target=self._work, name="DirectoryLoader", daemon=True).start()
+
+    def _discard_cancelled(self):
+        """대기열에서 취소된 로더를 뺀다 (조건 변수를 잡은 상태에서 호출)."""
+        if any(loader._cancelled for loader in self._queue):
+            for loader in self._queue:
+                if loader._cancelled:
+                    loader._done.set()
+            self._queue = [loader for loader in self._queue if not loader._cancelled]
+
+    def _work(self):
+        """풀 스레드: 대기열의 로더를 하나씩 실행한다."""
+        while True:
+            with self._condition:
+                self._idle += 1
+                has_work = self._condition.wait_for(lambda: self._queue, self.IDLE_SECONDS)
+                self._idle -= 1
+                if not has_work:
+                    self._threads -= 1
+                    return
+                # 우선순위가 가장 높은 로더 (같으면 먼저 들어온 것)
+                loader = min(self._queue, key=_priority)
+                self._queue.remove(loader)
+                if loader._cancelled:
+                    loader._done.set()
+                    continue
+                self._running.add(loader)
+            try:
+                loader.run()
+            finally:
+                loader._done.set()
+                with self._condition:
+                    self._running.discard(loader)
+                    self._condition.notify_all()
+
+
+def _priority(loader) -> int:
+    """풀 작업의 우선순위 (priority 속성이 없는 작업은 PRIORITY_VISIBLE)."""
+    return getattr(loader, "priority", PRIORITY_VISIBLE)
+
+
+_shared_pool = None
+
+
+def shared_loader_pool() -> LoaderPool:
+    """프로세스 전역 로더 풀 (탐색기 위젯끼리 공유)."""
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = LoaderPool()
+    return _shared_pool
+
+
+class DirectoryLoader(QObject):
+    """백그라운드에서 디렉토리 항목을 스캔하는 워커
+
+    항목 나열/glob 필터/stat은 scan 모듈(iter_entries, entry_stat)에 맡기고, 이 로더는
+    결과를 청크로 묶어 Qt 시그널로 보낸다. start()하면 로더 풀(LoaderPool)의 스레드에서 run()을 실행한다. cancel()은
+    플래그만 세우고 기다리지 않으므로, 취소된 로더가 보내는 시그널은 받는 쪽에서
+    generation으로 걸러야 한다.
+
+    stat_workers가 0이면 항목마다 차례로 stat한다. 양수이면 이름을 먼저 보내고
+    (크기/수정시간은 알 수 없음 상태), stat은 stat_workers개 스레드 풀에서
+    병렬로 수행해 끝나는 대로 stats_ready로 보낸다. 왕복 지연이 큰
+    네트워크/FUSE 파일 시스템에서 지연이 겹쳐지도록 하기 위한 모드다.
+    finished는 모든 stat 결과를 보낸 뒤에 발송된다.
+    청크는 보내기 전에 워커 스레드에서 기본 정렬 순서로 정렬한다 (SortedChunk).
+    청크를 보낼 때마다 풀에서 우선순위(priority)가 더 높은 로더에 양보한다.
+    """
+
+    chunk_ready = pyqtSignal(object)  # 청크 단위 결과 전달 (SortedChunk)
+    stats_ready = pyqtSignal(object)  # 병렬 stat 결과 전달 (StatBatch)
+    finished = pyqtSignal()  # 전체 완료
+    unchanged = pyqtSignal()  # 디렉토리 서명이 기대값과 같아 스캔을 생략함
+
+    # 병렬 stat 작업 하나가 처리하는 항목 수
+    STAT_TASK_SIZE = 8
+    # 청크 전송 대기 중 취소 여부를 확인하는 간격(초)
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, path: str, glob_pattern: str = None, expected_signature: tuple = None,
+                 batch_policy: BatchPolicy = None, stat_workers: int = 0,
+                 instrumentation: Instrumentation = None, backend: FileSystemBackend = None):
         super().__init__()
         self.path = path
+        self.backend = backend if backend is not None else local_backend()  # 파일 시스템 백엔드
         self.glob_pattern = glob_pattern  # glob 필터 패턴
+        self.expected_signature = expected_signature  # 재검증할 디렉토리 서명
+        self.signature = None  # 스캔 시작 시점의 디렉토리 서명
+        self.batch_policy = batch_policy or BatchPolicy()  # 청크 전송 정책
+        self.stat_workers = stat_workers  # 병렬 stat 스레드 수 (0이면 순차 stat)
+        self.instrumentation = instrumentation  # 성능 계측기 (None이면 계측 안 함)
+        # 계측 중일 때 청크 발송 시각 (수신 측이 순서대로 꺼내 전달 지연을 계산)
+        self.emit_times = deque()
+        self._stat_seconds = 0.0  # 계측 중 순차 stat에 쓴 시간
+        self.generation = 0  # 받는 쪽이 지난 로딩의 결과를 거르는 데 쓰는 세대 번호
+        self.priority = PRIORITY_VISIBLE  # 로더 풀 우선순위 (PRIORITY_*, 바꿀 때는 풀의 set_priority)
+        self._pool = None  # 실행 중인 로더 풀 (start()에서 정함)
         self._cancelled = False
-        self._chunk_size = 500  # 청크 크기
+        self._done = threading.Event()  # run()이 끝났거나 실행되지 않고 버려짐
+        self._done.set()
+        self._stat_results = queue.SimpleQueue()  # 병렬 stat 작업이 끝낸 StatBatch
+        # 보낸 뒤 아직 처리되지 않은 청크 수 제한 (chunk_consumed()로 반환)
+        self._in_flight = threading.Semaphore(self.batch_policy.max_in_flight)
 
     def run(self):
         """디렉토리를 스캔하고 항목 정보를 수집한다."""
         try:
-            items = []
-            chunk = []
+            # 스캔 중 변경도 다음 재검증에서 감지되도록 스캔 전에 서명을 기록
+            self.signature = self.backend.signature(self.path)
+            if self.expected_signature is not None and self.signature == self.expected_signature:
+                self.unchanged.emit()
+                return
+
+            instrumentation = self.instrumentation
+            if instrumentation is not None:
+                scan_start = batch_start = instrumentation.now()
+                batch_stat_seconds = 0.0
+
+            policy = self.batch_policy
+            batch_sizes = policy.batch_sizes()
+            batch_size = next(batch_sizes)
+            flush_interval = policy.flush_ms / 1000
+            flush_deadline = time.monotonic() + flush_interval
+            chunk = EntryStore(self.path)
+
+            # 병렬 stat 모드: 이름을 먼저 보내고 stat은 스레드 풀에 맡긴다
+            pool = None
+            if self.stat_workers > 0:
+                from concurrent.futures import ThreadPoolExecutor  # 병렬 모드에서만 필요
+                pool = ThreadPoolExecutor(self.stat_workers)
+            stat_task = []  # 아직 풀에 넘기지 않은 항목
+            submitted = 0  # 풀에 넘긴 작업 수
+            seq = 0  # 보낸(보낼) 항목 수
+
+            try:
+                with closing(iter_entries(self.path, self.glob_pattern, self.backend)) as entries:
+                    for entry in entries:
+                        # 취소 플래그 확인
+                        if self._cancelled:
+                            return
+
+                        if pool is not None:
+                            size = modified = None
+                            stat_task.append(entry)
+                            if len(stat_task) >= self.STAT_TASK_SIZE:
+                                pool.submit(self._stat_task, stat_task)
+                                submitted += 1
+                                stat_task = []
+                        elif instrumentation is not None:
+                            size, modified = self._timed_stat_entry(entry)
+                        else:
+                            size, modified = self._stat_entry(entry)
+
+                        chunk.append(
+                            entry.name,
+                            entry.is_dir(follow_symlinks=False),
+                            entry.is_file(follow_symlinks=False),
+                            size,
+                            modified,
+                        )
+                        seq += 1
 
-            with os.scandir(self.path) as entries:
-                for entry in entries:
-                    # 취소 플래그 확인
+                        # 청크 크기에 도달했거나 보관 시간이 지나면 신호 발송
+                        if len(chunk) >= batch_size or time.monotonic() >= flush_deadline:
+                            if instrumentation is not None:
+                                instrumentation.record(
+                                    "loader.batch", "loader", batch_start, entries=len(chunk),
+                                    stat_ms=(self._stat_seconds - batch_stat_seconds) * 1000,
+                                )
+                            if not self._emit_chunk(chunk):
+                                return
+                            if instrumentation is not None:
+                                batch_start = instrumentation.now()
+                                batch_stat_seconds = self._stat_seconds
+                            chunk = EntryStore(self.path)
+                            batch_size = next(batch_sizes)
+                            flush_deadline = time.monotonic() + flush_interval
+                            if pool is not None:
+                                # 그 사이 끝난 stat 결과도 보낸다 (해당 항목은 이미 보낸 청크에 있음)
+                                submitted -= self._emit_stats(submitted)
+
+                if stat_task:
+                    pool.submit(self._stat_task, stat_task)
+                    submitted += 1
+
+                # 남은 청크 전송
+                if chunk and instrumentation is not None:
+                    instrumentation.record(
+                        "loader.batch", "loader", batch_start, entries=len(chunk),
+                        stat_ms=(self._stat_seconds - batch_stat_seconds) * 1000,
+                    )
+                if chunk and not self._emit_chunk(chunk):
+                    return
+
+                # 남은 stat 결과를 모아서 flush_ms 간격으로 전송
+                while submitted > 0:
                     if self._cancelled:
                         return
+                    submitted -= self._emit_stats(submitted, time.monotonic() + flush_interval)
+            finally:
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
 
-                    # glob 패턴이 지정된 경우 필터링
-                    if self.glob_pattern:
-                        if not fnmatch.fnmatch(entry.name, self.glob_pattern):
-                            continue
-
-                    try:
-                        # stat 정보 한 번에 가져오기
-                        stat_info = entry.stat(follow_symlinks=False)
-                        size = stat_info.st_size
-                        modified = stat_info.st_mtime
-                    except (OSError, PermissionError):
-                        # 권한 없음 등의 오류 처리
-                        size = None
-                        modified = None
-
-                    item_dict = {
-                        "name": entry.name,
-                        "path": entry.path,
-                        "is_dir": entry.is_dir(follow_symlinks=False),
-                        "is_file": entry.is_file(follow_symlinks=False),
-                        "size": size,
-                        "modified": modified,
-                    }
-
-                    chunk.append(item_dict)
-                    items.append(item_dict)
-
-                    # 청크 크기에 도달하면 신호 발송
-                    if len(chunk) >= self._chunk_size:
-                        self.chunk_ready.emit(chunk)
-                        chunk = []
-
-            # 남은 청크 전송
-            if chunk and not self._cancelled:
-                self.chunk_ready.emit(chunk)
+            if instrumentation is not None:
+                instrumentation.record("loader.scan", "loader", scan_start, path=self.path, entries=seq,
+                                       stat_workers=self.stat_workers,
+                                       serial_stat_ms=self._stat_seconds * 1000)
 
             # 전체 완료 신호
             if not self._cancelled:
-                self.finished.emit(items)
+                self.finished.emit()
 
         except Exception as e:
             print(f"디렉토리 스캔 오류: {e}")
-            self.finished.emit([])
+            self.finished.emit()
+
+    def _stat_entry(self, entry: os.DirEntry) -> tuple:
+        """항목의 (크기, 수정시간)을 구한다. 실패하면 (None, None) (하위 클래스에서 바꿀 수 있음)."""
+        return entry_stat(entry)
+
+    def _timed_stat_entry(self, entry: os.DirEntry) -> tuple:
+        """계측 중 순차 stat: 걸린 시간을 누적한다."""
+        start = time.perf_counter()
+        result = self._stat_entry(entry)
+        self._stat_seconds += time.perf_counter() - start
+        return result
+
+    def _stat_task(self, task: list):
+        """스레드 풀 작업: 항목 묶음을 stat해 결과 큐에 넣는다."""
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = instrumentation.now()
+        result = StatBatch()
+        for entry in task:
+            if self._cancelled:
+                break
+            size, modified = self._stat_entry(entry)
+            result.names.append(entry.name)
+            result.keys.append(sort_key(entry.name, FLAG_DIR if entry.is_dir(follow_symlinks=False) else 0))
+            result.sizes.append(UNKNOWN if size is None else size)
+            result.mtimes.append(UNKNOWN if modified is None else modified)
+        if instrumentation is not None:
+            instrumentation.record("loader.stat_task", "loader", start, entries=len(result))
+        self._stat_results.put(result)
+
+    def _emit_stats(self, remaining: int, block_until: float = None) -> int:
+        """끝난 stat 작업 결과를 하나로 합쳐 보내고 합친 작업 수를 반환한다.
+
+        block_until이 있으면 그 시각까지 (remaining개 작업이 모두 끝나지 않았다면)
+        결과를 더 기다려 모은다.
+        """
+        merged = StatBatch()
+        tasks = 0
+        while tasks < remaining:
+            try:
+                if block_until is None:
+                    result = self._stat_results.get_nowait()
+                else:
+                    result = self._stat_results.get(timeout=max(0.0, block_until - time.monotonic()))
+            except queue.Empty:
+                break
+            merged.names.extend(result.names)
+            merged.keys.extend(result.keys)
+            merged.sizes.extend(result.sizes)
+            merged.mtimes.extend(result.mtimes)
+            tasks += 1
+            if block_until is not None and time.monotonic() >= block_until:
+                break
+        if merged and not self._cancelled:
+            self.stats_ready.emit(merged)
+        return tasks
+
+    def _emit_chunk(self, chunk: EntryStore) -> bool:
+        """청크를 정렬하고, 처리 대기 중인 청크가 줄어들 때까지 기다렸다가 보낸다. 취소되면 False.
+
+        우선순위가 더 높은 로더가 있으면 그 로더가 끝날 때까지 먼저 멈춘다.
+        """
+        instrumentation = self.instrumentation
+        if self._pool is not None and not self._pool.wait_turn(self):
+            return False
+        chunk = SortedChunk(chunk)
+        if not self._in_flight.acquire(blocking=False):
+            if instrumentation is not None:
+                wait_start = instrumentation.now()
+            while not self._in_flight.acquire(timeout=self.POLL_INTERVAL):
+                if self._cancelled:
+                    return False
+            if instrumentation is not None:
+                instrumentation.record("loader.backpressure", "loader", wait_start)
+        if self._cancelled:
+            return False
+        if instrumentation is not None:
+            self.emit_times.append(instrumentation.now())
+        self.chunk_ready.emit(chunk)
+        return True
+
+    def chunk_consumed(self):
+        """GUI 스레드가 청크 하나를 처리했음을 알린다."""
+        self._in_flight.release()
+
+    def start(self, pool: LoaderPool = None):
+        """로더 풀(지정하지 않으면 프로세스 전역 풀)에서 스캔을 시작한다."""
+        self._done.clear()
+        self._pool = pool if pool is not None else shared_loader_pool()
+        self._pool.submit(self)
+
+    def set_priority(self, priority: int):
+        """로더 풀 우선순위를 바꾼다 (PRIORITY_*, 실행 중이어도 다음 청크부터 반영)."""
+        if self._pool is not None:
+            self._pool.set_priority(self, priority)
+        else:
+            self.priority = priority
+
+    def is_queued(self) -> bool:
+        """시작했지만 아직 스레드를 얻지 못하고 풀의 대기열에 있는지 여부."""
+        return self._pool is not None and self._pool.is_queued(self)
 
     def cancel(self):
-        """로딩을 취소한다."""
+        """로딩을 취소한다. 스캔 스레드가 멈추기를 기다리지 않는다."""
         self._cancelled = True
-        self.wait()
+
+    def wait(self, timeout: float = None) -> bool:
+        """스캔 스레드가 끝날 때까지 기다린다 (GUI 코드에서는 쓰지 않음). 시간 초과면 False."""
+        return self._done.wait(timeout)
@@ -0,0 +1,426 @@
+"""이름 필터 (빠른 필터의 부분 문자열/퍼지 검색, glob 필터)"""
+import fnmatch
+import itertools
+import operator
+import re
+from .entry_store import EntryStore, FLAG_PARENT, load_numpy
+
+# 서명에서 겹치지 않는 비트를 갖는 문자 (나머지 바이트는 남은 비트에 나눠 담는다)
+_EXACT_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789._- "
+_HASHED_BITS = 64 - len(_EXACT_CHARS)
+
+# 바이트 → 문자 서명 비트 번호 (0번 바이트는 이름 구분자라 비트 없음)
+_CHAR_BIT = [None] + [
+    _EXACT_CHARS.index(chr(byte)) if chr(byte) in _EXACT_CHARS else len(_EXACT_CHARS) + byte % _HASHED_BITS
+    for byte in range(1, 256)
+]
+
+# 플래그 바이트 → .. 항목이면 1
+_PARENT_TABLE = bytes(1 if flags & FLAG_PARENT else 0 for flags in range(256))
+
+
+def _bigram_bit(first: int, second: int) -> int:
+    """연속한 두 바이트의 바이그램 서명 비트 번호."""
+    return ((first * 31) ^ second) & 63
+
+
+def _query_masks(query: str, contiguous: bool) -> tuple[int, int]:
+    """검색어가 일치하려면 이름 서명에 있어야 하는 (문자 비트, 바이그램 비트)."""
+    data = query.encode("utf-8", "surrogateescape")
+    char_mask = 0
+    for byte in data:
+        char_mask |= 1 << _CHAR_BIT[byte]
+    bigram_mask = 0
+    if contiguous:
+        for first, second in zip(data, data[1:]):
+            bigram_mask |= 1 << _bigram_bit(first, second)
+    return char_mask, bigram_mask
+
+
+def _fuzzy_pattern(query: str) -> str:
+    """query의 글자가 순서대로 나오면 일치하는 정규식 (되추적 없는 a[^b]*b 형태)."""
+    parts = [re.escape(query[0])]
+    for char in query[1:]:
+        parts.append(f"[^{re.escape(char)}]*{re.escape(char)}")
+    return "".join(parts)
+
+
+class NameIndex:
+    """목록 이름의 소문자 사본과 행별 문자/바이그램 서명
+
+    서명은 이름에 나오는 바이트(UTF-8)와 연속한 두 바이트를 각각 64비트에 표시한
+    비트 집합이다. 검색어의 비트를 모두 가진 행만 실제 문자열 비교 대상이 되며,
+    서명 비교는 NumPy로 전체 행에 한 번에 수행한다 (NumPy가 없으면 서명 없이 비교).
+    영문 소문자/숫자/일부 기호는 비트가 겹치지 않아 한 글자 검색은 서명만으로 정확하다.
+    행이 끝에 추가되면 다음 sync에서 새 행만 색인하고, 중간에 추가/삭제되면 그 행만
+    색인해 끼워 넣거나 지운다 (insert/remove). 목록 전체가 바뀌면 처음부터 다시 색인한다.
+    """
+
+    def __init__(self):
+        self.lowered = []  # 소문자 이름 (.. 항목은 빈 문자열)
+        self.generation = 0  # 색인된 행이 잘릴 때마다 증가 (이전 검색 결과 재사용 판단)
+        self._char_sigs = None  # 행별 문자 서명 (NumPy uint64)
+        self._bigram_sigs = None  # 행별 바이그램 서명 (NumPy uint64)
+
+    def __len__(self) -> int:
+        return len(self.lowered)
+
+    def truncate(self, row: int):
+        """row 행부터 색인을 버린다 (다음 sync에서 다시 색인)."""
+        if row >= len(self.lowered):
+            return
+        del self.lowered[row:]
+        if self._char_sigs is not None:
+            self._char_sigs = self._char_sigs[:row]
+            self._bigram_sigs = self._bigram_sigs[:row]
+        self.generation += 1
+
+    def sync(self, items: EntryStore):
+        """아직 색인하지 않은 뒤쪽 행을 색인한다."""
+        start = len(self.lowered)
+        if start >= len(items):
+            return
+        lowered, signatures = self._index(items, start, len(items))
+        if signatures is not None:
+            if self._char_sigs is None or not len(self._char_sigs):
+                self._char_sigs, self._bigram_sigs = signatures
+            else:
+                numpy = load_numpy()
+                self._char_sigs = numpy.concatenate((self._char_sigs, signatures[0]))
+                self._bigram_sigs = numpy.concatenate((self._bigram_sigs, signatures[1]))
+        self.lowered.extend(lowered)
+
+    def insert(self, row: int, count: int, items: EntryStore):
+        """items의 row~row+count-1 행이 새로 끼워졌으므로 그 행만 색인해 끼워 넣는다."""
+        if not self.lowered or row > len(self.lowered):
+            # 아직 색인하지 않은 구간 (다음 sync에서 색인)
+            return
+        lowered, signatures = self._index(items, row, row + count)
+        self.lowered[row:row] = lowered
+        if signatures is not None and self._char_sigs is not None:
+            numpy = load_numpy()
+            self._char_sigs = numpy.insert(self._char_sigs, row, signatures[0])
+            self._bigram_sigs = numpy.insert(self._bigram_sigs, row, signatures[1])
+        self.generation += 1
+
+    def remove(self, first: int, last: int):
+        """first~last 행이 지워졌으므로 색인에서도 지운다."""
+        if first >= len(self.lowered):
+            return
+        del self.lowered[first:last + 1]
+        if self._char_sigs is not None:
+            numpy = load_numpy()
+            self._char_sigs = numpy.concatenate((self._char_sigs[:first], self._char_sigs[last + 1:]))
+            self._bigram_sigs = numpy.concatenate((self._bigram_sigs[:first], self._bigram_sigs[last + 1:]))
+        self.generation += 1
+
+    def _index(self, items: EntryStore, start: int, end: int) -> tuple:
+        """start~end-1 행의 (소문자 이름 목록, (문자 서명, 바이그램 서명) 또는 NumPy가 없으면 None)."""
+        # 이름마다 lower()를 부르지 않고 한 번에 변환 (이름에는 NUL이 없음)
+        joined = "\0".join(items.names[start:end]).lower()
+        lowered = joined.split("\0")
+        parents = items.flags[start:end].translate(_PARENT_TABLE)
+        row = parents.find(1)
+        while row != -1:
+            lowered[row] = ""
+            row = parents.find(1, row + 1)
+
+        numpy = load_numpy()
+        if numpy is None:
+            return lowered, None
+        if parents.count(1):
+            joined = "\0".join(lowered)
+        return lowered, self._signatures(numpy, joined)
+
+    @staticmethod
+    def _signatures(numpy, joined: str) -> tuple:
+        """NUL로 이어 붙인 이름들의 (문자 서명, 바이그램 서명) 배열."""
+        data = numpy.frombuffer((joined + "\0").encode("utf-8", "surrogateescape"), dtype=numpy.uint8)
+        ends = numpy.flatnonzero(data == 0)
+        starts = numpy.empty_like(ends)
+        starts[0] = 0
+        starts[1:] = ends[:-1] + 1
+
+        char_values = numpy.array([0] + [1 << bit for bit in _CHAR_BIT[1:]], dtype=numpy.uint64)
+        char_sigs = numpy.bitwise_or.reduceat(char_values[data], starts)
+
+        first = data[:-1].astype(numpy.uint16)
+        second = data[1:]
+        bits = ((first * 31) ^ second) & 63
+        bigram_values = numpy.left_shift(numpy.uint64(1), bits.astype(numpy.uint64))
+        bigram_values[(first == 0) | (second == 0)] = 0
+        if not len(bigram_values):
+            # .. 항목 하나뿐
+            return char_sigs, numpy.zeros(len(starts), dtype=numpy.uint64)
+        # 마지막 이름이 비어 있으면(..) 시작 위치가 바이그램 배열 끝을 넘으므로 당긴다 (값은 0)
+        bigram_sigs = numpy.bitwise_or.reduceat(bigram_values, numpy.minimum(starts, len(bigram_values) - 1))
+        return char_sigs, bigram_sigs
+
+    def search(self, query: str, fuzzy: bool, rows=None):
+        """rows(None이면 전체) 중 소문자 query와 일치하는 행 (오름차순).
+
+        fuzzy가 True면 query의 글자가 순서대로 나오는 이름과 일치한다.
+        NumPy가 있으면 int64 배열, 없으면 list를 반환한다.
+        """
+        if fuzzy:
+            search = re.compile(_fuzzy_pattern(query)).search
+
+            def matches(names):
+                return map(bool, map(search, names))
+        else:
+            def matches(names):
+                return map(operator.contains, names, itertools.repeat(query))
+
+        numpy = load_numpy()
+        lowered = self.lowered
+        if numpy is None or self._char_sigs is None:
+            rows = range(len(lowered)) if rows is None else rows
+            return list(itertools.compress(rows, matches(lowered[row] for row in rows)))
+
+        char_mask, bigram_mask = _query_masks(query, contiguous=not fuzzy)
+        char_mask, bigram_mask = numpy.uint64(char_mask), numpy.uint64(bigram_mask)
+        if rows is None:
+            char_sigs, bigram_sigs = self._char_sigs, self._bigram_sigs
+        else:
+            rows = numpy.asarray(rows, dtype=numpy.int64)
+            char_sigs, bigram_sigs = self._char_sigs[rows], self._bigram_sigs[rows]
+        passed = (char_sigs & char_mask) == char_mask
+        if bigram_mask:
+            passed &= (bigram_sigs & bigram_mask) == bigram_mask
+        rows = numpy.flatnonzero(passed) if rows is None else rows[passed]
+
+        if len(query) == 1 and query in _EXACT_CHARS:
+            return rows  # 서명만으로 정확
+        if not len(rows):
+            return rows
+
+        # 서명을 통과한 행만 문자열 비교 (이름 조회와 비교 모두 C 수준 반복)
+        names = operator.itemgetter(*rows.tolist())(lowered) if len(rows) > 1 else (lowered[rows[0]],)
+        return rows[numpy.fromiter(matches(names), dtype=bool, count=len(rows))]
+
+
+class QuickFilter:
+    """이름 빠른 필터 (ExplorerSortProxyModel.set_filter에 넘기는 행 필터)
+
+    이름에 query가 들어 있는(fuzzy면 글자가 순서대로 나오는) 행만 남긴다.
+    previous로 직전 필터를 넘기면, 검색어가 길어지기만 한 경우 전체 행 대신
+    직전 결과와 그 뒤에 추가된 행만 다시 확인한다.
+    """
+
+    def __init__(self, query: str, fuzzy: bool = False, previous: "QuickFilter" = None):
+        self.query = query.lower()
+        self.fuzzy = fuzzy
+        self._previous = previous if previous is not None and self._refines(previous) else None
+        self._result = None  # (색인 세대, 색인된 행 수, 일치 행)
+
+    def _refines(self, previous: "QuickFilter") -> bool:
+        """이 필터의 결과가 previous 결과의 부분집합인지."""
+        if not isinstance(previous, QuickFilter) or previous.fuzzy != self.fuzzy:
+            return False
+        if self.fuzzy:
+            return self.query.startswith(previous.query)
+        return previous.query in self.query
+
+    def rows(self, model) -> object:
+        """모델에서 일치하는 원본 행 (오름차순)."""
+        index = model.name_index()
+        count = len(index)
+        if self._result is not None and self._result[:2] == (index.generation, count):
+            return self._result[2]
+
+        candidates = None
+        base = self._result
+        if base is None and self._previous is not None:
+            base = self._previous._result
+        self._previous = None  # 필터가 줄줄이 참조되지 않도록 한 번만 사용
+        if base is not None and base[0] == index.generation:
+            # 이전 결과(자신 또는 직전 필터) + 그 뒤에 추가된 행만 확인
+            _, base_count, candidates = base
+            if base_count < count:
+                numpy = load_numpy()
+                if numpy is not None:
+                    candidates = numpy.concatenate((candidates, numpy.arange(base_count, count)))
+                else:
+                    candidates = [*candidates, *range(base_count, count)]
+
+        rows = index.search(self.query, self.fuzzy, candidates)
+        self._result = (index.generation, count, rows)
+        return rows
+
+    def rows_in_range(self, model, first: int, last: int) -> object:
+        """first~last 원본 행 중 일치하는 행 (새로 추가된 행 확인용)."""
+        return model.name_index().search(self.query, self.fuzzy, range(first, last + 1))
+
+
+class NameBuffer:
+    """목록 이름(원래 대소문자)을 NUL로 이어 붙인 UTF-8 바이트와 행별 시작/끝 위치
+
+    glob 필터가 리터럴 접두어/접미어를 전체 행에 대해 NumPy로 한 번에 비교하는 데 쓴다
+    (NumPy가 있을 때만 생성). .. 항목은 빈 이름으로 저장한다.
+    """
+
+    def __init__(self):
+        self.data = None  # 이름 바이트 (NumPy uint8, 이름마다 NUL로 끝남)
+        self.starts = None  # 행별 이름 시작 위치
+        self.ends = None  # 행별 이름 끝(NUL) 위치
+        self.generation = 0  # 색인된 행이 잘릴 때마다 증가
+
+    def __len__(self) -> int:
+        return 0 if self.ends is None else len(self.ends)
+
+    def truncate(self, row: int):
+        """row 행부터 버린다 (다음 sync에서 다시 채움)."""
+        if row >= len(self):
+            return
+        self.data = self.data[:self.starts[row]]
+        self.starts = self.starts[:row]
+        self.ends = self.ends[:row]
+        self.generation += 1
+
+    def sync(self, items: EntryStore):
+        """아직 담지 않은 뒤쪽 행을 담는다."""
+        start = len(self)
+        if start >= len(items):
+            return
+        offset = 0 if self.data is None else len(self.data)
+        data, starts, ends = self._encode(items, start, len(items), offset)
+        if self.data is None:
+            self.data, self.starts, self.ends = data, starts, ends
+        else:
+            numpy = load_numpy()
+            self.data = numpy.concatenate((self.data, data))
+            self.starts = numpy.concatenate((self.starts, starts))
+            self.ends = numpy.concatenate((self.ends, ends))
+
+    def insert(self, row: int, count: int, items: EntryStore):
+        """items의 row~row+count-1 행이 새로 끼워졌으므로 그 행만 담아 끼워 넣는다."""
+        if not len(self) or row > len(self):
+            # 아직 담지 않은 구간 (다음 sync에서 담음)
+            return
+        numpy = load_numpy()
+        offset = int(self.starts[row]) if row < len(self) else len(self.data)
+        data, starts, ends = self._encode(items, row, row + count, offset)
+        self.data = numpy.concatenate((self.data[:offset], data, self.data[offset:]))
+        self.starts = numpy.concatenate((self.starts[:row], starts, self.starts[row:] + len(data)))
+        self.ends = numpy.concatenate((self.ends[:row], ends, self.ends[row:] + len(data)))
+        self.generation += 1
+
+    def remove(self, first: int, last: int):
+        """first~last 행이 지워졌으므로 버퍼에서도 지운다."""
+        if first >= len(self):
+            return
+        numpy = load_numpy()
+        last = min(last, len(self) - 1)
+        begin, end = int(self.starts[first]), int(self.ends[last]) + 1
+        self.data = numpy.concatenate((self.data[:begin], self.data[end:]))
+        self.starts = numpy.concatenate((self.starts[:first], self.starts[last + 1:] - (end - begin)))
+        self.ends = numpy.concatenate((self.ends[:first], self.ends[last + 1:] - (end - begin)))
+        self.generation += 1
+
+    @staticmethod
+    def _encode(items: EntryStore, start: int, end: int, offset: int) -> tuple:
+        """start~end-1 행의 (이름 바이트, 시작 위치, 끝 위치) (위치는 offset부터)."""
+        numpy = load_numpy()
+        names = items.names[start:end]
+        parents = items.flags[start:end].translate(_PARENT_TABLE)
+        row = parents.find(1)
+        while row != -1:
+            names[row] = ""
+            row = parents.find(1, row + 1)
+
+        data = numpy.frombuffer(("\0".join(names) + "\0").encode("utf-8", "surrogateescape"), dtype=numpy.uint8)
+        ends = numpy.flatnonzero(data == 0) + offset
+        starts = numpy.empty_like(ends)
+        starts[0] = offset
+        starts[1:] = ends[:-1] + 1
+        return data, starts, ends
+
+
+def _literal_affixes(pattern: str) -> tuple[str, str, bool]:
+    """glob 패턴의 (리터럴 접두어, 리터럴 접미어, 접두어/접미어 비교만으로 정확한지).
+
+    와일드카드가 없는 패턴은 패턴 전체가 접두어다.
+    """
+    wildcards = [i for i, char in enumerate(pattern) if char in "*?["]
+    if not wildcards:
+        return pattern, "", True
+    prefix = pattern[:wildcards[0]]
+    suffix = pattern[max(i for i, char in enumerate(pattern) if char in "*?[]") + 1:]
+    exact = pattern.count("*") == 1 and not any(char in pattern for char in "?[]")
+    return prefix, suffix, exact
+
+
+class GlobFilter:
+    """glob 패턴 필터 (ExplorerSortProxyModel.set_filter에 넘기는 행 필터)
+
+    이미 로드된 목록에서 이름이 패턴과 일치하는 행만 남긴다 (디스크를 다시 스캔하지 않음).
+    패턴은 한 번만 컴파일하고(fnmatch.translate, 대소문자 구분), 리터럴 접두어/접미어로
+    후보를 먼저 줄인 뒤 후보만 정규식으로 확인한다. *.log처럼 *가 하나뿐인 패턴은
+    접두어/접미어 비교만으로 끝난다. .. 항목은 일치하지 않는다.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._match = re.compile(fnmatch.translate(pattern), re.DOTALL).match
+        self._prefix, self._suffix, self._exact = _literal_affixes(pattern)
+        self._result = None  # (버퍼 세대, 확인한 행 수, 일치 행)
+
+    def rows(self, model) -> object:
+        """모델에서 일치하는 원본 행 (오름차순)."""
+        numpy = load_numpy()
+        if numpy is None:
+            return self._match_rows(model, range(len(model.entries())))
+        buffer = model.name_buffer()
+        count = len(buffer)
+        result = self._result
+        if result is not None and result[0] == buffer.generation and result[1] <= count:
+            if result[1] < count:
+                # 뒤에 추가된 행만 확인
+                tail = self._match_rows(model, numpy.arange(result[1], count))
+                result = (buffer.generation, count, numpy.concatenate((result[2], tail)))
+        else:
+            result = (buffer.generation, count, self._match_rows(model, None))
+        self._result = result
+        return result[2]
+
+    def rows_in_range(self, model, first: int, last: int) -> object:
+        """first~last 원본 행 중 일치하는 행 (새로 추가된 행 확인용)."""
+        numpy = load_numpy()
+        if numpy is None:
+            return self._match_rows(model, range(first, last + 1))
+        return self._match_rows(model, numpy.arange(first, last + 1))
+
+    def _match_rows(self, model, rows):
+        """rows(None이면 전체) 중 일치하는 행."""
+        items = model.entries()
+        numpy = load_numpy()
+        if numpy is None:
+            names = items.names
+            flags = items.flags
+            return [row for row in rows if not flags[row] & FLAG_PARENT and self._match(names[row])]
+
+        buffer = model.name_buffer()
+        data = buffer.data
+        prefix = self._prefix.encode("utf-8", "surrogateescape")
+        suffix = self._suffix.encode("utf-8", "surrogateescape")
+        starts, ends = (buffer.starts, buffer.ends) if rows is None else (buffer.starts[rows], buffer.ends[rows])
+        lengths = ends - starts
+        if self._prefix == self.pattern:
+            passed = lengths == len(prefix)  # 와일드카드 없는 패턴: 이름 전체 비교
+        else:
+            passed = lengths >= max(len(prefix) + len(suffix), 1)  # .. 항목(빈 이름) 제외
+        candidates = numpy.flatnonzero(passed)
+        # 길이가 충분한 후보만 바이트 단위로 비교 (다른 이름의 바이트를 읽지 않음)
+        for i, byte in enumerate(prefix):
+            candidates = candidates[data[starts[candidates] + i] == byte]
+        for i, byte in enumerate(suffix):
+            candidates = candidates[data[ends[candidates] - len(suffix) + i] == byte]
+        if rows is not None:
+            candidates = rows[candidates]
+        if self._exact or not len(candidates):
+            return candidates
+
+        names = items.names
+        selected = operator.itemgetter(*candidates.tolist())(names) if len(candidates) > 1 \
+            else (names[candidates[0]],)
+        return candidates[numpy.fromiter(map(bool, map(self._match, selected)), dtype=bool, count=len(candidates))]
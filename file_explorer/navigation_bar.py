@@ -1,5 +1,5 @@
-"""네비게이션 바 - 뒤로/앞으로 버튼 + 경로 입력 필드"""
-from PyQt6.QtCore import Qt, pyqtSignal
+"""네비게이션 바 - 뒤로/앞으로 버튼 + 경로 입력 필드 + 이름 필터"""
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QLineEdit
 
 
@@ -9,6 +9,8 @@ class NavigationBar(QWidget):
     path_changed = pyqtSignal(str)  # 사용자가 경로를 변경했을 때
     back_requested = pyqtSignal()  # 뒤로가기 요청
     forward_requested = pyqtSignal()  # 앞으로가기 요청
+    filter_changed = pyqtSignal(str, bool)  # 이름 필터 입력 변경 (검색어, 퍼지 여부)
+    filter_focused = pyqtSignal()  # 이름 필터 입력에 포커스가 들어왔을 때
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -37,14 +39,47 @@ class NavigationBar(QWidget):
         self.path_input.returnPressed.connect(self._on_path_input)
         layout.addWidget(self.path_input)
 
+        # 이름 필터 입력 필드 (입력할 때마다 현재 목록을 거름)
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("이름 필터...")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.setMaximumWidth(200)
+        self.filter_input.textChanged.connect(self._on_filter_input)
+        self.filter_input.installEventFilter(self)
+        layout.addWidget(self.filter_input)
+
+        # 퍼지 검색 토글 (글자가 순서대로 나오면 일치)
+        self.fuzzy_btn = QPushButton("~")
+        self.fuzzy_btn.setFixedWidth(24)
+        self.fuzzy_btn.setCheckable(True)
+        self.fuzzy_btn.setToolTip("퍼지 검색")
+        self.fuzzy_btn.toggled.connect(self._on_filter_input)
+        layout.addWidget(self.fuzzy_btn)
+
         self.setLayout(layout)
 
+    def eventFilter(self, watched, event) -> bool:
+        """필터 입력에 포커스가 들어오면 알린다 (이름 인덱스 미리 준비용)."""
+        if watched is self.filter_input and event.type() == QEvent.Type.FocusIn:
+            self.filter_focused.emit()
+        return super().eventFilter(watched, event)
+
     def _on_path_input(self):
         """사용자가 경로를 입력했을 때."""
         path = self.path_input.text().strip()
         if path:
             self.path_changed.emit(path)
 
+    def _on_filter_input(self, *args):
+        """이름 필터 입력이나 퍼지 토글이 바뀌었을 때."""
+        self.filter_changed.emit(self.filter_input.text(), self.fuzzy_btn.isChecked())
+
+    def clear_filter(self):
+        """이름 필터 입력을 비운다 (filter_changed는 발생하지 않음)."""
+        self.filter_input.blockSignals(True)
+        self.filter_input.clear()
+        self.filter_input.blockSignals(False)
+
     def update_path(self, path: str):
         """현재 경로를 표시한다."""
         self.path_input.setText(path)
@@ -0,0 +1,188 @@
+"""다음에 열 가능성이 큰 디렉토리를 유휴 시간에 미리 스캔 (메모리 예산, 느린 마운트 제외)"""
+import os
+from collections import OrderedDict, deque
+from PyQt6.QtCore import QObject, pyqtSignal
+from .entry_store import EntryStore
+from .instrumentation import Instrumentation
+from .backends import FileSystemBackend, local_backend
+from .listing_cache import ListingCache
+from .loader import PRIORITY_PREFETCH, SortedChunk
+from .scan_scheduler import ScanScheduler, shared_scan_scheduler
+
+
+def is_under(path: str, roots) -> bool:
+    """path가 roots 중 하나이거나 그 아래에 있는지 여부."""
+    for root in roots:
+        if path == root or path.startswith(os.path.join(root, "")):
+            return True
+    return False
+
+
+class Prefetcher(QObject):
+    """후보 디렉토리를 스캔 스케줄러에서 가장 낮은 우선순위로 스캔해 목록 캐시에 넣는다
+
+    set_candidates()로 받은 후보를 앞에서부터 하나씩 스캔하며, 이미 캐시에 있거나
+    느린 마운트(slow_mounts) 아래의 디렉토리는 건드리지 않는다. 미리 스캔은 PRIORITY_PREFETCH로
+    실행되어 (다른 창을 포함한) 모든 전경 로딩이 있는 동안 청크 사이에서 멈추고, 스캔 중인
+    디렉토리를 창에서 열면 그 스캔에 합류하므로 같은 디렉토리를 다시 읽지 않는다.
+    pause()하면 resume()까지 다음 후보를 시작하지 않는다. 미리 스캔해 두고 아직 열지 않은
+    목록은 max_bytes 안에서만 보관하며, 넘으면 오래된 것부터 캐시에서 뺀다 (스캔 중에 예산을
+    넘는 디렉토리는 포기). 목록을 실제로 열면 claim()으로 예산에서 제외한다.
+    """
+
+    listing_ready = pyqtSignal(str, object, object)  # 캐시에 넣은 경로, 목록 (EntryStore), 서명
+
+    # 예산 확인에 쓰는 행당 대략적인 바이트 (이름 문자열 제외)
+    ROW_BYTES = 96
+
+    def __init__(self, listing_cache: ListingCache, max_bytes: int = 32 * 1024 * 1024, slow_mounts=(),
+                 instrumentation: Instrumentation = None, backend: FileSystemBackend = None,
+                 scheduler: ScanScheduler = None, parent=None):
+        super().__init__(parent)
+        self.listing_cache = listing_cache
+        self.backend = backend if backend is not None else local_backend()  # 파일 시스템 백엔드
+        self.scheduler = scheduler if scheduler is not None else shared_scan_scheduler()  # 스캔을 요청할 스케줄러
+        self.max_bytes = max_bytes  # 아직 열지 않은 미리 스캔한 목록의 최대 전체 바이트
+        self.slow_mounts = tuple(self.backend.abspath(path) for path in slow_mounts)  # 미리 스캔하지 않을 경로
+        self.instrumentation = instrumentation
+        self._queue = deque()  # 스캔할 후보 (앞이 먼저)
+        self._paused = False
+        self._scan = None  # 진행 중인 미리 스캔 (SharedScan)
+        self._scan_path = None  # 진행 중인 미리 스캔의 경로
+        self._scan_chunks = []  # 진행 중인 미리 스캔에서 받은 청크
+        self._scan_bytes = 0  # 진행 중인 미리 스캔 목록의 대략적인 바이트
+        self._scan_start = None  # 계측 중 미리 스캔 시작 시각
+        self._prefetched = OrderedDict()  # 미리 스캔해 캐시에 넣은 경로 -> 바이트 (오래된 순)
+        self._prefetched_bytes = 0
+
+    def set_candidates(self, paths):
+        """스캔할 후보를 바꾼다 (가능성이 큰 순서)."""
+        candidates = []
+        for path in paths:
+            if path in candidates or path in self.listing_cache or is_under(path, self.slow_mounts):
+                continue
+            candidates.append(path)
+        if self._scan is not None:
+            if self._scan_path in candidates:
+                # 진행 중인 후보는 이어서 스캔한다
+                candidates.remove(self._scan_path)
+            else:
+                self._stop_scan()
+        self._queue = deque(candidates)
+        self._start_next()
+
+    def pause(self):
+        """전경 로딩 중: resume()까지 다음 후보를 시작하지 않는다 (진행 중인 스캔은 스케줄러가 멈춤)."""
+        self._paused = True
+
+    def resume(self):
+        """미리 스캔을 다시 시작한다."""
+        self._paused = False
+        self._start_next()
+
+    def claim(self, path: str):
+        """path 목록을 열었다: 미리 스캔 예산에서 빼고 후보에서도 제외한다.
+
+        그 디렉토리를 미리 스캔 중이었으면 스캔은 연 쪽에 맡기고 빠진다 (먼저 합류한 뒤 호출).
+        """
+        nbytes = self._prefetched.pop(path, None)
+        if nbytes is not None:
+            self._prefetched_bytes -= nbytes
+        if path in self._queue:
+            self._queue.remove(path)
+        if self._scan is not None and self._scan_path == path:
+            self._stop_scan()
+            self._start_next()
+
+    def pending(self) -> int:
+        """아직 끝나지 않은 후보 수 (진행 중인 스캔 포함)."""
+        return len(self._queue) + (self._scan is not None)
+
+    def _start_next(self):
+        """멈춰 있지 않고 진행 중인 스캔이 없으면 다음 후보의 스캔을 요청한다."""
+        while self._scan is None and not self._paused and self._queue:
+            path = self._queue.popleft()
+            if path in self.listing_cache:
+                continue
+            if self.instrumentation is not None:
+                self._scan_start = self.instrumentation.now()
+            # 창에서 여는 전체 목록 스캔과 같은 요청이라 서로 합류할 수 있다
+            scan = self.scheduler.scan_directory(self, path, backend=self.backend,
+                                                 instrumentation=self.instrumentation,
+                                                 priority=PRIORITY_PREFETCH)
+            self._scan, self._scan_path = scan, path
+            self._scan_chunks, self._scan_bytes = [], 0
+            scan.chunk_ready.connect(self._on_chunk_ready)
+            scan.finished.connect(self._on_finished)
+            # 다른 창이 먼저 시작한 스캔이면 그 창이 지금까지 받은 항목부터 모은다
+            for chunk in scan.received(self):
+                if not self._add_chunk(chunk):
+                    break
+
+    def scan_results(self, scan) -> list:
+        """진행 중인 미리 스캔에서 지금까지 받은 청크 (늦게 합류한 창이 따라잡는 데 씀)."""
+        return list(self._scan_chunks) if scan is self._scan else []
+
+    def _stop_scan(self):
+        """진행 중인 미리 스캔에서 빠진다 (다른 구독자가 없으면 스캔은 취소된다)."""
+        scan = self._scan
+        self._scan = self._scan_path = None
+        self._scan_chunks = []
+        scan.chunk_ready.disconnect(self._on_chunk_ready)
+        scan.finished.disconnect(self._on_finished)
+        scan.unsubscribe(self)
+
+    def _add_chunk(self, chunk: SortedChunk) -> bool:
+        """청크를 모은다. 예산을 넘으면 이 후보를 포기하고 다음 후보로 넘어가 False."""
+        self._scan_bytes += self.ROW_BYTES * len(chunk) + sum(map(len, chunk.names))
+        if self._scan_bytes > self.max_bytes:
+            self._stop_scan()
+            self._start_next()
+            return False
+        self._scan_chunks.append(chunk)
+        return True
+
+    def _on_chunk_ready(self, chunk: SortedChunk):
+        if self.sender() is self._scan:
+            self._add_chunk(chunk)
+
+    def _on_finished(self):
+        """미리 스캔한 목록을 기본 정렬 순서로 만들어 캐시에 넣고 다음 후보로 넘어간다."""
+        scan = self.sender()
+        if scan is not self._scan:
+            return
+        path, chunks = self._scan_path, self._scan_chunks
+        self._stop_scan()
+        if scan.signature is not None:
+            store = EntryStore(path)
+            parent_dir = os.path.dirname(path)
+            if parent_dir and parent_dir != path:
+                store.append_parent()
+            keys = list(map(store.sort_key, range(len(store))))
+            for chunk in chunks:
+                store.extend(chunk)
+                keys += chunk.keys
+            # 청크마다 이미 정렬되어 있으므로 정렬은 구간 병합만 한다
+            store = store.select(sorted(range(len(keys)), key=keys.__getitem__))
+            if self.instrumentation is not None:
+                self.instrumentation.record("prefetch.scan", "prefetch", self._scan_start, path=path,
+                                            entries=len(store))
+            self._store_listing(path, store, scan.signature)
+        self._start_next()
+
+    def _store_listing(self, path: str, store: EntryStore, signature: tuple):
+        """미리 스캔한 목록을 캐시에 넣고 예산을 넘으면 오래된 것부터 뺀다."""
+        if path in self.listing_cache:
+            # 그 사이 전경에서 로드됨
+            return
+        self.listing_cache.put(path, store, signature)
+        if path not in self.listing_cache:
+            return
+        nbytes = store.nbytes()
+        self._prefetched[path] = nbytes
+        self._prefetched_bytes += nbytes
+        while self._prefetched_bytes > self.max_bytes and self._prefetched:
+            old_path, old_bytes = self._prefetched.popitem(last=False)
+            self._prefetched_bytes -= old_bytes
+            self.listing_cache.invalidate(old_path)
+        self.listing_ready.emit(path, store, signature)
@@ -0,0 +1,415 @@
+"""Qt 없이 쓰는 디렉토리 스캔 코어와 스트리밍 명령줄 도구
+
+디렉토리 항목 나열, glob 필터, stat, 재귀 glob 검색을 순수 Python 제너레이터로 제공한다.
+위젯의 로더(DirectoryLoader, RecursiveSearchLoader)는 이 코어를 Qt 시그널로 감싼 것이고,
+배치 작업이나 서버에서는 QApplication 없이 직접 쓸 수 있다.
+
+    python -m file_explorer.scan [경로] [--glob 패턴] [--recursive] [--format ndjson|csv]
+                                 [--no-stat] [--workers N]
+
+출력은 항목마다 한 줄 (경로는 시작 경로 기준 상대 경로)이다. type은 dir, file, symlink
+(따라가지 않음), other(장치, FIFO 등) 중 하나다.
+NDJSON: {"path": "src/a.py", "type": "file", "size": 120, "mtime": 1700000000.5}
+CSV: path,type,size,mtime 헤더 뒤에 항목마다 한 행
+"""
+import fnmatch
+import os
+import queue
+import re
+import sys
+from contextlib import closing
+from typing import TYPE_CHECKING, Callable, Iterator
+from .backends import FileSystemBackend, local_backend
+from .entry_store import EntryStore, FLAG_DIR, FLAG_FILE, FLAG_LINK, UNKNOWN
+
+if TYPE_CHECKING:
+    from .instrumentation import Instrumentation
+
+
+def is_recursive_pattern(pattern: str | None) -> bool:
+    """패턴이 여러 경로 단계에 걸치는지(** 또는 경로 구분자 포함) 여부."""
+    return bool(pattern) and ("**" in pattern or os.sep in pattern or "/" in pattern)
+
+
+def glob_matcher(pattern: str | None) -> Callable[[str], object] | None:
+    """이름 하나에 대한 glob 패턴 비교 함수 (패턴이 없으면 None). 패턴은 한 번만 컴파일한다.
+
+    fnmatch.fnmatch와 같은 규칙이다 (대소문자를 구분하지 않는 OS에서는 대소문자 무시).
+    """
+    if not pattern:
+        return None
+    match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    if os.path.normcase("A") == "A":
+        return match
+    return lambda name: match(os.path.normcase(name))
+
+
+def entry_stat(entry) -> tuple:
+    """항목의 (크기, 수정시간)을 구한다 (심볼릭 링크는 따라가지 않음). 실패하면 (None, None)."""
+    try:
+        stat_info = entry.stat(follow_symlinks=False)
+        return stat_info.st_size, stat_info.st_mtime
+    except OSError:
+        # 권한 없음, 스캔 중 삭제됨 등
+        return None, None
+
+
+def iter_entries(path: str, glob_pattern: str = None, backend: FileSystemBackend = None) -> Iterator:
+    """디렉토리의 항목(os.DirEntry 호환 객체) 중 glob 패턴과 일치하는 것을 차례로 반환한다.
+
+    디렉토리를 열 수 없으면 OSError를 그대로 올린다. 제너레이터를 닫으면 목록도 닫힌다.
+    """
+    backend = backend if backend is not None else local_backend()
+    matcher = glob_matcher(glob_pattern)
+    with backend.list(path) as entries:
+        if matcher is None:
+            yield from entries
+            return
+        for entry in entries:
+            if matcher(entry.name):
+                yield entry
+
+
+def scan(path: str, glob_pattern: str = None, backend: FileSystemBackend = None, stat: bool = True,
+         batch_size: int = 1024) -> Iterator[EntryStore]:
+    """디렉토리 하나를 스캔해 항목을 batch_size개씩 EntryStore로 반환한다 (디렉토리 순서).
+
+    stat이 False면 크기/수정시간은 알 수 없음(UNKNOWN)으로 둔다.
+    """
+    batch = EntryStore(path)
+    # 항목이 많을 때를 위해 EntryStore.append 대신 컬럼에 직접 넣는다
+    names, sizes, mtimes, flags = batch.names, batch.sizes, batch.mtimes, batch.flags
+    with closing(iter_entries(path, glob_pattern, backend)) as entries:
+        for entry in entries:
+            names.append(entry.name)
+            flags.append(FLAG_DIR if entry.is_dir(follow_symlinks=False)
+                         else FLAG_FILE if entry.is_file(follow_symlinks=False)
+                         else FLAG_LINK if entry.is_symlink() else 0)
+            size = modified = None
+            if stat:
+                size, modified = entry_stat(entry)
+            sizes.append(UNKNOWN if size is None else size)
+            mtimes.append(UNKNOWN if modified is None else modified)
+            if len(names) >= batch_size:
+                yield batch
+                batch = EntryStore(path)
+                names, sizes, mtimes, flags = batch.names, batch.sizes, batch.mtimes, batch.flags
+    if batch:
+        yield batch
+
+
+class PathPattern:
+    """경로 단계별 glob 패턴 (`**`는 0개 이상의 디렉토리와 일치)
+
+    디렉토리를 내려가며 "다음에 맞춰야 할 패턴 단계" 집합(상태)을 갱신한다.
+    상태 집합이 비면 그 아래에서는 일치할 수 있는 경로가 없으므로 가지치기한다.
+    """
+
+    def __init__(self, pattern: str):
+        parts = []
+        for part in re.split(r"[\\/]" if os.sep == "\\" else "/", pattern):
+            if not part or part == ".":
+                continue
+            if part == "**" and parts and parts[-1] == "**":
+                continue
+            parts.append(part)
+        if not parts:
+            raise ValueError(f"빈 검색 패턴: {pattern!r}")
+
+        self.parts = parts
+        self._matchers = [None if part == "**" else re.compile(fnmatch.translate(part)).match
+                          for part in parts]
+        self.start = self._closure({0})
+        self._fixed_steps = {}  # 이름과 무관하게 정해지는(** 단계뿐인) 상태 집합의 다음 상태
+
+    def _closure(self, states) -> frozenset:
+        """`**` 단계는 0개 디렉토리와도 일치하므로 다음 단계도 상태에 넣는다."""
+        result = set(states)
+        for state in sorted(states):
+            while state < len(self.parts) and self._matchers[state] is None:
+                state += 1
+                result.add(state)
+        return frozenset(result)
+
+    def step(self, states: frozenset, name: str) -> frozenset:
+        """이름 하나를 지난 뒤의 상태 집합."""
+        fixed = self._fixed_steps.get(states)
+        if fixed is not None:
+            return fixed
+        matchers = self._matchers
+        result = set()
+        name_dependent = False
+        for state in states:
+            if state >= len(matchers):
+                continue
+            matcher = matchers[state]
+            if matcher is None:
+                result.add(state)  # **는 이 디렉토리를 삼키고 계속 유지
+            else:
+                name_dependent = True
+                if matcher(name):
+                    result.add(state + 1)
+        result = self._closure(result) if result else frozenset()
+        if not name_dependent:
+            self._fixed_steps[states] = result  # 예: `**`만 남은 상태는 모든 이름에서 같다
+        return result
+
+    def accepts(self, states: frozenset) -> bool:
+        """패턴 전체와 일치하는 상태인지."""
+        return len(self.parts) in states
+
+    def can_descend(self, states: frozenset) -> bool:
+        """하위 디렉토리에서 더 일치할 수 있는지."""
+        return any(state < len(self.parts) for state in states)
+
+
+class TreeSearch:
+    """루트 아래 하위 트리를 병렬로 훑으며 경로 패턴과 일치하는 항목을 찾는 검색
+
+    workers개 스레드가 디렉토리 하나씩 스캔하고, 일치할 수 없는 하위 디렉토리는
+    내려가지 않는다. 항목 이름은 루트 기준 상대 경로다. 대기 중인 디렉토리는 깊이 우선
+    스택으로 관리하고 스레드 결과 큐의 크기를 제한해 메모리 사용량을 묶어 둔다.
+    모든 대기는 POLL_INTERVAL마다 취소 여부(cancel() 또는 cancelled())를 확인한다.
+    열 수 없는 디렉토리(권한 없음 등)는 건너뛴다.
+    """
+
+    # 스레드가 한 번에 결과 큐에 넣는 최대 일치 항목 수 (큰 디렉토리도 나눠서 스트리밍)
+    PARTIAL_RESULT_SIZE = 1024
+    # 대기 간격(초): 이 간격마다 취소 여부를 확인한다
+    POLL_INTERVAL = 0.01
+
+    def __init__(self, path: str, pattern: str, backend: FileSystemBackend = None, workers: int = 4,
+                 stat: bool = True, cancelled: Callable[[], bool] = None,
+                 instrumentation: "Instrumentation" = None):
+        self.path = path
+        self.glob_pattern = pattern
+        self.pattern = PathPattern(pattern)
+        self.backend = backend if backend is not None else local_backend()
+        self.workers = max(1, workers)  # 디렉토리 스캔 스레드 수
+        self.stat = stat  # False면 크기/수정시간을 구하지 않음
+        self.instrumentation = instrumentation  # 성능 계측기 (None이면 계측 안 함)
+        self._cancelled_by = cancelled  # 바깥의 취소 여부 (예: 로더의 취소 플래그)
+        self._stopped = False
+        self._results = queue.Queue(maxsize=self.workers * 4)  # (일치 항목, 하위 디렉토리, 완료 여부)
+
+    def cancel(self):
+        """검색을 멈춘다 (스레드가 끝나기를 기다리지 않음)."""
+        self._stopped = True
+
+    def cancelled(self) -> bool:
+        """검색이 취소되었는지 여부."""
+        return self._stopped or (self._cancelled_by is not None and self._cancelled_by())
+
+    def batches(self, heartbeat: bool = False) -> Iterator[EntryStore]:
+        """일치 항목을 찾는 대로 EntryStore 묶음으로 반환한다 (순서는 정해지지 않음).
+
+        heartbeat가 True면 POLL_INTERVAL 동안 결과가 없을 때 빈 묶음을 반환한다
+        (받는 쪽이 기다리는 동안에도 모은 항목을 제때 보낼 수 있도록). 제너레이터를
+        닫거나 취소하면 스레드는 진행 중인 디렉토리까지만 보고 멈춘다.
+        """
+        from concurrent.futures import ThreadPoolExecutor  # 검색할 때만 필요 (import 비용 지연)
+        pool = ThreadPoolExecutor(self.workers)
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            search_start = instrumentation.now()
+            directories = matched = 0
+        try:
+            stack = [("", self.pattern.start)]  # 검색할 (상대 경로, 상태)
+            running = 0  # 스캔 중인 디렉토리 수
+
+            while stack or running:
+                # 스레드 수의 두 배까지만 미리 넘겨 대기 디렉토리는 스택에 남긴다
+                while stack and running < self.workers * 2:
+                    relative, states = stack.pop()
+                    pool.submit(self._run_directory, relative, states)
+                    running += 1
+
+                try:
+                    matches, subdirectories, done = self._results.get(timeout=self.POLL_INTERVAL)
+                except queue.Empty:
+                    matches, subdirectories, done = None, (), False
+
+                if self.cancelled():
+                    return
+                if isinstance(matches, Exception):
+                    # 스레드에서 난 (OSError가 아닌) 오류는 결과를 빠뜨리지 않고 호출한 쪽으로 올린다
+                    raise matches
+
+                stack.extend(subdirectories)
+                if done:
+                    running -= 1
+                if instrumentation is not None:
+                    directories += done
+                    matched += len(matches) if matches else 0
+                if matches:
+                    yield matches
+                elif heartbeat:
+                    yield EntryStore(self.path)
+
+            if instrumentation is not None:
+                instrumentation.record("search.run", "loader", search_start, path=self.path,
+                                       pattern=self.glob_pattern, directories=directories, matches=matched)
+        finally:
+            self._stopped = True
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run_directory(self, relative: str, states: frozenset):
+        """스레드 작업: 디렉토리 하나를 스캔한다 (예외는 결과 큐로 넘김)."""
+        try:
+            self._scan_directory(relative, states)
+        except Exception as e:
+            self._put_result((e, (), True))
+
+    def _scan_directory(self, relative: str, states: frozenset):
+        """디렉토리 하나에서 일치 항목과 내려갈 하위 디렉토리를 찾는다."""
+        pattern = self.pattern
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = instrumentation.now()
+        step, accepts, can_descend = pattern.step, pattern.accepts, pattern.can_descend
+        prefix = relative + os.sep if relative else ""
+        matches = EntryStore(self.path)
+        # 항목이 많을 때를 위해 EntryStore.append 대신 컬럼에 직접 넣는다 (scan()과 같은 방식)
+        names, sizes, mtimes, flags = matches.names, matches.sizes, matches.mtimes, matches.flags
+        subdirectories = []
+        try:
+            with self.backend.list(os.path.join(self.path, relative)) as entries:
+                for entry in entries:
+                    if self.cancelled():
+                        return
+                    next_states = step(states, entry.name)
+                    if not next_states:
+                        continue
+
+                    name = prefix + entry.name
+                    is_dir = entry.is_dir(follow_symlinks=False)  # 심볼릭 링크는 따라가지 않음
+                    if is_dir and can_descend(next_states):
+                        subdirectories.append((name, next_states))
+                    if accepts(next_states):
+                        names.append(name)
+                        flags.append(FLAG_DIR if is_dir else FLAG_FILE if entry.is_file(follow_symlinks=False)
+                                     else FLAG_LINK if entry.is_symlink() else 0)
+                        size = modified = None
+                        if self.stat:
+                            size, modified = entry_stat(entry)
+                        sizes.append(UNKNOWN if size is None else size)
+                        mtimes.append(UNKNOWN if modified is None else modified)
+                        if len(names) >= self.PARTIAL_RESULT_SIZE:
+                            if not self._put_result((matches, (), False)):
+                                return
+                            matches = EntryStore(self.path)
+                            names, sizes, mtimes, flags = matches.names, matches.sizes, matches.mtimes, matches.flags
+        except OSError:
+            # 권한 없음, 검색 중 삭제됨 등으로 읽을 수 없는 디렉토리는 건너뛴다
+            pass
+        if instrumentation is not None:
+            instrumentation.record("search.directory", "loader", start, path=relative or ".")
+        self._put_result((matches, subdirectories, True))
+
+    def _put_result(self, result: tuple) -> bool:
+        """결과 큐에 자리가 날 때까지 기다렸다가 넣는다. 취소되면 False."""
+        while not self.cancelled():
+            try:
+                self._results.put(result, timeout=self.POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+
+def walk(path: str, glob_pattern: str = None, recursive: bool = False, backend: FileSystemBackend = None,
+         stat: bool = True, workers: int = 4) -> Iterator[EntryStore]:
+    """경로 아래 항목을 EntryStore 묶음으로 반환한다 (이름은 path 기준 상대 경로).
+
+    recursive가 False이고 패턴이 한 단계면 path 디렉토리만, 아니면 하위 트리 전체에서
+    찾는다 (recursive이면 한 단계 패턴은 모든 깊이의 이름과 비교).
+    """
+    if recursive:
+        glob_pattern = "**/" + glob_pattern if glob_pattern else "**"
+    if is_recursive_pattern(glob_pattern):
+        yield from TreeSearch(path, glob_pattern, backend, workers, stat).batches()
+    else:
+        yield from scan(path, glob_pattern, backend, stat)
+
+
+def _entry_type(flags: int) -> str:
+    """항목 종류 문자열."""
+    if flags & FLAG_DIR:
+        return "dir"
+    if flags & FLAG_FILE:
+        return "file"
+    return "symlink" if flags & FLAG_LINK else "other"
+
+
+# 플래그 값(바이트)별 항목 종류 문자열
+_ENTRY_TYPES = [_entry_type(flags) for flags in range(256)]
+
+
+def write_ndjson(batches, out):
+    """항목을 한 줄에 JSON 객체 하나로 쓴다 (알 수 없는 크기/수정시간은 null)."""
+    from json.encoder import encode_basestring_ascii  # 출력할 때만 필요 (위젯 import 비용을 늘리지 않음)
+    # json.dumps(문자열)과 같은 출력이지만 항목마다 인코더를 만들지 않는다
+    quote = encode_basestring_ascii
+    types = _ENTRY_TYPES
+    for batch in batches:
+        lines = []
+        for name, size, modified, flags in zip(batch.names, batch.sizes, batch.mtimes, batch.flags):
+            lines.append(f'{{"path": {quote(name)}, "type": "{types[flags]}", '
+                         f'"size": {"null" if size == UNKNOWN else size}, '
+                         f'"mtime": {"null" if modified == UNKNOWN else repr(modified)}}}\n')
+        out.write("".join(lines))
+
+
+def write_csv(batches, out):
+    """path,type,size,mtime 헤더와 항목별 행을 쓴다 (알 수 없는 크기/수정시간은 빈 칸)."""
+    import csv  # CSV 출력에서만 필요
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(("path", "type", "size", "mtime"))
+    types = _ENTRY_TYPES
+    for batch in batches:
+        writer.writerows(
+            (name, types[flags], "" if size == UNKNOWN else size, "" if modified == UNKNOWN else modified)
+            for name, size, modified, flags in zip(batch.names, batch.sizes, batch.mtimes, batch.flags)
+        )
+
+
+def main(argv=None) -> int:
+    """명령줄 진입점: 경로 아래 항목을 NDJSON 또는 CSV로 표준 출력에 스트리밍한다."""
+    import argparse  # 명령줄에서만 필요
+    parser = argparse.ArgumentParser(prog="python -m file_explorer.scan",
+                                     description="디렉토리 항목을 NDJSON/CSV로 스트리밍한다 (Qt 불필요).")
+    parser.add_argument("path", nargs="?", default=".", help="스캔할 디렉토리 (압축 파일도 가능, 기본: 현재 디렉토리)")
+    parser.add_argument("-g", "--glob", help="이름 glob 패턴 (**나 /가 있으면 하위 트리 검색)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="하위 디렉토리까지 모든 깊이에서 찾기")
+    parser.add_argument("-f", "--format", choices=("ndjson", "csv"), default="ndjson", help="출력 형식")
+    parser.add_argument("--no-stat", action="store_true", help="크기/수정시간을 구하지 않음 (stat 생략)")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="하위 트리 검색 스레드 수 (기본: 4)")
+    args = parser.parse_args(argv)
+
+    from .archives import archive_backend  # 압축 파일 안도 스캔 (Qt 없이 동작)
+    backend = archive_backend()
+    if not backend.is_dir(args.path):
+        print(f"디렉토리가 아닙니다: {args.path}", file=sys.stderr)
+        return 2
+
+    # 이름의 잘못된 바이트(surrogateescape)도 그대로 내보낸다
+    out = open(sys.stdout.fileno(), "w", encoding="utf-8", errors="surrogateescape", newline="",
+               buffering=1 << 16, closefd=False)
+    batches = walk(args.path, args.glob, args.recursive, backend, not args.no_stat, args.workers)
+    try:
+        with closing(batches):
+            (write_csv if args.format == "csv" else write_ndjson)(batches, out)
+        out.flush()
+    except BrokenPipeError:
+        # 출력을 읽는 쪽이 먼저 끝남 (예: | head): 남은 출력을 버리고 조용히 끝냄
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except OSError as e:
+        out.flush()
+        print(f"스캔 오류: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
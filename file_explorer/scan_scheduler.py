@@ -0,0 +1,187 @@
+"""여러 탐색기 창이 공유하는 디렉토리 스캔 스케줄러 (같은 디렉토리는 한 번만 스캔, 창 우선순위)"""
+from PyQt6.QtCore import QObject, pyqtSignal
+from .backends import FileSystemBackend
+from .instrumentation import Instrumentation
+from .loader import BatchPolicy, DirectoryLoader, LoaderPool, PRIORITY_VISIBLE, SortedChunk, StatBatch
+from .search import RecursiveSearchLoader
+
+
+class SharedScan(QObject):
+    """로더 하나의 결과를 구독한 모든 모델(과 미리 스캔기)에 나눠 주는 스캔
+
+    로더의 시그널을 GUI 스레드에서 받아 같은 스레드의 구독자에게 다시 보낸다 (직접 연결이라
+    시그널 발송이 끝나면 모든 구독자가 처리를 마친 것이고, 그때 로더에 청크 처리를 알리므로
+    backpressure는 가장 느린 구독자 기준이다). 받은 청크는 보관하지 않는다. 스캔 도중 구독한 쪽은
+    received()로 먼저 구독한 쪽이 지금까지 받은 결과(stat 결과 반영됨)를 복사해 따라잡으므로,
+    구독자는 scan_results(scan) 메서드로 받은 항목을 정렬된 청크 목록으로 내줄 수 있어야 한다.
+    로더의 우선순위는 구독자 우선순위 중 가장 높은 것이고, 구독자가 모두 떠나면 로더를 취소한다.
+    """
+
+    chunk_ready = pyqtSignal(object)  # 청크 (SortedChunk)
+    stats_ready = pyqtSignal(object)  # 병렬 stat 결과 (StatBatch)
+    finished = pyqtSignal()  # 전체 완료
+    unchanged = pyqtSignal()  # 디렉토리 서명이 기대값과 같아 스캔을 생략함
+
+    def __init__(self, scheduler: "ScanScheduler", key: tuple, loader: DirectoryLoader):
+        super().__init__()
+        self.key = key  # 스케줄러가 같은 요청을 찾는 키
+        self.loader = loader
+        self.done = False  # finished 또는 unchanged를 보냄
+        self._scheduler = scheduler
+        self._subscribers = {}  # 구독자 -> 우선순위
+        loader.chunk_ready.connect(self._on_chunk_ready)
+        loader.stats_ready.connect(self._on_stats_ready)
+        loader.finished.connect(self._on_finished)
+        loader.unchanged.connect(self._on_unchanged)
+
+    @property
+    def signature(self) -> tuple | None:
+        """스캔 시작 시점의 디렉토리 서명."""
+        return self.loader.signature
+
+    def subscribers(self) -> int:
+        """구독자 수."""
+        return len(self._subscribers)
+
+    def subscribe(self, subscriber, priority: int = PRIORITY_VISIBLE):
+        """구독자를 더한다 (시그널 연결과 received()로 따라잡기는 구독자가 한다)."""
+        self._subscribers[subscriber] = priority
+        self._update_priority()
+
+    def set_priority(self, subscriber, priority: int):
+        """구독자의 우선순위를 바꾼다."""
+        if subscriber in self._subscribers:
+            self._subscribers[subscriber] = priority
+            self._update_priority()
+
+    def unsubscribe(self, subscriber):
+        """구독자를 뺀다. 남은 구독자가 없으면 로더를 취소하고 스케줄러에서 뺀다."""
+        if self._subscribers.pop(subscriber, None) is None:
+            return
+        if self._subscribers:
+            self._update_priority()
+        elif not self.done:
+            self.loader.cancel()
+            self._release()
+
+    def received(self, subscriber) -> list:
+        """subscriber보다 먼저 구독한 쪽이 지금까지 받은 항목 (정렬된 청크 목록, 처음 구독하면 빈 목록).
+
+        구독자는 구독한 뒤의 청크를 모두 받으므로 다른 구독자 하나의 결과면 충분하다.
+        """
+        for other in self._subscribers:
+            if other is not subscriber:
+                return other.scan_results(self)
+        return []
+
+    def wait(self, timeout: float = None) -> bool:
+        """로더 스레드가 끝날 때까지 기다린다 (GUI 코드에서는 쓰지 않음). 시간 초과면 False."""
+        return self.loader.wait(timeout)
+
+    def _update_priority(self):
+        """구독자 중 가장 높은 우선순위를 로더에 적용한다."""
+        priority = min(self._subscribers.values())
+        if priority != self.loader.priority:
+            self.loader.set_priority(priority)
+
+    def _release(self):
+        """스케줄러에서 뺀다 (새 요청은 새로 스캔)."""
+        self._scheduler._discard(self)
+
+    def _on_chunk_ready(self, chunk: SortedChunk):
+        loader = self.loader
+        if not self._subscribers:
+            return
+        instrumentation = loader.instrumentation
+        if instrumentation is not None and loader.emit_times:
+            # 워커 스레드 발송 → GUI 스레드 수신까지의 지연
+            instrumentation.record("signal.chunk_delivery", "signal", loader.emit_times.popleft(),
+                                   entries=len(chunk), subscribers=len(self._subscribers))
+        self.chunk_ready.emit(chunk)
+        # 모든 구독자가 처리했으므로 로더가 다음 청크를 보낼 수 있다
+        loader.chunk_consumed()
+
+    def _on_stats_ready(self, stats: StatBatch):
+        if not self._subscribers:
+            return
+        self.stats_ready.emit(stats)
+
+    def _on_finished(self):
+        if not self._subscribers:
+            return
+        self.done = True
+        self._release()
+        self.finished.emit()
+
+    def _on_unchanged(self):
+        if not self._subscribers:
+            return
+        self.done = True
+        self._release()
+        self.unchanged.emit()
+
+
+class ScanScheduler:
+    """여러 탐색기 창(모델)과 미리 스캔기가 함께 쓰는 스캔 스케줄러
+
+    같은 요청(백엔드, 경로, 패턴, 스캔 방식이 모두 같음)이 진행 중이면 새로 스캔하지 않고
+    그 스캔(SharedScan)을 함께 구독하게 하므로, 같은 큰 디렉토리를 두 창에서 열어도 스캔은
+    한 번이다. 로더는 공유 로더 풀(스레드 수 제한)에서 우선순위(PRIORITY_*) 순서로 실행되고,
+    낮은 우선순위 스캔은 높은 우선순위 스캔이 있는 동안 청크 사이에서 멈춘다.
+    청크 정책과 계측기는 처음 요청한 쪽의 것을 쓴다.
+
+    fresh 요청(변경 후 새로고침 등)은 이미 디렉토리를 읽기 시작한 스캔에 합류하지 않는다
+    (그 스캔은 요청 전의 내용을 볼 수 있으므로). 이때는 새로 스캔하고 이후 요청은 새 스캔에 합류한다.
+    """
+
+    def __init__(self, pool: LoaderPool = None):
+        self.pool = pool  # 로더를 실행할 스레드 풀 (None이면 프로세스 전역 풀)
+        self._scans = {}  # 요청 키 -> 진행 중인 SharedScan
+
+    def scan_directory(self, subscriber, path: str, glob_pattern: str = None, expected_signature: tuple = None,
+                       backend: FileSystemBackend = None, stat_workers: int = 0,
+                       batch_policy: BatchPolicy = None, instrumentation: Instrumentation = None,
+                       priority: int = PRIORITY_VISIBLE, fresh: bool = False) -> SharedScan:
+        """디렉토리 스캔을 구독한다 (같은 스캔이 진행 중이면 합류)."""
+        key = ("list", backend, path, glob_pattern, expected_signature, stat_workers)
+        return self._request(key, subscriber, priority, fresh, lambda: DirectoryLoader(
+            path, glob_pattern, expected_signature, batch_policy, stat_workers, instrumentation, backend))
+
+    def search(self, subscriber, path: str, pattern: str, backend: FileSystemBackend = None, workers: int = 4,
+               batch_policy: BatchPolicy = None, instrumentation: Instrumentation = None,
+               priority: int = PRIORITY_VISIBLE, fresh: bool = False) -> SharedScan:
+        """재귀 glob 검색을 구독한다 (같은 검색이 진행 중이면 합류)."""
+        key = ("search", backend, path, pattern, workers)
+        return self._request(key, subscriber, priority, fresh, lambda: RecursiveSearchLoader(
+            path, pattern, batch_policy, workers, instrumentation, backend))
+
+    def active_scans(self) -> int:
+        """진행 중인 (구독자가 있는) 스캔 수."""
+        return len(self._scans)
+
+    def _request(self, key: tuple, subscriber, priority: int, fresh: bool, create_loader) -> SharedScan:
+        scan = self._scans.get(key)
+        if scan is not None and (not fresh or scan.loader.is_queued()):
+            scan.subscribe(subscriber, priority)
+            return scan
+        scan = SharedScan(self, key, create_loader())
+        self._scans[key] = scan
+        scan.subscribe(subscriber, priority)
+        scan.loader.start(self.pool)
+        return scan
+
+    def _discard(self, scan: SharedScan):
+        """끝났거나 구독자가 없는 스캔을 뺀다 (같은 키의 더 새 스캔은 그대로)."""
+        if self._scans.get(scan.key) is scan:
+            del self._scans[scan.key]
+
+
+_shared_scheduler = None
+
+
+def shared_scan_scheduler() -> ScanScheduler:
+    """프로세스 전역 스캔 스케줄러 (전역 로더 풀 사용, 탐색기 위젯끼리 공유)."""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        _shared_scheduler = ScanScheduler()
+    return _shared_scheduler
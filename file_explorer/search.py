@@ -0,0 +1,63 @@
+"""재귀 glob 검색 (`**`) 워커 (검색 자체는 scan.TreeSearch)"""
+import sys
+import time
+from .entry_store import EntryStore
+from .instrumentation import Instrumentation
+from .backends import FileSystemBackend
+from .loader import BatchPolicy, DirectoryLoader
+from .scan import PathPattern, TreeSearch, is_recursive_pattern  # noqa: F401 (기존 import 경로 유지)
+
+
+class RecursiveSearchLoader(DirectoryLoader):
+    """루트 아래 하위 트리에서 패턴과 일치하는 항목을 청크 단위로 스트리밍하는 워커
+
+    검색(병렬 디렉토리 스캔, 가지치기)은 Qt와 무관한 TreeSearch가 하고, 이 로더는
+    찾은 항목을 BatchPolicy대로 청크로 묶어 시그널로 보낸다 (청크 전송 backpressure 포함).
+    항목 이름은 루트 기준 상대 경로로 저장된다. 취소하면 검색 스레드도 곧 멈춘다.
+    """
+
+    def __init__(self, path: str, glob_pattern: str, batch_policy: BatchPolicy = None, workers: int = 4,
+                 instrumentation: Instrumentation = None, backend: FileSystemBackend = None):
+        super().__init__(path, glob_pattern, batch_policy=batch_policy, instrumentation=instrumentation,
+                         backend=backend)
+        self.search = TreeSearch(path, glob_pattern, self.backend, workers,
+                                 cancelled=lambda: self._cancelled, instrumentation=instrumentation)
+        self.pattern = self.search.pattern
+        self.workers = self.search.workers  # 디렉토리 스캔 스레드 수
+
+    def run(self):
+        """하위 트리를 검색하고 일치 항목을 청크 단위로 보낸다."""
+        try:
+            policy = self.batch_policy
+            batch_sizes = policy.batch_sizes()
+            batch_size = next(batch_sizes)
+            flush_interval = policy.flush_ms / 1000
+            flush_deadline = time.monotonic() + flush_interval
+            chunk = EntryStore(self.path)
+
+            # 결과가 없을 때도 빈 묶음을 받아 보관 시간과 취소 여부를 확인한다
+            batches = self.search.batches(heartbeat=True)
+            try:
+                for matches in batches:
+                    if self._cancelled:
+                        return
+                    chunk.extend(matches)
+
+                    # 청크 크기에 도달했거나 보관 시간이 지나면 신호 발송
+                    if chunk and (len(chunk) >= batch_size or time.monotonic() >= flush_deadline):
+                        if not self._emit_chunk(chunk):
+                            return
+                        chunk = EntryStore(self.path)
+                        batch_size = next(batch_sizes)
+                        flush_deadline = time.monotonic() + flush_interval
+            finally:
+                batches.close()
+
+            # 남은 청크 전송
+            if self._cancelled or (chunk and not self._emit_chunk(chunk)):
+                return
+            self.finished.emit()
+
+        except Exception as e:
+            print(f"검색 오류: {e}", file=sys.stderr)
+            self.finished.emit()
@@ -0,0 +1,515 @@
+"""원본 모델이 계산한 정렬 순서를 그대로 적용하는 프록시 모델"""
+import bisect
+from array import array
+from PyQt6.QtCore import Qt, QAbstractProxyModel, QModelIndex, QPersistentModelIndex
+from .entry_store import load_numpy
+from .instrumentation import Instrumentation
+
+
+def _row_array(rows) -> array:
+    """행 번호 시퀀스(NumPy 배열, list, array)를 array('q')로 바꾼다."""
+    if isinstance(rows, array):
+        return rows
+    if hasattr(rows, "tobytes"):
+        result = array("q")
+        result.frombytes(rows.astype("int64", copy=False).tobytes())
+        return result
+    return array("q", rows)
+
+
+def intersect_rows(rows, other):
+    """오름차순 행 목록 두 개의 교집합."""
+    numpy = load_numpy()
+    if numpy is not None:
+        return numpy.intersect1d(rows, other, assume_unique=True)
+    other = set(other)
+    return [row for row in rows if row in other]
+
+
+def restrict_rows(permutation, rows, count: int):
+    """정렬 순서(permutation)에서 rows에 있는 행만 남긴다 (count는 전체 행 수)."""
+    numpy = load_numpy()
+    if numpy is not None:
+        keep = numpy.zeros(count, dtype=bool)
+        keep[numpy.asarray(rows, dtype=numpy.int64)] = True
+        order = numpy.asarray(permutation, dtype=numpy.int64)
+        return order[keep[order]]
+    rows = set(rows)
+    return [row for row in permutation if row in rows]
+
+
+class ExplorerSortProxyModel(QAbstractProxyModel):
+    """파일 탐색기 정렬 규칙(.. 우선, 디렉토리 우선)을 적용하는 프록시 모델
+
+    비교 함수(lessThan)를 행마다 호출하는 대신, 원본 모델의
+    sort_permutation()이 키 기반으로 한 번에 계산한 행 순서를
+    프록시 행 → 원본 행 매핑으로 보관한다.
+    정렬하지 않았거나 원본 모델의 기본 순서와 같은 정렬이면 매핑 없이
+    원본 행을 그대로 통과시킨다.
+
+    행 필터(set_filter)도 filterAcceptsRow를 행마다 호출하지 않는다. 필터 객체는
+    rows(model)로 일치하는 원본 행 전체를, rows_in_range(model, first, last)로
+    새로 추가된 행 중 일치하는 행을 한 번에 계산하고, 프록시는 정렬 순서에서
+    일치하지 않는 행을 빼서 매핑을 만든다. 이름이 다른 필터 여러 개는 모두 적용된다.
+
+    원본 모델이 행을 나눠 보이면 (canFetchMore/fetchMore) 정렬/필터는 보이는 행이 아니라
+    전체 항목에 적용되어야 하므로, 원본의 set_view()로 정렬 기준과 필터를 넘기고 원본이
+    그 순서의 앞쪽 행만 보이게 한다. 이때 프록시는 매핑 없이 원본 행을 그대로 통과시킨다.
+    """
+
+    def __init__(self, parent=None, instrumentation: Instrumentation = None):
+        super().__init__(parent)
+        self.instrumentation = instrumentation  # 성능 계측기 (None이면 계측 안 함)
+        self._mapping = None  # 프록시 행 → 원본 행 (None이면 원본 순서 그대로)
+        self._inverse = None  # 원본 행 → 프록시 행 (필요할 때 생성)
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._removing = None  # 원본 행 삭제 중인 구간 (first, last)
+        self._layout_persistent = None  # 원본 레이아웃 변경 중 (프록시 영구 인덱스, 원본 영구 인덱스)
+        self._filters = {}  # 이름 -> 행 필터
+        self._source_view = False  # 원본 모델이 정렬/필터를 직접 적용 중 (set_view)
+        self._connections = []
+
+    # ------------------------------------------------------------------
+    # 원본 모델 연결
+    # ------------------------------------------------------------------
+
+    def setSourceModel(self, source_model):
+        """원본 모델을 지정하고 시그널을 연결한다."""
+        self.beginResetModel()
+        old_model = self.sourceModel()
+        if old_model is not None:
+            for signal, slot in self._connections:
+                signal.disconnect(slot)
+        self._connections = []
+
+        super().setSourceModel(source_model)
+
+        if source_model is not None:
+            self._connections = [
+                (source_model.modelAboutToBeReset, self._on_source_about_to_be_reset),
+                (source_model.modelReset, self._on_source_reset),
+                (source_model.rowsInserted, self._on_rows_inserted),
+                (source_model.rowsAboutToBeRemoved, self._on_rows_about_to_be_removed),
+                (source_model.rowsRemoved, self._on_rows_removed),
+                (source_model.dataChanged, self._on_data_changed),
+                (source_model.layoutAboutToBeChanged, self._on_source_layout_about_to_be_changed),
+                (source_model.layoutChanged, self._on_source_layout_changed),
+                (source_model.headerDataChanged, self.headerDataChanged),
+            ]
+            for signal, slot in self._connections:
+                signal.connect(slot)
+
+        self._source_view = False
+        self._apply_source_view()
+        self._rebuild_mapping()
+        self.endResetModel()
+
+    def _uses_mapping(self) -> bool:
+        """현재 정렬이 원본 순서와 달라 매핑이 필요한지 여부."""
+        source = self.sourceModel()
+        if self._sort_column < 0 or source is None or self._source_view:
+            return False
+        native_sort = getattr(source, "native_sort", None)
+        return (self._sort_column, self._sort_order) != native_sort
+
+    def _apply_source_view(self) -> bool:
+        """원본 모델이 정렬/필터를 직접 적용할 수 있으면 (행을 나눠 보이는 모델) 넘긴다.
+
+        원본이 적용했으면 True (이후 원본의 레이아웃 변경 알림으로 행이 바뀜).
+        """
+        source = self.sourceModel()
+        set_view = getattr(source, "set_view", None)
+        if set_view is None:
+            return False
+        sort = (self._sort_column, self._sort_order) if self._sort_column >= 0 else None
+        self._source_view = set_view(sort, dict(self._filters))
+        return self._source_view
+
+    def _rebuild_mapping(self):
+        """현재 정렬 기준과 필터로 매핑을 다시 계산한다."""
+        self._inverse = None
+        self._mapping = self._compute_mapping()
+
+    def _compute_mapping(self) -> array | None:
+        """현재 정렬 기준과 필터로 프록시 행 → 원본 행 매핑을 계산한다 (필요 없으면 None)."""
+        source = self.sourceModel()
+        if self._source_view:
+            return None
+        if self._filters and source is not None:
+            rows = self._filtered_rows()
+            if self._uses_mapping():
+                permutation = source.sort_permutation(self._sort_column, self._sort_order)
+                rows = restrict_rows(permutation, rows, source.rowCount())
+            return _row_array(rows)
+        if not self._uses_mapping():
+            return None
+        permutation = source.sort_permutation(self._sort_column, self._sort_order)
+        return permutation if isinstance(permutation, array) else array("q", permutation)
+
+    def _filtered_rows(self, first: int = None, last: int = None):
+        """모든 필터와 일치하는 원본 행 (오름차순). first/last를 주면 그 구간만 확인한다."""
+        source = self.sourceModel()
+        result = None
+        for row_filter in self._filters.values():
+            if first is None:
+                rows = row_filter.rows(source)
+            else:
+                rows = row_filter.rows_in_range(source, first, last)
+            result = rows if result is None else intersect_rows(result, rows)
+        return result
+
+    def _source_to_proxy(self) -> array:
+        """원본 행 → 프록시 행 역매핑을 반환한다."""
+        if self._inverse is None:
+            count = self.sourceModel().rowCount()
+            numpy = load_numpy()
+            if numpy is not None:
+                inverse = numpy.full(count, -1, dtype=numpy.int64)
+                mapping = numpy.frombuffer(self._mapping, dtype=numpy.int64)
+                inverse[mapping] = numpy.arange(len(mapping), dtype=numpy.int64)
+                self._inverse = _row_array(inverse)
+                return self._inverse
+            inverse = array("q", [-1]) * count
+            for proxy_row, source_row in enumerate(self._mapping):
+                inverse[source_row] = proxy_row
+            self._inverse = inverse
+        return self._inverse
+
+    # ------------------------------------------------------------------
+    # 원본 모델 변경 처리
+    # ------------------------------------------------------------------
+
+    def _on_source_about_to_be_reset(self):
+        self.beginResetModel()
+
+    def _on_source_reset(self):
+        self._rebuild_mapping()
+        self.endResetModel()
+
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+        """원본 행 추가: 정렬/필터 순서에서 들어갈 위치에 끼워 넣는다.
+
+        기존 행끼리의 순서는 그대로이므로 기존 매핑의 원본 행 번호만 밀고, 추가된 행은
+        원본의 row_sort_key로 매핑에서 이분 탐색해 끼워 넣는다 (비용이 추가된 행 수에 비례).
+        추가된 행이 많아 이분 탐색이 전체 정렬보다 비싸면 매핑을 다시 계산한다.
+        추가된 행이 한 구간에 모이면 행 추가 알림을 보내고 여러 구간에 흩어지면 레이아웃 변경
+        알림 한 번으로 반영한다.
+        """
+        if parent.isValid():
+            return
+
+        if self._mapping is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+            self.endInsertRows()
+            return
+
+        count = last - first + 1
+        if count * max(len(self._mapping), 1).bit_length() > len(self._mapping):
+            self._insert_rebuilt(first, last)
+            return
+
+        self._shift_rows(first, count)
+        rows = range(first, last + 1) if not self._filters else self._filtered_rows(first, last)
+        rows = [int(row) for row in rows]
+        if not rows:
+            # 필터로 모두 빠짐: 프록시 행은 그대로이고 원본 행 번호만 밀림
+            return
+        if self._uses_mapping():
+            key = self.sourceModel().row_sort_key(self._sort_column, self._sort_order)
+            rows.sort(key=key)
+            positions = [bisect.bisect_left(self._mapping, key(row), key=key) for row in rows]
+        else:
+            # 필터만 적용 중: 매핑은 원본 행 번호 오름차순
+            positions = [bisect.bisect_left(self._mapping, row) for row in rows]
+
+        mapping = array("q")
+        previous = 0
+        for position, row in zip(positions, rows):
+            mapping.extend(self._mapping[previous:position])
+            mapping.append(row)
+            previous = position
+        mapping.extend(self._mapping[previous:])
+
+        if positions[0] == positions[-1]:
+            self.beginInsertRows(QModelIndex(), positions[0], positions[0] + len(rows) - 1)
+            self._mapping = mapping
+            self._inverse = None
+            self.endInsertRows()
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        self._mapping = mapping
+        self._inverse = None
+        # 기존 프록시 행은 앞에 끼워 넣은 행 수만큼 밀린다
+        new_persistent = [self.index(index.row() + bisect.bisect_right(positions, index.row()), index.column())
+                          for index in old_persistent]
+        self.changePersistentIndexList(old_persistent, new_persistent)
+        self.layoutChanged.emit()
+
+    def _insert_rebuilt(self, first: int, last: int):
+        """많은 행이 추가됨: 매핑을 다시 계산해 추가된 행의 위치를 찾는다."""
+        mapping = self._compute_mapping()
+        numpy = load_numpy()
+        if numpy is not None:
+            rows = numpy.frombuffer(mapping, dtype=numpy.int64)
+            positions = numpy.flatnonzero((rows >= first) & (rows <= last)).tolist()
+        else:
+            positions = [position for position, row in enumerate(mapping) if first <= row <= last]
+
+        if not positions:
+            self._mapping = mapping
+            self._inverse = None
+            return
+        if positions[-1] - positions[0] + 1 == len(positions):
+            self.beginInsertRows(QModelIndex(), positions[0], positions[-1])
+            self._mapping = mapping
+            self._inverse = None
+            self.endInsertRows()
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        # 이전 매핑의 원본 행 번호를 추가된 행 수만큼 밀어 새 매핑에서 찾는다
+        count = last - first + 1
+        old_sources = []
+        for index in old_persistent:
+            row = self._mapping[index.row()]
+            old_sources.append(self.sourceModel().index(row + count if row >= first else row, index.column()))
+        self._mapping = mapping
+        self._inverse = None
+        new_persistent = [self.mapFromSource(index) for index in old_sources]
+        self.changePersistentIndexList(old_persistent, new_persistent)
+        self.layoutChanged.emit()
+
+    def _shift_rows(self, start: int, delta: int):
+        """매핑에서 start 이상인 원본 행 번호에 delta를 더한다 (NumPy가 있으면 제자리에서)."""
+        numpy = load_numpy()
+        if numpy is not None:
+            rows = numpy.frombuffer(self._mapping, dtype=numpy.int64)
+            rows[rows >= start] += delta
+            del rows  # 버퍼를 놓아야 매핑 배열의 크기를 바꿀 수 있다
+        else:
+            self._mapping = array("q", [row + delta if row >= start else row for row in self._mapping])
+        self._inverse = None
+
+    def _on_source_layout_about_to_be_changed(self):
+        """원본 행 순서/수 변경 직전: 영구 인덱스가 가리키는 원본 행을 원본 쪽 영구 인덱스로 잡아 둔다."""
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        self._layout_persistent = (
+            old_persistent,
+            [QPersistentModelIndex(self.mapToSource(index)) for index in old_persistent],
+        )
+
+    def _on_source_layout_changed(self):
+        """원본이 옮긴 행 위치로 매핑과 영구 인덱스를 갱신한다 (초기화하지 않아 선택/스크롤 유지)."""
+        old_persistent, sources = self._layout_persistent or ([], [])
+        self._layout_persistent = None
+        self._rebuild_mapping()
+        source = self.sourceModel()
+        new_persistent = [self.mapFromSource(source.index(index.row(), index.column()) if index.isValid()
+                                             else QModelIndex()) for index in sources]
+        self.changePersistentIndexList(old_persistent, new_persistent)
+        self.layoutChanged.emit()
+
+    def _on_rows_about_to_be_removed(self, parent: QModelIndex, first: int, last: int):
+        """원본 행 삭제 직전: 해당 프록시 행들을 연속 구간 단위로 제거한다."""
+        if parent.isValid():
+            return
+
+        if self._mapping is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self._removing = (first, last)
+            return
+
+        # 필터로 빠진 행은 매핑에 없다 (역매핑을 만들지 않고 매핑에서 바로 찾음)
+        numpy = load_numpy()
+        if numpy is not None:
+            rows = numpy.frombuffer(self._mapping, dtype=numpy.int64)
+            proxy_rows = numpy.flatnonzero((rows >= first) & (rows <= last))[::-1].tolist()
+            del rows
+        else:
+            proxy_rows = [row for row in range(len(self._mapping) - 1, -1, -1)
+                          if first <= self._mapping[row] <= last]
+        index = 0
+        while index < len(proxy_rows):
+            end_row = start_row = proxy_rows[index]
+            index += 1
+            while index < len(proxy_rows) and proxy_rows[index] == start_row - 1:
+                start_row = proxy_rows[index]
+                index += 1
+            self.beginRemoveRows(QModelIndex(), start_row, end_row)
+            del self._mapping[start_row:end_row + 1]
+            self._inverse = None
+            self.endRemoveRows()
+        self._removing = (first, last)
+
+    def _on_rows_removed(self, parent: QModelIndex, first: int, last: int):
+        """원본 행 삭제 완료: 뒤쪽 원본 행 번호를 당긴다."""
+        if parent.isValid() or self._removing is None:
+            return
+        self._removing = None
+
+        if self._mapping is None:
+            self.endRemoveRows()
+            return
+
+        self._shift_rows(last + 1, -(last - first + 1))
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()):
+        """원본 데이터 변경을 프록시 범위로 바꿔 전달한다."""
+        if self._mapping is None:
+            first, last = top_left.row(), bottom_right.row()
+        elif top_left.row() == 0 and bottom_right.row() == self.sourceModel().rowCount() - 1:
+            # 전체 행 (아이콘 갱신 등): 행마다 역매핑하지 않음
+            if not self._mapping:
+                return
+            first, last = 0, len(self._mapping) - 1
+        else:
+            inverse = self._source_to_proxy()
+            proxy_rows = [inverse[row] for row in range(top_left.row(), bottom_right.row() + 1)]
+            proxy_rows = [row for row in proxy_rows if row >= 0]
+            if not proxy_rows:
+                return
+            first, last = min(proxy_rows), max(proxy_rows)
+
+        self.dataChanged.emit(
+            self.index(first, top_left.column()),
+            self.index(last, bottom_right.column()),
+            roles,
+        )
+
+    # ------------------------------------------------------------------
+    # 정렬
+    # ------------------------------------------------------------------
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """원본 모델이 계산한 순서로 정렬한다 (column < 0이면 원본 순서)."""
+        self._sort_column = column
+        self._sort_order = order
+        if self.instrumentation is not None:
+            start = self.instrumentation.now()
+
+        if not self._apply_source_view():
+            self.layoutAboutToBeChanged.emit()
+            old_persistent = self.persistentIndexList()
+            old_sources = [self.mapToSource(index) for index in old_persistent]
+
+            self._rebuild_mapping()
+
+            new_persistent = [self.mapFromSource(index) for index in old_sources]
+            self.changePersistentIndexList(old_persistent, new_persistent)
+            self.layoutChanged.emit()
+
+        if self.instrumentation is not None:
+            self.instrumentation.record("proxy.sort", "proxy", start, column=column,
+                                        descending=order == Qt.SortOrder.DescendingOrder,
+                                        rows=self.rowCount())
+
+    # ------------------------------------------------------------------
+    # 필터
+    # ------------------------------------------------------------------
+
+    def set_filter(self, name: str, row_filter):
+        """name 이름의 행 필터를 바꾼다 (None이면 해제)."""
+        if row_filter is None and name not in self._filters:
+            return
+        if self.instrumentation is not None:
+            start = self.instrumentation.now()
+
+        filters = dict(self._filters)
+        if row_filter is None:
+            del filters[name]
+        else:
+            filters[name] = row_filter
+
+        if self._source_view:
+            self._filters = filters
+            self._apply_source_view()
+        else:
+            self.layoutAboutToBeChanged.emit()
+            old_persistent = self.persistentIndexList()
+            old_sources = [self.mapToSource(index) for index in old_persistent]
+
+            self._filters = filters
+            self._rebuild_mapping()
+
+            new_persistent = [self.mapFromSource(index) for index in old_sources]
+            self.changePersistentIndexList(old_persistent, new_persistent)
+            self.layoutChanged.emit()
+
+        if self.instrumentation is not None:
+            self.instrumentation.record("proxy.filter", "proxy", start, filter=name, rows=self.rowCount())
+
+    def filter(self, name: str):
+        """name 이름의 현재 행 필터 (없으면 None)."""
+        return self._filters.get(name)
+
+    def source_rows(self, first: int, last: int):
+        """프록시 행 first..last(포함)에 해당하는 원본 행 (화면 순서)."""
+        if self._mapping is None:
+            return range(first, last + 1)
+        return self._mapping[first:last + 1]
+
+    def sortColumn(self) -> int:
+        """현재 정렬 컬럼."""
+        return self._sort_column
+
+    def sortOrder(self) -> Qt.SortOrder:
+        """현재 정렬 방향."""
+        return self._sort_order
+
+    # ------------------------------------------------------------------
+    # QAbstractProxyModel 구현
+    # ------------------------------------------------------------------
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        source = self.sourceModel()
+        if source is None or not proxy_index.isValid():
+            return QModelIndex()
+        row = proxy_index.row()
+        if self._mapping is not None:
+            if row >= len(self._mapping):
+                return QModelIndex()
+            row = self._mapping[row]
+        return source.index(row, proxy_index.column())
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        if self.sourceModel() is None or not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self._mapping is not None:
+            inverse = self._source_to_proxy()
+            if row >= len(inverse) or inverse[row] < 0:
+                return QModelIndex()
+            row = inverse[row]
+        return self.index(row, source_index.column())
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() or row < 0 or column < 0:
+            return QModelIndex()
+        if row >= self.rowCount() or column >= self.columnCount():
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex = None):
+        # 인자가 없으면 QObject.parent()
+        if index is None:
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        source = self.sourceModel()
+        if source is None or parent.isValid():
+            return 0
+        if self._mapping is None:
+            return source.rowCount()
+        return len(self._mapping)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        source = self.sourceModel()
+        if source is None or parent.isValid():
+            return 0
+        return source.columnCount()
@@ -0,0 +1,295 @@
+"""현재 디렉토리 변경 감시 (inotify / QFileSystemWatcher, 메모리 백엔드, 압축 파일)"""
+import functools
+import os
+import struct
+import sys
+from PyQt6.QtCore import QObject, QTimer, QSocketNotifier, QFileSystemWatcher, pyqtSignal
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+               | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+# 디렉토리 전체를 다시 확인해야 하는 이벤트
+_RESCAN_MASK = IN_Q_OVERFLOW | IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+@functools.cache
+def _load_libc():
+    """inotify를 지원하는 libc를 로드한다. 지원하지 않으면 None.
+
+    ctypes.util.find_library는 외부 명령을 실행할 수 있어 첫 감시자를 만들 때 한 번만 호출한다.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    import ctypes
+    import ctypes.util
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class DirectoryWatcher(QObject):
+    """디렉토리 하나의 변경을 감시하고 이벤트 폭주를 묶어서 알리는 감시자
+
+    Linux에서는 inotify로 변경된 항목 이름을 직접 받고, 그 외 환경이나 감시를
+    추가하지 못한 디렉토리(감시 개수 한도 ENOSPC, 권한 EACCES 등)는
+    QFileSystemWatcher로 디렉토리 변경만 감지한다.
+    changes_ready는 coalesce_ms 동안 모인 변경 이름 집합을 전달하며,
+    이름을 알 수 없어 전체 재확인이 필요하면 None을 전달한다.
+    """
+
+    changes_ready = pyqtSignal(object)  # set[str] 또는 None(전체 재확인)
+
+    # 모인 변경 이름이 이보다 많으면 (대량 복사/삭제 등) 이름을 더 모으지 않고 전체 재확인
+    MAX_PENDING_NAMES = 4096
+    # 알림 한 번에 읽는 최대 횟수 (이벤트가 계속 와도 GUI 스레드를 오래 잡지 않음)
+    MAX_READS = 4
+
+    def __init__(self, coalesce_ms: int = 150, parent=None):
+        super().__init__(parent)
+        self.path = None
+        self._pending = set()  # 모인 변경 이름 (None이면 전체 재확인)
+        self._fd = -1
+        self._wd = -1
+        self._notifier = None
+        self._fallback = None
+
+        # 첫 이벤트부터 coalesce_ms 뒤에 한 번에 전달 (이벤트가 계속 와도 지연되지 않음)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(coalesce_ms)
+        self._flush_timer.timeout.connect(self._flush)
+
+        self._libc = _load_libc()
+        if self._libc is not None:
+            self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd >= 0:
+            self._notifier = QSocketNotifier(self._fd, QSocketNotifier.Type.Read, self)
+            self._notifier.activated.connect(self._read_events)
+        else:
+            self._fallback_watcher()
+
+    def watch(self, path: str):
+        """감시할 디렉토리를 바꾼다."""
+        self.stop()
+        self.path = path
+
+        if self._fd >= 0:
+            self._wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+            if self._wd >= 0:
+                return
+        # inotify가 없거나 이 디렉토리에 감시를 추가하지 못함 (ENOSPC, EACCES 등)
+        self._fallback_watcher().addPath(path)
+
+    def _fallback_watcher(self) -> QFileSystemWatcher:
+        """QFileSystemWatcher 폴백 (처음 필요할 때 만든다)."""
+        if self._fallback is None:
+            self._fallback = QFileSystemWatcher(self)
+            self._fallback.directoryChanged.connect(self._on_directory_changed)
+        return self._fallback
+
+    def stop(self):
+        """감시를 중지하고 모인 변경을 버린다."""
+        if self._fd >= 0 and self._wd >= 0:
+            self._libc.inotify_rm_watch(self._fd, self._wd)
+        if self._fallback is not None and self._fallback.directories():
+            self._fallback.removePaths(self._fallback.directories())
+        self._wd = -1
+        self.path = None
+        self._pending = set()
+        self._flush_timer.stop()
+
+    def close(self):
+        """감시자를 해제한다."""
+        self.stop()
+        if self._fd >= 0:
+            self._notifier.setEnabled(False)
+            os.close(self._fd)
+            self._fd = -1
+
+    def _read_events(self):
+        """inotify 이벤트를 읽어 변경 이름을 모은다.
+
+        남은 이벤트는 다음 알림에서 읽는다. 전체 재확인이 정해지면 이벤트를 해석하지 않고 버린다.
+        """
+        for _ in range(self.MAX_READS):
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                self._mark_rescan()
+                break
+            if not data:
+                break
+            if self._pending is None:
+                continue
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    self._mark_rescan()
+                elif wd != self._wd:
+                    # 이전 디렉토리에서 남은 이벤트
+                    continue
+                elif mask & _RESCAN_MASK:
+                    self._mark_rescan()
+                elif name and self._pending is not None:
+                    self._pending.add(os.fsdecode(name))
+                    if len(self._pending) > self.MAX_PENDING_NAMES:
+                        self._mark_rescan()
+
+        self._schedule_flush()
+
+    def _on_directory_changed(self, path: str):
+        """QFileSystemWatcher 폴백: 변경 이름을 알 수 없어 전체 재확인을 요청한다."""
+        if path == self.path:
+            self._mark_rescan()
+            self._schedule_flush()
+
+    def _mark_rescan(self):
+        self._pending = None
+
+    def _schedule_flush(self):
+        if (self._pending is None or self._pending) and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """모인 변경을 한 번에 전달한다."""
+        if self.path is None:
+            return
+        pending = self._pending
+        self._pending = set()
+        self.changes_ready.emit(pending)
+
+
+class MemoryWatcher(QObject):
+    """MemoryBackend 디렉토리의 변경을 DirectoryWatcher와 같은 방식으로 알리는 감시자
+
+    백엔드는 어느 스레드에서든 notify()를 부를 수 있으며, 변경 이름은 GUI 스레드에서
+    coalesce_ms 동안 모아 changes_ready로 전달한다.
+    """
+
+    changes_ready = pyqtSignal(object)  # set[str] 또는 None(전체 재확인)
+    _changed = pyqtSignal(object)  # 백엔드 스레드 -> 감시자 스레드 (이름 또는 None)
+
+    def __init__(self, backend, coalesce_ms: int = 150, parent=None):
+        super().__init__(parent)
+        self.backend = backend
+        self.path = None
+        self._pending = set()  # 모인 변경 이름 (None이면 전체 재확인)
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(coalesce_ms)
+        self._flush_timer.timeout.connect(self._flush)
+        self._changed.connect(self._on_changed)
+
+    def watch(self, path: str):
+        """감시할 디렉토리를 바꾼다."""
+        self.stop()
+        self.path = path
+
+    def stop(self):
+        """감시를 중지하고 모인 변경을 버린다."""
+        self.path = None
+        self._pending = set()
+        self._flush_timer.stop()
+
+    def close(self):
+        """감시자를 해제한다."""
+        self.stop()
+        self.backend.unwatch(self)
+
+    def notify(self, name: str | None):
+        """백엔드: 감시 중인 디렉토리의 name이 바뀌었다 (None이면 전체 재확인)."""
+        try:
+            self._changed.emit(name)
+        except RuntimeError:
+            # 감시자(QObject)가 이미 삭제됨
+            pass
+
+    def _on_changed(self, name: str | None):
+        if name is None:
+            self._pending = None
+        elif self._pending is not None:
+            self._pending.add(name)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """모인 변경을 한 번에 전달한다."""
+        if self.path is None:
+            return
+        pending = self._pending
+        self._pending = set()
+        self.changes_ready.emit(pending)
+
+
+class ArchiveWatcher(QObject):
+    """ArchiveBackend 감시자: 실제 디렉토리는 DirectoryWatcher로 감시하고, 압축 파일 안에서는
+    압축 파일이 있는 디렉토리를 감시해 압축 파일이 바뀌면 전체 재확인을 알린다."""
+
+    changes_ready = pyqtSignal(object)  # set[str] 또는 None(전체 재확인)
+
+    def __init__(self, backend, coalesce_ms: int = 150, parent=None):
+        super().__init__(parent)
+        self.backend = backend
+        self.path = None
+        self._archive_name = None  # 압축 파일 안을 감시 중이면 압축 파일 이름
+        self._watcher = DirectoryWatcher(coalesce_ms, parent=self)
+        self._watcher.changes_ready.connect(self._on_changes)
+
+    def watch(self, path: str):
+        """감시할 디렉토리를 바꾼다."""
+        archive = self.backend.split(path)
+        if archive is None:
+            self._archive_name = None
+            self._watcher.watch(path)
+        else:
+            directory, self._archive_name = os.path.split(archive[0])
+            self._watcher.watch(directory)
+        self.path = path
+
+    def stop(self):
+        """감시를 중지하고 모인 변경을 버린다."""
+        self._watcher.stop()
+        self.path = None
+        self._archive_name = None
+
+    def close(self):
+        """감시자를 해제한다."""
+        self.stop()
+        self._watcher.close()
+
+    def _on_changes(self, names):
+        if self._archive_name is None:
+            self.changes_ready.emit(names)
+        elif names is None or self._archive_name in names:
+            self.changes_ready.emit(None)
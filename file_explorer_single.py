@@ -7,20 +7,205 @@ glob 패턴 필터링 기능 지원
 import os
 import sys
 import fnmatch
+import math
 import re
+import time
+from array import array
+from collections import OrderedDict
 from datetime import datetime
-from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QFileInfo, QThread, pyqtSignal, QSortFilterProxyModel
+from PyQt6.QtCore import Qt, QAbstractTableModel, QAbstractProxyModel, QModelIndex, QFileInfo, QThread, pyqtSignal
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
     QTableView, QHeaderView, QApplication, QMainWindow, QFileIconProvider, QAbstractItemView
 )
 
+try:
+    import numpy
+except ImportError:  # NumPy는 선택 사항 (없으면 순수 Python 정렬)
+    numpy = None
+
+
+# 항목 플래그 비트
+FLAG_DIR = 0x01
+FLAG_PARENT = 0x04  # 상위 디렉토리(..) 항목
+
+# 크기/수정시간을 알 수 없을 때의 값
+UNKNOWN = -1
+
+# 플래그 바이트 → 정렬 그룹 (0: .., 1: 디렉토리, 2: 파일)
+_GROUP_TABLE = bytes(
+    0 if flags & FLAG_PARENT else 1 if flags & FLAG_DIR else 2 for flags in range(256)
+)
+
+# 수정일시 포맷 구간(초). 모든 표준 시간대 오프셋과 서머타임 전환은 15분 단위이므로
+# 구간 안에서는 현지 날짜/시가 바뀌지 않는다.
+_BUCKET_SECONDS = 900
+
+# 시 안의 초(0~3599) -> "MM:SS"
+_MINUTE_SECOND = tuple(f"{minute:02d}:{second:02d}" for minute in range(60) for second in range(60))
+
+
+def format_size(size: int | None) -> str:
+    """파일 크기를 사람이 읽기 쉬운 형태로 변환한다."""
+    if size is None:
+        return "—"
+
+    size_float = float(size)
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size_float < 1024:
+            return f"{size_float:.1f} {unit}"
+        size_float /= 1024
+
+    return "—"
+
+
+def format_modified(timestamp: float | None) -> str:
+    """수정 시간을 포맷팅한다."""
+    if timestamp is None:
+        return "—"
+
+    try:
+        dt = datetime.fromtimestamp(timestamp)
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except Exception:
+        return "—"
+
+
+class DisplayFormatter:
+    """수정일시 문자열을 strftime 없이 만드는 포맷터
+
+    15분 구간마다 localtime()을 한 번만 호출해 "YYYY-MM-DD HH:" 접두어와
+    구간 시작의 분/초를 캐시하고, 구간 안의 시각은 정수 연산으로 만든다.
+    """
+
+    def __init__(self, max_buckets: int = 16384):
+        self.max_buckets = max_buckets  # 캐시할 최대 구간 수
+        self._buckets = {}  # 구간 번호 -> (시 접두어, 구간 시작 시점의 분*60+초)
+
+    def format_modified(self, timestamp: float | None) -> str:
+        """수정 시간을 "YYYY-MM-DD HH:MM:SS" 형식으로 만든다."""
+        if timestamp is None:
+            return "—"
+
+        try:
+            seconds = math.floor(timestamp)
+        except (OverflowError, ValueError):
+            return "—"
+
+        bucket, within = divmod(seconds, _BUCKET_SECONDS)
+        entry = self._buckets.get(bucket)
+        if entry is None:
+            try:
+                local = time.localtime(bucket * _BUCKET_SECONDS)
+            except (OverflowError, OSError, ValueError):
+                return format_modified(timestamp)
+            if len(self._buckets) >= self.max_buckets:
+                self._buckets.clear()
+            entry = (
+                f"{local.tm_year:04d}-{local.tm_mon:02d}-{local.tm_mday:02d} {local.tm_hour:02d}:",
+                local.tm_min * 60 + local.tm_sec,
+            )
+            self._buckets[bucket] = entry
+
+        offset = entry[1] + within
+        if offset >= 3600:
+            # 정시에 맞지 않는 역사적 시간대 오프셋이라 구간 안에서 시가 바뀜
+            return format_modified(timestamp)
+        return entry[0] + _MINUTE_SECOND[offset]
+
+
+class EntryStore:
+    """항목 하나당 dict 대신 컬럼별 배열로 항목을 저장하는 컨테이너
+
+    이름은 list, 크기/수정시간은 typed array, 플래그는 bytearray에 보관하고
+    전체 경로는 부모 디렉토리 + 이름으로, 표시 문자열은 모델이 화면에 그릴 때
+    필요한 만큼만 만든다.
+    """
+
+    __slots__ = ("base_path", "names", "sizes", "mtimes", "flags")
+
+    def __init__(self, base_path: str = ""):
+        self.base_path = base_path  # 항목들이 속한 디렉토리
+        self.names = []  # 이름
+        self.sizes = array("q")  # 크기 (UNKNOWN = 알 수 없음)
+        self.mtimes = array("d")  # 수정시간 (UNKNOWN = 알 수 없음)
+        self.flags = bytearray()  # FLAG_* 비트 조합
+
+    def append(self, name: str, is_dir: bool, size: int | None, modified: float | None):
+        """항목 하나를 추가한다."""
+        self.names.append(name)
+        self.sizes.append(UNKNOWN if size is None else size)
+        self.mtimes.append(UNKNOWN if modified is None else modified)
+        self.flags.append(FLAG_DIR if is_dir else 0)
+
+    def append_parent(self):
+        """상위 디렉토리(..) 항목을 추가한다."""
+        self.append("..", True, None, None)
+        self.flags[-1] |= FLAG_PARENT
+
+    def extend(self, other: "EntryStore"):
+        """다른 저장소의 항목을 뒤에 이어 붙인다."""
+        self.names.extend(other.names)
+        self.sizes.extend(other.sizes)
+        self.mtimes.extend(other.mtimes)
+        self.flags.extend(other.flags)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def is_dir(self, row: int) -> bool:
+        """디렉토리 여부."""
+        return bool(self.flags[row] & FLAG_DIR)
+
+    def is_parent(self, row: int) -> bool:
+        """상위 디렉토리(..) 항목 여부."""
+        return bool(self.flags[row] & FLAG_PARENT)
+
+    def size(self, row: int) -> int | None:
+        """크기 (알 수 없으면 None)."""
+        size = self.sizes[row]
+        return None if size == UNKNOWN else size
+
+    def modified(self, row: int) -> float | None:
+        """수정시간 (알 수 없으면 None)."""
+        modified = self.mtimes[row]
+        return None if modified == UNKNOWN else modified
+
+    def path(self, row: int) -> str:
+        """항목의 전체 경로를 만든다."""
+        if self.flags[row] & FLAG_PARENT:
+            return os.path.dirname(self.base_path)
+        return os.path.join(self.base_path, self.names[row])
+
+    def item(self, row: int) -> dict:
+        """기존 dict 형식으로 항목을 만든다."""
+        return {
+            "name": self.names[row],
+            "path": self.path(row),
+            "is_dir": self.is_dir(row),
+            "size": self.size(row),
+            "modified": self.modified(row),
+            "display_size": "" if self.is_parent(row) else format_size(self.size(row)),
+            "display_modified": "" if self.is_parent(row) else format_modified(self.modified(row)),
+        }
+
+    def __getitem__(self, row: int) -> dict:
+        if row < 0:
+            row += len(self.names)
+        if not 0 <= row < len(self.names):
+            raise IndexError("EntryStore index out of range")
+        return self.item(row)
+
+    def __iter__(self):
+        for row in range(len(self.names)):
+            yield self.item(row)
+
 
 class DirectoryLoader(QThread):
     """백그라운드에서 디렉토리 항목을 스캔하는 QThread 워커"""
 
-    chunk_ready = pyqtSignal(list)  # 청크 단위 결과 전달
+    chunk_ready = pyqtSignal(object)  # 청크 단위 결과 전달 (EntryStore)
     finished = pyqtSignal()  # 전체 완료
 
     def __init__(self, path: str, glob_pattern: str = None, parent=None):
@@ -36,7 +221,7 @@ class DirectoryLoader(QThread):
     def run(self):
         """디렉토리를 스캔하고 항목 정보를 수집한다."""
         try:
-            chunk = []
+            chunk = EntryStore(self.path)
 
             with os.scandir(self.path) as entries:
                 for entry in entries:
@@ -64,22 +249,13 @@ class DirectoryLoader(QThread):
                             size = None
                             modified = None
 
-                    item_dict = {
-                        "name": entry.name,
-                        "path": entry.path,
-                        "is_dir": is_dir,
-                        "size": size,
-                        "modified": modified,
-                        "display_size": self._format_size(size),
-                        "display_modified": self._format_modified(modified),
-                    }
-
-                    chunk.append(item_dict)
+                    # 표시 문자열은 모델이 화면에 보이는 행만 지연 생성
+                    chunk.append(entry.name, is_dir, size, modified)
 
                     # 청크 크기에 도달하면 신호 발송
                     if len(chunk) >= self._chunk_size:
                         self.chunk_ready.emit(chunk)
-                        chunk = []
+                        chunk = EntryStore(self.path)
 
             # 남은 청크 전송
             if chunk and not self._cancelled:
@@ -101,28 +277,12 @@ class DirectoryLoader(QThread):
     @staticmethod
     def _format_size(size: int | None) -> str:
         """파일 크기를 사람이 읽기 쉬운 형태로 변환한다."""
-        if size is None:
-            return "—"
-
-        size_float = float(size)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_float < 1024:
-                return f"{size_float:.1f} {unit}"
-            size_float /= 1024
-
-        return "—"
+        return format_size(size)
 
     @staticmethod
     def _format_modified(timestamp: float | None) -> str:
         """수정 시간을 포맷팅한다."""
-        if timestamp is None:
-            return "—"
-
-        try:
-            dt = datetime.fromtimestamp(timestamp)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except Exception:
-            return "—"
+        return format_modified(timestamp)
 
 
 class FileTableModel(QAbstractTableModel):
@@ -136,17 +296,34 @@ class FileTableModel(QAbstractTableModel):
     COLUMN_MODIFIED = 3
     COLUMN_COUNT = 4
 
+    # 표시 문자열을 한 번에 포맷팅/캐시하는 단위 (행 수, 블록 수)
+    DISPLAY_BLOCK_ROWS = 64
+    DISPLAY_CACHE_BLOCKS = 256
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._items = []  # 항목 데이터
+        self._items = EntryStore()  # 항목 데이터 (컬럼 지향 저장소)
         self._current_path = ""  # 현재 경로
         self._loader = None  # 현재 실행 중인 로더
         self._icon_cache = {}  # 확장자별 아이콘 캐시
         self._file_icon_provider = QFileIconProvider()
+        self._sort_keys = None  # 정렬 키 캐시 (.. 행, 디렉토리 행, 파일 행)
+        self._formatter = DisplayFormatter()  # 수정일시 포맷터
+        self._display_blocks = OrderedDict()  # 블록 번호 -> (크기 문자열들, 수정일시 문자열들)
 
         # 기본 아이콘 미리 로드
         self._init_default_icons()
 
+        # 항목이 바뀌면 정렬 키/표시 문자열 캐시 무효화
+        for signal in (self.modelReset, self.rowsInserted, self.rowsRemoved,
+                       self.dataChanged, self.layoutChanged):
+            signal.connect(self._invalidate_sort_keys)
+        self.modelReset.connect(self._invalidate_display)
+        self.layoutChanged.connect(self._invalidate_display)
+        self.rowsInserted.connect(lambda parent, first, last: self._invalidate_display(first))
+        self.rowsRemoved.connect(lambda parent, first, last: self._invalidate_display(first))
+        self.dataChanged.connect(lambda top_left, bottom_right, roles=(): self._invalidate_display(top_left.row()))
+
     def _init_default_icons(self):
         """기본 아이콘을 초기화한다."""
         try:
@@ -170,15 +347,14 @@ class FileTableModel(QAbstractTableModel):
 
         # 모델 초기화
         self.beginResetModel()
-        self._items = []
+        self._items = EntryStore(path)
         self.endResetModel()
 
         # .. 항목을 미리 추가 (루트가 아닐 경우, glob 필터가 없을 때만)
         parent_dir = os.path.dirname(path)
         if not glob_pattern and parent_dir and parent_dir != path:
-            parent_item = self._create_parent_item(parent_dir)
             self.beginInsertRows(QModelIndex(), 0, 0)
-            self._items.append(parent_item)
+            self._items.append_parent()
             self.endInsertRows()
 
         # 새로운 로더 생성
@@ -188,7 +364,7 @@ class FileTableModel(QAbstractTableModel):
         self._loader.finished.connect(self._loader.deleteLater)
         self._loader.start()
 
-    def _on_chunk_ready(self, chunk: list):
+    def _on_chunk_ready(self, chunk: EntryStore):
         """청크 단위 결과를 받아 모델에 추가한다."""
         if self.sender() is not self._loader:
             return
@@ -216,26 +392,103 @@ class FileTableModel(QAbstractTableModel):
         if self._loader is not None:
             self._loader.cancel()
 
-    @staticmethod
-    def _create_parent_item(parent_dir: str) -> dict:
-        """상위 디렉토리(..) 항목을 생성한다."""
-        return {
-            "name": "..",
-            "path": parent_dir,
-            "is_dir": True,
-            "size": None,
-            "modified": None,
-            "display_size": "",
-            "display_modified": "",
-        }
+    def _invalidate_sort_keys(self, *args):
+        """항목이 바뀌었으므로 정렬 키 캐시를 버린다."""
+        self._sort_keys = None
+
+    def _display_strings(self, row: int) -> tuple[str, str]:
+        """행의 (크기, 수정일시) 표시 문자열을 반환한다.
+
+        화면에 그려지는 행이 속한 블록만 한 번에 포맷팅하고 최근 블록을 캐시한다.
+        """
+        block = row // self.DISPLAY_BLOCK_ROWS
+        start = block * self.DISPLAY_BLOCK_ROWS
+        cached = self._display_blocks.get(block)
+        if cached is None:
+            items = self._items
+            rows = range(start, min(start + self.DISPLAY_BLOCK_ROWS, len(items)))
+            format_one = self._formatter.format_modified
+            cached = (
+                [format_size(items.size(r)) for r in rows],
+                [format_one(items.modified(r)) for r in rows],
+            )
+            self._display_blocks[block] = cached
+            if len(self._display_blocks) > self.DISPLAY_CACHE_BLOCKS:
+                self._display_blocks.popitem(last=False)
+        else:
+            self._display_blocks.move_to_end(block)
+        return cached[0][row - start], cached[1][row - start]
 
-    def _get_icon(self, item: dict) -> QIcon:
+    def _invalidate_display(self, first_row: int = 0):
+        """first_row 이후 행의 표시 문자열 캐시를 버린다."""
+        if first_row <= 0:
+            self._display_blocks.clear()
+            return
+        first_block = first_row // self.DISPLAY_BLOCK_ROWS
+        for block in [block for block in self._display_blocks if block >= first_block]:
+            del self._display_blocks[block]
+
+    def _native_order(self) -> tuple[list, list, list]:
+        """(.. 행, 디렉토리 행, 파일 행)을 각각 이름(대소문자 무시)순으로 나눈다."""
+        if self._sort_keys is None:
+            items = self._items
+            groups = items.flags.translate(_GROUP_TABLE)
+            folded = [name.casefold() for name in items.names]
+            name_order = sorted(range(len(folded)), key=folded.__getitem__)
+            self._sort_keys = (
+                [row for row in name_order if groups[row] == 0],
+                [row for row in name_order if groups[row] == 1],
+                [row for row in name_order if groups[row] == 2],
+            )
+        return self._sort_keys
+
+    def sort_permutation(self, column: int, order: Qt.SortOrder) -> list:
+        """컬럼 기준으로 정렬된 행 순서(원본 행 번호 목록)를 계산한다.
+
+        .. 항목과 디렉토리는 정렬 방향과 관계없이 항상 앞에 둔다.
+        이름순 행 순서를 캐시해 두고 크기/수정시간은 그 순서를 기준으로
+        키 배열 하나로 안정 정렬한다 (NumPy가 있으면 argsort 사용).
+        """
+        parent_rows, directories, files = self._native_order()
+        descending = order == Qt.SortOrder.DescendingOrder
+
+        if column == self.COLUMN_SIZE:
+            keys = self._items.sizes
+        elif column == self.COLUMN_MODIFIED:
+            keys = self._items.mtimes
+        elif column == self.COLUMN_NAME:
+            keys = None
+        else:
+            # 타입 컬럼은 디렉토리 우선 규칙만으로 정해지므로 이름순 유지
+            return parent_rows + directories + files
+
+        if keys is not None and numpy is not None:
+            values = numpy.frombuffer(keys, dtype=numpy.dtype(keys.typecode))
+            parts = [numpy.asarray(parent_rows, dtype=numpy.int64)]
+            for rows in (directories, files):
+                rows = numpy.asarray(rows, dtype=numpy.int64)
+                row_values = values[rows]
+                parts.append(rows[numpy.argsort(-row_values if descending else row_values, kind="stable")])
+            permutation = array("q")
+            permutation.frombytes(numpy.concatenate(parts).tobytes())
+            return permutation
+
+        permutation = list(parent_rows)
+        for rows in (directories, files):
+            if keys is None:
+                permutation.extend(reversed(rows) if descending else rows)
+            else:
+                permutation.extend(sorted(rows, key=keys.tolist().__getitem__, reverse=descending))
+        return permutation
+
+    def _get_icon(self, row: int) -> QIcon:
         """항목의 아이콘을 반환한다 (캐시 활용)."""
-        if item["is_dir"]:
+        items = self._items
+        if items.is_dir(row):
             return self._icon_cache.get("__dir__", QIcon())
 
         # 확장자 기반 캐시 조회
-        ext = os.path.splitext(item["name"])[1].lower() if item["name"] != ".." else ""
+        ext = os.path.splitext(items.names[row])[1].lower()
 
         if not ext:
             ext = "__file__"
@@ -243,7 +496,7 @@ class FileTableModel(QAbstractTableModel):
         if ext not in self._icon_cache:
             # 캐시에 없으면 QFileInfo로 로드
             try:
-                file_info = QFileInfo(item["path"])
+                file_info = QFileInfo(items.path(row))
                 self._icon_cache[ext] = self._file_icon_provider.icon(file_info)
             except Exception:
                 self._icon_cache[ext] = self._icon_cache.get("__file__", QIcon())
@@ -263,34 +516,29 @@ class FileTableModel(QAbstractTableModel):
         if not index.isValid() or index.row() >= len(self._items):
             return None
 
-        item = self._items[index.row()]
+        items = self._items
+        row = index.row()
 
         if role == Qt.ItemDataRole.DisplayRole:
             col = index.column()
             if col == self.COLUMN_NAME:
-                return item["name"]
+                return items.names[row]
+            # .. 항목은 크기/타입/수정일시 표시 안 함
+            if items.is_parent(row):
+                return ""
             elif col == self.COLUMN_SIZE:
-                # .. 항목은 크기 표시 안 함
-                if item["name"] == "..":
-                    return ""
-                return item.get("display_size", DirectoryLoader._format_size(item["size"]))
+                return self._display_strings(row)[0]
             elif col == self.COLUMN_TYPE:
-                # .. 항목은 타입 표시 안 함
-                if item["name"] == "..":
-                    return ""
-                return "디렉토리" if item["is_dir"] else "파일"
+                return "디렉토리" if items.is_dir(row) else "파일"
             elif col == self.COLUMN_MODIFIED:
-                # .. 항목은 수정일시 표시 안 함
-                if item["name"] == "..":
-                    return ""
-                return item.get("display_modified", DirectoryLoader._format_modified(item["modified"]))
+                return self._display_strings(row)[1]
 
         elif role == Qt.ItemDataRole.DecorationRole:
             # 첫 번째 컬럼에만 아이콘 표시
             if index.column() == self.COLUMN_NAME:
-                return self._get_icon(item)
+                return self._get_icon(row)
         elif role == Qt.ItemDataRole.UserRole:
-            return item
+            return items.item(row)
 
         return None
 
@@ -365,49 +613,134 @@ class NavigationBar(QWidget):
         self.forward_btn.setEnabled(enabled)
 
 
-class ExplorerSortProxyModel(QSortFilterProxyModel):
-    """파일 탐색기 정렬 규칙(.. 우선, 디렉토리 우선)을 적용하는 프록시 모델"""
-
-    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
-        left_item = left.data(Qt.ItemDataRole.UserRole)
-        right_item = right.data(Qt.ItemDataRole.UserRole)
+class ExplorerSortProxyModel(QAbstractProxyModel):
+    """파일 탐색기 정렬 규칙(.. 우선, 디렉토리 우선)을 적용하는 프록시 모델
 
-        if not isinstance(left_item, dict) or not isinstance(right_item, dict):
-            return super().lessThan(left, right)
+    비교 함수(lessThan)를 행마다 호출하는 대신, 원본 모델의
+    sort_permutation()이 키 기반으로 한 번에 계산한 행 순서를
+    프록시 행 → 원본 행 매핑으로 보관한다.
+    삽입된 행은 다시 정렬하지 않고 끝에 붙인다.
+    """
 
-        left_name = left_item.get("name", "")
-        right_name = right_item.get("name", "")
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mapping = None  # 프록시 행 → 원본 행 (None이면 원본 순서 그대로)
+        self._inverse = None  # 원본 행 → 프록시 행 (필요할 때 생성)
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
 
-        # 상위 디렉토리(..)는 항상 최상단
-        if left_name == ".." and right_name != "..":
-            return True
-        if right_name == ".." and left_name != "..":
-            return False
+    def setSourceModel(self, source_model):
+        """원본 모델을 지정하고 시그널을 연결한다."""
+        self.beginResetModel()
+        super().setSourceModel(source_model)
+        source_model.modelAboutToBeReset.connect(self.beginResetModel)
+        source_model.modelReset.connect(self._on_source_reset)
+        source_model.rowsInserted.connect(self._on_rows_inserted)
+        source_model.dataChanged.connect(self._on_data_changed)
+        source_model.headerDataChanged.connect(self.headerDataChanged)
+        self._rebuild_mapping()
+        self.endResetModel()
 
-        # 디렉토리를 파일보다 우선 배치
-        left_is_dir = bool(left_item.get("is_dir"))
-        right_is_dir = bool(right_item.get("is_dir"))
-        if left_is_dir != right_is_dir:
-            return left_is_dir
+    def _rebuild_mapping(self):
+        """현재 정렬 기준으로 매핑을 다시 계산한다."""
+        self._inverse = None
+        if self._sort_column < 0:
+            self._mapping = None
+            return
+        permutation = self.sourceModel().sort_permutation(self._sort_column, self._sort_order)
+        self._mapping = permutation if isinstance(permutation, array) else array("q", permutation)
+
+    def _source_to_proxy(self) -> array:
+        """원본 행 → 프록시 행 역매핑을 반환한다."""
+        if self._inverse is None:
+            inverse = array("q", [-1]) * self.sourceModel().rowCount()
+            for proxy_row, source_row in enumerate(self._mapping):
+                inverse[source_row] = proxy_row
+            self._inverse = inverse
+        return self._inverse
+
+    def _on_source_reset(self):
+        self._rebuild_mapping()
+        self.endResetModel()
 
-        col = left.column()
-        if col == FileTableModel.COLUMN_SIZE:
-            left_size = left_item.get("size")
-            right_size = right_item.get("size")
-            left_size = -1 if left_size is None else left_size
-            right_size = -1 if right_size is None else right_size
-            return left_size < right_size
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+        """원본 행 추가: 원본 순서면 같은 위치에, 정렬 중이면 끝에 붙인다."""
+        if self._mapping is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+            self.endInsertRows()
+            return
 
-        if col == FileTableModel.COLUMN_MODIFIED:
-            left_modified = left_item.get("modified")
-            right_modified = right_item.get("modified")
-            left_modified = -1 if left_modified is None else left_modified
-            right_modified = -1 if right_modified is None else right_modified
-            return left_modified < right_modified
+        start = len(self._mapping)
+        self.beginInsertRows(QModelIndex(), start, start + last - first)
+        self._mapping.extend(range(first, last + 1))
+        self._inverse = None
+        self.endInsertRows()
 
-        left_text = str(left.data(Qt.ItemDataRole.DisplayRole) or "").lower()
-        right_text = str(right.data(Qt.ItemDataRole.DisplayRole) or "").lower()
-        return left_text < right_text
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()):
+        """원본 데이터 변경을 프록시 범위로 바꿔 전달한다."""
+        if self._mapping is None:
+            first, last = top_left.row(), bottom_right.row()
+        else:
+            inverse = self._source_to_proxy()
+            proxy_rows = [inverse[row] for row in range(top_left.row(), bottom_right.row() + 1)]
+            first, last = min(proxy_rows), max(proxy_rows)
+        self.dataChanged.emit(self.index(first, top_left.column()), self.index(last, bottom_right.column()), roles)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """원본 모델이 계산한 순서로 정렬한다 (column < 0이면 원본 순서)."""
+        self._sort_column = column
+        self._sort_order = order
+
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        old_sources = [self.mapToSource(index) for index in old_persistent]
+        self._rebuild_mapping()
+        self.changePersistentIndexList(old_persistent, [self.mapFromSource(index) for index in old_sources])
+        self.layoutChanged.emit()
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        if self.sourceModel() is None or not proxy_index.isValid():
+            return QModelIndex()
+        row = proxy_index.row()
+        if self._mapping is not None:
+            if row >= len(self._mapping):
+                return QModelIndex()
+            row = self._mapping[row]
+        return self.sourceModel().index(row, proxy_index.column())
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        if self.sourceModel() is None or not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self._mapping is not None:
+            inverse = self._source_to_proxy()
+            if row >= len(inverse) or inverse[row] < 0:
+                return QModelIndex()
+            row = inverse[row]
+        return self.index(row, source_index.column())
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not (0 <= row < self.rowCount() and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex = None):
+        # 인자가 없으면 QObject.parent()
+        if index is None:
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if self.sourceModel() is None or parent.isValid():
+            return 0
+        if self._mapping is None:
+            return self.sourceModel().rowCount()
+        return len(self._mapping)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if self.sourceModel() is None or parent.isValid():
+            return 0
+        return self.sourceModel().columnCount()
 
 
 def parse_path_with_pattern(input_path: str):
@@ -459,9 +792,9 @@ class FileExplorerWidget(QWidget):
         self.model = FileTableModel()
 
         # 정렬 필터 프록시 모델
+        # (모델이 계산한 정렬 순서를 매핑으로 적용, 삽입 시 자동 재정렬 없음)
         self.proxy_model = ExplorerSortProxyModel()
         self.proxy_model.setSourceModel(self.model)
-        self.proxy_model.setDynamicSortFilter(False)  # 삽입 시 자동 재정렬 비활성화
         self.model.loading_finished.connect(self._resort_proxy)
 
         # 테이블 뷰
@@ -527,13 +860,13 @@ class FileExplorerWidget(QWidget):
         source_index = self.proxy_model.mapToSource(index)
         row = source_index.row()
 
-        if row >= len(self.model._items):
+        items = self.model._items
+        if row < 0 or row >= len(items):
             return
 
-        item = self.model._items[row]
-        path = item["path"]
+        path = items.path(row)
 
-        if item["is_dir"]:
+        if items.is_dir(row):
             # 디렉토리: 진입
             self.navigate_to(path)
 
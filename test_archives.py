@@ -0,0 +1,265 @@
+"""압축 파일 탐색 백엔드 테스트 (pytest, Qt 불필요)
+
+    python -m pytest -q test_archives.py
+"""
+import io
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tarfile
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from file_explorer.archives import ArchiveBackend, _tar_headers, _tar_number, archive_format
+from file_explorer.scan import walk, write_ndjson
+
+# 압축 파일 안 트리 (디렉토리 항목 없이 파일 경로만 있는 상위 디렉토리 포함)
+FILES = {
+    "readme.txt": b"hello",
+    "src/main.py": b"print('main')\n",
+    "src/pkg/util.py": b"x = 1\n" * 100,
+    "data/deep/er/still/value.bin": bytes(range(256)),
+}
+LONG_NAME = "long/" + "n" * 120 + ".txt"  # ustar 이름 필드(100바이트)를 넘는 경로
+MTIME = 1_700_000_000
+
+
+def add_tar_file(archive: tarfile.TarFile, name: str, data: bytes):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = MTIME
+    archive.addfile(info, io.BytesIO(data))
+
+
+def make_tar(path: str, mode: str = "w", format: int = tarfile.GNU_FORMAT) -> str:
+    with tarfile.open(path, mode, format=format) as archive:
+        directory = tarfile.TarInfo("src")
+        directory.type = tarfile.DIRTYPE
+        directory.mtime = MTIME
+        archive.addfile(directory)
+        for name, data in FILES.items():
+            add_tar_file(archive, name, data)
+        add_tar_file(archive, LONG_NAME, b"long")
+        link = tarfile.TarInfo("src/link.py")
+        link.type = tarfile.SYMTYPE
+        link.linkname = "main.py"
+        link.mtime = MTIME
+        archive.addfile(link)
+    return path
+
+
+def make_zip(path: str) -> str:
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("src/", b"")
+        for name, data in FILES.items():
+            archive.writestr(name, data)
+        archive.writestr(LONG_NAME, b"long")
+        link = zipfile.ZipInfo("src/link.py")
+        link.external_attr = (stat.S_IFLNK | 0o777) << 16
+        archive.writestr(link, "main.py")
+    return path
+
+
+def listing(backend: ArchiveBackend, path: str) -> dict:
+    """이름 -> (디렉토리 여부, 파일 여부, 심볼릭 링크 여부, 크기)."""
+    with backend.list(path) as entries:
+        return {entry.name: (entry.is_dir(follow_symlinks=False), entry.is_file(follow_symlinks=False),
+                             entry.is_symlink(), entry.stat(follow_symlinks=False).st_size)
+                for entry in entries}
+
+
+@pytest.fixture(params=["zip", "tar", "tar.gz", "tar.bz2", "tar.xz", "pax.tar"])
+def archive(request, tmp_path):
+    kind = request.param
+    path = str(tmp_path / f"sample.{kind}")
+    if kind == "zip":
+        return make_zip(path)
+    if kind == "pax.tar":
+        return make_tar(path, format=tarfile.PAX_FORMAT)
+    return make_tar(path, "w" if kind == "tar" else "w:" + kind.split(".")[1])
+
+
+def test_archive_format():
+    assert archive_format("/a/b.zip") == "zip"
+    assert archive_format("/a/B.TAR.GZ") == "tar"
+    assert archive_format("/a/b.tgz") == "tar"
+    assert archive_format("/a/.zip") is None
+    assert archive_format("/a/b.gz") is None
+
+
+def test_tar_number():
+    assert _tar_number(b"0000644\x00") == 0o644
+    assert _tar_number(b"  17 \x00") == 0o17
+    assert _tar_number(b"\x00" * 12) == 0
+    # 8진수 12자리를 넘는 값은 GNU base-256
+    assert _tar_number(tarfile.itn(1 << 40, 12, tarfile.GNU_FORMAT)) == 1 << 40
+    assert _tar_number(tarfile.itn(-5, 12, tarfile.GNU_FORMAT)) == -5
+
+
+def test_list_top_level(archive):
+    backend = ArchiveBackend()
+    top = listing(backend, archive)
+    assert top == {
+        "readme.txt": (False, True, False, 5),
+        "src": (True, False, False, 0),
+        "data": (True, False, False, 0),
+        "long": (True, False, False, 0),
+    }
+    assert backend.is_dir(archive)
+    if not archive.endswith(".zip"):
+        assert backend.stat(os.path.join(archive, "readme.txt")).st_mtime == MTIME
+
+
+def test_nested_folders(archive):
+    backend = ArchiveBackend()
+    src = listing(backend, os.path.join(archive, "src"))
+    assert set(src) == {"main.py", "pkg", "link.py"}
+    assert src["pkg"][0] and src["main.py"][1]
+    assert listing(backend, os.path.join(archive, "src", "pkg")) == {"util.py": (False, True, False, 600)}
+    # 디렉토리 항목이 없는 깊은 상위 디렉토리도 만들어짐
+    deep = os.path.join(archive, "data", "deep", "er", "still")
+    assert backend.is_dir(deep)
+    assert listing(backend, deep) == {"value.bin": (False, True, False, 256)}
+    assert listing(backend, os.path.join(archive, "long")) == {"n" * 120 + ".txt": (False, True, False, 4)}
+
+
+def test_open_members(archive):
+    backend = ArchiveBackend()
+    for name, data in FILES.items():
+        with backend.open(os.path.join(archive, name)) as f:
+            assert f.read() == data
+    with backend.open(os.path.join(archive, LONG_NAME)) as f:
+        assert f.read() == b"long"
+    with pytest.raises(IsADirectoryError):
+        backend.open(os.path.join(archive, "src"))
+
+
+def test_missing_paths(archive):
+    backend = ArchiveBackend()
+    with pytest.raises(FileNotFoundError):
+        backend.list(os.path.join(archive, "nope"))
+    with pytest.raises(NotADirectoryError):
+        backend.list(os.path.join(archive, "readme.txt"))
+    with pytest.raises(FileNotFoundError):
+        backend.stat(os.path.join(archive, "src", "nope.py"))
+    assert not backend.is_dir(os.path.join(archive, "readme.txt"))
+    assert not backend.is_dir(os.path.join(archive, "nope"))
+
+
+def test_symlink_members(archive):
+    backend = ArchiveBackend()
+    link = os.path.join(archive, "src", "link.py")
+    assert listing(backend, os.path.dirname(link))["link.py"] == (False, False, True, len("main.py"))
+    assert stat.S_ISLNK(backend.stat(link).st_mode)
+    assert not backend.is_dir(link)
+    with pytest.raises(OSError):
+        backend.open(link)
+
+
+def test_scan_reports_symlinks(archive):
+    out = io.StringIO()
+    write_ndjson(walk(archive, recursive=True, backend=ArchiveBackend()), out)
+    types = {}
+    for line in out.getvalue().splitlines():
+        path = line.split('"path": "', 1)[1].split('"', 1)[0]
+        types[path] = line.split('"type": "', 1)[1].split('"', 1)[0]
+    assert types[os.path.join("src", "link.py")] == "symlink"
+    assert types[os.path.join("src", "main.py")] == "file"
+    assert types["src"] == "dir"
+
+
+def test_nested_archive_resolution(tmp_path):
+    backend = ArchiveBackend()
+    # 압축 파일이 일반 디렉토리 아래에 있고, 이름이 압축 파일 같은 디렉토리는 그냥 디렉토리
+    outer = tmp_path / "dir.zip"
+    outer.mkdir()
+    inner_dir = outer / "deeper"
+    inner_dir.mkdir()
+    archive = make_zip(str(inner_dir / "a.zip"))
+    assert backend.split(str(outer)) is None
+    assert backend.split(archive) == (archive, "")
+    assert backend.split(os.path.join(archive, "src", "pkg")) == (archive, "src/pkg")
+    assert "util.py" in listing(backend, os.path.join(archive, "src", "pkg"))
+
+    # 압축 파일 안의 압축 파일은 열지 않는다 (멤버 파일로 보임)
+    nested = str(tmp_path / "outer.zip")
+    with zipfile.ZipFile(nested, "w") as zf:
+        with open(archive, "rb") as f:
+            zf.writestr("inner.zip", f.read())
+    assert listing(backend, nested)["inner.zip"][1]
+    assert not backend.is_dir(os.path.join(nested, "inner.zip"))
+    with pytest.raises(FileNotFoundError):
+        backend.list(os.path.join(nested, "inner.zip", "src"))
+
+
+def test_index_cache(tmp_path):
+    backend = ArchiveBackend(max_archives=2)
+    first = make_zip(str(tmp_path / "1.zip"))
+    index = backend.index(first)
+    assert first in backend
+    listing(backend, os.path.join(first, "src"))
+    assert backend.index(first) is index
+
+    # 압축 파일이 바뀌면 인덱스를 다시 만든다
+    with zipfile.ZipFile(first, "a") as archive:
+        archive.writestr("added.txt", b"new")
+    os.utime(first, (MTIME, MTIME))
+    assert backend.index(first) is not index
+    assert "added.txt" in listing(backend, first)
+
+    # 최대 개수를 넘으면 오래된 것부터 버린다
+    second = make_zip(str(tmp_path / "2.zip"))
+    third = shutil.copy(second, tmp_path / "3.zip")
+    backend.index(second)
+    backend.index(first)
+    backend.index(third)
+    assert first in backend and third in backend and second not in backend
+    backend.clear()
+    assert first not in backend
+
+
+def test_tar_headers_offsets(tmp_path):
+    path = make_tar(str(tmp_path / "plain.tar"))
+    with open(path, "rb") as stream:
+        headers = {name.rstrip("/"): (is_dir, is_link, size, offset)
+                   for name, is_dir, is_link, size, _, offset in _tar_headers(stream, path)}
+    with tarfile.open(path) as archive:
+        for info in archive:
+            assert headers[info.name][3] == info.offset
+    assert headers["src/link.py"][:3] == (False, True, len("main.py"))
+    assert headers[LONG_NAME][:3] == (False, False, 4)
+
+
+def test_corrupt_tar(tmp_path):
+    path = make_tar(str(tmp_path / "bad.tar"))
+    with open(path, "r+b") as f:
+        f.seek(148)
+        f.write(b"9999999")
+    with pytest.raises(OSError):
+        ArchiveBackend().list(path)
+
+
+@pytest.mark.skipif(shutil.which("tar") is None, reason="GNU tar 필요")
+def test_gnu_sparse_falls_back_to_tarfile(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    with open(source / "sparse.bin", "wb") as f:
+        f.seek(1 << 20)
+        f.write(b"end")
+    (source / "plain.txt").write_bytes(b"plain")
+    path = str(tmp_path / "sparse.tar")
+    result = subprocess.run(["tar", "--sparse", "--format=gnu", "-cf", path, "-C", str(source), "."],
+                            capture_output=True)
+    if result.returncode != 0:
+        pytest.skip("GNU sparse tar를 만들 수 없음")
+    backend = ArchiveBackend()
+    top = listing(backend, path)
+    assert top["sparse.bin"] == (False, True, False, (1 << 20) + 3)
+    assert top["plain.txt"] == (False, True, False, 5)
+    with backend.open(os.path.join(path, "plain.txt")) as f:
+        assert f.read() == b"plain"
@@ -0,0 +1,196 @@
+"""디렉토리 변경 반영 테스트 (pytest)
+
+    QT_QPA_PLATFORM=offscreen python -m pytest -q test_directory_changes.py
+"""
+import os
+import random
+import sys
+import time
+
+import pytest
+from PyQt6.QtCore import Qt
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from file_explorer.file_model import FileTableModel
+from file_explorer.listing_cache import ListingCache
+from file_explorer.name_filter import GlobFilter, QuickFilter
+from file_explorer.sort_proxy import ExplorerSortProxyModel
+from file_explorer.watcher import DirectoryWatcher
+
+
+def wait_loaded(app, model, timeout=10.0):
+    start = time.monotonic()
+    while model._loading:
+        app.processEvents()
+        assert time.monotonic() - start < timeout, "로딩 시간 초과"
+
+
+def shown_names(model):
+    return [model._items.names[row] for row in range(model.rowCount())]
+
+
+def make_dir(tmp_path):
+    for name in ("sub", "zdir"):
+        (tmp_path / name).mkdir()
+    for name in ("a.txt", "f1.txt", "g.txt"):
+        (tmp_path / name).write_text("x")
+    return str(tmp_path)
+
+
+def replace_with_dir(path, name):
+    os.remove(os.path.join(path, name))
+    os.mkdir(os.path.join(path, name))
+
+
+def expected_order(path):
+    names = os.listdir(path)
+    dirs = sorted((name for name in names if os.path.isdir(os.path.join(path, name))), key=str.casefold)
+    files = sorted((name for name in names if not os.path.isdir(os.path.join(path, name))), key=str.casefold)
+    return ["..", *dirs, *files]
+
+
+@pytest.mark.parametrize("apply", ["named", "listing"])
+def test_file_replaced_by_directory_moves_row(app, tmp_path, apply):
+    path = make_dir(tmp_path)
+    model = FileTableModel(listing_cache=ListingCache())
+    model.load(path)
+    wait_loaded(app, model)
+    assert shown_names(model) == ["..", "sub", "zdir", "a.txt", "f1.txt", "g.txt"]
+
+    replace_with_dir(path, "f1.txt")
+    if apply == "named":
+        model._apply_named_changes({"f1.txt"})
+    else:
+        model.refresh()
+        wait_loaded(app, model)
+    assert shown_names(model) == expected_order(path) == ["..", "f1.txt", "sub", "zdir", "a.txt", "g.txt"]
+    assert model._items.is_dir(1)
+
+    # 다시 방문해 캐시된 목록을 써도 순서가 유지된다
+    model.load(os.path.dirname(path))
+    wait_loaded(app, model)
+    model.load(path)
+    wait_loaded(app, model)
+    assert shown_names(model) == expected_order(path)
+
+
+def test_directory_replaced_by_file_moves_row(app, tmp_path):
+    path = make_dir(tmp_path)
+    model = FileTableModel(listing_cache=ListingCache())
+    model.load(path)
+    wait_loaded(app, model)
+
+    os.rmdir(os.path.join(path, "sub"))
+    (tmp_path / "sub").write_text("x")
+    model._apply_named_changes({"sub"})
+    assert shown_names(model) == expected_order(path) == ["..", "zdir", "a.txt", "f1.txt", "g.txt", "sub"]
+
+
+def test_fetch_rows_sorts_and_filters_outside_model(app, tmp_path):
+    for index in range(40):
+        (tmp_path / f"f{index:02d}.txt").write_text("x" * (40 - index))
+    path = str(tmp_path)
+    model = FileTableModel(listing_cache=ListingCache(), fetch_rows=10)
+    model.load(path)
+    wait_loaded(app, model)
+    assert shown_names(model) == expected_order(path)[:10]
+    assert model.total_rows() == 41 and model.canFetchMore()
+
+    # 다른 컬럼 정렬/필터는 전체 항목에 적용하고 앞쪽만 행으로 보인다
+    model.set_view((FileTableModel.COLUMN_SIZE, Qt.SortOrder.DescendingOrder), {})
+    assert shown_names(model) == ["..", *(f"f{index:02d}.txt" for index in range(9))]
+    model.set_view(None, {"quick": QuickFilter("f3")})
+    assert shown_names(model) == [f"f{index}.txt" for index in range(30, 40)]
+    assert model.total_rows() == 10 and not model.canFetchMore()
+
+    # 보이는 구간 밖의 변경도 전체 목록에 반영된다
+    model.set_view(None, {})
+    (tmp_path / "a.txt").write_text("x")
+    os.remove(os.path.join(path, "f39.txt"))
+    model._apply_named_changes({"a.txt", "f39.txt"})
+    assert list(model.entries().names) == expected_order(path)
+    assert shown_names(model) == expected_order(path)[:10]
+    model.fetchMore()
+    assert shown_names(model) == expected_order(path)[:20]
+
+
+@pytest.mark.parametrize("row_filter", [None, QuickFilter("1"), GlobFilter("*1*")], ids=["none", "quick", "glob"])
+def test_sorted_filtered_proxy_follows_changes(app, tmp_path, row_filter):
+    rng = random.Random(3)
+    names = []
+    for index in range(300):
+        name = f"f{index}.txt"
+        (tmp_path / name).write_text("x" * rng.randrange(20))
+        names.append(name)
+    path = str(tmp_path)
+    model = FileTableModel(listing_cache=ListingCache())
+    model.load(path)
+    wait_loaded(app, model)
+    proxy = ExplorerSortProxyModel()
+    proxy.setSourceModel(model)
+    proxy.sort(FileTableModel.COLUMN_SIZE, Qt.SortOrder.DescendingOrder)
+    if row_filter is not None:
+        proxy.set_filter("test", row_filter)
+
+    def expected():
+        # 기본 순서(디렉토리 우선, 이름순)에서 걸러낸 뒤 크기 내림차순으로 안정 정렬
+        shown = [name for name in expected_order(path) if row_filter is None or "1" in name]
+        is_dir = lambda name: name == ".." or os.path.isdir(os.path.join(path, name))
+        size = lambda name: 0 if is_dir(name) else os.path.getsize(os.path.join(path, name))
+        return sorted(shown, key=lambda name: (name != "..", not is_dir(name), -size(name)))
+
+    # 바뀐 항목만 반영하므로 매핑을 처음부터 다시 계산한 결과와 같아야 한다
+    for step in range(100):
+        changed = set()
+        for _ in range(rng.randint(1, 4)):
+            if rng.random() < 0.5 and names:
+                name = names.pop(rng.randrange(len(names)))
+                os.remove(os.path.join(path, name))
+            elif rng.random() < 0.2:
+                name = f"d{step}_{len(changed)}"
+                os.mkdir(os.path.join(path, name))
+            else:
+                name = f"n{step}_{len(changed)}.txt"
+                (tmp_path / name).write_text("x" * rng.randrange(20))
+                names.append(name)
+            changed.add(name)
+        model._apply_named_changes(changed)
+        shown = [model._items.names[proxy.mapToSource(proxy.index(row, 0)).row()] for row in range(proxy.rowCount())]
+        assert shown == expected()
+        assert list(proxy._mapping) == list(proxy._compute_mapping())
+
+
+class FailingAddWatch:
+    """inotify_add_watch만 실패(-1)하는 libc (감시 개수 한도 ENOSPC 등)."""
+
+    def __init__(self, libc):
+        self._libc = libc
+
+    def inotify_add_watch(self, *args):
+        return -1
+
+    def __getattr__(self, name):
+        return getattr(self._libc, name)
+
+
+def test_watcher_falls_back_when_add_watch_fails(app, tmp_path):
+    watcher = DirectoryWatcher(coalesce_ms=0)
+    if watcher._fd < 0:
+        pytest.skip("inotify 필요")
+    watcher._libc = FailingAddWatch(watcher._libc)
+    changes = []
+    watcher.changes_ready.connect(changes.append)
+    watcher.watch(str(tmp_path))
+    assert watcher._fallback.directories() == [str(tmp_path)]
+
+    (tmp_path / "new.txt").write_text("x")
+    start = time.monotonic()
+    while not changes:
+        app.processEvents()
+        assert time.monotonic() - start < 10, "변경 알림 시간 초과"
+    assert changes == [None]  # 폴백은 이름을 모르므로 전체 재확인
+
+    watcher.stop()
+    assert watcher._fallback.directories() == []
+    watcher.close()
@@ -0,0 +1,203 @@
+"""백그라운드 파일 작업(복사/이동/삭제) 테스트 (pytest, 작업은 테스트 스레드에서 실행)
+
+    python -m pytest -q test_file_operations.py
+"""
+import errno
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from file_explorer import file_operations
+from file_explorer.file_operations import COPY, DELETE, MOVE, FileOperation, copy_file
+from file_explorer.loader import LoaderPool
+
+
+def make_tree(root) -> str:
+    """파일, 하위 디렉토리, 심볼릭 링크가 있는 트리를 만든다."""
+    (root / "tree" / "sub" / "deep").mkdir(parents=True)
+    (root / "tree" / "a.txt").write_text("a")
+    (root / "tree" / "sub" / "b.bin").write_bytes(bytes(range(256)) * 40)
+    (root / "tree" / "sub" / "deep" / "c.txt").write_text("c" * 1000)
+    os.symlink("a.txt", root / "tree" / "link")
+    os.utime(root / "tree" / "a.txt", (1_600_000_000, 1_600_000_000))
+    return str(root / "tree")
+
+
+def snapshot(path: str) -> dict:
+    """상대 경로 -> 파일 내용 / 링크 대상 / 디렉토리."""
+    result = {}
+    for directory, dirs, files in os.walk(path):
+        for name in dirs + files:
+            full = os.path.join(directory, name)
+            relative = os.path.relpath(full, path)
+            if os.path.islink(full):
+                result[relative] = ("link", os.readlink(full))
+            elif os.path.isdir(full):
+                result[relative] = ("dir",)
+            else:
+                with open(full, "rb") as f:
+                    result[relative] = ("file", f.read())
+    return result
+
+
+def run(operation: FileOperation):
+    """작업을 테스트 스레드에서 실행하고 finished 결과를 반환한다."""
+    results = []
+    operation.finished.connect(results.append)
+    operation.run()
+    assert len(results) == 1
+    return results[0]
+
+
+def test_copy_tree(tmp_path):
+    source = make_tree(tmp_path)
+    expected = snapshot(source)
+    (tmp_path / "dest").mkdir()
+    result = run(FileOperation(COPY, [source], str(tmp_path / "dest")))
+    assert result.errors == [] and not result.cancelled
+    copied = str(tmp_path / "dest" / "tree")
+    assert snapshot(copied) == expected == snapshot(source)
+    assert os.stat(os.path.join(copied, "a.txt")).st_mtime == 1_600_000_000
+    assert result.files_done == result.files_total == 4
+    assert result.bytes_done == result.bytes_total == 1 + 256 * 40 + 1000
+
+
+def test_move_across_devices(tmp_path, monkeypatch):
+    source = make_tree(tmp_path)
+    expected = snapshot(source)
+    (tmp_path / "dest").mkdir()
+
+    def rename(src, dst, *args, **kwargs):
+        raise OSError(errno.EXDEV, "Invalid cross-device link", src)
+
+    monkeypatch.setattr(file_operations.os, "rename", rename)
+    result = run(FileOperation(MOVE, [source], str(tmp_path / "dest")))
+    monkeypatch.undo()
+    assert result.errors == [] and not result.cancelled
+    assert snapshot(str(tmp_path / "dest" / "tree")) == expected
+    assert not os.path.lexists(source)
+
+
+def test_move_same_device(tmp_path):
+    source = make_tree(tmp_path)
+    expected = snapshot(source)
+    (tmp_path / "dest").mkdir()
+    result = run(FileOperation(MOVE, [source, str(tmp_path / "missing")], str(tmp_path / "dest")))
+    assert [path for path, _ in result.errors] == [str(tmp_path / "missing")]
+    assert snapshot(str(tmp_path / "dest" / "tree")) == expected
+    assert not os.path.lexists(source)
+
+
+@pytest.mark.parametrize("kind", [COPY, MOVE])
+def test_name_conflict_is_skipped(tmp_path, kind):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "dest").mkdir()
+    (tmp_path / "src" / "same.txt").write_text("new")
+    (tmp_path / "src" / "other.txt").write_text("other")
+    (tmp_path / "dest" / "same.txt").write_text("old")
+    sources = [str(tmp_path / "src" / name) for name in ("same.txt", "other.txt")]
+    result = run(FileOperation(kind, sources, str(tmp_path / "dest")))
+    assert [path for path, _ in result.errors] == [sources[0]]
+    assert (tmp_path / "dest" / "same.txt").read_text() == "old"
+    assert (tmp_path / "dest" / "other.txt").read_text() == "other"
+    assert (tmp_path / "src" / "same.txt").exists()
+
+    # 자기 자신 안으로는 복사/이동하지 않는다
+    result = run(FileOperation(kind, [str(tmp_path / "src")], str(tmp_path / "src")))
+    assert len(result.errors) == 1 and not (tmp_path / "src" / "src").exists()
+
+
+def test_delete(tmp_path):
+    source = make_tree(tmp_path)
+    (tmp_path / "keep.txt").write_text("keep")
+    single = tmp_path / "single.txt"
+    single.write_text("x")
+    result = run(FileOperation(DELETE, [source, str(single)]))
+    assert result.errors == [] and result.files_done == result.files_total == 5
+    assert sorted(os.listdir(tmp_path)) == ["keep.txt"]
+
+
+def test_cancel_mid_run(tmp_path, monkeypatch):
+    (tmp_path / "src").mkdir()
+    for index in range(200):
+        (tmp_path / "src" / f"f{index:03d}").write_text("x")
+    (tmp_path / "dest").mkdir()
+    operation = FileOperation(COPY, [str(tmp_path / "src")], str(tmp_path / "dest"), workers=1)
+    calls = []
+
+    def copy_then_cancel(*args, **kwargs):
+        calls.append(args[0])
+        if len(calls) == 5:
+            operation.cancel()
+        return copy_file(*args, **kwargs)
+
+    monkeypatch.setattr(file_operations, "copy_file", copy_then_cancel)
+    result = run(operation)
+    # 취소될 때 복사하던 파일은 지우고 이미 끝낸 파일은 남긴다
+    assert result.cancelled
+    assert result.files_done == len(os.listdir(tmp_path / "dest" / "src")) == 4 < result.files_total
+
+
+class Blocker:
+    """작업 풀의 스레드를 붙잡아 두는 작업."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self._cancelled = False
+        self._done = threading.Event()
+
+    def run(self):
+        self.started.set()
+        self.release.wait(10)
+
+
+def test_cancel_before_start(tmp_path):
+    source = make_tree(tmp_path)
+    (tmp_path / "dest").mkdir()
+    pool = LoaderPool(max_threads=1)
+    blocker = Blocker()
+    pool.submit(blocker)
+    assert blocker.started.wait(10)
+
+    operation = FileOperation(COPY, [source], str(tmp_path / "dest"))
+    results = []
+    operation.finished.connect(results.append)
+    operation.start(pool)
+    assert pool.is_queued(operation) and not operation.wait(0)
+    operation.cancel()
+    # 대기열에서 버려지는 작업도 바로 끝남을 알린다 (한 번만)
+    assert len(results) == 1 and results[0].cancelled and not results[0].planning
+    assert operation.wait(0)
+    operation.cancel()
+    assert len(results) == 1
+
+    blocker.release.set()
+    assert blocker._done.wait(10)
+    pool.submit(Blocker())  # 대기열에 남은 취소된 작업을 버린다
+    assert not pool.is_queued(operation)
+    assert os.listdir(tmp_path / "dest") == [] and len(results) == 1
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="/proc 필요")
+def test_copy_pseudo_file(tmp_path):
+    # /proc 파일은 st_size가 0이고 커널 복사가 0을 반환하지만 내용이 있다
+    target = str(tmp_path / "status")
+    copied = copy_file("/proc/self/status", target)
+    with open(target, "rb") as f:
+        data = f.read()
+    assert copied == len(data) > 0 and data.startswith(b"Name:")
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="os.copy_file_range 필요")
+def test_copy_falls_back_when_kernel_copy_returns_zero(tmp_path, monkeypatch):
+    # 가상 파일처럼 끝이 아닌데 copy_file_range가 0을 반환해도 잘리지 않는다
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"data" * 1000)
+    monkeypatch.setattr(file_operations.os, "copy_file_range", lambda *args: 0)
+    assert copy_file(str(source), str(tmp_path / "copy.bin")) == 4000
+    assert (tmp_path / "copy.bin").read_bytes() == b"data" * 1000
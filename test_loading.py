@@ -0,0 +1,348 @@
+"""로딩 중 목록 반영 테스트 (pytest, 행을 나눠 보이는 모델과 모델 밖 버퍼)
+
+    QT_QPA_PLATFORM=offscreen python -m pytest -q test_loading.py
+"""
+import os
+import sys
+import threading
+import time
+
+import pytest
+from PyQt6.QtCore import QPersistentModelIndex, Qt
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from file_explorer.backends import MemoryBackend, VirtualListing
+from file_explorer import scan_scheduler
+from file_explorer.entry_store import FLAG_DIR, EntryStore, sort_key
+from file_explorer.file_model import FileTableModel
+from file_explorer.listing_buffer import ListingBuffer
+from file_explorer.listing_cache import ListingCache
+from file_explorer.loader import BatchPolicy, LoaderPool, StatBatch
+from file_explorer.name_filter import QuickFilter
+from file_explorer.scan_scheduler import ScanScheduler
+
+
+def wait_for(app, condition, timeout=10.0):
+    start = time.monotonic()
+    while not condition():
+        app.processEvents()
+        assert time.monotonic() - start < timeout, "시간 초과"
+
+
+def shown_names(model):
+    return [model._items.names[row] for row in range(model.rowCount())]
+
+
+def store(*names) -> EntryStore:
+    """이름 순서 그대로의 파일 목록 (크기는 0부터 차례로)."""
+    items = EntryStore("/d")
+    for size, name in enumerate(names):
+        items.append(name, False, True, size)
+    return items
+
+
+# ListingBuffer
+
+
+def test_buffer_merges_runs_in_key_order():
+    buffer = ListingBuffer(store("b.txt", "d.txt"))
+    buffer.add(store("a.txt", "c.txt", "e.txt"))
+    buffer.add(store())
+    buffer.add(store("f.txt"))
+    assert len(buffer) == 6
+    assert buffer.head(1, 4).names == ["b.txt", "c.txt", "d.txt"]
+    assert buffer.merged().names == ["a.txt", "b.txt", "c.txt", "d.txt", "e.txt", "f.txt"]
+    assert len(buffer.runs) == 1 and len(buffer) == 6
+
+
+def test_buffer_equal_keys_keep_run_order():
+    # 대소문자만 다른 이름은 키가 같으므로 먼저 추가된 구간의 행이 앞에 온다
+    buffer = ListingBuffer(store("a", "B", "c"))
+    buffer.add(store("A", "b"))
+    buffer.add(store("a.txt", "b"))
+    expected = ["a", "A", "a.txt", "B", "b", "b", "c"]
+    assert buffer.head(0, len(buffer)).names == expected
+    merged = buffer.merged()
+    assert merged.names == expected
+    # 같은 키의 행도 자기 크기를 유지한다 (구간별 원래 행에서 복사)
+    assert list(merged.sizes) == [0, 0, 0, 1, 1, 1, 2]
+
+
+def test_buffer_apply_stats_matches_exact_name():
+    buffer = ListingBuffer(store("A.txt", "a.txt", "b.txt"))
+    buffer.add(store("B.TXT", "c.txt"))
+    stats = StatBatch()
+    for name, size in (("a.txt", 100), ("B.TXT", 200), ("A.txt", 300), ("missing", 400)):
+        stats.names.append(name)
+        stats.keys.append(sort_key(name, 0))
+        stats.sizes.append(size)
+        stats.mtimes.append(1.0)
+    assert buffer.apply_stats(stats) == 3
+    merged = buffer.merged()
+    sizes = dict(zip(merged.names, merged.sizes))
+    assert sizes == {"A.txt": 300, "a.txt": 100, "b.txt": 2, "B.TXT": 200, "c.txt": 1}
+
+
+# 로딩 중인 모델
+
+
+class GatedBackend(MemoryBackend):
+    """list()가 gate번째 항목 앞에서 release될 때까지 멈추는 메모리 백엔드."""
+
+    def __init__(self, gate: int):
+        super().__init__()
+        self.gate = gate
+        self.release = threading.Event()
+
+    def list(self, path: str):
+        return VirtualListing(self._gated(super().list(path)))
+
+    def _gated(self, listing):
+        with listing:
+            for index, entry in enumerate(listing):
+                if index == self.gate:
+                    self.release.wait(10)
+                yield entry
+
+
+GATE = 50
+
+
+@pytest.fixture
+def loading(app):
+    """합성 항목 300개 중 GATE개만 받은 채 멈춘 모델 (fetch_rows=20)."""
+    backend = GatedBackend(GATE)
+    backend.add_synthetic("/data", 290, dirs=10)
+    model = FileTableModel(listing_cache=ListingCache(), backend=backend, fetch_rows=20,
+                           batch_policy=BatchPolicy(first_batch=10, max_batch=10, flush_ms=10_000))
+    model.load("/data")
+    wait_for(app, lambda: model._buffer is not None and len(model._buffer) == GATE + 1)
+    yield backend, model
+    backend.release.set()
+    wait_for(app, lambda: not model.is_loading())
+
+
+def full_order(backend, names=None) -> list:
+    """기본 정렬 순서의 전체 목록 (names를 주면 그 이름만)."""
+    with MemoryBackend.list(backend, "/data") as listing:  # 멈추지 않는 목록
+        entries = [(entry.name, entry.is_dir()) for entry in listing]
+    keys = {name: sort_key(name, FLAG_DIR if is_dir else 0) for name, is_dir in entries}
+    return ["..", *sorted(keys if names is None else names, key=keys.__getitem__)]
+
+
+def view_order(backend, names: list, text: str = "") -> list:
+    """기본 순서 names를 크기 내림차순으로 (디렉토리는 기본 순서) 정렬하고 text로 거른 목록."""
+    def key(name):
+        if name == "..":
+            return 0, 0
+        stat = backend.stat(os.path.join("/data", name))
+        return (1, 0) if backend.is_dir(os.path.join("/data", name)) else (2, -stat.st_size)
+    return [name for name in sorted(names, key=key) if text in name and name != ".."]
+
+
+def received(model) -> list:
+    """지금까지 받은 항목 이름 (.. 제외)."""
+    return [name for run in model._buffer.runs for name in run.names if name != ".."]
+
+
+def test_fetch_past_window_while_loading(app, loading):
+    backend, model = loading
+    assert shown_names(model) == full_order(backend, received(model))[:20]
+    assert model.total_rows() == GATE + 1 and model.canFetchMore()
+
+    # 받은 항목보다 많이 요청하면 받은 만큼만 보이고, 나머지는 받는 대로 채운다
+    model.fetchMore()
+    model.fetchMore()
+    assert shown_names(model) == full_order(backend, received(model)) and not model.canFetchMore()
+    model.fetchMore()
+    window = GATE + 1 + model.fetch_rows
+    backend.release.set()
+    wait_for(app, lambda: not model.is_loading())
+    assert shown_names(model) == full_order(backend)[:window]
+    assert list(model.entries().names) == full_order(backend)
+    assert model.total_rows() == 301 and model.canFetchMore()
+
+
+def test_sort_and_filter_change_while_loading(app, loading):
+    backend, model = loading
+    size_descending = (FileTableModel.COLUMN_SIZE, Qt.SortOrder.DescendingOrder)
+
+    # 정렬: 받은 항목 전체에서 고른 앞쪽 행이 보인다
+    model.set_view(size_descending, {})
+    assert shown_names(model)[1:] == view_order(backend, full_order(backend, received(model)))[:19]
+    # 필터: 일치하는 항목만 센다
+    model.set_view(size_descending, {"quick": QuickFilter("1")})
+    matched = view_order(backend, full_order(backend, received(model)), "1")
+    assert shown_names(model) == matched[:20] and model.total_rows() == len(matched)
+    # 기본 순서로 돌아오면 버퍼 앞쪽을 보인다
+    model.set_view(None, {})
+    assert shown_names(model) == full_order(backend, received(model))[:20]
+
+    model.set_view(size_descending, {"quick": QuickFilter("1")})
+    backend.release.set()
+    wait_for(app, lambda: not model.is_loading())
+    matched = view_order(backend, full_order(backend), "1")
+    assert shown_names(model) == matched[:20] and model.total_rows() == len(matched)
+    model.set_view(None, {})
+    assert shown_names(model) == full_order(backend)[:20] and model.total_rows() == 301
+
+
+# 스트리밍 병합 (행을 모두 보이는 모델)
+
+
+def test_streamed_chunks_merge_without_reset(app):
+    backend = MemoryBackend()
+    backend.add_synthetic("/data", 3000, dirs=30)
+    model = FileTableModel(listing_cache=ListingCache(), backend=backend,
+                           batch_policy=BatchPolicy(first_batch=2, max_batch=512))
+    model.MERGE_FRACTION = 0  # 청크마다 병합
+    model.load("/data")
+    events = []
+    model.modelReset.connect(lambda: events.append("reset"))
+    model.rowsInserted.connect(lambda *args: events.append("insert"))
+    model.layoutChanged.connect(lambda *args: events.append("layout"))
+
+    # 합성 이름은 스캔 순서가 정렬 순서와 달라 청크마다 목록 곳곳에 끼워 넣어진다
+    wait_for(app, lambda: model.rowCount() > 2)
+    name = model._items.names[2]
+    persistent = QPersistentModelIndex(model.index(2, 0))
+    wait_for(app, lambda: not model.is_loading())
+    assert shown_names(model) == full_order(backend)
+    assert model._items.names[persistent.row()] == name
+    # 적게 흩어진 청크는 행 추가, 많이 흩어진 청크는 레이아웃 변경으로 반영하고 초기화는 없다
+    assert "insert" in events and "layout" in events and "reset" not in events
+
+
+# ScanScheduler
+
+
+SMALL_BATCHES = BatchPolicy(first_batch=10, max_batch=10, flush_ms=10_000)
+
+
+class Subscriber:
+    """모델처럼 스캔을 구독하고 받은 청크를 모으는 구독자."""
+
+    def __init__(self, scheduler: ScanScheduler, backend, fresh: bool = False):
+        self.chunks = []
+        self.finished = False
+        self.scan = scheduler.scan_directory(self, "/data", backend=backend, batch_policy=SMALL_BATCHES,
+                                             fresh=fresh)
+        # 늦게 합류하면 먼저 구독한 쪽이 받은 결과로 따라잡는다
+        self.chunks.extend(self.scan.received(self))
+        self.scan.chunk_ready.connect(self.chunks.append)
+        self.scan.finished.connect(self._on_finished)
+
+    def _on_finished(self):
+        self.finished = True
+
+    def scan_results(self, scan) -> list:
+        return list(self.chunks)
+
+    def names(self) -> list:
+        return [name for chunk in self.chunks for name in chunk.names]
+
+
+@pytest.fixture
+def gated():
+    backend = GatedBackend(GATE)
+    backend.add_synthetic("/data", 290, dirs=10)
+    yield backend
+    backend.release.set()
+
+
+def all_names(backend) -> list:
+    with MemoryBackend.list(backend, "/data") as listing:
+        return sorted(entry.name for entry in listing)
+
+
+def test_subscribers_share_one_loader(app, gated, monkeypatch):
+    created = []
+
+    class CountingLoader(scan_scheduler.DirectoryLoader):
+        def __init__(self, *args):
+            super().__init__(*args)
+            created.append(self)
+
+    monkeypatch.setattr(scan_scheduler, "DirectoryLoader", CountingLoader)
+    scheduler = ScanScheduler(LoaderPool(max_threads=2))
+    first = Subscriber(scheduler, gated)
+    second = Subscriber(scheduler, gated)
+    assert first.scan is second.scan and len(created) == 1
+    assert scheduler.active_scans() == 1 and first.scan.subscribers() == 2
+
+    gated.release.set()
+    wait_for(app, lambda: first.finished and second.finished)
+    assert sorted(first.names()) == sorted(second.names()) == all_names(gated)
+    assert len(created) == 1 and scheduler.active_scans() == 0
+
+
+def test_late_joiner_catches_up(app, gated):
+    scheduler = ScanScheduler(LoaderPool(max_threads=2))
+    first = Subscriber(scheduler, gated)
+    wait_for(app, lambda: len(first.names()) == GATE)
+
+    late = Subscriber(scheduler, gated)
+    assert late.scan is first.scan and late.names() == first.names()
+    gated.release.set()
+    wait_for(app, lambda: first.finished and late.finished)
+    # 따라잡은 결과와 이후 청크를 합치면 빠지거나 겹치는 항목 없이 전체 목록이다
+    assert sorted(late.names()) == sorted(first.names()) == all_names(gated)
+
+
+def test_fresh_request_does_not_join_started_scan(app, gated):
+    scheduler = ScanScheduler(LoaderPool(max_threads=2))
+    first = Subscriber(scheduler, gated)
+    wait_for(app, lambda: len(first.names()) == GATE)
+
+    fresh = Subscriber(scheduler, gated, fresh=True)
+    assert fresh.scan is not first.scan and fresh.chunks == []
+    # 이후 요청은 새 스캔에 합류한다
+    later = Subscriber(scheduler, gated)
+    assert later.scan is fresh.scan and scheduler.active_scans() == 1
+
+    gated.release.set()
+    wait_for(app, lambda: first.finished and fresh.finished and later.finished)
+    assert sorted(first.names()) == sorted(fresh.names()) == all_names(gated)
+
+
+def test_fresh_request_joins_queued_scan(app, gated):
+    # 아직 디렉토리를 읽기 시작하지 않은 (대기열의) 스캔에는 fresh 요청도 합류한다
+    pool = LoaderPool(max_threads=1)
+    blocker = ScanScheduler(pool)
+    busy = Subscriber(blocker, gated)
+    wait_for(app, lambda: len(busy.names()) == GATE)
+
+    backend = MemoryBackend()
+    backend.add_synthetic("/data", 10)
+    scheduler = ScanScheduler(pool)
+    first = Subscriber(scheduler, backend)
+    assert first.scan.loader.is_queued()
+    fresh = Subscriber(scheduler, backend, fresh=True)
+    assert fresh.scan is first.scan and scheduler.active_scans() == 1
+
+    gated.release.set()
+    wait_for(app, lambda: first.finished and fresh.finished)
+    assert sorted(fresh.names()) == all_names(backend)
+
+
+def test_last_unsubscribe_cancels_loader(app, gated):
+    scheduler = ScanScheduler(LoaderPool(max_threads=2))
+    first = Subscriber(scheduler, gated)
+    second = Subscriber(scheduler, gated)
+    wait_for(app, lambda: len(first.names()) == GATE)
+    scan = first.scan
+
+    scan.unsubscribe(first)
+    assert not scan.loader._cancelled and scheduler.active_scans() == 1
+    scan.unsubscribe(second)
+    assert scan.loader._cancelled and scheduler.active_scans() == 0
+
+    # 취소된 로더는 더 보내지 않고 끝나며, 같은 요청은 새로 스캔한다
+    received = len(second.names())
+    gated.release.set()
+    assert scan.wait(10)
+    for _ in range(10):
+        app.processEvents()
+    assert len(second.names()) == received and not second.finished
+    assert Subscriber(scheduler, gated).scan is not scan